@@ -1,8 +1,57 @@
+import base64
+import binascii
+import datetime
+import json
+from functools import partial
+from typing import Any, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DataError, transaction
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import OrderBy
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.pagination import (
+    LimitOffsetPagination as RestFrameworkLimitOffsetPagination,
+)
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+
+class PrecalculatedCountPaginator(DjangoPaginator):
+    """
+    A paginator that doesn't count the objects because the count is provided, for
+    example from the cache or as an estimate. Because the count can be approximate,
+    the pages after the last page according to the count can still be requested.
+    """
+
+    def __init__(self, *args, count: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count = count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            number = int(number)
+            if number < 1:
+                raise
+            return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -11,8 +60,18 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, *args, count=None, **kwargs):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param count: Optionally the already calculated number of objects, so that
+            they don't have to be counted again.
+        """
+
         self.limit_page_size = limit_page_size
+        if count is not None:
+            self.django_paginator_class = partial(
+                PrecalculatedCountPaginator, count=count
+            )
         super().__init__(*args, **kwargs)
 
     def get_page_size(self, request):
@@ -39,3 +98,304 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
+    def __init__(self, count: Optional[int] = None):
+        """
+        :param count: Optionally the already calculated number of objects, so that
+            they don't have to be counted again.
+        """
+
+        self.precalculated_count = count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.precalculated_count is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        # The precalculated count can be approximate, so the objects after it are
+        # still returned.
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.count = self.precalculated_count
+        self.offset = self.get_offset(request)
+        return list(queryset[self.offset : self.offset + self.limit])
+
+
+class KeysetCursorEncoder(DjangoJSONEncoder):
+    """
+    Keeps the full microsecond precision of datetimes and times because the
+    `DjangoJSONEncoder` truncates them to milliseconds, which would make the
+    cursor skip or repeat rows.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates a queryset by remembering the ordering values of the last returned
+    row in an opaque cursor instead of using an offset. Fetching the next page
+    filters on those values, so the database can start reading right after the
+    previous page and page N costs the same as page 1. No `COUNT(*)` query is
+    executed.
+
+    The ordering of the provided queryset is used as the keyset. It must end with
+    a unique column like `id`, otherwise it's added automatically as tiebreaker.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    annotation_prefix = "_keyset_"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+        self.request = None
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        Returns whether the keyset pagination has been requested. The first page
+        can be requested by providing an empty `cursor` query parameter.
+        """
+
+        return cls.cursor_query_param in request.GET
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.GET.get(self.page_size_query_param, self.page_size))
+            if page_size <= 0:
+                raise ValueError
+        except ValueError:
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            exception = APIException(
+                {
+                    "error": "ERROR_PAGE_SIZE_LIMIT",
+                    "detail": f"The page size is limited to {self.limit_page_size}.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return page_size
+
+    @staticmethod
+    def encode_cursor(values: List[Any]) -> str:
+        data = json.dumps(values, cls=KeysetCursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request, expected_length: int) -> Optional[List[Any]]:
+        """
+        Decodes the cursor query parameter. An empty cursor means that the first
+        page is requested.
+
+        :raises APIException: If the cursor is malformed or doesn't match the
+            current ordering of the queryset.
+        """
+
+        encoded = request.GET.get(self.cursor_query_param, "")
+
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except (ValueError, UnicodeError, binascii.Error):
+            values = None
+
+        if (
+            not isinstance(values, list)
+            or len(values) != expected_length
+            or not all(
+                value is None or isinstance(value, (str, int, float, bool))
+                for value in values
+            )
+        ):
+            self.raise_invalid_cursor()
+
+        return values
+
+    def raise_invalid_cursor(self):
+        exception = APIException(
+            {
+                "error": "ERROR_INVALID_CURSOR",
+                "detail": "The provided cursor is invalid or the ordering has "
+                "changed since it was created.",
+            }
+        )
+        exception.status_code = HTTP_400_BAD_REQUEST
+        raise exception
+
+    def get_order_bys(self, queryset: QuerySet) -> List[OrderBy]:
+        """
+        Converts the ordering of the queryset into a list of OrderBy expressions and
+        makes sure that the primary key is the last tiebreaker.
+        """
+
+        query = queryset.query
+        if query.order_by:
+            ordering = list(query.order_by)
+        elif query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+        else:
+            ordering = []
+
+        order_bys = []
+        for order in ordering:
+            if isinstance(order, str):
+                descending = order.startswith("-")
+                name = order.lstrip("-")
+                if name == "pk":
+                    name = queryset.model._meta.pk.name
+                order = F(name).desc() if descending else F(name).asc()
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+            order_bys.append(order)
+
+        pk_name = queryset.model._meta.pk.name
+        last = order_bys[-1].expression if order_bys else None
+        if not (isinstance(last, F) and last.name in (pk_name, "pk")):
+            order_bys.append(F(pk_name).asc())
+
+        return order_bys
+
+    def _get_after_q(self, name: str, order_by: OrderBy, value: Any) -> Optional[Q]:
+        """
+        Returns the condition matching the rows that come strictly after the
+        provided value for one order by expression, respecting the nulls ordering.
+        Postgres puts nulls last when ascending and first when descending by default.
+        """
+
+        if order_by.nulls_first:
+            nulls_first = True
+        elif order_by.nulls_last:
+            nulls_first = False
+        else:
+            nulls_first = order_by.descending
+
+        if value is None:
+            return Q(**{f"{name}__isnull": False}) if nulls_first else None
+
+        lookup = "lt" if order_by.descending else "gt"
+        after = Q(**{f"{name}__{lookup}": value})
+        if not nulls_first:
+            after |= Q(**{f"{name}__isnull": True})
+        return after
+
+    def _get_leading_bound_q(
+        self, name: str, order_by: OrderBy, value: Any
+    ) -> Optional[Q]:
+        """
+        Returns the condition matching the rows that come at or after the provided
+        value of the leading order by expression, so that the database can use it
+        as range condition on an index.
+        """
+
+        if order_by.nulls_first:
+            nulls_first = True
+        elif order_by.nulls_last:
+            nulls_first = False
+        else:
+            nulls_first = order_by.descending
+
+        if value is None:
+            return None if nulls_first else Q(**{f"{name}__isnull": True})
+
+        lookup = "lte" if order_by.descending else "gte"
+        bound = Q(**{f"{name}__{lookup}": value})
+        if not nulls_first:
+            bound |= Q(**{f"{name}__isnull": True})
+        return bound
+
+    def get_keyset_filter(
+        self, names: List[str], order_bys: List[OrderBy], values: List[Any]
+    ) -> Optional[Q]:
+        """
+        Builds the lexicographic `(a, b, c) > (x, y, z)` comparison as
+        `a >= x AND (a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z))`
+        because the directions and nulls ordering can differ per expression. The
+        redundant `a >= x` bound allows the database to start reading an index at
+        the cursor instead of at the beginning.
+        """
+
+        keyset_filter = None
+        equal_prefix = Q()
+        for name, order_by, value in zip(names, order_bys, values):
+            after = self._get_after_q(name, order_by, value)
+            if after is not None:
+                condition = equal_prefix & after
+                keyset_filter = (
+                    condition if keyset_filter is None else keyset_filter | condition
+                )
+            if value is None:
+                equal_prefix &= Q(**{f"{name}__isnull": True})
+            else:
+                equal_prefix &= Q(**{name: value})
+
+        if keyset_filter is not None:
+            leading_bound = self._get_leading_bound_q(names[0], order_bys[0], values[0])
+            if leading_bound is not None:
+                keyset_filter = leading_bound & keyset_filter
+
+        return keyset_filter
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        order_bys = self.get_order_bys(queryset)
+        names = [f"{self.annotation_prefix}{i}" for i in range(len(order_bys))]
+        values = self.decode_cursor(request, len(order_bys))
+
+        queryset = queryset.annotate(
+            **{name: order.expression for name, order in zip(names, order_bys)}
+        ).order_by(*order_bys)
+
+        try:
+            # The savepoint makes sure that the transaction can still be used if the
+            # values of the cursor can't be compared with the ordered columns.
+            with transaction.atomic():
+                if values is not None:
+                    keyset_filter = self.get_keyset_filter(names, order_bys, values)
+                    if keyset_filter is None:
+                        return []
+                    queryset = queryset.filter(keyset_filter)
+
+                rows = list(queryset[: page_size + 1])
+        except (ValueError, TypeError, ValidationError, DataError):
+            if values is None:
+                raise
+            self.raise_invalid_cursor()
+
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_cursor = self.encode_cursor(
+                [getattr(rows[-1], name) for name in names]
+            )
+
+        return rows
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "next_cursor": self.next_cursor,
+                "results": data,
+            }
+        )
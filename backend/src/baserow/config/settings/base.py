@@ -339,6 +339,12 @@ CELERY_SINGLETON_BACKEND_CLASS = (
 # This flag enable automatic index creation for table views based on sortings.
 AUTO_INDEX_VIEW_ENABLED = os.getenv("BASEROW_AUTO_INDEX_VIEW_ENABLED", "true") == "true"
 AUTO_INDEX_LOCK_EXPIRY = os.getenv("BASEROW_AUTO_INDEX_LOCK_EXPIRY", 60 * 2)
+# This flag enables automatic trigram index creation for the text fields filtered
+# with a contains filter. It requires the `pg_trgm` extension, which is created
+# when missing if the database user is allowed to.
+AUTO_INDEX_TRIGRAM_ENABLED = (
+    os.getenv("BASEROW_AUTO_INDEX_TRIGRAM_ENABLED", "false") == "true"
+)
 
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
@@ -836,6 +842,11 @@ MIDNIGHT_CRONTAB_STR = "0 0 * * *"
 BASEROW_STORAGE_USAGE_JOB_CRONTAB = get_crontab_from_env(
     "BASEROW_STORAGE_USAGE_JOB_CRONTAB", default_crontab=MIDNIGHT_CRONTAB_STR
 )
+# When enabled, the periodic storage usage job only recalculates the workspaces that
+# have changed since the previous run instead of all of them.
+BASEROW_STORAGE_USAGE_JOB_ONLY_UPDATED = str_to_bool(
+    os.getenv("BASEROW_STORAGE_USAGE_JOB_ONLY_UPDATED", "false")
+)
 
 ONE_AM_CRONTRAB_STR = "0 1 * * *"
 BASEROW_SEAT_USAGE_JOB_CRONTAB = get_crontab_from_env(
@@ -970,6 +981,25 @@ PERIODIC_FIELD_UPDATE_CRONTAB = get_crontab_from_env(
 PERIODIC_FIELD_UPDATE_QUEUE_NAME = os.getenv(
     "BASEROW_PERIODIC_FIELD_UPDATE_QUEUE_NAME", "export"
 )
+# The amount of seconds the deferred formula, lookup and rollup updates of the tables
+# in eventual mode are collected before they're applied together.
+BASEROW_DEFERRED_DEPENDANT_UPDATES_DELAY_SECONDS = int(
+    os.getenv("BASEROW_DEFERRED_DEPENDANT_UPDATES_DELAY_SECONDS", 2)
+)
+BASEROW_DEFERRED_DEPENDANT_UPDATES_BATCH_SIZE = int(
+    os.getenv("BASEROW_DEFERRED_DEPENDANT_UPDATES_BATCH_SIZE", 200)
+)
+# How often the deferred updates of which the task has been lost are scheduled again.
+BASEROW_DEFERRED_DEPENDANT_UPDATES_SWEEP_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_DEFERRED_DEPENDANT_UPDATES_SWEEP_INTERVAL_SECONDS", 5 * 60)
+)
+# The amount of seconds the row count of a table is cached for the unfiltered views.
+# The cached count is kept up to date when rows are created or deleted.
+BASEROW_CACHED_ROW_COUNT_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_CACHED_ROW_COUNT_TIMEOUT_SECONDS", 60 * 10)
+)
+# The maximum number of rows counted when a capped row count is requested.
+BASEROW_CAPPED_ROW_COUNT_LIMIT = int(os.getenv("BASEROW_CAPPED_ROW_COUNT_LIMIT", 10000))
 
 BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES = int(
     os.getenv("BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES", 8)
@@ -984,6 +1014,23 @@ BASEROW_WEBHOOKS_MAX_CALL_LOG_ENTRIES = int(
 BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS = int(
     os.getenv("BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS", 5)
 )
+# The maximum amount of webhook calls of one event that are made at the same time
+# by a single worker.
+BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS", 10)
+)
+BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS", 5)
+)
+BASEROW_WEBHOOKS_BATCH_MAX_EVENTS = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_MAX_EVENTS", 100)
+)
+# A scheduled batch delivery that hasn't run this many seconds after it was expected
+# to is considered lost, for example because the worker crashed, and is scheduled
+# again.
+BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS", 600)
+)
 BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS = bool(
     os.getenv("BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS", False)
 )
@@ -1044,9 +1091,20 @@ BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES = int(
 BASEROW_ROW_HISTORY_RETENTION_DAYS = int(
     os.getenv("BASEROW_ROW_HISTORY_RETENTION_DAYS", 180)
 )
+# The number of days the row changes are kept in the change log of the tables. The
+# change log is disabled if set to 0.
+BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS = int(
+    os.getenv("BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS", 0)
+)
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
+# When at least this amount of rows is created at once, for example by a file
+# import, the rows are inserted using the `COPY` command instead of an `INSERT`
+# statement. Set to 0 to always use `INSERT`.
+BASEROW_CREATE_ROWS_COPY_THRESHOLD = int(
+    os.getenv("BASEROW_CREATE_ROWS_COPY_THRESHOLD", 0)
+)
 BASEROW_MAX_SNAPSHOTS_PER_GROUP = int(os.getenv("BASEROW_MAX_SNAPSHOTS_PER_GROUP", -1))
 BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS = int(
     os.getenv("BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS", 360)  # 360 days
@@ -1139,6 +1197,17 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum amount of tables of which the generated model field attrs are kept in
+# the memory of every process, in front of the Redis generated models cache.
+BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE = int(
+    os.getenv("BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE", 128)
+)
+# The amount of seconds the users permitted to receive a real-time event about a
+# scope are cached. The cache is invalidated when the workspace members or their
+# permissions change. Set to 0 to disable it.
+BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS", 60 * 5)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1169,6 +1238,25 @@ USE_PG_FULLTEXT_SEARCH = str_to_bool(
 PG_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 AUTO_VACUUM_AFTER_SEARCH_UPDATE = str_to_bool(os.getenv("BASEROW_AUTO_VACUUM", "true"))
 TSV_UPDATE_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_CHUNK_SIZE", "2000"))
+# The size of the following chunks is adapted so that updating the tsvectors of
+# one chunk takes roughly this amount of seconds. Set to 0 to disable.
+TSV_UPDATE_CHUNK_TARGET_SECONDS = float(
+    os.getenv("BASEROW_TSV_UPDATE_CHUNK_TARGET_SECONDS", "2")
+)
+TSV_UPDATE_MIN_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_MIN_CHUNK_SIZE", "100"))
+TSV_UPDATE_MAX_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_MAX_CHUNK_SIZE", "20000"))
+# The maximum number of tables of which the tsvectors are updated at the same time
+# by all the workers together. Set to 0 to disable the limit.
+TSV_UPDATE_MAX_CONCURRENT_TABLES = int(
+    os.getenv("BASEROW_TSV_UPDATE_MAX_CONCURRENT_TABLES", "4")
+)
+TSV_UPDATE_RETRY_DELAY_SECONDS = int(
+    os.getenv("BASEROW_TSV_UPDATE_RETRY_DELAY_SECONDS", "10")
+)
+# The tsvector update task is redelivered if the worker is lost, for example when
+# the hard time limit is exceeded. It's abandoned after this many attempts without
+# any progress.
+TSV_UPDATE_MAX_ATTEMPTS = int(os.getenv("BASEROW_TSV_UPDATE_MAX_ATTEMPTS", "3"))
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "")
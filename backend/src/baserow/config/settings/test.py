@@ -55,6 +55,9 @@ if "cachalot" not in INSTALLED_APPS:
 
 CACHALOT_ENABLED = False
 AUTO_INDEX_VIEW_ENABLED = False
+# Many tests change the workspace members directly without sending the signals that
+# invalidate this cache, so it's only enabled in the tests that need it.
+BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS = 0
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
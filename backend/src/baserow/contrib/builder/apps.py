@@ -260,4 +260,5 @@ class BuilderConfig(AppConfig):
 
         # The signals must always be imported last because they use the registries
         # which need to be filled first.
+        import baserow.contrib.builder.elements.receivers  # noqa: F401
         import baserow.contrib.builder.ws.signals  # noqa: F403, F401
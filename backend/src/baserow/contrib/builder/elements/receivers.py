@@ -0,0 +1,43 @@
+from django.dispatch import receiver
+
+from baserow.contrib.builder.elements.models import ImageElement
+from baserow.contrib.builder.elements.signals import (
+    element_created,
+    element_deleted,
+    element_updated,
+    elements_created,
+)
+from baserow.contrib.builder.pages.signals import page_created, page_deleted
+from baserow.core.usage.handler import UsageHandler
+
+
+@receiver([element_created, element_updated])
+def on_image_element_created_or_updated(sender, element, **kwargs):
+    if isinstance(element, ImageElement):
+        UsageHandler.mark_workspaces_for_storage_usage_update(
+            [element.page.builder.workspace_id]
+        )
+
+
+@receiver(elements_created)
+def on_image_elements_created(sender, elements, page, **kwargs):
+    if any(isinstance(element, ImageElement) for element in elements):
+        UsageHandler.mark_workspaces_for_storage_usage_update(
+            [page.builder.workspace_id]
+        )
+
+
+@receiver(element_deleted)
+def on_element_deleted(sender, page, **kwargs):
+    # The type of the deleted element isn't known anymore at this point.
+    UsageHandler.mark_workspaces_for_storage_usage_update([page.builder.workspace_id])
+
+
+@receiver(page_created)
+def on_page_created(sender, page, **kwargs):
+    UsageHandler.mark_workspaces_for_storage_usage_update([page.builder.workspace_id])
+
+
+@receiver(page_deleted)
+def on_page_deleted(sender, builder, **kwargs):
+    UsageHandler.mark_workspaces_for_storage_usage_update([builder.workspace_id])
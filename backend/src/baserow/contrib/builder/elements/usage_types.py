@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from django.db.models import Q, Sum
 from django.db.models.functions import Coalesce
 
@@ -6,6 +8,7 @@ from baserow.core.usage.registries import (
     USAGE_UNIT_MB,
     UsageInMB,
     WorkspaceStorageUsageItemType,
+    get_user_files_usage_by_workspace,
 )
 from baserow.core.user_files.models import UserFile
 
@@ -27,3 +30,18 @@ class ImageElementWorkspaceStorageUsageItem(WorkspaceStorageUsageItemType):
         )
 
         return usage_in_mb
+
+    def calculate_storage_usage_for_workspaces(
+        self, workspace_ids: List[int]
+    ) -> Dict[int, UsageInMB]:
+        image_elements = ImageElement.objects.filter(
+            page__builder__workspace_id__in=workspace_ids,
+            page__trashed=False,
+            page__builder__trashed=False,
+        ).order_by()
+
+        return get_user_files_usage_by_workspace(
+            image_elements.values_list(
+                "page__builder__workspace_id", "image_file_id"
+            ).distinct()
+        )
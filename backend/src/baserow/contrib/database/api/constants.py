@@ -3,6 +3,11 @@
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter
 
+from baserow.contrib.database.constants import (
+    ROW_COUNT_MODE_CAPPED,
+    ROW_COUNT_MODE_ESTIMATE,
+    ROW_COUNT_MODE_EXACT,
+)
 from baserow.contrib.database.search.handler import SearchModes
 
 PUBLIC_PLACEHOLDER_ENTITY_ID = 0
@@ -19,3 +24,33 @@ SEARCH_MODE_API_PARAM = OpenApiParameter(
         "whitespace on each cell. This is the Baserow legacy search behaviour."
     ),
 )
+COUNT_MODE_API_PARAM = OpenApiParameter(
+    name="count_mode",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "Defines how the rows are counted. "
+        f"`{ROW_COUNT_MODE_EXACT}` (default) counts all the rows. With "
+        f"`{ROW_COUNT_MODE_ESTIMATE}` or `{ROW_COUNT_MODE_CAPPED}`, the count of an "
+        "unfiltered view comes from a cache. If the view is filtered or searched, "
+        f"`{ROW_COUNT_MODE_ESTIMATE}` returns the estimate of the database if there "
+        f"are many rows and `{ROW_COUNT_MODE_CAPPED}` stops counting after a "
+        "maximum number of rows. The `count_mode` of the response is then "
+        f"`{ROW_COUNT_MODE_EXACT}`, `{ROW_COUNT_MODE_ESTIMATE}` or "
+        f"`{ROW_COUNT_MODE_CAPPED}`, in which case there are more rows than the "
+        "`count`."
+    ),
+)
+LIMIT_LINK_ROW_VALUES_API_PARAM = OpenApiParameter(
+    name="limit_link_row_values",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.BOOL,
+    description=(
+        "If `true`, the values of the link row fields having a "
+        "`link_row_values_limit` only contain the first linked rows. The total "
+        "amount of linked rows is then available in the `link_row_values_count` row "
+        "metadata and all of them can be listed with the endpoint listing the linked "
+        "rows of a cell. Defaults to `false`, in which case all the linked rows are "
+        "included."
+    ),
+)
@@ -48,6 +48,14 @@ SUPPORTED_EXPORT_CHARSETS = [
     ("windows-1252", "windows-1252"),
     ("iso-8859-3", "iso-8859-3"),
 ]
+# Please keep in sync with
+# modules/database/components/export/TableParquetExporter.vue
+SUPPORTED_PARQUET_COMPRESSIONS = [
+    ("snappy", "snappy"),
+    ("zstd", "zstd"),
+    ("gzip", "gzip"),
+    ("none", "none"),
+]
 # Please keep in sync with modules/database/components/export/TableCSVExporter.vue
 SUPPORTED_CSV_COLUMN_SEPARATORS = [
     (",", ","),
@@ -149,3 +157,11 @@ class CsvExporterOptionsSerializer(BaseExporterOptionsSerializer):
         default=True,
         help_text="Whether or not to generate a header row at the top of the csv file.",
     )
+
+
+class ParquetExporterOptionsSerializer(BaseExporterOptionsSerializer):
+    parquet_compression = fields.ChoiceField(
+        choices=SUPPORTED_PARQUET_COMPRESSIONS,
+        default="snappy",
+        help_text="The compression codec used for the columns of the parquet file.",
+    )
@@ -11,3 +11,17 @@ ERROR_ROW_IDS_NOT_UNIQUE = (
     HTTP_400_BAD_REQUEST,
     "The provided row ids {e.ids} are not unique.",
 )
+
+ERROR_INVALID_ROW_CHANGE_CURSOR = (
+    "ERROR_INVALID_ROW_CHANGE_CURSOR",
+    HTTP_400_BAD_REQUEST,
+    "The provided cursor is invalid. It must be a `next_cursor` returned when "
+    "listing the row changes.",
+)
+
+ERROR_ROW_CHANGE_CURSOR_EXPIRED = (
+    "ERROR_ROW_CHANGE_CURSOR_EXPIRED",
+    HTTP_400_BAD_REQUEST,
+    "The changes following the provided cursor are not retained anymore. All the "
+    "rows must be synchronized again before listing the changes without a cursor.",
+)
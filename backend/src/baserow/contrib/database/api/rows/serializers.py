@@ -10,7 +10,7 @@ from rest_framework import serializers
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
 from baserow.contrib.database.fields.registries import field_type_registry
-from baserow.contrib.database.rows.models import RowHistory
+from baserow.contrib.database.rows.models import RowChange, RowHistory
 from baserow.contrib.database.rows.registries import row_metadata_registry
 
 
@@ -353,6 +353,40 @@ class ListRowsQueryParamsSerializer(SearchQueryParamSerializer):
     exclude = serializers.CharField(required=False)
     filter_type = serializers.CharField(required=False, default="")
     view_id = serializers.IntegerField(required=False)
+    limit_link_row_values = serializers.BooleanField(required=False, default=False)
+
+
+class ListRowChangesQueryParamsSerializer(serializers.Serializer):
+    since = serializers.CharField(required=False, default=None)
+    limit = serializers.IntegerField(
+        required=False,
+        default=settings.ROW_PAGE_SIZE_LIMIT,
+        min_value=1,
+        max_value=settings.ROW_PAGE_SIZE_LIMIT,
+    )
+
+
+class RowChangeSerializer(serializers.ModelSerializer):
+    type = serializers.CharField(
+        source="change_type",
+        help_text="`created`, `updated` or `deleted`, or `refreshed` if any row "
+        "of the table might have changed.",
+    )
+
+    class Meta:
+        model = RowChange
+        fields = ["id", "type", "row_ids", "field_ids", "timestamp"]
+
+
+class RowChangesSerializer(serializers.Serializer):
+    changes = RowChangeSerializer(many=True)
+    next_cursor = serializers.CharField(
+        allow_null=True,
+        help_text="The cursor to provide as `since` to list the next changes.",
+    )
+    has_more = serializers.BooleanField(
+        help_text="Whether there are more changes after the returned ones."
+    )
 
 
 class BatchUpdateRowsSerializer(serializers.Serializer):
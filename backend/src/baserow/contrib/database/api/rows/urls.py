@@ -4,7 +4,9 @@ from .views import (
     BatchDeleteRowsView,
     BatchRowsView,
     RowAdjacentView,
+    RowChangesView,
     RowHistoryView,
+    RowLinkRowValuesView,
     RowMoveView,
     RowNamesView,
     RowsView,
@@ -30,6 +32,11 @@ urlpatterns = [
         BatchRowsView.as_view(),
         name="batch",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/changes/$",
+        RowChangesView.as_view(),
+        name="changes",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/batch-delete/$",
         BatchDeleteRowsView.as_view(),
@@ -50,4 +57,10 @@ urlpatterns = [
         RowHistoryView.as_view(),
         name="history",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/link-row-values/"
+        r"(?P<field_id>[0-9]+)/$",
+        RowLinkRowValuesView.as_view(),
+        name="link_row_values",
+    ),
 ]
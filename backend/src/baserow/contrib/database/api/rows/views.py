@@ -23,7 +23,7 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -38,7 +38,10 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
     ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
 )
+from baserow.contrib.database.api.fields.serializers import LinkRowValueSerializer
 from baserow.contrib.database.api.rows.errors import (
+    ERROR_INVALID_ROW_CHANGE_CURSOR,
+    ERROR_ROW_CHANGE_CURSOR_EXPIRED,
     ERROR_ROW_DOES_NOT_EXIST,
     ERROR_ROW_IDS_NOT_UNIQUE,
 )
@@ -58,6 +61,8 @@ from baserow.contrib.database.fields.exceptions import (
     OrderByFieldNotFound,
     OrderByFieldNotPossible,
 )
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import LinkRowField
 from baserow.contrib.database.rows.actions import (
     CreateRowActionType,
     CreateRowsActionType,
@@ -66,7 +71,13 @@ from baserow.contrib.database.rows.actions import (
     MoveRowActionType,
     UpdateRowsActionType,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+from baserow.contrib.database.rows.exceptions import (
+    InvalidRowChangeCursor,
+    RowChangeCursorExpired,
+    RowDoesNotExist,
+    RowIdsNotUnique,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.history import RowHistoryHandler
 from baserow.contrib.database.rows.operations import (
@@ -97,15 +108,18 @@ from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 
-from ..constants import SEARCH_MODE_API_PARAM
+from ..constants import LIMIT_LINK_ROW_VALUES_API_PARAM, SEARCH_MODE_API_PARAM
 from .example_serializers import example_pagination_row_serializer_class
 from .schemas import row_names_response_schema
 from .serializers import (
     BatchCreateRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
     CreateRowQueryParamsSerializer,
+    ListRowChangesQueryParamsSerializer,
     ListRowsQueryParamsSerializer,
     MoveRowQueryParamsSerializer,
+    RowChangeSerializer,
+    RowChangesSerializer,
     RowHistorySerializer,
     RowSerializer,
     get_batch_row_serializer_class,
@@ -140,6 +154,17 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="Enables the keyset pagination if provided. An empty "
+                "value returns the first page and the `next_cursor` of the response "
+                "can be provided to fetch the next one. Unlike the other pagination "
+                "styles, fetching a page deep into the table is as fast as fetching "
+                "the first one and the total count is not calculated. Can be "
+                "combined with the `size` parameter.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -270,19 +295,20 @@ class RowsView(APIView):
                 description="Includes all the filters and sorts of the provided view.",
             ),
             SEARCH_MODE_API_PARAM,
+            LIMIT_LINK_ROW_VALUES_API_PARAM,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's workspace. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
-            "optional search query, only rows where the data matches the search query "
-            "are going to be returned then. The properties of the returned rows "
-            "depends on which fields the table has. For a complete overview of fields "
-            "use the **list_database_table_fields** endpoint to list them all. In the "
-            "example all field types are listed, but normally the number in "
-            "field_{id} key is going to be the id of the field. Or if the GET "
+            "paginated by a page/size or cursor/size style. It is also possible to "
+            "provide an optional search query, only rows where the data matches the "
+            "search query are going to be returned then. The properties of the "
+            "returned rows depends on which fields the table has. For a complete "
+            "overview of fields use the **list_database_table_fields** endpoint to "
+            "list them all. In the example all field types are listed, but normally "
+            "the number in field_{id} key is going to be the id of the field. Or if the GET "
             "parameter `user_field_names` is provided then the keys will be the name "
             "of the field. The value is what the user has provided and the format of "
             "it depends on the fields type."
@@ -295,6 +321,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -359,7 +386,9 @@ class RowsView(APIView):
             fields=fields,
             field_ids=[] if fields else None,
         )
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            limit_link_row_values=query_params["limit_link_row_values"]
+        )
 
         if view_id:
             view_handler = ViewHandler()
@@ -387,7 +416,12 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, user_field_names=user_field_names
@@ -1513,3 +1547,189 @@ class RowHistoryView(APIView):
         return paginator.get_paginated_response(
             RowHistorySerializer(page, many=True).data
         )
+
+
+class RowChangesView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The id of the table to list the row changes of.",
+            ),
+            OpenApiParameter(
+                name="since",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="The `next_cursor` of a previous response. Only the "
+                "changes made after it are returned. All the retained changes are "
+                "returned if not provided.",
+            ),
+            OpenApiParameter(
+                name="limit",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum number of changes to return.",
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="list_database_table_row_changes",
+        description=(
+            "Lists the ids of the rows that have been created, updated or deleted in "
+            "the table, in the order the changes must be applied. This allows "
+            "synchronizing the rows incrementally by providing the returned "
+            "`next_cursor` as `since` in the next request. A change of type "
+            "`refreshed` means that any row might have changed. The changes are only "
+            "recorded if the change log is enabled with the "
+            "`BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS` environment variable and are "
+            "kept for that many days. If the changes following the `since` cursor "
+            "are not retained anymore, then the "
+            "`ERROR_ROW_CHANGE_CURSOR_EXPIRED` error is returned and all the rows "
+            "must be synchronized again. The changes are only listed once all the "
+            "database transactions that started before them have finished, so that "
+            "a change committed late is never skipped. This means that any long "
+            "running transaction in the database, even one unrelated to the table, "
+            "delays the changes of every table until it finishes."
+        ),
+        responses={
+            200: RowChangesSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_INVALID_ROW_CHANGE_CURSOR",
+                    "ERROR_ROW_CHANGE_CURSOR_EXPIRED",
+                    "ERROR_QUERY_PARAMETER_VALIDATION",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            InvalidRowChangeCursor: ERROR_INVALID_ROW_CHANGE_CURSOR,
+            RowChangeCursorExpired: ERROR_ROW_CHANGE_CURSOR_EXPIRED,
+        }
+    )
+    @validate_query_parameters(ListRowChangesQueryParamsSerializer)
+    def get(self, request: Request, table_id: int, query_params) -> Response:
+        table = TableHandler().get_table(table_id)
+        CoreHandler().check_permissions(
+            request.user,
+            ListRowsDatabaseTableOperationType.type,
+            workspace=table.database.workspace,
+            context=table,
+        )
+        TokenHandler().check_table_permissions(request, "read", table, False)
+
+        changes, next_cursor, has_more = RowChangeLogHandler.list_changes(
+            table.id, query_params["since"], query_params["limit"]
+        )
+
+        return Response(
+            {
+                "changes": RowChangeSerializer(changes, many=True).data,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+            }
+        )
+
+
+class RowLinkRowValuesView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The id of the table containing the row.",
+            ),
+            OpenApiParameter(
+                name="row_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The id of the row to fetch the linked rows of.",
+            ),
+            OpenApiParameter(
+                name="field_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The id of the link row field to fetch the linked rows of.",
+            ),
+            OpenApiParameter(
+                name="limit",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum number of linked rows to return.",
+            ),
+            OpenApiParameter(
+                name="offset",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The offset of the linked rows to return.",
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="list_database_table_row_link_row_values",
+        description=(
+            "Lists the rows linked to the row with the given row_id in the link row "
+            "field with the given field_id. The linked rows are paginated and can be "
+            "limited with the limit and offset query parameters. This can be used to "
+            "fetch the linked rows that are not included when listing rows with "
+            "`limit_link_row_values`, because the field has a "
+            "`link_row_values_limit`."
+        ),
+        responses={
+            200: get_example_pagination_serializer_class(LinkRowValueSerializer),
+            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                [
+                    "ERROR_TABLE_DOES_NOT_EXIST",
+                    "ERROR_ROW_DOES_NOT_EXIST",
+                    "ERROR_FIELD_DOES_NOT_EXIST",
+                ]
+            ),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    def get(
+        self, request: Request, table_id: int, row_id: int, field_id: int
+    ) -> Response:
+        paginator = LimitOffsetPagination()
+        paginator.max_limit = settings.ROW_PAGE_SIZE_LIMIT
+        paginator.default_limit = settings.ROW_PAGE_SIZE_LIMIT
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "read", table, False)
+
+        field = FieldHandler().get_field(field_id, LinkRowField)
+        if field.table_id != table.id:
+            raise FieldDoesNotExist(f"The field {field_id} is not in the table.")
+
+        model = table.get_model(fields=[field], field_ids=[])
+        row = RowHandler().get_row(request.user, table, row_id, model)
+        linked_rows = getattr(row, field.db_column).all()
+        page = paginator.paginate_queryset(linked_rows, request, self)
+
+        return paginator.get_paginated_response(
+            LinkRowValueSerializer(page, many=True).data
+        )
@@ -6,11 +6,12 @@ from baserow.contrib.database.table.models import Table
 class TableSerializer(serializers.ModelSerializer):
     class Meta:
         model = Table
-        fields = ("id", "name", "order", "database_id")
+        fields = ("id", "name", "order", "database_id", "defer_dependant_updates")
         extra_kwargs = {
             "id": {"read_only": True},
             "database_id": {"read_only": True},
             "order": {"help_text": "Lowest first."},
+            "defer_dependant_updates": {"read_only": True},
         }
 
 
@@ -67,7 +68,18 @@ class TableImportSerializer(serializers.Serializer):
 class TableUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Table
-        fields = ("name",)
+        fields = ("name", "defer_dependant_updates")
+        extra_kwargs = {
+            "name": {"required": False},
+            "defer_dependant_updates": {"required": False},
+        }
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError(
+                "At least one of the fields must be provided."
+            )
+        return attrs
 
 
 class OrderTablesSerializer(serializers.Serializer):
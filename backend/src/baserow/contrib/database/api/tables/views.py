@@ -398,7 +398,8 @@ class TableView(APIView):
         table = action_type_registry.get_by_type(UpdateTableActionType).do(
             request.user,
             TableHandler().get_table(table_id),
-            name=data["name"],
+            name=data.get("name"),
+            defer_dependant_updates=data.get("defer_dependant_updates"),
         )
 
         serializer = TableSerializer(table)
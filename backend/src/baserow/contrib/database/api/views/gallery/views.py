@@ -14,9 +14,11 @@ from baserow.api.decorators import (
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.api.schemas import get_error_schema
-from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
-from baserow.contrib.database.api.constants import SEARCH_MODE_API_PARAM
+from baserow.contrib.database.api.constants import (
+    LIMIT_LINK_ROW_VALUES_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FILTER_FIELD_NOT_FOUND,
@@ -37,7 +39,10 @@ from baserow.contrib.database.api.views.errors import (
 from baserow.contrib.database.api.views.gallery.serializers import (
     GalleryViewFieldOptionsSerializer,
 )
-from baserow.contrib.database.api.views.serializers import FieldOptionsField
+from baserow.contrib.database.api.views.serializers import (
+    FieldOptionsField,
+    LimitLinkRowValuesQueryParamSerializer,
+)
 from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
@@ -46,6 +51,9 @@ from baserow.contrib.database.fields.exceptions import (
     OrderByFieldNotPossible,
 )
 from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.contrib.database.rows.row_metadata_types import (
+    LinkRowValuesCountMetadataType,
+)
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
 from baserow.contrib.database.views.exceptions import (
     NoAuthorizationToPubliclySharedView,
@@ -182,6 +190,7 @@ class GalleryViewView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            LIMIT_LINK_ROW_VALUES_API_PARAM,
         ],
         tags=["Database table gallery view"],
         operation_id="list_database_table_gallery_view_rows",
@@ -230,7 +239,9 @@ class GalleryViewView(APIView):
         }
     )
     @allowed_includes("field_options", "row_metadata")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(
+        LimitLinkRowValuesQueryParamSerializer, return_validated=True
+    )
     def get(
         self,
         request: Request,
@@ -273,6 +284,7 @@ class GalleryViewView(APIView):
             search_mode=search_mode,
             apply_sorts=order_by is None,
             apply_filters=not adhoc_filters.has_any_filters,
+            limit_link_row_values=query_params["limit_link_row_values"],
         )
 
         if adhoc_filters.has_any_filters:
@@ -301,7 +313,12 @@ class GalleryViewView(APIView):
 
         if row_metadata:
             row_metadata = row_metadata_registry.generate_and_merge_metadata_for_rows(
-                request.user, view.table, (row.id for row in page)
+                request.user,
+                view.table,
+                (row.id for row in page),
+                opt_in_types=[LinkRowValuesCountMetadataType.type]
+                if query_params["limit_link_row_values"]
+                else None,
             )
             response.data.update(row_metadata=row_metadata)
 
@@ -467,6 +484,7 @@ class PublicGalleryViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            LIMIT_LINK_ROW_VALUES_API_PARAM,
         ],
         tags=["Database table gallery view"],
         operation_id="public_list_database_table_gallery_view_rows",
@@ -526,7 +544,9 @@ class PublicGalleryViewRowsView(APIView):
     )
     @transaction.atomic
     @allowed_includes("field_options")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(
+        LimitLinkRowValuesQueryParamSerializer, return_validated=True
+    )
     def get(
         self, request: Request, slug: str, field_options: bool, query_params
     ) -> Response:
@@ -571,6 +591,7 @@ class PublicGalleryViewRowsView(APIView):
             table_model=model,
             view_type=view_type,
             search_mode=search_mode,
+            limit_link_row_values=query_params["limit_link_row_values"],
         )
 
         if count:
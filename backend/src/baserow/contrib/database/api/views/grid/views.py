@@ -2,7 +2,6 @@ from decimal import Decimal
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -15,11 +14,19 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import (
+    KeysetPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
-from baserow.contrib.database.api.constants import SEARCH_MODE_API_PARAM
+from baserow.contrib.database.api.constants import (
+    COUNT_MODE_API_PARAM,
+    LIMIT_LINK_ROW_VALUES_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FIELD_NOT_IN_TABLE,
@@ -45,9 +52,14 @@ from baserow.contrib.database.api.views.grid.serializers import (
 )
 from baserow.contrib.database.api.views.serializers import (
     FieldOptionsField,
+    ListViewRowsQueryParamSerializer,
     serialize_group_by_metadata,
 )
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_public_view_authorization_token,
+    get_row_count_response_data,
+)
+from baserow.contrib.database.constants import ROW_COUNT_MODE_EXACT
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FieldNotInTable,
@@ -58,6 +70,9 @@ from baserow.contrib.database.fields.exceptions import (
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.contrib.database.rows.row_metadata_types import (
+    LinkRowValuesCountMetadataType,
+)
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
 from baserow.contrib.database.views.exceptions import (
     AggregationTypeDoesNotExist,
@@ -156,6 +171,17 @@ class GridViewView(APIView):
                 description="Can only be used in combination with the `page` parameter "
                 "and defines how many rows should be returned.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="Enables the keyset pagination if provided. An empty "
+                "value returns the first page and the `next_cursor` of the response "
+                "can be provided to fetch the next one. Unlike the other pagination "
+                "styles, fetching a page deep into the table is as fast as fetching "
+                "the first one and the total count is not calculated. Can be "
+                "combined with the `size` parameter.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -251,13 +277,16 @@ class GridViewView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            LIMIT_LINK_ROW_VALUES_API_PARAM,
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
+            "The response is paginated either by a limit/offset, page/size or "
+            "cursor/size style. "
             "The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
@@ -293,6 +322,7 @@ class GridViewView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
                 ]
             ),
             404: get_error_schema(
@@ -313,12 +343,13 @@ class GridViewView(APIView):
         }
     )
     @allowed_includes("field_options", "row_metadata")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(ListViewRowsQueryParamSerializer, return_validated=True)
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will
+        be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
@@ -360,6 +391,7 @@ class GridViewView(APIView):
             search=query_params.get("search"),
             search_mode=query_params.get("search_mode"),
             model=model,
+            limit_link_row_values=query_params["limit_link_row_values"],
         )
 
         if order_by is not None:
@@ -368,13 +400,30 @@ class GridViewView(APIView):
         if adhoc_filters.has_any_filters:
             queryset = adhoc_filters.apply_to_queryset(model, queryset)
 
-        if "count" in request.GET:
-            return Response({"count": queryset.count()})
+        paginate_by_keyset = KeysetPagination.is_requested(request)
+        # The exact count is calculated by the paginators themselves, so that a
+        # page out of range is still rejected.
+        count = None
+        count_mode = query_params["count_mode"]
+        if "count" in request.GET or (
+            not paginate_by_keyset and count_mode != ROW_COUNT_MODE_EXACT
+        ):
+            count, count_mode = view_handler.get_row_count(
+                view,
+                queryset,
+                count_mode,
+                search=query_params.get("search"),
+                adhoc_filters=adhoc_filters,
+            )
+            if "count" in request.GET:
+                return Response(get_row_count_response_data(request, count, count_mode))
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+        if paginate_by_keyset:
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
+            paginator = LimitOffsetPagination(count=count)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count=count)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -386,6 +435,14 @@ class GridViewView(APIView):
         serializer = serializer_class(page, many=True)
 
         response = paginator.get_paginated_response(serializer.data)
+        if not paginate_by_keyset:
+            response.data.update(
+                get_row_count_response_data(
+                    request,
+                    response.data["count"] if count is None else count,
+                    count_mode,
+                )
+            )
 
         if view_type.can_group_by and view.viewgroupby_set.all():
             group_by_fields = [
@@ -409,7 +466,12 @@ class GridViewView(APIView):
 
         if row_metadata:
             row_metadata = row_metadata_registry.generate_and_merge_metadata_for_rows(
-                request.user, view.table, (row.id for row in page)
+                request.user,
+                view.table,
+                (row.id for row in page),
+                opt_in_types=[LinkRowValuesCountMetadataType.type]
+                if query_params["limit_link_row_values"]
+                else None,
             )
             response.data.update(row_metadata=row_metadata)
 
@@ -819,6 +881,17 @@ class PublicGridViewRowsView(APIView):
                 description="Can only be used in combination with the `page` parameter "
                 "and defines how many rows should be returned.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="Enables the keyset pagination if provided. An empty "
+                "value returns the first page and the `next_cursor` of the response "
+                "can be provided to fetch the next one. Unlike the other pagination "
+                "styles, fetching a page deep into the table is as fast as fetching "
+                "the first one and the total count is not calculated. Can be "
+                "combined with the `size` parameter.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -922,13 +995,16 @@ class PublicGridViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            LIMIT_LINK_ROW_VALUES_API_PARAM,
         ],
         tags=["Database table grid view"],
         operation_id="public_list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
+            "The response is paginated either by a limit/offset, page/size or "
+            "cursor/size style. "
             "The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
@@ -959,6 +1035,7 @@ class PublicGridViewRowsView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
                 ]
             ),
             401: get_error_schema(["ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW"]),
@@ -981,14 +1058,15 @@ class PublicGridViewRowsView(APIView):
         }
     )
     @allowed_includes("field_options")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(ListViewRowsQueryParamSerializer, return_validated=True)
     def get(
         self, request: Request, slug: str, field_options: bool, query_params
     ) -> Response:
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will
+        be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -1002,7 +1080,7 @@ class PublicGridViewRowsView(APIView):
         exclude_fields = request.GET.get("exclude_fields")
         adhoc_filters = AdHocFilters.from_request(request)
 
-        count = "count" in request.GET
+        count_only = "count" in request.GET
 
         view_handler = ViewHandler()
         view = view_handler.get_public_view_by_slug(
@@ -1029,15 +1107,33 @@ class PublicGridViewRowsView(APIView):
             adhoc_filters=adhoc_filters,
             table_model=model,
             view_type=view_type,
+            limit_link_row_values=query_params["limit_link_row_values"],
         )
 
-        if count:
-            return Response({"count": queryset.count()})
+        paginate_by_keyset = KeysetPagination.is_requested(request)
+        # The exact count is calculated by the paginators themselves, so that a
+        # page out of range is still rejected.
+        count = None
+        count_mode = query_params["count_mode"]
+        if count_only or (
+            not paginate_by_keyset and count_mode != ROW_COUNT_MODE_EXACT
+        ):
+            count, count_mode = view_handler.get_row_count(
+                view,
+                queryset,
+                count_mode,
+                search=search,
+                adhoc_filters=adhoc_filters,
+            )
+            if count_only:
+                return Response(get_row_count_response_data(request, count, count_mode))
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+        if paginate_by_keyset:
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
+            paginator = LimitOffsetPagination(count=count)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count=count)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -1045,6 +1141,14 @@ class PublicGridViewRowsView(APIView):
         )
         serializer = serializer_class(page, many=True)
         response = paginator.get_paginated_response(serializer.data)
+        if not paginate_by_keyset:
+            response.data.update(
+                get_row_count_response_data(
+                    request,
+                    response.data["count"] if count is None else count,
+                    count_mode,
+                )
+            )
 
         if field_options:
             context = {"field_options": publicly_visible_field_options}
@@ -8,10 +8,12 @@ from drf_spectacular.openapi import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import serialize_validation_errors_recursive
 from baserow.contrib.database.api.constants import PUBLIC_PLACEHOLDER_ENTITY_ID
 from baserow.contrib.database.api.fields.serializers import FieldSerializer
 from baserow.contrib.database.api.serializers import TableSerializer
+from baserow.contrib.database.constants import ROW_COUNT_MODE_EXACT, ROW_COUNT_MODES
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
     FILTER_TYPE_OR,
@@ -48,6 +50,18 @@ class ListQueryParamatersSerializer(serializers.Serializer):
     )
 
 
+class LimitLinkRowValuesQueryParamSerializer(SearchQueryParamSerializer):
+    limit_link_row_values = serializers.BooleanField(required=False, default=False)
+
+
+class ListViewRowsQueryParamSerializer(LimitLinkRowValuesQueryParamSerializer):
+    count_mode = serializers.ChoiceField(
+        required=False,
+        default=ROW_COUNT_MODE_EXACT,
+        choices=ROW_COUNT_MODES,
+    )
+
+
 class FieldOptionsField(serializers.Field):
     default_error_messages = {
         "invalid_key": "Field option key must be numeric.",
@@ -8,6 +8,7 @@ from .views import (
     PublicViewAuthView,
     PublicViewInfoView,
     PublicViewLinkRowFieldLookupView,
+    PublicViewLinkRowValuesView,
     RotateViewSlugView,
     ViewDecorationsView,
     ViewDecorationView,
@@ -36,6 +37,12 @@ urlpatterns = view_type_registry.api_urls + [
         PublicViewLinkRowFieldLookupView.as_view(),
         name="link_row_field_lookup",
     ),
+    re_path(
+        r"(?P<slug>[-\w]+)/link-row-values/(?P<row_id>[0-9]+)/"
+        r"(?P<field_id>[0-9]+)/$",
+        PublicViewLinkRowValuesView.as_view(),
+        name="link_row_values",
+    ),
     re_path(
         r"filter/(?P<view_filter_id>[0-9]+)/$",
         ViewFilterView.as_view(),
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from django.conf import settings
 
@@ -19,3 +19,24 @@ def get_public_view_authorization_token(request: Request) -> Optional[str]:
     except (AttributeError, ValueError):
         return None
     return token
+
+
+def get_row_count_response_data(
+    request: Request, count: int, count_mode: str
+) -> Dict[str, Any]:
+    """
+    Returns the row count data that must be included in the response of a list
+    rows endpoint. The count mode describing whether the count is exact, estimated
+    or capped is only included if a `count_mode` was requested, to keep the
+    response the same for the existing clients.
+
+    :param request: The request listing the rows.
+    :param count: The number of rows.
+    :param count_mode: The count mode returned by `ViewHandler.get_row_count`.
+    :return: The data to add to the response.
+    """
+
+    data = {"count": count}
+    if "count_mode" in request.GET:
+        data["count_mode"] = count_mode
+    return data
@@ -9,6 +9,7 @@ from django.db.models import ObjectDoesNotExist
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -42,6 +43,7 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_NOT_IN_TABLE,
 )
 from baserow.contrib.database.api.fields.serializers import LinkRowValueSerializer
+from baserow.contrib.database.api.rows.errors import ERROR_ROW_DOES_NOT_EXIST
 from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
 from baserow.contrib.database.api.views.serializers import (
     CreateViewGroupBySerializer,
@@ -55,6 +57,7 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, LinkRowField
+from baserow.contrib.database.rows.exceptions import RowDoesNotExist
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.actions import (
@@ -1980,6 +1983,116 @@ class PublicViewLinkRowFieldLookupView(APIView):
         return paginator.get_paginated_response(serializer.data)
 
 
+class PublicViewLinkRowValuesView(APIView):
+    permission_classes = (AllowAny,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="slug",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.STR,
+                required=True,
+                description="The slug related to the view.",
+            ),
+            OpenApiParameter(
+                name="row_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                required=True,
+                description="The id of the row to fetch the linked rows of.",
+            ),
+            OpenApiParameter(
+                name="field_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                required=True,
+                description="The field id of the link row field.",
+            ),
+            OpenApiParameter(
+                name="limit",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum number of linked rows to return.",
+            ),
+            OpenApiParameter(
+                name="offset",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The offset of the linked rows to return.",
+            ),
+        ],
+        tags=["Database table views"],
+        operation_id="database_table_public_view_link_row_values",
+        description=(
+            "If the view is publicly shared or if an authenticated user has access to "
+            "the related workspace, then this endpoint lists the rows linked to a row "
+            "that is visible in the view, in a link row field that is visible in the "
+            "view. This can be used to fetch the linked rows that are not included "
+            "when listing the public rows with `limit_link_row_values`, because the "
+            "field has a `link_row_values_limit`."
+        ),
+        responses={
+            200: get_example_pagination_serializer_class(LinkRowValueSerializer),
+            401: get_error_schema(["ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW"]),
+            404: get_error_schema(
+                [
+                    "ERROR_VIEW_DOES_NOT_EXIST",
+                    "ERROR_ROW_DOES_NOT_EXIST",
+                    "ERROR_FIELD_DOES_NOT_EXIST",
+                ]
+            ),
+        },
+    )
+    @map_exceptions(
+        {
+            ViewDoesNotExist: ERROR_VIEW_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            NoAuthorizationToPubliclySharedView: ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
+        }
+    )
+    def get(self, request: Request, slug: str, row_id: int, field_id: int) -> Response:
+        handler = ViewHandler()
+        view = handler.get_public_view_by_slug(
+            request.user,
+            slug,
+            authorization_token=get_public_view_authorization_token(request),
+        ).specific
+        view_type = view_type_registry.get_by_model(view)
+
+        if not view_type.can_share:
+            raise ViewDoesNotExist("View does not exist.")
+
+        link_row_field_content_type = ContentType.objects.get_for_model(LinkRowField)
+
+        try:
+            field_option = view_type.get_visible_field_options_in_order(view).get(
+                field_id=field_id, field__content_type=link_row_field_content_type
+            )
+        except ObjectDoesNotExist as exc:
+            raise FieldDoesNotExist("The view field option does not exist.") from exc
+
+        # The row must be visible in the view, so the filters of the view are
+        # applied.
+        queryset, _, _ = handler.get_public_rows_queryset_and_field_ids(
+            view, view_type=view_type
+        )
+        row = queryset.filter(id=row_id).first()
+        if row is None:
+            raise RowDoesNotExist(row_id)
+
+        paginator = LimitOffsetPagination()
+        paginator.max_limit = settings.ROW_PAGE_SIZE_LIMIT
+        paginator.default_limit = settings.ROW_PAGE_SIZE_LIMIT
+
+        linked_rows = getattr(row, field_option.field.db_column).all()
+        page = paginator.paginate_queryset(linked_rows, request, self)
+        return paginator.get_paginated_response(
+            LinkRowValueSerializer(page, many=True).data
+        )
+
+
 class PublicViewAuthView(APIView):
     """
     This view is used to authenticate an user against a password
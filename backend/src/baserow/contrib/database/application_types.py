@@ -36,6 +36,7 @@ from baserow.core.utils import ChildProgressBuilder, grouper
 
 from .constants import IMPORT_SERIALIZED_IMPORTING, IMPORT_SERIALIZED_IMPORTING_TABLE
 from .db.atomic import read_repeatable_single_database_atomic_transaction
+from .db.copy_rows import copy_table_relations, copy_table_rows
 from .export_serialized import DatabaseExportSerializedStructure
 from .fields.deferred_field_fk_updater import DeferredFieldFkUpdater
 from .search.handler import SearchHandler
@@ -51,6 +52,9 @@ class DatabaseApplicationType(ApplicationType):
     # Mark the request serializer field names as empty, otherwise
     # the polymorphic request serializer will try and serialize tables.
     request_serializer_field_names = []
+    # The amount of serialized rows that are converted and inserted together when
+    # importing a table.
+    IMPORT_ROWS_CHUNK_SIZE = 512
 
     def pre_delete(self, database):
         """
@@ -117,6 +121,10 @@ class DatabaseApplicationType(ApplicationType):
                 row_queryset = row_queryset.select_related("created_by")
             if table.last_modified_by_column_added:
                 row_queryset = row_queryset.select_related("last_modified_by")
+            # The rows will be copied directly in the database when importing, so
+            # there is no need to serialize them.
+            if import_export_config.copy_rows_in_database:
+                row_queryset = row_queryset.none()
             for row in row_queryset:
                 serialized_row = DatabaseExportSerializedStructure.row(
                     id=row.id,
@@ -197,6 +205,7 @@ class DatabaseApplicationType(ApplicationType):
         self,
         serialized_tables: List[Dict[str, Any]],
         external_table_fields_to_import: List[Tuple[Table, Dict[str, Any]]] = None,
+        copy_rows_in_database: bool = False,
     ) -> int:
         return (
             +
@@ -221,6 +230,8 @@ class DatabaseApplicationType(ApplicationType):
                 ]
             )
             + len(external_table_fields_to_import or [])
+            # Copying the rows and the relations of every table in the database
+            + (2 * len(serialized_tables) if copy_rows_in_database else 0)
         )
 
     def init_application(self, user, application: Database) -> None:
@@ -276,7 +287,9 @@ class DatabaseApplicationType(ApplicationType):
         """
 
         child_total = self._ops_count_for_import_tables_serialized(
-            serialized_tables, external_table_fields_to_import
+            serialized_tables,
+            external_table_fields_to_import,
+            import_export_config.copy_rows_in_database,
         )
         progress = ChildProgressBuilder.build(progress_builder, child_total=child_total)
 
@@ -446,17 +459,82 @@ class DatabaseApplicationType(ApplicationType):
 
             progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
 
-        # Now that everything is in place we can start filling the table with the rows
-        # in an efficient matter by using the bulk_create functionality.
+        if import_export_config.copy_rows_in_database:
+            self._copy_tables_rows_in_database(
+                serialized_tables,
+                id_mapping,
+                workspace_id_for_user_references,
+                progress.create_child_builder(
+                    represents_progress=2 * len(serialized_tables)
+                ),
+            )
+
+        # Now that everything is in place we can start filling the tables with the
+        # rows. This is a separate phase that has to be completed before the
+        # relations and formulas are finalized below.
+        self._import_tables_rows(
+            serialized_tables,
+            id_mapping,
+            user_email_mapping,
+            files_zip,
+            storage,
+            progress,
+        )
+
+        # The progress off `apply_updates_and_get_updated_fields` takes 5% of the
+        # total progress of this import.
+        for field_type, field_instance in all_fields:
+            update_collector = FieldUpdateCollector(field_instance.table)
+            field_type.after_rows_imported(
+                field_instance, update_collector, field_cache, []
+            )
+            update_collector.apply_updates_and_get_updated_fields(
+                field_cache, skip_search_updates=True
+            )
+            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+
+        # Finally, now that everything has been created, loop over the
+        # `serialization_processor_registry` registry and ensure extra
+        # metadata is imported too.
+        source_workspace = Workspace.objects.get(pk=id_mapping["import_workspace_id"])
+        for serialized_table in serialized_tables:
+            table = serialized_table["_object"]
+            if not import_export_config.reduce_disk_space_usage:
+                SearchHandler.entire_field_values_changed_or_created(table)
+            for (
+                serialized_structure_processor
+            ) in serialization_processor_registry.get_all():
+                serialized_structure_processor.import_serialized(
+                    source_workspace, table, serialized_table, import_export_config
+                )
+
+        return imported_tables
+
+    def _import_tables_rows(
+        self,
+        serialized_tables: List[Dict[str, Any]],
+        id_mapping: Dict[str, Any],
+        user_email_mapping: Dict[str, Any],
+        files_zip: Optional[ZipFile],
+        storage: Optional[Storage],
+        progress: ChildProgressBuilder,
+    ):
+        """
+        Inserts the serialized rows of every table into the newly created table
+        models. The tables are loaded one after another because the whole import
+        runs in the transaction of the job, which can't be shared with other
+        connections. The rows of a table are converted and inserted in chunks, so
+        that the model instances of a big table never have to be kept in memory
+        all at once. The sequences of all the tables are reset in one statement at
+        the end.
+        """
+
         table_cache: Dict[str, Any] = {}
         already_filled_up_through_table_names = set()
+        table_models = []
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
-            rows_to_be_inserted = []
-            # Holds a mapping where the key is a model, and the value a list of
-            # objects that must be inserted. These objects are returned by the
-            # `set_import_serialized_value`, and will typically hold m2m relationships.
-            additional_objects_to_be_inserted = defaultdict(list)
+            table_models.append(table_model)
 
             m2m_fields_to_not_import_as_already_done = set()
             for field in table_model._meta.get_fields():
@@ -468,54 +546,41 @@ class DatabaseApplicationType(ApplicationType):
                     else:
                         already_filled_up_through_table_names.add(db_table)
 
-            for serialized_row in serialized_table["rows"]:
-                created_on = serialized_row.get("created_on")
-                updated_on = serialized_row.get("updated_on")
-
-                if created_on:
-                    created_on = datetime.fromisoformat(created_on)
-                else:
-                    created_on = timezone.now()
-
-                if updated_on:
-                    updated_on = datetime.fromisoformat(updated_on)
-                else:
-                    updated_on = timezone.now()
-
-                created_by_email = serialized_row.get("created_by", None)
-                created_by = (
-                    user_email_mapping.get(created_by_email, None)
-                    if created_by_email
-                    else None
-                )
-
-                last_modified_by_email = serialized_row.get("last_modified_by", None)
-                last_modified_by = (
-                    user_email_mapping.get(last_modified_by_email, None)
-                    if last_modified_by_email
-                    else None
+            # Resolve the field types and names once per table instead of once per
+            # row and field.
+            fields_to_import = []
+            for serialized_field in serialized_table["fields"]:
+                new_field_id = id_mapping["database_fields"][serialized_field["id"]]
+                new_field_name = f"field_{new_field_id}"
+                if new_field_name in m2m_fields_to_not_import_as_already_done:
+                    continue
+                fields_to_import.append(
+                    (
+                        field_type_registry.get(serialized_field["type"]),
+                        f'field_{serialized_field["id"]}',
+                        new_field_name,
+                    )
                 )
 
-                row_instance = table_model(
-                    id=serialized_row["id"],
-                    order=serialized_row["order"],
-                    created_on=created_on,
-                    updated_on=updated_on,
-                    created_by=created_by,
-                    last_modified_by=last_modified_by,
-                )
+            state = f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
+            for serialized_rows in grouper(
+                self.IMPORT_ROWS_CHUNK_SIZE, serialized_table["rows"]
+            ):
+                rows_to_be_inserted = []
+                # Holds a mapping where the key is a model, and the value a list of
+                # objects that must be inserted. These objects are returned by the
+                # `set_import_serialized_value`, and will typically hold m2m
+                # relationships.
+                additional_objects_to_be_inserted = defaultdict(list)
+
+                for serialized_row in serialized_rows:
+                    row_instance = self._get_row_instance_to_import(
+                        table_model, serialized_row, user_email_mapping
+                    )
+                    for field_type, field_name, new_field_name in fields_to_import:
+                        if field_name not in serialized_row:
+                            continue
 
-                for serialized_field in serialized_table["fields"]:
-                    field_type = field_type_registry.get(serialized_field["type"])
-                    new_field_id = id_mapping["database_fields"][serialized_field["id"]]
-                    new_field_name = f"field_{new_field_id}"
-                    field_name = f'field_{serialized_field["id"]}'
-
-                    if (
-                        field_name in serialized_row
-                        and new_field_name
-                        not in m2m_fields_to_not_import_as_already_done
-                    ):
                         related_objects_to_save = (
                             field_type.set_import_serialized_value(
                                 row_instance,
@@ -527,69 +592,140 @@ class DatabaseApplicationType(ApplicationType):
                                 storage,
                             )
                         )
+                        for additional_object in related_objects_to_save or []:
+                            additional_objects_to_be_inserted[
+                                additional_object._meta.model
+                            ].append(additional_object)
+
+                    rows_to_be_inserted.append(row_instance)
+                progress.increment(len(rows_to_be_inserted), state=state)
+
+                # We want to insert the rows in bulk because there could potentially
+                # be hundreds of thousands of rows in there and this will result in
+                # better performance.
+                table_model.objects.bulk_create(
+                    rows_to_be_inserted, batch_size=self.IMPORT_ROWS_CHUNK_SIZE
+                )
+                progress.increment(len(rows_to_be_inserted), state=state)
+
+                # Every row import can have additional objects that must be
+                # inserted, like for example the m2m relationships. We want to
+                # efficiently import them in bulk here.
+                for model, objects in additional_objects_to_be_inserted.items():
+                    model.objects.bulk_create(
+                        objects, batch_size=self.IMPORT_ROWS_CHUNK_SIZE
+                    )
 
-                        if related_objects_to_save is not None:
-                            for additional_object in related_objects_to_save:
-                                additional_objects_to_be_inserted[
-                                    additional_object._meta.model
-                                ].append(additional_object)
+        # When the rows are inserted we keep the provide the old ids and because of
+        # that the auto increment is still set at `1`. This needs to be set to the
+        # maximum value because otherwise creating a new row could later fail.
+        if table_models:
+            sequence_sql = connection.ops.sequence_reset_sql(no_style(), table_models)
+            with connection.cursor() as cursor:
+                cursor.execute(";".join(sequence_sql))
 
-                rows_to_be_inserted.append(row_instance)
-                progress.increment(
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
-                )
+    def _get_row_instance_to_import(
+        self,
+        table_model,
+        serialized_row: Dict[str, Any],
+        user_email_mapping: Dict[str, Any],
+    ):
+        """
+        Returns a not yet saved row instance having the metadata of the serialized
+        row. The values of the fields must still be set.
+        """
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
-                progress.increment(
-                    len(chunk),
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}",
-                )
+        created_on = serialized_row.get("created_on")
+        updated_on = serialized_row.get("updated_on")
 
-            # Every row import can have additional objects that must be inserted,
-            # like for example the m2m relationships. We want to efficiently import
-            # them in bulk here.
-            for model, objects in additional_objects_to_be_inserted.items():
-                model.objects.bulk_create(objects, batch_size=512)
+        if created_on:
+            created_on = datetime.fromisoformat(created_on)
+        else:
+            created_on = timezone.now()
 
-            # When the rows are inserted we keep the provide the old ids and because of
-            # that the auto increment is still set at `1`. This needs to be set to the
-            # maximum value because otherwise creating a new row could later fail.
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [table_model])
-            with connection.cursor() as cursor:
-                cursor.execute(sequence_sql[0])
+        if updated_on:
+            updated_on = datetime.fromisoformat(updated_on)
+        else:
+            updated_on = timezone.now()
 
-        # The progress off `apply_updates_and_get_updated_fields` takes 5% of the
-        # total progress of this import.
-        for field_type, field_instance in all_fields:
-            update_collector = FieldUpdateCollector(field_instance.table)
-            field_type.after_rows_imported(
-                field_instance, update_collector, field_cache, []
-            )
-            update_collector.apply_updates_and_get_updated_fields(
-                field_cache, skip_search_updates=True
-            )
-            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+        created_by_email = serialized_row.get("created_by", None)
+        created_by = (
+            user_email_mapping.get(created_by_email, None) if created_by_email else None
+        )
 
-        # Finally, now that everything has been created, loop over the
-        # `serialization_processor_registry` registry and ensure extra
-        # metadata is imported too.
-        source_workspace = Workspace.objects.get(pk=id_mapping["import_workspace_id"])
+        last_modified_by_email = serialized_row.get("last_modified_by", None)
+        last_modified_by = (
+            user_email_mapping.get(last_modified_by_email, None)
+            if last_modified_by_email
+            else None
+        )
+
+        return table_model(
+            id=serialized_row["id"],
+            order=serialized_row["order"],
+            created_on=created_on,
+            updated_on=updated_on,
+            created_by=created_by,
+            last_modified_by=last_modified_by,
+        )
+
+    def _copy_tables_rows_in_database(
+        self,
+        serialized_tables: List[Dict[str, Any]],
+        id_mapping: Dict[str, Any],
+        workspace_id_for_user_references: Optional[int],
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ):
+        """
+        Copies the rows and relations of the exported tables into the newly created
+        tables using `INSERT ... SELECT` statements, without loading them in memory.
+        This is used instead of importing the serialized rows when the export has
+        been made with the `copy_rows_in_database` config.
+        """
+
+        select_option_mapping = id_mapping.get("database_field_select_options", {})
+        tables_to_copy = []
         for serialized_table in serialized_tables:
-            table = serialized_table["_object"]
-            if not import_export_config.reduce_disk_space_usage:
-                SearchHandler.entire_field_values_changed_or_created(table)
-            for (
-                serialized_structure_processor
-            ) in serialization_processor_registry.get_all():
-                serialized_structure_processor.import_serialized(
-                    source_workspace, table, serialized_table, import_export_config
+            source_table = Table.objects_and_trash.get(id=serialized_table["id"])
+            field_names_mapping = {
+                f"field_{id_mapping['database_fields'][serialized_field['id']]}": (
+                    f"field_{serialized_field['id']}"
                 )
+                for serialized_field in serialized_table["fields"]
+            }
+            tables_to_copy.append(
+                (
+                    source_table.get_model(add_dependencies=False),
+                    serialized_table["_model"],
+                    field_names_mapping,
+                )
+            )
 
-        return imported_tables
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=2 * len(tables_to_copy)
+        )
+        for source_model, target_model, field_names_mapping in tables_to_copy:
+            copy_table_rows(
+                source_model,
+                target_model,
+                field_names_mapping,
+                select_option_mapping,
+                workspace_id_for_user_references,
+                progress_builder=progress.create_child_builder(represents_progress=1),
+            )
+
+        # The relations can only be copied once the rows of all the tables exist.
+        already_copied_through_tables = set()
+        for source_model, target_model, field_names_mapping in tables_to_copy:
+            copy_table_relations(
+                source_model,
+                target_model,
+                field_names_mapping,
+                select_option_mapping,
+                workspace_id_for_user_references,
+                already_copied_through_tables,
+            )
+            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
 
     def import_serialized(
         self,
@@ -416,8 +416,10 @@ class DatabaseConfig(AppConfig):
         page_registry.register(RowPageType())
 
         from .export.table_exporters.csv_table_exporter import CsvTableExporter
+        from .export.table_exporters.parquet_table_exporter import ParquetTableExporter
 
         table_exporter_registry.register(CsvTableExporter())
+        table_exporter_registry.register(ParquetTableExporter())
 
         from .trash.trash_types import (
             FieldTrashableItemType,
@@ -453,6 +455,11 @@ class DatabaseConfig(AppConfig):
         webhook_event_type_registry.register(RowsDeletedEventType())
         webhook_event_type_registry.register(RowDeletedEventType())
 
+        from .rows.registries import row_metadata_registry
+        from .rows.row_metadata_types import LinkRowValuesCountMetadataType
+
+        row_metadata_registry.register(LinkRowValuesCountMetadataType())
+
         from .airtable.airtable_column_types import (
             CheckboxAirtableColumnType,
             CountAirtableColumnType,
@@ -504,7 +511,7 @@ class DatabaseConfig(AppConfig):
         from baserow.core.jobs.registries import job_type_registry
 
         from .airtable.job_types import AirtableImportJobType
-        from .fields.job_types import DuplicateFieldJobType
+        from .fields.job_types import ConvertFieldJobType, DuplicateFieldJobType
         from .file_import.job_types import FileImportJobType
         from .table.job_types import DuplicateTableJobType
 
@@ -512,6 +519,7 @@ class DatabaseConfig(AppConfig):
         job_type_registry.register(FileImportJobType())
         job_type_registry.register(DuplicateTableJobType())
         job_type_registry.register(DuplicateFieldJobType())
+        job_type_registry.register(ConvertFieldJobType())
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
         pre_migrate.connect(clear_generated_model_cache_receiver, sender=self)
@@ -769,6 +777,7 @@ class DatabaseConfig(AppConfig):
         pre_migrate.connect(clear_generated_model_cache_receiver, sender=self)
 
         import baserow.contrib.database.fields.tasks  # noqa: F401
+        import baserow.contrib.database.rows.change_log  # noqa: F401
         import baserow.contrib.database.rows.history  # noqa: F401
         import baserow.contrib.database.rows.tasks  # noqa: F401
         import baserow.contrib.database.search.tasks  # noqa: F401
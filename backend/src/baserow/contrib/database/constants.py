@@ -1,2 +1,10 @@
 IMPORT_SERIALIZED_IMPORTING = "importing"
 IMPORT_SERIALIZED_IMPORTING_TABLE = "importing-table-"
+
+# The ways the number of rows of a view can be counted. `estimate` returns the
+# estimate of the query planner and `capped` stops counting at
+# `BASEROW_CAPPED_ROW_COUNT_LIMIT`.
+ROW_COUNT_MODE_EXACT = "exact"
+ROW_COUNT_MODE_ESTIMATE = "estimate"
+ROW_COUNT_MODE_CAPPED = "capped"
+ROW_COUNT_MODES = [ROW_COUNT_MODE_EXACT, ROW_COUNT_MODE_ESTIMATE, ROW_COUNT_MODE_CAPPED]
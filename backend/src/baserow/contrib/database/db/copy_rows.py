@@ -0,0 +1,280 @@
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import ForeignKey, ManyToManyField, Model
+
+from psycopg2 import sql
+
+from baserow.contrib.database.constants import IMPORT_SERIALIZED_IMPORTING
+from baserow.contrib.database.fields.models import SelectOption
+from baserow.contrib.database.table.constants import TSV_FIELD_PREFIX
+from baserow.core.models import WorkspaceUser
+from baserow.core.utils import ChildProgressBuilder
+
+# The maximum amount of rows copied by a single `INSERT ... SELECT` statement.
+COPY_ROWS_CHUNK_SIZE = 10000
+
+User = get_user_model()
+
+
+def _source_column(column: str) -> sql.Composable:
+    return sql.SQL("src.{}").format(sql.Identifier(column))
+
+
+def _workspace_users_subquery(workspace_id: int) -> Tuple[sql.Composable, List[Any]]:
+    return (
+        sql.SQL("SELECT user_id FROM {} WHERE workspace_id = %s").format(
+            sql.Identifier(WorkspaceUser._meta.db_table)
+        ),
+        [workspace_id],
+    )
+
+
+def _get_m2m_through_columns(
+    model: Type[Model], field: ManyToManyField
+) -> Tuple[str, str]:
+    """
+    Returns the columns of the through table of the provided many to many field
+    holding the id of the row and the id of the related object.
+    """
+
+    is_referencing_the_same_table = field.model == field.related_model
+    row_column, value_column = None, None
+    for through_field in field.remote_field.through._meta.get_fields():
+        if type(through_field) is not ForeignKey:
+            continue
+
+        if is_referencing_the_same_table:
+            # Django creates `from_tableXmodel` and `to_tableXmodel` columns for
+            # self-referencing many to many relations.
+            if through_field.name.startswith("from_"):
+                row_column = through_field.column
+            else:
+                value_column = through_field.column
+        elif through_field.remote_field.model == model:
+            row_column = through_field.column
+        else:
+            value_column = through_field.column
+
+    return row_column, value_column
+
+
+def copy_table_rows(
+    source_model: Type[Model],
+    target_model: Type[Model],
+    field_names_mapping: Dict[str, str],
+    select_option_mapping: Dict[int, int],
+    workspace_id: Optional[int] = None,
+    chunk_size: int = COPY_ROWS_CHUNK_SIZE,
+    progress_builder: Optional[ChildProgressBuilder] = None,
+):
+    """
+    Copies all the non trashed rows of the source table into the target table using
+    `INSERT ... SELECT` statements, so that the rows never have to be loaded in
+    memory. The row ids are kept. The ids of the select options are remapped and the
+    user references are only kept if the user belongs to the workspace. The many to
+    many relations must be copied afterwards with `copy_table_relations`.
+
+    :param source_model: The model of the table to copy the rows from.
+    :param target_model: The model of the table to copy the rows into.
+    :param field_names_mapping: The name of the source field for every user field of
+        the target model.
+    :param select_option_mapping: The new select option id for every old one.
+    :param workspace_id: The workspace the referenced users must belong to. If not
+        provided, the user references are not copied.
+    :param chunk_size: The maximum amount of rows copied by a single statement.
+    :param progress_builder: An optional progress builder, incremented for every
+        copied chunk.
+    """
+
+    target_columns, select_expressions, select_params = [], [], []
+    joins, join_params = [], []
+
+    for target_field in target_model._meta.concrete_fields:
+        if TSV_FIELD_PREFIX in target_field.attname:
+            continue
+
+        source_name = field_names_mapping.get(target_field.name, target_field.name)
+        try:
+            source_field = source_model._meta.get_field(source_name)
+        except FieldDoesNotExist:
+            source_field = None
+
+        if source_field is None or not source_field.concrete:
+            if target_field.has_default():
+                target_columns.append(target_field.column)
+                select_expressions.append(sql.SQL("%s"))
+                select_params.append(
+                    target_field.get_db_prep_save(
+                        target_field.get_default(), connection
+                    )
+                )
+            continue
+
+        source_column = _source_column(source_field.column)
+        related_model = (
+            target_field.remote_field.model
+            if isinstance(target_field, ForeignKey)
+            else None
+        )
+
+        if related_model is SelectOption:
+            alias = sql.Identifier(f"m{len(joins)}")
+            joins.append(
+                sql.SQL(
+                    "LEFT JOIN unnest(%s::int[], %s::int[]) AS {alias}(old_id, new_id) "
+                    "ON {alias}.old_id = {column}"
+                ).format(alias=alias, column=source_column)
+            )
+            join_params += [
+                list(select_option_mapping.keys()),
+                list(select_option_mapping.values()),
+            ]
+            select_expression = sql.SQL("{}.new_id").format(alias)
+        elif related_model is User:
+            if workspace_id is None:
+                continue
+            subquery, params = _workspace_users_subquery(workspace_id)
+            select_expression = sql.SQL(
+                "CASE WHEN {column} IN ({subquery}) THEN {column} END"
+            ).format(column=source_column, subquery=subquery)
+            select_params += params
+        else:
+            select_expression = source_column
+
+        target_columns.append(target_field.column)
+        select_expressions.append(select_expression)
+
+    statement = sql.SQL(
+        "INSERT INTO {target} ({columns}) SELECT {expressions} FROM {source} AS src "
+        "{joins} WHERE NOT src.trashed AND src.id > %s AND src.id <= %s"
+    ).format(
+        target=sql.Identifier(target_model._meta.db_table),
+        columns=sql.SQL(", ").join(map(sql.Identifier, target_columns)),
+        expressions=sql.SQL(", ").join(select_expressions),
+        source=sql.Identifier(source_model._meta.db_table),
+        joins=sql.SQL(" ").join(joins),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql.SQL("SELECT min(id), max(id) FROM {} WHERE NOT trashed").format(
+                sql.Identifier(source_model._meta.db_table)
+            )
+        )
+        min_id, max_id = cursor.fetchone()
+        chunk_starts = (
+            range(min_id - 1, max_id, chunk_size) if min_id is not None else range(0)
+        )
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=max(len(chunk_starts), 1)
+        )
+        if not chunk_starts:
+            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+            return
+
+        for start in chunk_starts:
+            cursor.execute(
+                statement, [*select_params, *join_params, start, start + chunk_size]
+            )
+            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+
+
+def copy_table_relations(
+    source_model: Type[Model],
+    target_model: Type[Model],
+    field_names_mapping: Dict[str, str],
+    select_option_mapping: Dict[int, int],
+    workspace_id: Optional[int] = None,
+    already_copied_through_tables: Optional[Set[str]] = None,
+):
+    """
+    Copies the many to many relations of the source table into the through tables of
+    the target table, after the rows of all the related tables have been copied
+    with `copy_table_rows`. Relations to rows or select options that don't exist in
+    the target are skipped.
+
+    :param source_model: The model of the table to copy the relations from.
+    :param target_model: The model of the table to copy the relations into.
+    :param field_names_mapping: The name of the source field for every user field of
+        the target model.
+    :param select_option_mapping: The new select option id for every old one.
+    :param workspace_id: The workspace the referenced users must belong to. If not
+        provided, the relations to users are not copied.
+    :param already_copied_through_tables: The names of the through tables that have
+        already been filled, for example by the related link row field. The names of
+        the through tables filled by this function are added to it.
+    """
+
+    if already_copied_through_tables is None:
+        already_copied_through_tables = set()
+
+    for target_field in target_model._meta.many_to_many:
+        through_table = target_field.remote_field.through._meta.db_table
+        source_name = field_names_mapping.get(target_field.name)
+        if through_table in already_copied_through_tables or source_name is None:
+            continue
+        already_copied_through_tables.add(through_table)
+
+        try:
+            source_field = source_model._meta.get_field(source_name)
+        except FieldDoesNotExist:
+            continue
+        if not isinstance(source_field, ManyToManyField):
+            continue
+
+        source_row_column, source_value_column = _get_m2m_through_columns(
+            source_model, source_field
+        )
+        row_column, value_column = _get_m2m_through_columns(target_model, target_field)
+
+        source_value = _source_column(source_value_column)
+        related_model = target_field.related_model
+        join, params = sql.SQL(""), []
+        if related_model is SelectOption:
+            join = sql.SQL(
+                "JOIN unnest(%s::int[], %s::int[]) AS m(old_id, new_id) "
+                "ON m.old_id = {}"
+            ).format(source_value)
+            params += [
+                list(select_option_mapping.keys()),
+                list(select_option_mapping.values()),
+            ]
+            value_expression = sql.SQL("m.new_id")
+            value_filter = sql.SQL("TRUE")
+        elif related_model is User:
+            if workspace_id is None:
+                continue
+            value_expression = source_value
+            subquery, subquery_params = _workspace_users_subquery(workspace_id)
+            value_filter = sql.SQL("{} IN ({})").format(source_value, subquery)
+            params += subquery_params
+        else:
+            value_expression = source_value
+            value_filter = sql.SQL("{} IN (SELECT id FROM {})").format(
+                source_value, sql.Identifier(related_model._meta.db_table)
+            )
+
+        statement = sql.SQL(
+            "INSERT INTO {through} ({row_column}, {value_column}) "
+            "SELECT {source_row}, {value_expression} FROM {source_through} AS src "
+            "{join} WHERE {source_row} IN (SELECT id FROM {target}) "
+            "AND {value_filter} ORDER BY src.id"
+        ).format(
+            through=sql.Identifier(through_table),
+            row_column=sql.Identifier(row_column),
+            value_column=sql.Identifier(value_column),
+            source_row=_source_column(source_row_column),
+            value_expression=value_expression,
+            source_through=sql.Identifier(
+                source_field.remote_field.through._meta.db_table
+            ),
+            join=join,
+            target=sql.Identifier(target_model._meta.db_table),
+            value_filter=value_filter,
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(statement, params)
@@ -71,6 +71,7 @@ class PostgresqlLenientDatabaseSchemaEditor:
             self.execute(
                 sql_create_try_cast
                 % {
+                    "function": "pg_temp.try_cast",
                     "column": quoted_column_name,
                     "type": new_type,
                     "alter_column_prepare_old_value": alter_column_prepare_old_value,
@@ -2,7 +2,6 @@ import abc
 import time
 from typing import Any, Callable
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
 import unicodecsv as csv
@@ -11,6 +10,7 @@ from baserow.contrib.database.export.exceptions import ExportJobCanceledExceptio
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.utils import grouper
 
 
 class FileWriter(abc.ABC):
@@ -58,15 +58,25 @@ class FileWriter(abc.ABC):
     def get_csv_dict_writer(self, headers, **kwargs):
         return csv.DictWriter(self._file, headers, **kwargs)
 
+    def get_parquet_writer(self, schema, **kwargs):
+        # Imported here because pyarrow is only needed by the parquet exporter and
+        # slow to import.
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(self._file, schema, **kwargs)
+
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files in a memory efficient manner. The ids of the rows are
+    read in order through a server side cursor and the rows themselves are fetched
+    per chunk, so that the export time grows linearly with the number of rows. Also
+    updates the provided job as it progresses through any queryset writes every
+    EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    CHUNK_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -94,16 +104,43 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        total_rows = queryset.count()
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        previous_row = None
+        # The rows are written one behind, so that the last row is known for sure
+        # even if rows are created or deleted while exporting.
+        for row in self._iterate_rows(queryset):
+            if previous_row is not None:
                 i = i + 1
-                is_last_row = i == paginator.count
-                write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+                write_row(previous_row, False)
+                self._check_and_update_job(i, total_rows)
+            previous_row = row
+
+        if previous_row is not None:
+            i = i + 1
+            write_row(previous_row, True)
+            self._check_and_update_job(i, total_rows, is_last_row=True)
+
+    def _iterate_rows(self, queryset):
+        """
+        Yields the rows of the queryset in order. The ids are streamed using a server
+        side cursor, and the rows, including their prefetched relations, are fetched
+        per chunk of ids. Contrary to offset based pagination, every chunk query
+        is as fast as the previous one.
 
-    def _check_and_update_job(self, current_row, total_rows):
+        :param queryset: The queryset to iterate over.
+        """
+
+        ids = queryset.values_list("id", flat=True).iterator(chunk_size=self.CHUNK_SIZE)
+        for chunk_ids in grouper(self.CHUNK_SIZE, ids):
+            rows_by_id = {
+                row.id: row for row in queryset.filter(id__in=chunk_ids).order_by()
+            }
+            for row_id in chunk_ids:
+                if row_id in rows_by_id:
+                    yield rows_by_id[row_id]
+
+    def _check_and_update_job(self, current_row, total_rows, is_last_row=False):
         """
         Checks if enough time has passed and if so checks the state of the job and
         updates its progress percentage.
@@ -113,6 +150,7 @@ class PaginatedExportJobFileWriter(FileWriter):
         :param current_row: An int indicating the current row this export job has
             exported upto
         :param total_rows: An int of the total number of rows this job is exporting.
+        :param is_last_row: Indicates whether the current row is the last one.
         """
 
         current_time = time.perf_counter()
@@ -121,15 +159,20 @@ class PaginatedExportJobFileWriter(FileWriter):
         enough_time_has_passed = (
             current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
         )
-        is_last_row = current_row == total_rows
         if enough_time_has_passed or is_last_row:
             self.last_check = time.perf_counter()
-            self.job.refresh_from_db()
+            # Only the state and the progress are read and written, instead of
+            # refreshing and saving the entire job.
+            job_queryset = type(self.job).objects.filter(id=self.job.id)
+            self.job.state = job_queryset.values_list("state", flat=True).first()
             if self.job.is_cancelled_or_expired():
                 raise ExportJobCanceledException()
             else:
-                self.job.progress_percentage = current_row / total_rows * 100
-                self.job.save()
+                # Rows might have been created since the rows have been counted.
+                self.job.progress_percentage = (
+                    current_row / max(current_row, total_rows) * 100
+                )
+                job_queryset.update(progress_percentage=self.job.progress_percentage)
 
 
 class QuerysetSerializer(abc.ABC):
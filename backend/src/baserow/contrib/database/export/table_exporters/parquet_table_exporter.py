@@ -0,0 +1,191 @@
+import json
+from typing import Any, Callable, List, NamedTuple, Optional, Type
+
+from django.db import models
+
+from baserow.contrib.database.api.export.serializers import (
+    BaseExporterOptionsSerializer,
+    ParquetExporterOptionsSerializer,
+)
+from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
+from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.table.models import FieldObject
+from baserow.contrib.database.views.view_types import GridViewType
+
+
+class ParquetTableExporter(TableExporter):
+    type = "parquet"
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return ParquetExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
+
+
+class ParquetColumn(NamedTuple):
+    name: str
+    arrow_type: Any
+    get_value: Callable[[Any], Any]
+
+
+def get_arrow_type_for_model_field(model_field: models.Field) -> Optional[Any]:
+    """
+    Returns the Apache Arrow type matching the provided model field, or None if the
+    values of the model field can't be stored natively.
+
+    :param model_field: The model field of a field or the expression field of a
+        formula field.
+    """
+
+    import pyarrow as pa
+
+    model_field = getattr(model_field, "expression_field", model_field)
+
+    if isinstance(model_field, models.BooleanField):
+        return pa.bool_()
+    if isinstance(model_field, models.IntegerField):
+        return pa.int64()
+    if isinstance(model_field, models.DecimalField):
+        if model_field.max_digits <= 38:
+            return pa.decimal128(model_field.max_digits, model_field.decimal_places)
+        return pa.decimal256(model_field.max_digits, model_field.decimal_places)
+    if isinstance(model_field, models.FloatField):
+        return pa.float64()
+    # Must be checked before the date field because it's a subclass of it.
+    if isinstance(model_field, models.DateTimeField):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(model_field, models.DateField):
+        return pa.date32()
+    if isinstance(model_field, models.DurationField):
+        return pa.duration("us")
+    if isinstance(model_field, (models.TextField, models.CharField)):
+        return pa.string()
+    return None
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    can_handle_rich_value = True
+    RECORD_BATCH_SIZE = 10000
+
+    def __init__(self, queryset, ordered_field_objects):
+        import pyarrow as pa
+
+        super().__init__(queryset, ordered_field_objects)
+
+        self.columns = [ParquetColumn("id", pa.int64(), lambda row: row.id)]
+        for field_object in ordered_field_objects:
+            column = self._get_column(queryset.model, field_object)
+            # The column names must be unique, but a field can be named like the id
+            # column. It's then suffixed with a number, like the JSON exporter does.
+            self.columns.append(
+                column._replace(name=self._get_unique_name(column.name))
+            )
+
+    def _get_unique_name(self, base_name: str) -> str:
+        """
+        Returns the provided name if there is no column with that name yet,
+        otherwise the first available name suffixed with a count, like `id 2`.
+        """
+
+        names = {column.name for column in self.columns}
+        name = base_name
+        count = 2
+        while name in names:
+            name = f"{base_name} {count}"
+            count += 1
+        return name
+
+    def _get_column(self, model, field_object: FieldObject) -> ParquetColumn:
+        """
+        Returns the column of the provided field. The native database value is used
+        if the field type supports it and if it has a matching Arrow type, otherwise
+        the rich export value is stored as a string, encoded as JSON if it isn't a
+        string already.
+        """
+
+        import pyarrow as pa
+
+        name = field_object["name"]
+        field_type = field_object["type"]
+        if field_type.can_export_native_value:
+            arrow_type = get_arrow_type_for_model_field(model._meta.get_field(name))
+            if arrow_type is not None:
+                return ParquetColumn(
+                    field_object["field"].name,
+                    arrow_type,
+                    lambda row: getattr(row, name),
+                )
+
+        def get_export_value(row):
+            value = getattr(row, name)
+            if value is None:
+                return None
+            value = field_type.get_export_value(value, field_object, rich_value=True)
+            if value is None or isinstance(value, str):
+                return value
+            return json.dumps(value, default=str)
+
+        return ParquetColumn(field_object["field"].name, pa.string(), get_export_value)
+
+    def write_to_file(
+        self,
+        file_writer: FileWriter,
+        export_charset="utf-8",
+        parquet_compression="snappy",
+    ):
+        """
+        Writes the queryset to the provided file in the parquet format. The rows are
+        converted to columns and written in record batches of RECORD_BATCH_SIZE rows,
+        so that the memory usage stays bounded.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: Unused because the strings of parquet files are
+            always encoded in utf-8.
+        :param parquet_compression: The compression codec of the columns.
+        """
+
+        import pyarrow as pa
+
+        schema = pa.schema(
+            [pa.field(column.name, column.arrow_type) for column in self.columns]
+        )
+        writer = file_writer.get_parquet_writer(
+            schema,
+            compression=None if parquet_compression == "none" else parquet_compression,
+        )
+        column_values = [[] for _ in self.columns]
+
+        def write_batch():
+            arrays = [
+                pa.array(values, type=column.arrow_type)
+                for column, values in zip(self.columns, column_values)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            for values in column_values:
+                values.clear()
+
+        def write_row(row, last_row):
+            for column, values in zip(self.columns, column_values):
+                values.append(column.get_value(row))
+            if last_row or len(column_values[0]) >= self.RECORD_BATCH_SIZE:
+                write_batch()
+
+        try:
+            file_writer.write_rows(self.queryset, write_row)
+        finally:
+            writer.close()
@@ -16,6 +16,7 @@ from baserow.contrib.database.fields.backup_handler import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, SpecificFieldForUpdate
+from baserow.contrib.database.fields.online_conversion import OnlineFieldConversion
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.table.models import Table
 from baserow.core.action.models import Action
@@ -71,6 +72,7 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         user: AbstractUser,
         field: SpecificFieldForUpdate,
         new_type_name: Optional[str] = None,
+        online_conversion: Optional[OnlineFieldConversion] = None,
         **kwargs,
     ) -> Tuple[Field, List[Field]]:
         """
@@ -82,6 +84,8 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         :param user: The user on whose behalf the table is updated.
         :param field: The field instance that needs to be updated.
         :param new_type_name: If the type needs to be changed it can be provided here.
+        :param online_conversion: If provided, the column has already been converted
+            into a shadow column, and the old column is kept as backup.
         :return: The updated field instance and any
             updated fields as a result of updated the field are returned in a list
             as the second tuple value.
@@ -100,11 +104,20 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         )
 
         optional_backup_data = cls._backup_field_if_required(
-            field, kwargs, to_field_type_name, backup_uuid
+            field,
+            kwargs,
+            to_field_type_name,
+            backup_uuid,
+            online_conversion=online_conversion,
         )
 
         field, updated_fields = FieldHandler().update_field(
-            user, field, new_type_name, return_updated_fields=True, **kwargs
+            user,
+            field,
+            new_type_name,
+            return_updated_fields=True,
+            online_conversion=online_conversion,
+            **kwargs,
         )
 
         table = field.table
@@ -168,22 +181,30 @@ class UpdateFieldActionType(UndoableActionCustomCleanupMixin, UndoableActionType
         to_field_type_name: str,
         backup_uuid: str,
         for_undo: bool = False,
+        online_conversion: Optional[OnlineFieldConversion] = None,
     ) -> Optional[BackupData]:
         """
         Performs a backup if needed and returns a dictionary of backup data which can
         be then used with the FieldDataBackupHandler to restore a backup or clean up
-        the backed up data.
+        the backed up data. If the field is converted online, the old column is
+        kept as backup instead of copying its data.
         """
 
         if cls._should_backup_field(
             original_field, to_field_type_name, allowed_new_field_attrs
         ):
-            backup_data = FieldDataBackupHandler.backup_field_data(
-                original_field,
-                identifier_to_backup_into=cls._get_backup_identifier(
-                    original_field.id, backup_uuid, for_undo=for_undo
-                ),
+            identifier_to_backup_into = cls._get_backup_identifier(
+                original_field.id, backup_uuid, for_undo=for_undo
             )
+            if online_conversion is not None:
+                backup_data = online_conversion.backup_old_column_into(
+                    identifier_to_backup_into
+                )
+            else:
+                backup_data = FieldDataBackupHandler.backup_field_data(
+                    original_field,
+                    identifier_to_backup_into=identifier_to_backup_into,
+                )
         else:
             backup_data = None
         return backup_data
@@ -0,0 +1,271 @@
+from collections import defaultdict
+from datetime import timedelta
+from itertools import chain
+from typing import Dict, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
+from baserow.contrib.database.fields.dependencies.models import DeferredDependantUpdate
+from baserow.contrib.database.fields.dependencies.update_collector import (
+    FieldUpdateCollector,
+)
+from baserow.contrib.database.fields.field_cache import FieldCache
+from baserow.contrib.database.rows.signals import before_rows_update, rows_updated
+from baserow.contrib.database.table.models import Table
+
+DEFERRED_DEPENDANT_UPDATES_SCHEDULED_KEY = "deferred_dependant_updates_scheduled_{}"
+# The amount of seconds the scheduled key is kept on top of the delay, in case the
+# task is lost before it starts.
+DEFERRED_DEPENDANT_UPDATES_SCHEDULED_GRACE_SECONDS = 60
+
+
+class DeferredDependantUpdateHandler:
+    @classmethod
+    def defer_updates(
+        cls,
+        table: Table,
+        row_ids: List[int],
+        field_ids: List[int],
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+    ) -> DeferredDependantUpdate:
+        """
+        Marks the provided rows of the table as dirty, so that the formula, lookup
+        and rollup fields depending on the updated fields in the other tables are
+        recalculated later by a background worker. The updates of the same table
+        are coalesced and applied together after
+        `BASEROW_DEFERRED_DEPENDANT_UPDATES_DELAY_SECONDS`.
+
+        :param table: The table of which the rows have been updated.
+        :param row_ids: The ids of the updated rows.
+        :param field_ids: The ids of the updated fields.
+        :param deleted_m2m_rels_per_link_field: The ids of the rows that are not
+            linked anymore per link row field, because the dependants in the
+            previously linked rows must be recalculated too.
+        :return: The created deferred update.
+        """
+
+        deferred_update = DeferredDependantUpdate.objects.create(
+            table=table,
+            row_ids=list(row_ids),
+            field_ids=list(field_ids),
+            deleted_m2m_rels_per_link_field={
+                str(field_id): list(rel_ids)
+                for field_id, rel_ids in (deleted_m2m_rels_per_link_field or {}).items()
+            },
+        )
+        transaction.on_commit(lambda: cls.schedule_deferred_updates(table.id))
+        return deferred_update
+
+    @classmethod
+    def schedule_deferred_updates(cls, table_id: int):
+        """
+        Schedules the task applying the deferred updates of the table, unless it has
+        already been scheduled and hasn't started yet.
+
+        :param table_id: The id of the table having deferred updates.
+        """
+
+        from baserow.contrib.database.fields.tasks import (
+            apply_deferred_dependant_updates,
+        )
+
+        delay = settings.BASEROW_DEFERRED_DEPENDANT_UPDATES_DELAY_SECONDS
+        if cache.add(
+            DEFERRED_DEPENDANT_UPDATES_SCHEDULED_KEY.format(table_id),
+            True,
+            timeout=delay + DEFERRED_DEPENDANT_UPDATES_SCHEDULED_GRACE_SECONDS,
+        ):
+            apply_deferred_dependant_updates.apply_async(
+                kwargs={"table_id": table_id}, countdown=delay
+            )
+
+    @classmethod
+    def schedule_leftover_deferred_updates(cls) -> List[int]:
+        """
+        Schedules the task applying the deferred updates of every table having
+        deferred updates that should already have been applied. This happens when
+        the scheduled task has been lost, for example because the worker crashed or
+        the task couldn't be queued after the transaction was committed.
+
+        :return: The ids of the tables of which the deferred updates are scheduled.
+        """
+
+        leftover_before = timezone.now() - timedelta(
+            seconds=settings.BASEROW_DEFERRED_DEPENDANT_UPDATES_DELAY_SECONDS
+            + DEFERRED_DEPENDANT_UPDATES_SCHEDULED_GRACE_SECONDS
+        )
+        table_ids = list(
+            DeferredDependantUpdate.objects.filter(created_on__lt=leftover_before)
+            .order_by()
+            .values_list("table_id", flat=True)
+            .distinct()
+        )
+        for table_id in table_ids:
+            cls.schedule_deferred_updates(table_id)
+        return table_ids
+
+    @classmethod
+    def apply_deferred_updates(
+        cls, table_id: int, batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Recalculates the dependants of all the deferred updates of the table. The
+        deferred updates are processed in batches, and the updates of a batch are
+        combined so that every dependant row is only updated once. The
+        `rows_updated` signals of the updated rows are sent afterwards. The batches
+        that are being processed by another worker are skipped.
+
+        :param table_id: The id of the table having deferred updates.
+        :param batch_size: The maximum amount of deferred updates applied together.
+        :return: The amount of deferred updates that have been applied.
+        """
+
+        if batch_size is None:
+            batch_size = settings.BASEROW_DEFERRED_DEPENDANT_UPDATES_BATCH_SIZE
+
+        # The updates deferred from now on must schedule a new task, because the
+        # ones that have already been selected won't be picked up anymore.
+        cache.delete(DEFERRED_DEPENDANT_UPDATES_SCHEDULED_KEY.format(table_id))
+
+        try:
+            table = Table.objects.get(id=table_id)
+        except Table.DoesNotExist:
+            # The deferred updates have been deleted together with the table.
+            return 0
+
+        applied = 0
+        while True:
+            with transaction.atomic():
+                deferred_updates = list(
+                    DeferredDependantUpdate.objects.select_for_update(
+                        skip_locked=True
+                    ).filter(table_id=table_id)[:batch_size]
+                )
+                if not deferred_updates:
+                    break
+
+                cls._apply_deferred_updates(table, deferred_updates)
+                DeferredDependantUpdate.objects.filter(
+                    id__in=[deferred.id for deferred in deferred_updates]
+                ).delete()
+                applied += len(deferred_updates)
+        return applied
+
+    @classmethod
+    def _apply_deferred_updates(
+        cls, table: Table, deferred_updates: List[DeferredDependantUpdate]
+    ):
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        row_ids = sorted(
+            set(chain.from_iterable(deferred.row_ids for deferred in deferred_updates))
+        )
+        field_ids = set(
+            chain.from_iterable(deferred.field_ids for deferred in deferred_updates)
+        )
+        deleted_m2m_rels_per_link_field = defaultdict(set)
+        for deferred in deferred_updates:
+            for field_id, rel_ids in deferred.deleted_m2m_rels_per_link_field.items():
+                deleted_m2m_rels_per_link_field[int(field_id)].update(rel_ids)
+
+        field_cache = FieldCache()
+        model = field_cache.get_model(table)
+        update_collector = FieldUpdateCollector(
+            table,
+            starting_row_ids=row_ids,
+            deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+        )
+        dependant_fields = []
+        for (
+            dependant_field,
+            dependant_field_type,
+            path_to_starting_table,
+        ) in FieldDependencyHandler.get_all_dependent_fields_with_type(
+            table.id,
+            field_ids,
+            field_cache,
+            associated_relations_changed=True,
+        ):
+            # The dependants in the table itself have already been updated together
+            # with the rows.
+            if not path_to_starting_table:
+                continue
+            dependant_fields.append(dependant_field)
+            dependant_field_type.row_of_dependency_updated(
+                dependant_field,
+                model.objects.filter(id__in=row_ids),
+                update_collector,
+                field_cache,
+                path_to_starting_table,
+            )
+
+        if not dependant_fields:
+            return
+
+        updated_tables = {
+            updated_table.id: updated_table
+            for updated_table in update_collector.get_updated_tables()
+        }
+        signals_per_table = []
+        for (
+            updated_table_id,
+            updated_row_ids,
+        ) in update_collector.get_row_ids_to_update_per_table(field_cache).items():
+            updated_table = updated_tables[updated_table_id]
+            updated_model = field_cache.get_model(updated_table)
+            updated_field_ids = [
+                field.id
+                for field in update_collector.get_updated_fields_for_table(
+                    updated_table
+                )
+            ]
+            rows = list(
+                updated_model.objects.all()
+                .enhance_by_fields()
+                .filter(id__in=updated_row_ids)
+            )
+            before_return = before_rows_update.send(
+                cls,
+                rows=rows,
+                user=None,
+                table=updated_table,
+                model=updated_model,
+                updated_field_ids=updated_field_ids,
+            )
+            signals_per_table.append(
+                (
+                    updated_table,
+                    updated_model,
+                    updated_row_ids,
+                    updated_field_ids,
+                    before_return,
+                )
+            )
+
+        update_collector.apply_updates_and_get_updated_fields(field_cache)
+        ViewHandler().field_value_updated(dependant_fields)
+
+        for (
+            updated_table,
+            updated_model,
+            updated_row_ids,
+            updated_field_ids,
+            before_return,
+        ) in signals_per_table:
+            rows_updated.send(
+                cls,
+                rows=list(
+                    updated_model.objects.all()
+                    .enhance_by_fields()
+                    .filter(id__in=updated_row_ids)
+                ),
+                user=None,
+                table=updated_table,
+                model=updated_model,
+                before_return=before_return,
+                updated_field_ids=updated_field_ids,
+            )
@@ -1,3 +1,4 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
 
@@ -49,3 +50,35 @@ class FieldDependency(models.Model):
         """
 
         return f"{self.dependant_id}__{self._dependency_postfix()}"
+
+
+class DeferredDependantUpdate(models.Model):
+    """
+    Marks rows of a table that defers the updates of its dependants as dirty. The
+    formula, lookup and rollup fields in other tables depending on the changed
+    fields of these rows are recalculated in the background, where multiple entries
+    of the same table are coalesced and applied in a single batch.
+    """
+
+    table = models.ForeignKey(
+        "database.Table",
+        on_delete=models.CASCADE,
+        related_name="deferred_dependant_updates",
+    )
+    row_ids = ArrayField(
+        models.IntegerField(),
+        help_text="The ids of the rows that have been changed.",
+    )
+    field_ids = ArrayField(
+        models.IntegerField(),
+        help_text="The ids of the fields of which the values have been changed.",
+    )
+    deleted_m2m_rels_per_link_field = models.JSONField(
+        default=dict,
+        help_text="The ids of the related rows that aren't linked to the changed "
+        "rows anymore, per link row field id.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("id",)
@@ -1,7 +1,7 @@
 from collections import defaultdict
 from typing import Dict, List, NamedTuple, Optional, Set, Tuple, cast
 
-from django.db.models import Expression, Q, Value
+from django.db.models import Expression, Q, QuerySet, Value
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -38,6 +38,7 @@ class PathBasedUpdateStatementCollector:
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.connection_here: Optional[LinkRowField] = connection_here
         self.connection_is_broken = connection_is_broken
+        self.updated_rows = 0
 
     def add_update_statement(
         self,
@@ -124,6 +125,8 @@ class PathBasedUpdateStatementCollector:
         starting_row_ids: StartingRowIdsType = None,
         path_to_starting_table: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+        include_sub_paths: bool = True,
+        flag_changed_rows: bool = False,
     ) -> int:
         updated_rows = 0
         path_to_starting_table = path_to_starting_table or []
@@ -134,24 +137,123 @@ class PathBasedUpdateStatementCollector:
             path_to_starting_table,
             starting_row_ids,
             deleted_m2m_rels_per_link_field,
+            flag_changed_rows,
         )
 
+        if not include_sub_paths:
+            return updated_rows
+
         for sub_path in self.sub_paths.values():
             updated_rows += sub_path.execute_all(
                 starting_row_ids=starting_row_ids,
                 path_to_starting_table=path_to_starting_table,
                 field_cache=field_cache,
                 deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+                flag_changed_rows=flag_changed_rows,
             )
         return updated_rows
 
+    def get_table_ids_with_updated_rows(
+        self, table_ids: Optional[Set[int]] = None
+    ) -> Set[int]:
+        """
+        Returns the ids of the tables of which at least one row has been updated
+        by the executed update statements of this collector and its sub paths.
+        """
+
+        if table_ids is None:
+            table_ids = set()
+        if self.updated_rows:
+            table_ids.add(self.table.id)
+        for sub_path in self.sub_paths.values():
+            sub_path.get_table_ids_with_updated_rows(table_ids)
+        return table_ids
+
+    def get_row_ids_to_update_per_table(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: List[int],
+        path_to_starting_table: StartingRowIdsType = None,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+        row_ids_per_table: Optional[Dict[int, Set[int]]] = None,
+    ) -> Dict[int, Set[int]]:
+        """
+        Returns the ids of the rows, per table id, that the pending update statements
+        of this collector and its sub paths will update, without executing them.
+        """
+
+        if row_ids_per_table is None:
+            row_ids_per_table = defaultdict(set)
+        path_to_starting_table = path_to_starting_table or []
+        if self.connection_here is not None:
+            path_to_starting_table = [self.connection_here] + path_to_starting_table
+
+        if set(self.update_statements) - {ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME}:
+            row_ids_per_table[self.table.id].update(
+                self._get_queryset_to_update(
+                    field_cache,
+                    path_to_starting_table,
+                    starting_row_ids,
+                    deleted_m2m_rels_per_link_field,
+                ).values_list("id", flat=True)
+            )
+
+        for sub_path in self.sub_paths.values():
+            sub_path.get_row_ids_to_update_per_table(
+                field_cache,
+                starting_row_ids,
+                path_to_starting_table,
+                deleted_m2m_rels_per_link_field,
+                row_ids_per_table,
+            )
+        return row_ids_per_table
+
     def _execute_pending_update_statements(
         self,
         field_cache: FieldCache,
         path_to_starting_table: List[LinkRowField],
         starting_row_ids: StartingRowIdsType,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+        flag_changed_rows: bool = False,
     ) -> int:
+        qs = self._get_queryset_to_update(
+            field_cache,
+            path_to_starting_table,
+            starting_row_ids,
+            deleted_m2m_rels_per_link_field,
+        )
+        exclude_statements = self.update_statements
+        if starting_row_ids is None:
+            if flag_changed_rows:
+                # Only the rows of which a value changes must be flagged, so the
+                # flag itself must not be compared to exclude the unchanged rows.
+                exclude_statements = {
+                    column: statement
+                    for column, statement in self.update_statements.items()
+                    if column != ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
+                }
+            else:
+                # We aren't updating individual rows but instead entire columns, so
+                # don't set this per row attribute.
+                self.update_statements.pop(
+                    ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None
+                )
+
+        updated_rows = 0
+        if self.update_statements:
+            if exclude_statements:
+                qs = qs.exclude(**exclude_statements)
+            updated_rows = qs.update(**self.update_statements)
+        self.updated_rows += updated_rows
+        return updated_rows
+
+    def _get_queryset_to_update(
+        self,
+        field_cache: FieldCache,
+        path_to_starting_table: List[LinkRowField],
+        starting_row_ids: StartingRowIdsType,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+    ) -> QuerySet:
         model = field_cache.get_model(self.table)
         qs = model.objects_and_trash
         # If the connection is broken back to the starting table then there is no
@@ -173,17 +275,7 @@ class PathBasedUpdateStatementCollector:
             )
 
             qs = qs.filter(filter_for_rows_connected_to_starting_row)
-        if starting_row_ids is None:
-            # We aren't updating individual rows but instead entire columns, so don't
-            # set this per row attribute.
-            self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
-
-        updated_rows = 0
-        if self.update_statements:
-            updated_rows = qs.exclude(**self.update_statements).update(
-                **self.update_statements
-            )
-        return updated_rows
+        return qs
 
     def _include_rows_connected_to_deleted_m2m_relationships(
         self,
@@ -247,6 +339,7 @@ class FieldUpdateCollector:
         starting_table: Table,
         starting_row_ids: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+        flag_changed_rows: bool = False,
     ):
         """
 
@@ -254,6 +347,10 @@ class FieldUpdateCollector:
         :param starting_row_ids: If the update starts from specific rows in the
             starting table set this and all update statements executed by this collector
             will only update rows which join back to these starting rows.
+        :param flag_changed_rows: If the update is for entire fields, the rows of
+            which a value actually changes are flagged as needing a background
+            update, so that only their search vectors are updated afterwards
+            instead of the ones of the entire table.
         """
 
         self._updated_fields_per_table: Dict[
@@ -263,6 +360,7 @@ class FieldUpdateCollector:
         self._starting_row_ids = starting_row_ids
         self._starting_table = starting_table
         self._deleted_m2m_rels_per_link_field = deleted_m2m_rels_per_link_field
+        self._flag_changed_rows = flag_changed_rows
 
         self._update_statement_collector = PathBasedUpdateStatementCollector(
             self._starting_table, connection_here=None, connection_is_broken=False
@@ -339,8 +437,57 @@ class FieldUpdateCollector:
             field_cache,
             self._starting_row_ids,
             deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
+            flag_changed_rows=self._flag_changed_rows,
+        )
+
+    def apply_starting_table_updates_and_get_updated_fields(
+        self, field_cache: FieldCache
+    ) -> List[Field]:
+        """
+        Only executes the update statements of the starting table. This can be used
+        when the updates of the other tables are deferred, in which case they must be
+        applied later by collecting the same updates in a new collector.
+
+        :return: The list of all fields which have been updated in the starting table.
+        """
+
+        self._update_statement_collector.execute_all(
+            field_cache,
+            self._starting_row_ids,
+            deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
+            include_sub_paths=False,
+        )
+        return self._for_table(self._starting_table)
+
+    def get_row_ids_to_update_per_table(
+        self, field_cache: FieldCache
+    ) -> Dict[int, Set[int]]:
+        """
+        Returns the ids of the rows, per table id, which are going to be updated by
+        `apply_updates`. Can only be used if the starting row ids have been provided.
+        """
+
+        return self._update_statement_collector.get_row_ids_to_update_per_table(
+            field_cache,
+            self._starting_row_ids,
+            deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
         )
 
+    def has_updates_via_link_row_fields(self) -> bool:
+        """
+        Returns whether there are fields to update in the rows connected to the
+        starting rows via link row fields, which are not updated by
+        `apply_starting_table_updates_and_get_updated_fields`.
+        """
+
+        return bool(self._update_statement_collector.sub_paths)
+
+    def get_updated_tables(self) -> List[Table]:
+        return list(self._updated_tables.values())
+
+    def get_updated_fields_for_table(self, table: Table) -> List[Field]:
+        return self._for_table(table)
+
     def apply_updates_and_get_updated_fields(
         self, field_cache: FieldCache, skip_search_updates=False
     ) -> List[Field]:
@@ -355,9 +502,9 @@ class FieldUpdateCollector:
         if not skip_search_updates:
             for table in self._updated_tables.values():
                 if not self._starting_table or table.id != self._starting_table.id:
-                    if self._starting_row_ids is not None:
+                    if self._starting_row_ids is not None or self._flag_changed_rows:
                         # The cascade was only for some specific rows and not the
-                        # entire field
+                        # entire field, or the changed rows have been flagged
                         SearchHandler.field_value_updated_or_created(
                             table,
                         )
@@ -390,8 +537,25 @@ class FieldUpdateCollector:
                     user=None,
                 )
 
-    def send_force_refresh_signals_for_all_updated_tables(self):
+    def send_force_refresh_signals_for_all_updated_tables(
+        self, only_tables_with_updated_rows: bool = False
+    ):
+        """
+        Sends a table_updated signal forcing a refresh for every updated table.
+
+        :param only_tables_with_updated_rows: If True, the tables of which no row
+            has been changed by the applied update statements are skipped.
+        """
+
+        table_ids_with_updated_rows = (
+            self._update_statement_collector.get_table_ids_with_updated_rows()
+        )
         for table in self._updated_tables.values():
+            if (
+                only_tables_with_updated_rows
+                and table.id not in table_ids_with_updated_rows
+            ):
+                continue
             table_updated.send(self, table=table, user=None, force_table_refresh=True)
 
     def _get_updated_fields_to_send_signals_for_per_table(
@@ -201,6 +201,7 @@ from .utils.duration import (
     is_duration_format_conversion_lossy,
     prepare_duration_value_for_db,
 )
+from .utils.link_row import LimitedLinkRowPrefetch
 
 User = get_user_model()
 
@@ -357,6 +358,8 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
 
 class TextFieldType(CollationSortMixin, FieldType):
     type = "text"
+    can_have_trigram_index = True
+    can_export_native_value = True
     model_class = TextField
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
@@ -403,6 +406,8 @@ class TextFieldType(CollationSortMixin, FieldType):
 
 class LongTextFieldType(CollationSortMixin, FieldType):
     type = "long_text"
+    can_have_trigram_index = True
+    can_export_native_value = True
     model_class = LongTextField
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
@@ -479,6 +484,8 @@ class LongTextFieldType(CollationSortMixin, FieldType):
 
 class URLFieldType(CollationSortMixin, TextFieldMatchingRegexFieldType):
     type = "url"
+    can_have_trigram_index = True
+    can_export_native_value = True
     model_class = URLField
     _can_group_by = True
 
@@ -501,6 +508,7 @@ class NumberFieldType(FieldType):
     MAX_DIGITS = 50
 
     type = "number"
+    can_export_native_value = True
     model_class = NumberField
     allowed_fields = ["number_decimal_places", "number_negative"]
     serializer_field_names = ["number_decimal_places", "number_negative", "number_type"]
@@ -651,6 +659,7 @@ class NumberFieldType(FieldType):
 
 class RatingFieldType(FieldType):
     type = "rating"
+    can_export_native_value = True
     model_class = RatingField
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
@@ -772,6 +781,7 @@ class RatingFieldType(FieldType):
 
 class BooleanFieldType(FieldType):
     type = "boolean"
+    can_export_native_value = True
     model_class = BooleanField
     _can_group_by = True
 
@@ -820,6 +830,7 @@ class BooleanFieldType(FieldType):
 
 class DateFieldType(FieldType):
     type = "date"
+    can_export_native_value = True
     model_class = DateField
     allowed_fields = [
         "date_format",
@@ -1729,6 +1740,7 @@ class CreatedByFieldType(ReadOnlyFieldType):
 
 class DurationFieldType(FieldType):
     type = "duration"
+    can_export_native_value = True
     model_class = DurationField
     allowed_fields = ["duration_format"]
     serializer_field_names = ["duration_format"]
@@ -1888,12 +1900,14 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         "link_row_related_field",
         "link_row_table",
         "link_row_relation_id",
+        "link_row_values_limit",
     ]
     serializer_field_names = [
         "link_row_table_id",
         "link_row_related_field_id",
         "link_row_table",
         "link_row_related_field",
+        "link_row_values_limit",
     ]
     serializer_field_overrides = {
         "link_row_table_id": serializers.IntegerField(
@@ -1921,6 +1935,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         "link_row_table_id",
         "link_row_table",
         "has_related_field",
+        "link_row_values_limit",
     ]
     request_serializer_field_overrides = {
         "has_related_field": serializers.BooleanField(required=False),
@@ -1985,7 +2000,9 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         Makes sure that the related rows are prefetched by Django. We also want to
         enhance the primary field of the related queryset. If for example the primary
         field is a single select field then the dropdown options need to be
-        prefetched in order to prevent many queries.
+        prefetched in order to prevent many queries. If the field has a
+        `link_row_values_limit` and the queryset is used to list rows, then only the
+        first related rows are prefetched.
         """
 
         remote_model = queryset.model._meta.get_field(name).remote_field.model
@@ -2011,6 +2028,15 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
             # need to enhance the queryset.
             pass
 
+        if field.link_row_values_limit is not None and getattr(
+            queryset, "limit_link_row_values", False
+        ):
+            return queryset.multi_field_prefetch(
+                LimitedLinkRowPrefetch(
+                    name, field.link_row_values_limit, related_queryset
+                )
+            )
+
         return queryset.prefetch_related(
             models.Prefetch(name, queryset=related_queryset)
         )
@@ -2726,6 +2752,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         serialized["link_row_table_id"] = field.link_row_table_id
         serialized["link_row_related_field_id"] = field.link_row_related_field_id
         serialized["has_related_field"] = field.link_row_table_has_related_field
+        serialized["link_row_values_limit"] = field.link_row_values_limit
         return serialized
 
     def import_serialized(
@@ -2969,6 +2996,8 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 
 class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
     type = "email"
+    can_have_trigram_index = True
+    can_export_native_value = True
     model_class = EmailField
 
     @property
@@ -4148,6 +4177,8 @@ class PhoneNumberFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
     """
 
     type = "phone_number"
+    can_have_trigram_index = True
+    can_export_native_value = True
     model_class = PhoneNumberField
 
     MAX_PHONE_NUMBER_LENGTH = 100
@@ -4188,6 +4219,7 @@ class PhoneNumberFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 
 class FormulaFieldType(ReadOnlyFieldType):
     type = "formula"
+    can_export_native_value = True
     model_class = FormulaField
 
     can_be_in_form_view = False
@@ -4422,6 +4454,15 @@ class FormulaFieldType(ReadOnlyFieldType):
             table__database__workspace__trashed=False,
         )
 
+    def should_run_periodic_update(
+        self, field: Field, previous_now: Optional[datetime], now: datetime
+    ) -> bool:
+        if previous_now is not None and previous_now.date() == now.date():
+            # The values of the formulas only depending on the date, like
+            # `today()`, can't have changed since the previous update.
+            return not FormulaHandler.periodic_update_only_needed_on_date_change(field)
+        return True
+
     def run_periodic_update(
         self,
         field: Field,
@@ -4440,7 +4481,9 @@ class FormulaFieldType(ReadOnlyFieldType):
             # We are the outermost root call, and so we should send all the signals
             # when we finish.
             is_root_update_call = True
-            update_collector = FieldUpdateCollector(field.table)
+            # Only the rows of which the value changes are flagged, so that the
+            # search index of the other rows doesn't have to be updated.
+            update_collector = FieldUpdateCollector(field.table, flag_changed_rows=True)
 
         if field_cache is None:
             field_cache = FieldCache()
@@ -4480,7 +4523,9 @@ class FormulaFieldType(ReadOnlyFieldType):
 
         if is_root_update_call:
             update_collector.apply_updates_and_get_updated_fields(field_cache)
-            update_collector.send_force_refresh_signals_for_all_updated_tables()
+            update_collector.send_force_refresh_signals_for_all_updated_tables(
+                only_tables_with_updated_rows=True
+            )
 
         return new_all_updated_fields
 
@@ -5652,6 +5697,7 @@ class AutonumberFieldType(ReadOnlyFieldType):
     """
 
     type = "autonumber"
+    can_export_native_value = True
     model_class = AutonumberField
     can_be_in_form_view = False
     keep_data_on_duplication = True
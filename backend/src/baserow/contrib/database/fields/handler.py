@@ -49,7 +49,7 @@ from baserow.contrib.database.fields.operations import (
     UpdateFieldOperationType,
 )
 from baserow.contrib.database.table.models import Table
-from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.handler import ViewHandler, ViewIndexingHandler
 from baserow.core.db import specific_iterator
 from baserow.core.handler import CoreHandler
 from baserow.core.models import TrashEntry
@@ -84,6 +84,7 @@ from .exceptions import (
 )
 from .field_cache import FieldCache
 from .models import Field, SelectOption, SpecificFieldForUpdate
+from .online_conversion import OnlineFieldConversion
 from .registries import field_converter_registry, field_type_registry
 from .signals import (
     before_field_deleted,
@@ -439,6 +440,7 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         after_schema_change_callback: Optional[
             Callable[[SpecificFieldForUpdate], None]
         ] = None,
+        online_conversion: Optional[OnlineFieldConversion] = None,
         **kwargs,
     ) -> Union[SpecificFieldForUpdate, Tuple[SpecificFieldForUpdate, List[Field]]]:
         """
@@ -458,6 +460,10 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         :param after_schema_change_callback: If specified this callback is called
             after the field has had it's schema updated but before any dependant
             fields have been updated.
+        :param online_conversion: If provided, the column of the field has already
+            been converted into a shadow column by this online conversion, which is
+            swapped in instead of altering the column type. It must have been
+            prepared for the same update using `OnlineFieldConversion.for_update`.
         :param kwargs: The field values that need to be updated
         :raises ValueError: When the provided field is not an instance of Field.
         :raises CannotChangeFieldType: When the database server responds with an
@@ -578,6 +584,12 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
                 user,
                 connection,
             )
+        elif online_conversion is not None:
+            # The values have already been converted into the shadow column in the
+            # background, so only the columns have to be swapped, which doesn't
+            # require rewriting the table while it's locked.
+            online_conversion.swap()
+            ViewIndexingHandler.after_field_changed_or_deleted(field)
         else:
             if baserow_field_type_changed:
                 # If the baserow type has changed we always want to force run any alter
@@ -1170,6 +1182,7 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             cursor.execute(
                 sql_create_try_cast
                 % {
+                    "function": "pg_temp.try_cast",
                     "alter_column_prepare_old_value": alter_column_prepare_old_value
                     or "",
                     "alter_column_prepare_new_value": "",
@@ -1,3 +1,8 @@
+import contextlib
+
+from django.db import transaction
+from django.utils.functional import lazy
+
 from rest_framework import serializers
 
 from baserow.api.errors import ERROR_GROUP_DOES_NOT_EXIST, ERROR_USER_NOT_IN_GROUP
@@ -8,10 +13,18 @@ from baserow.contrib.database.api.fields.serializers import (
 from baserow.contrib.database.db.atomic import (
     read_repeatable_read_single_table_transaction,
 )
-from baserow.contrib.database.fields.actions import DuplicateFieldActionType
+from baserow.contrib.database.fields.actions import (
+    DuplicateFieldActionType,
+    UpdateFieldActionType,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import DuplicateFieldJob
-from baserow.contrib.database.fields.operations import DuplicateFieldOperationType
+from baserow.contrib.database.fields.models import ConvertFieldJob, DuplicateFieldJob
+from baserow.contrib.database.fields.online_conversion import OnlineFieldConversion
+from baserow.contrib.database.fields.operations import (
+    DuplicateFieldOperationType,
+    UpdateFieldOperationType,
+)
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.core.action.registries import action_type_registry
 from baserow.core.exceptions import UserNotInWorkspace, WorkspaceDoesNotExist
 from baserow.core.handler import CoreHandler
@@ -81,3 +94,100 @@ class DuplicateFieldJobType(JobType):
         job.save(update_fields=("duplicated_field",))
 
         return new_field_clone, updated_fields
+
+
+class ConvertFieldJobType(JobType):
+    type = "convert_field"
+    model_class = ConvertFieldJob
+    max_count = 1
+
+    api_exceptions_map = {
+        UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+        WorkspaceDoesNotExist: ERROR_GROUP_DOES_NOT_EXIST,
+    }
+
+    request_serializer_field_names = ["field_id", "new_type_name", "field_values"]
+
+    request_serializer_field_overrides = {
+        "field_id": serializers.IntegerField(
+            help_text="The ID of the field to convert.",
+        ),
+        "new_type_name": serializers.ChoiceField(
+            choices=lazy(field_type_registry.get_types, list)(),
+            required=False,
+            help_text="The type the field must be converted to.",
+        ),
+        "field_values": serializers.DictField(
+            required=False,
+            help_text="The values of the field that must be updated, like when "
+            "updating the field.",
+        ),
+    }
+
+    serializer_field_names = ["field"]
+    serializer_field_overrides = {
+        "field": FieldSerializerWithRelatedFields(read_only=True),
+    }
+
+    def transaction_atomic_context(self, job: "ConvertFieldJob"):
+        # The values are converted in chunks that are committed separately, so that
+        # the table isn't locked during the whole conversion.
+        return contextlib.nullcontext()
+
+    def prepare_values(self, values, user):
+        field = FieldHandler().get_field(values["field_id"])
+        CoreHandler().check_permissions(
+            user,
+            UpdateFieldOperationType.type,
+            workspace=field.table.database.workspace,
+            context=field,
+        )
+
+        return {
+            "field": field,
+            "new_type_name": values.get("new_type_name"),
+            "field_values": values.get("field_values", {}),
+        }
+
+    def run(self, job, progress):
+        conversion = OnlineFieldConversion.for_update(
+            job.user, job.field.specific, job.new_type_name, **job.field_values
+        )
+
+        try:
+            if conversion is not None:
+                conversion.start()
+                conversion.backfill(
+                    progress.create_child_builder(represents_progress=90)
+                )
+
+            with transaction.atomic():
+                field = FieldHandler().get_specific_field_for_update(job.field_id)
+                if conversion is not None and not conversion.has_same_conversion(
+                    OnlineFieldConversion.for_update(
+                        job.user, field, job.new_type_name, **job.field_values
+                    )
+                ):
+                    # The field has been changed during the conversion, so the shadow
+                    # column can't be used and the column is altered in place instead.
+                    conversion.abort()
+                    conversion = None
+
+                update_field_action_type = action_type_registry.get_by_type(
+                    UpdateFieldActionType
+                )
+                field, updated_fields = update_field_action_type.do(
+                    job.user,
+                    field,
+                    job.new_type_name,
+                    online_conversion=conversion,
+                    **job.field_values,
+                )
+        except Exception:
+            if conversion is not None:
+                conversion.abort()
+            raise
+
+        progress.increment(by=progress.total - progress.progress)
+
+        return field, updated_fields
@@ -159,6 +159,10 @@ class Field(
     def tsv_index_name(self):
         return f"tbl_tsv_{self.id}_idx"
 
+    @property
+    def trigram_index_name(self):
+        return f"tbl_trgm_{self.id}_idx"
+
     @property
     def model_attribute_name(self):
         """
@@ -385,6 +389,12 @@ class LinkRowField(Field):
         blank=True,
     )
     link_row_relation_id = SerialField(null=True, unique=False)
+    link_row_values_limit = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="The maximum amount of linked rows included in the value of a row "
+        "when listing rows. All the linked rows are included if not set.",
+    )
 
     @property
     def through_table_name(self):
@@ -763,4 +773,25 @@ class DuplicateFieldJob(
     )
 
 
+class ConvertFieldJob(
+    JobWithUserIpAddress, JobWithWebsocketId, JobWithUndoRedoIds, Job
+):
+    field = models.ForeignKey(
+        Field,
+        null=True,
+        related_name="converted_by_jobs",
+        on_delete=models.SET_NULL,
+        help_text="The Baserow field to convert.",
+    )
+    new_type_name = models.CharField(
+        max_length=255,
+        null=True,
+        help_text="The type the field must be converted to, if it changes.",
+    )
+    field_values = models.JSONField(
+        default=dict,
+        help_text="The values of the field that must be updated.",
+    )
+
+
 SpecificFieldForUpdate = NewType("SpecificFieldForUpdate", Field)
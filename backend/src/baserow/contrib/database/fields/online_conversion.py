@@ -0,0 +1,416 @@
+from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
+
+from django.contrib.auth.models import AbstractUser
+from django.db import connection, transaction
+
+from psycopg2 import sql
+
+from baserow.contrib.database.db.sql_queries import sql_create_try_cast
+from baserow.core.utils import ChildProgressBuilder, extract_allowed, set_allowed_attrs
+
+from .exceptions import IncompatiblePrimaryFieldTypeError
+from .models import Field
+from .registries import field_converter_registry, field_type_registry
+
+# The maximum amount of rows converted by a single `UPDATE` statement of the backfill.
+ONLINE_CONVERSION_CHUNK_SIZE = 10000
+
+
+def _split_alter_column_prepare_value(value) -> Tuple[str, Dict[str, Any]]:
+    """
+    The `get_alter_column_prepare_{old,new}_value` hooks can either return the SQL
+    or a tuple containing the SQL and the variables that must be safely injected.
+    """
+
+    if isinstance(value, tuple):
+        value, variables = value
+    else:
+        variables = {}
+
+    return value or "", {
+        key: variable.replace("$FUNCTION$", "") for key, variable in variables.items()
+    }
+
+
+class OnlineFieldConversion:
+    """
+    Converts the column of a field to another type without locking the table while
+    all the rows are rewritten, which is what `ALTER COLUMN ... TYPE` does.
+
+    Instead, a nullable shadow column of the new type is added, and filled in chunks
+    that are committed separately using the same SQL as the lenient schema editor. A
+    trigger keeps the shadow column in sync with the rows that are created or updated
+    in the meantime. Finally, `swap` replaces the column with the shadow column, which
+    only changes the metadata of the table.
+
+    Only the conversions that would alter the column type using the lenient schema
+    editor are supported. The others, like the ones using a field converter, are
+    converted in place by `FieldHandler.update_field`.
+    """
+
+    def __init__(
+        self,
+        field: Field,
+        column_type: str,
+        alter_column_prepare_old_value,
+        alter_column_prepare_new_value,
+    ):
+        self.table_id = field.table_id
+        self.table_name = field.table.get_database_table_name()
+        self.column = field.db_column
+        self.shadow_column = f"{field.db_column}_shadow"
+        self.cast_function = f"{field.db_column}_online_conversion_cast"
+        self.sync_function = f"{field.db_column}_online_conversion_sync"
+        self.column_type = column_type
+        self.alter_column_prepare_old_value = alter_column_prepare_old_value
+        self.alter_column_prepare_new_value = alter_column_prepare_new_value
+        self.backup_column = None
+
+    @classmethod
+    def for_update(
+        cls,
+        user: AbstractUser,
+        field: Field,
+        new_type_name: Optional[str] = None,
+        **kwargs,
+    ) -> Optional["OnlineFieldConversion"]:
+        """
+        Prepares the online conversion of the column of the field for the update
+        that `FieldHandler.update_field` would make with the same arguments.
+
+        :param user: The user on whose behalf the field is updated.
+        :param field: The specific field instance that is going to be updated.
+        :param new_type_name: If the type needs to be changed it can be provided here.
+        :param kwargs: The field values that are going to be updated.
+        :raises IncompatiblePrimaryFieldTypeError: When the field is the primary field
+            and the new type can't be primary.
+        :return: The online conversion or None if the column doesn't have to be
+            rewritten or can't be converted online.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get(new_type_name or from_field_type.type)
+        field_type_changed = from_field_type.type != to_field_type.type
+
+        if field.primary and not to_field_type.can_be_primary_field:
+            raise IncompatiblePrimaryFieldTypeError(to_field_type.type)
+
+        if (
+            from_field_type.read_only
+            or to_field_type.read_only
+            or from_field_type.can_have_select_options
+            or to_field_type.can_have_select_options
+        ):
+            return None
+
+        # The new field is not saved, because it's only needed to figure out the new
+        # column and how the values are converted.
+        if field_type_changed:
+            new_field = to_field_type.model_class(
+                id=field.id,
+                table=field.table,
+                name=field.name,
+                order=field.order,
+                primary=field.primary,
+            )
+        else:
+            new_field = deepcopy(field)
+        allowed_fields = ["name"] + to_field_type.allowed_fields
+        field_values = to_field_type.prepare_values(
+            extract_allowed(kwargs, allowed_fields), user
+        )
+        set_allowed_attrs(field_values, allowed_fields, new_field)
+
+        from_model = field.table.get_model(
+            field_ids=[], fields=[field], add_dependencies=False
+        )
+        if field_converter_registry.find_applicable_converter(
+            from_model, field, new_field
+        ):
+            return None
+
+        from_model_field = from_model._meta.get_field(field.db_column)
+        to_model_field = to_field_type.get_model_field(
+            new_field, db_column=new_field.db_column, verbose_name=new_field.name
+        )
+        to_model_field.set_attributes_from_name(new_field.db_column)
+
+        if (
+            to_model_field.many_to_many
+            or not to_model_field.null
+            or to_model_field.db_index
+            or to_model_field.unique
+        ):
+            return None
+
+        from_column_type = from_model_field.db_parameters(connection)["type"]
+        to_column_type = to_model_field.db_parameters(connection)["type"]
+        force_alter_column = (
+            field_type_changed
+            or to_field_type.force_same_type_alter_column(field, new_field)
+        )
+        if from_column_type == to_column_type and not force_alter_column:
+            return None
+
+        return cls(
+            field,
+            to_column_type,
+            from_field_type.get_alter_column_prepare_old_value(
+                connection, field, new_field
+            ),
+            to_field_type.get_alter_column_prepare_new_value(
+                connection, field, new_field
+            ),
+        )
+
+    def has_same_conversion(self, other: Optional["OnlineFieldConversion"]) -> bool:
+        """
+        Returns whether the other conversion converts the same column in the same
+        way, which is not the case anymore if the field has been changed after this
+        conversion has been prepared.
+        """
+
+        return other is not None and (
+            self.table_name,
+            self.column,
+            self.column_type,
+            self.alter_column_prepare_old_value,
+            self.alter_column_prepare_new_value,
+        ) == (
+            other.table_name,
+            other.column,
+            other.column_type,
+            other.alter_column_prepare_old_value,
+            other.alter_column_prepare_new_value,
+        )
+
+    def start(self):
+        """
+        Adds the shadow column and the trigger converting the values of the rows
+        that are created or updated into it. Any leftover of a previous conversion
+        of the column that didn't finish is removed first.
+        """
+
+        prepare_old_value, old_variables = _split_alter_column_prepare_value(
+            self.alter_column_prepare_old_value
+        )
+        prepare_new_value, new_variables = _split_alter_column_prepare_value(
+            self.alter_column_prepare_new_value
+        )
+        table = sql.Identifier(self.table_name)
+        shadow_column = sql.Identifier(self.shadow_column)
+        sync_function = sql.Identifier(self.sync_function)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._drop(cursor, drop_shadow_column=True)
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table} ADD COLUMN {shadow_column} {type}").format(
+                    table=table,
+                    shadow_column=shadow_column,
+                    type=sql.SQL(self.column_type),
+                )
+            )
+            cursor.execute(
+                sql_create_try_cast
+                % {
+                    "function": self.cast_function,
+                    "type": self.column_type,
+                    "alter_column_prepare_old_value": prepare_old_value,
+                    "alter_column_prepare_new_value": prepare_new_value,
+                },
+                {**old_variables, **new_variables},
+            )
+            cursor.execute(
+                sql.SQL(
+                    """
+                    CREATE FUNCTION {sync_function}() RETURNS trigger AS
+                    $FUNCTION$
+                    BEGIN
+                        NEW.{shadow_column} := {cast_function}(NEW.{column}::text);
+                        RETURN NEW;
+                    END;
+                    $FUNCTION$
+                    LANGUAGE plpgsql
+                    """
+                ).format(
+                    sync_function=sync_function,
+                    shadow_column=shadow_column,
+                    cast_function=sql.Identifier(self.cast_function),
+                    column=sql.Identifier(self.column),
+                )
+            )
+            cursor.execute(
+                sql.SQL(
+                    "CREATE TRIGGER {sync_function} BEFORE INSERT OR UPDATE OF "
+                    "{column} ON {table} FOR EACH ROW EXECUTE PROCEDURE "
+                    "{sync_function}()"
+                ).format(
+                    sync_function=sync_function,
+                    column=sql.Identifier(self.column),
+                    table=table,
+                )
+            )
+
+    def backfill(
+        self,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+        chunk_size: int = ONLINE_CONVERSION_CHUNK_SIZE,
+    ):
+        """
+        Converts the values of the existing rows into the shadow column. Every chunk
+        is committed separately, so that the rows are only locked for a short time.
+        Must be called after `start`, so that the rows created in the meantime are
+        converted by the trigger.
+
+        :param progress_builder: If provided will be used to build a child progress
+            bar and report on this methods progress to the parent of the
+            progress_builder.
+        :param chunk_size: The maximum amount of rows converted by a single statement.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("SELECT min(id), max(id) FROM {}").format(
+                    sql.Identifier(self.table_name)
+                )
+            )
+            min_id, max_id = cursor.fetchone()
+
+        if min_id is None:
+            ChildProgressBuilder.build(progress_builder, child_total=1).increment()
+            return
+
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=max_id - min_id + 1
+        )
+        statement = sql.SQL(
+            "UPDATE {table} SET {shadow_column} = {cast_function}({column}::text) "
+            "WHERE id > %s AND id <= %s"
+        ).format(
+            table=sql.Identifier(self.table_name),
+            shadow_column=sql.Identifier(self.shadow_column),
+            cast_function=sql.Identifier(self.cast_function),
+            column=sql.Identifier(self.column),
+        )
+
+        for start in range(min_id - 1, max_id, chunk_size):
+            end = min(start + chunk_size, max_id)
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(statement, [start, end])
+            progress.increment(by=end - start)
+
+    def backup_old_column_into(self, backup_column: str) -> Dict[str, Any]:
+        """
+        Keeps the old column as backup column when swapping, instead of dropping
+        it. This saves copying all the values into a new backup column.
+
+        :param backup_column: The name that the old column will be renamed to.
+        :return: The same backup data as `FieldDataBackupHandler.backup_field_data`.
+        """
+
+        self.backup_column = backup_column
+        return {
+            "table_id_containing_backup_column": self.table_id,
+            "backed_up_column_name": backup_column,
+        }
+
+    def swap(self):
+        """
+        Replaces the column with the filled shadow column. Only the metadata of the
+        table is changed, so the table is locked for a short time only. Must be
+        called in the transaction that updates the field.
+
+        The indexes of the old column are dropped and not created on the new column
+        here, because building them would keep the table locked. The view sort and
+        group by indexes are created again by the view index update that
+        `FieldHandler.update_field` schedules after the swap, and the trigram
+        indexes by the update scheduled when the `field_updated` signal is sent.
+        """
+
+        table = sql.Identifier(self.table_name)
+        column = sql.Identifier(self.column)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("LOCK TABLE {} IN ACCESS EXCLUSIVE MODE").format(table)
+            )
+            self._drop(cursor)
+
+            if self.backup_column is None:
+                cursor.execute(
+                    sql.SQL("ALTER TABLE {table} DROP COLUMN {column}").format(
+                        table=table, column=column
+                    )
+                )
+            else:
+                # The indexes of the old column, like the ones of the view sortings,
+                # aren't useful for the backup column. They're created again on the
+                # new column in the background, see the docstring.
+                cursor.execute(
+                    """
+                    SELECT i.indexrelid::regclass::text FROM pg_index i
+                    JOIN pg_attribute a
+                        ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                    WHERE i.indrelid = %s::regclass AND a.attname = %s
+                    """,
+                    [self.table_name, self.column],
+                )
+                for (index_name,) in cursor.fetchall():
+                    cursor.execute(sql.SQL("DROP INDEX {}").format(sql.SQL(index_name)))
+
+                backup_column = sql.Identifier(self.backup_column)
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} RENAME COLUMN {column} TO {backup_column}"
+                    ).format(table=table, column=column, backup_column=backup_column)
+                )
+                cursor.execute(
+                    sql.SQL(
+                        "ALTER TABLE {table} ALTER COLUMN {backup_column} "
+                        "DROP NOT NULL"
+                    ).format(table=table, backup_column=backup_column)
+                )
+
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} RENAME COLUMN {shadow_column} TO {column}"
+                ).format(
+                    table=table,
+                    shadow_column=sql.Identifier(self.shadow_column),
+                    column=column,
+                )
+            )
+
+    def abort(self):
+        """
+        Removes the shadow column and the trigger, leaving the column untouched.
+        """
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._drop(cursor, drop_shadow_column=True)
+
+    def _drop(self, cursor, drop_shadow_column: bool = False):
+        cursor.execute(
+            sql.SQL("DROP TRIGGER IF EXISTS {sync_function} ON {table}").format(
+                sync_function=sql.Identifier(self.sync_function),
+                table=sql.Identifier(self.table_name),
+            )
+        )
+        cursor.execute(
+            sql.SQL("DROP FUNCTION IF EXISTS {}()").format(
+                sql.Identifier(self.sync_function)
+            )
+        )
+        cursor.execute(
+            sql.SQL("DROP FUNCTION IF EXISTS {}(text, int)").format(
+                sql.Identifier(self.cast_function)
+            )
+        )
+        if drop_shadow_column:
+            cursor.execute(
+                sql.SQL("ALTER TABLE {} DROP COLUMN IF EXISTS {}").format(
+                    sql.Identifier(self.table_name),
+                    sql.Identifier(self.shadow_column),
+                )
+            )
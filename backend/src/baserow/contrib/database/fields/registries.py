@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Tuple, Union
 from zipfile import ZipFile
 
@@ -123,6 +124,12 @@ class FieldType(
     _can_group_by = False
     """Indicates whether it is possible to group by by this field type."""
 
+    can_have_trigram_index = False
+    """
+    Indicates whether the contains filters on this field type can be sped up with a
+    trigram index on the upper cased value of the field.
+    """
+
     read_only = False
     """Indicates whether the field allows inserting/updating row values or if it is
     read only."""
@@ -160,6 +167,13 @@ class FieldType(
     all times.
     """
 
+    can_export_native_value = False
+    """
+    Set to True if the raw database value of the field can be exported as is by the
+    columnar exporters, instead of its human readable export value. The value is
+    then typed based on the model field.
+    """
+
     def prepare_value_for_db(self, instance: Field, value: Any) -> Any:
         """
         When a row is created or updated all the values are going to be prepared for the
@@ -1195,6 +1209,23 @@ class FieldType(
 
         return None
 
+    def should_run_periodic_update(
+        self, field: Field, previous_now: Optional[datetime], now: datetime
+    ) -> bool:
+        """
+        Called before `run_periodic_update` to check whether the values of the field
+        can have changed since the previous periodic update. Field types can
+        override this to skip updates that would not change any value.
+
+        :param field: The field that needs to be periodically updated.
+        :param previous_now: The `now` of the workspace during the previous
+            periodic update, if known.
+        :param now: The `now` of the workspace used for this periodic update.
+        :return: Whether the periodic update of the field must run.
+        """
+
+        return True
+
     def run_periodic_update(
         self,
         field: Field,
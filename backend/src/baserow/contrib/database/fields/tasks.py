@@ -1,6 +1,5 @@
 import traceback
 from datetime import timedelta
-from itertools import groupby
 from typing import Optional
 
 from django.conf import settings
@@ -75,7 +74,11 @@ def _run_periodic_field_type_update_per_workspace(
     if qs is None:
         return
 
+    # The `now` of the previous periodic update is only known if it's refreshed
+    # now, otherwise the values must be recalculated with the same `now`.
+    previous_now = None
     if update_now:
+        previous_now = workspace.now
         workspace.refresh_now()
     add_baserow_trace_attrs(update_now=update_now, workspace_id=workspace.id)
 
@@ -86,6 +89,11 @@ def _run_periodic_field_type_update_per_workspace(
         table__trashed=False,
         table__database__trashed=False,
     ):
+        if not field_type_instance.should_run_periodic_update(
+            field, previous_now, workspace.now
+        ):
+            continue
+
         # noinspection PyBroadException
         try:
             all_updated_fields = _run_periodic_field_update(
@@ -102,10 +110,11 @@ def _run_periodic_field_type_update_per_workspace(
 
     # After a successful periodic update of all fields, we would need to update the
     # search index for all of them in one function per table to avoid ending up in a
-    # deadlock because rows are updated simultaneously.
-    for table_id, fields in groupby(all_updated_fields, lambda x: x.table_id):
-        fields = list(fields)
-        SearchHandler().entire_field_values_changed_or_created(fields[0].table, fields)
+    # deadlock because rows are updated simultaneously. Only the rows of which a
+    # value has changed have been flagged, so only their search vectors are updated.
+    updated_tables = {field.table_id: field.table for field in all_updated_fields}
+    for table in updated_tables.values():
+        SearchHandler().field_value_updated_or_created(table)
 
 
 @app.task(bind=True)
@@ -118,6 +127,36 @@ def delete_mentions_marked_for_deletion(self):
     ).delete()
 
 
+@app.task(bind=True, queue="export")
+def apply_deferred_dependant_updates(self, table_id: int):
+    """
+    Recalculates the formula, lookup and rollup fields depending on the rows that
+    have been updated in a table where the dependant updates are deferred.
+
+    :param table_id: The id of the table having deferred updates.
+    """
+
+    from baserow.contrib.database.fields.dependencies.deferred_updates import (
+        DeferredDependantUpdateHandler,
+    )
+
+    DeferredDependantUpdateHandler.apply_deferred_updates(table_id)
+
+
+@app.task(queue="export")
+def schedule_leftover_deferred_dependant_updates():
+    """
+    Schedules the deferred dependant updates that haven't been applied because
+    their task has been lost.
+    """
+
+    from baserow.contrib.database.fields.dependencies.deferred_updates import (
+        DeferredDependantUpdateHandler,
+    )
+
+    DeferredDependantUpdateHandler.schedule_leftover_deferred_updates()
+
+
 @baserow_trace(tracer)
 def _run_periodic_field_update(field, field_type_instance, all_updated_fields):
     add_baserow_trace_attrs(field_id=field.id)
@@ -136,3 +175,9 @@ def setup_periodic_tasks(sender, **kwargs):
         timedelta(minutes=min(15, settings.STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES)),
         delete_mentions_marked_for_deletion.s(),
     )
+    sender.add_periodic_task(
+        timedelta(
+            seconds=settings.BASEROW_DEFERRED_DEPENDANT_UPDATES_SWEEP_INTERVAL_SECONDS
+        ),
+        schedule_leftover_deferred_dependant_updates.s(),
+    )
@@ -0,0 +1,165 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from django.db import connection
+from django.db.models import ManyToManyField, QuerySet
+
+from psycopg2 import sql
+
+from baserow.core.db import ModelInstance
+
+
+def _get_link_row_field_columns(model_field: ManyToManyField):
+    """
+    Returns the through table of the link row field, the column holding the id of
+    the row and the column holding the id of the related row.
+    """
+
+    through = model_field.remote_field.through
+    return (
+        through._meta.db_table,
+        model_field.m2m_column_name(),
+        model_field.m2m_reverse_name(),
+    )
+
+
+def get_link_row_values_count(
+    model_field: ManyToManyField, row_ids: List[int]
+) -> Dict[int, int]:
+    """
+    Counts the non trashed rows linked to every provided row in one single query.
+
+    :param model_field: The many to many field of the link row field.
+    :param row_ids: The ids of the rows to count the linked rows of.
+    :return: The amount of linked rows per row id. The rows without any linked row
+        are not included.
+    """
+
+    through_table, row_column, related_column = _get_link_row_field_columns(model_field)
+    related_table = model_field.remote_field.model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                "SELECT th.{row}, count(*) FROM {through} th "
+                "JOIN {related} r ON r.id = th.{related_row} "
+                "WHERE th.{row} = ANY(%s) AND NOT r.trashed GROUP BY th.{row}"
+            ).format(
+                row=sql.Identifier(row_column),
+                through=sql.Identifier(through_table),
+                related=sql.Identifier(related_table),
+                related_row=sql.Identifier(related_column),
+            ),
+            [list(row_ids)],
+        )
+        return dict(cursor.fetchall())
+
+
+class LimitedLinkRowPrefetch:
+    """
+    This prefetch class can be used as argument of the `multi_field_prefetch` method.
+    It prefetches at most `limit` related rows per row for the link row field, in
+    the default order of the related table. Compared to a regular prefetch, the
+    related rows that exceed the limit are never fetched from the database.
+
+    Example:
+
+    results = list(
+        model.objects.all().multi_field_prefetch(
+            LimitedLinkRowPrefetch("field_1", 10)
+        )
+    )
+
+    results[0].field_1.all()  # contains at most 10 prefetched rows.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        limit: int,
+        related_queryset: Optional[QuerySet] = None,
+    ):
+        """
+        :param field_name: The name of the many to many field of the link row field.
+        :param limit: The maximum amount of related rows prefetched per row.
+        :param related_queryset: The queryset used to fetch the related rows, so
+            that it can be enhanced. Defaults to all the related rows.
+        """
+
+        self.field_name = field_name
+        self.limit = limit
+        self.related_queryset = related_queryset
+
+    def __call__(self, queryset: QuerySet, result_set: List[ModelInstance]):
+        """
+        This method is called when the queryset resolved. It fetches the ids of the
+        first related rows of every row in one query and then the related rows in
+        another one.
+
+        :param queryset: The queryset that is being resolved.
+        :param result_set: The fetched `result_set` where the prefetched results must
+            be added to.
+        """
+
+        model_field = queryset.model._meta.get_field(self.field_name)
+        related_model = model_field.remote_field.model
+        through_table, row_column, related_column = _get_link_row_field_columns(
+            model_field
+        )
+
+        related_ids_per_row = defaultdict(list)
+        row_ids = [result.id for result in result_set]
+        if row_ids:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL(
+                        "SELECT row_id, related_id FROM ("
+                        "SELECT th.{row} AS row_id, th.{related_row} AS related_id, "
+                        "row_number() OVER ("
+                        "PARTITION BY th.{row} ORDER BY r.{order}, r.id"
+                        ") AS position FROM {through} th "
+                        "JOIN {related} r ON r.id = th.{related_row} "
+                        "WHERE th.{row} = ANY(%s) AND NOT r.trashed"
+                        ") limited WHERE position <= %s ORDER BY row_id, position"
+                    ).format(
+                        row=sql.Identifier(row_column),
+                        related_row=sql.Identifier(related_column),
+                        order=sql.Identifier("order"),
+                        through=sql.Identifier(through_table),
+                        related=sql.Identifier(related_model._meta.db_table),
+                    ),
+                    [row_ids, self.limit],
+                )
+                for row_id, related_id in cursor.fetchall():
+                    related_ids_per_row[row_id].append(related_id)
+
+        related_queryset = self.related_queryset
+        if related_queryset is None:
+            related_queryset = related_model.objects.all()
+        all_related_ids = {
+            related_id
+            for related_ids in related_ids_per_row.values()
+            for related_id in related_ids
+        }
+        related_instances = (
+            {
+                instance.id: instance
+                for instance in related_queryset.filter(id__in=all_related_ids)
+            }
+            if all_related_ids
+            else {}
+        )
+
+        for result in result_set:
+            qs = getattr(result, self.field_name).get_queryset()
+            qs._result_cache = [
+                related_instances[related_id]
+                for related_id in related_ids_per_row[result.id]
+                if related_id in related_instances
+            ]
+            qs._prefetch_done = True
+            result._prefetched_objects_cache = getattr(
+                result, "_prefetched_objects_cache", {}
+            )
+            result._prefetched_objects_cache[self.field_name] = qs
+
+        return result_set
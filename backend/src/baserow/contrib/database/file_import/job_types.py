@@ -1,5 +1,3 @@
-import json
-
 from django.core.files.base import ContentFile
 from django.db import transaction
 
@@ -36,6 +34,7 @@ from baserow.core.jobs.registries import JobType
 
 from .models import FileImportJob
 from .serializers import ReportSerializer
+from .utils import read_file_import_data, serialize_file_import_data
 
 BATCH_SIZE = 1024
 
@@ -94,12 +93,11 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The rows are stored as JSON
+        lines so that they can be streamed by `.run()`.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
-        )
+        data_file = ContentFile(serialize_file_import_data(values["data"]))
         job.data_file.save(None, data_file)
 
     def before_delete(self, job):
@@ -133,30 +131,37 @@ class FileImportJobType(JobType):
         creation of the table.
         """
 
+        # The rows are read from the data file while they're imported, chunk by chunk,
+        # so the file is never loaded in memory as a whole.
         with job.data_file.open("r") as fin:
-            data = json.load(fin)
-
-        if job.table is None:
-            new_table, error_report = action_type_registry.get_by_type(
-                CreateTableActionType
-            ).do(
-                job.user,
-                job.database,
-                name=job.name,
-                data=data,
-                first_row_header=job.first_row_header,
-                progress=progress,
-            )
-
-            job.table = new_table
-            job.save(update_fields=("table",))
-        else:
-            _, error_report = action_type_registry.get_by_type(ImportRowsActionType).do(
-                job.user,
-                table=job.table,
-                data=data,
-                progress=progress,
-            )
+            data, row_count, column_count = read_file_import_data(fin)
+
+            if job.table is None:
+                new_table, error_report = action_type_registry.get_by_type(
+                    CreateTableActionType
+                ).do(
+                    job.user,
+                    job.database,
+                    name=job.name,
+                    data=data,
+                    first_row_header=job.first_row_header,
+                    progress=progress,
+                    row_count=row_count,
+                    column_count=column_count,
+                )
+
+                job.table = new_table
+                job.save(update_fields=("table",))
+            else:
+                _, error_report = action_type_registry.get_by_type(
+                    ImportRowsActionType
+                ).do(
+                    job.user,
+                    table=job.table,
+                    data=data,
+                    progress=progress,
+                    row_count=row_count,
+                )
 
         def after_commit():
             """
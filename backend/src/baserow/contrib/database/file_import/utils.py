@@ -0,0 +1,43 @@
+import json
+from typing import IO, Any, Iterable, List, Tuple
+
+
+def serialize_file_import_data(data: List[List[Any]]) -> bytes:
+    """
+    Serializes the rows of a file import as JSON lines. The first line contains the
+    amount of rows and the largest amount of columns, then every line contains a
+    single row. This allows the import job to read the rows one by one instead of
+    loading the whole file in memory.
+
+    :param data: The normalized rows to import.
+    :return: The content of the data file.
+    """
+
+    metadata = {
+        "row_count": len(data),
+        "column_count": max(map(len, data), default=0),
+    }
+    return "".join(
+        json.dumps(line, ensure_ascii=False) + "\n" for line in [metadata, *data]
+    ).encode("utf8")
+
+
+def read_file_import_data(fin: IO) -> Tuple[Iterable[List[Any]], int, int]:
+    """
+    Reads a data file written by `serialize_file_import_data`. The rows are lazily
+    parsed while they're consumed, so the file must remain open until then.
+
+    :param fin: The opened data file.
+    :return: An iterable yielding the rows, the amount of rows and the largest amount
+        of columns.
+    """
+
+    first_line = json.loads(fin.readline())
+
+    if isinstance(first_line, list):
+        # Data files created before the JSON lines format contain a single JSON
+        # array with all the rows.
+        return first_line, len(first_line), max(map(len, first_line), default=0)
+
+    rows = (json.loads(line) for line in fin if line.strip())
+    return rows, first_line["row_count"], first_line["column_count"]
@@ -1526,6 +1526,8 @@ class BaserowNow(ZeroArgumentBaserowFunction):
 class BaserowToday(ZeroArgumentBaserowFunction):
     type = "today"
     needs_periodic_update = True
+    # The UTC date is the only thing that can change the result of this function.
+    periodic_update_only_needed_on_date_change = True
 
     def type_function(
         self, func_call: BaserowFunctionCall[UnTyped]
@@ -57,6 +57,17 @@ def _needs_periodic_update(expression: BaserowExpression):
     return any(getattr(f, "needs_periodic_update", False) for f in functions_used)
 
 
+def _periodic_update_only_needed_on_date_change(expression: BaserowExpression):
+    functions_used: Set[BaserowFunctionDefinition] = expression.accept(
+        FunctionsUsedVisitor()
+    )
+    return all(
+        getattr(f, "periodic_update_only_needed_on_date_change", False)
+        for f in functions_used
+        if getattr(f, "needs_periodic_update", False)
+    )
+
+
 def _expression_requires_refresh_after_insert(expression: BaserowExpression):
     """
     WARNING: This function is directly used by migration code. Please ensure
@@ -319,6 +330,22 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         )
         return untyped_internal_expr.with_type(formula_field.cached_formula_type)
 
+    @classmethod
+    def periodic_update_only_needed_on_date_change(cls, formula_field) -> bool:
+        """
+        Checks whether the values of the provided formula field, which needs a
+        periodic update, can only change when the date changes. This is for
+        example the case for `today()`, but not for `now()`.
+
+        :param formula_field: The formula field needing a periodic update.
+        :return: True if all the functions needing a periodic update only depend on
+            the date.
+        """
+
+        return _periodic_update_only_needed_on_date_change(
+            formula_field.cached_typed_internal_expression
+        )
+
     @classmethod
     def recalculate_formula_field_cached_properties(cls, formula_field, field_cache):
         """
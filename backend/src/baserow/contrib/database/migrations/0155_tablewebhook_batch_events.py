@@ -0,0 +1,72 @@
+# Generated by Django 4.1.13 on 2024-04-15 10:00
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0154_richtextfieldmention_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tablewebhook",
+            name="batch_events",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the events must be collected for a short "
+                "while and sent together in a single call instead of making a call "
+                "per event.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tablewebhook",
+            name="batch_scheduled",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether a call delivering the batched events has "
+                "been scheduled.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="TableWebhookBatchedEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event_id",
+                    models.UUIDField(help_text="The unique id of the event."),
+                ),
+                ("event_type", models.CharField(max_length=50)),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The payload of the event that must be included in "
+                        "the next call.",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "webhook",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="batched_events",
+                        to="database.tablewebhook",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
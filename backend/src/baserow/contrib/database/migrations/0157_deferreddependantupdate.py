@@ -0,0 +1,71 @@
+# Generated by Django 4.1.13 on 2024-04-17 10:00
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0156_convertfieldjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="defer_dependant_updates",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the formula, lookup and rollup fields in other tables depending on the changed rows are updated in the background instead of while the rows are updated.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="DeferredDependantUpdate",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "row_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(),
+                        help_text="The ids of the rows that have been changed.",
+                        size=None,
+                    ),
+                ),
+                (
+                    "field_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(),
+                        help_text="The ids of the fields of which the values have been changed.",
+                        size=None,
+                    ),
+                ),
+                (
+                    "deleted_m2m_rels_per_link_field",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The ids of the related rows that aren't linked to the changed rows anymore, per link row field id.",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deferred_dependant_updates",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.1.13 on 2024-04-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0157_deferreddependantupdate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="linkrowfield",
+            name="link_row_values_limit",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="The maximum amount of linked rows included in the value of "
+                "a row when listing rows. All the linked rows are included if not set.",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.1.13 on 2024-04-22 10:00
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0158_linkrowfield_link_row_values_limit"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RowChange",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "transaction_id",
+                    models.BigIntegerField(
+                        help_text="The id of the database transaction that changed "
+                        "the rows. The changes are listed in the order of this id, so "
+                        "that a change committed after a more recent one is never "
+                        "skipped."
+                    ),
+                ),
+                (
+                    "change_type",
+                    models.CharField(
+                        choices=[
+                            ("created", "created"),
+                            ("updated", "updated"),
+                            ("deleted", "deleted"),
+                            ("refreshed", "refreshed"),
+                        ],
+                        help_text="Whether the rows have been created, updated or "
+                        "deleted, or if any row might have changed.",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "row_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveIntegerField(),
+                        help_text="The ids of the changed rows. Empty if any row "
+                        "might have changed.",
+                        size=None,
+                    ),
+                ),
+                (
+                    "field_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveIntegerField(),
+                        help_text="The ids of the updated fields. Only set for "
+                        "updated rows.",
+                        null=True,
+                        size=None,
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="The moment the rows have changed."
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        help_text="The table where the rows have changed.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("transaction_id", "id"),
+                "indexes": [
+                    models.Index(
+                        fields=["table", "transaction_id", "id"],
+                        name="database_ro_table_i_6bc5b7_idx",
+                    )
+                ],
+            },
+        ),
+    ]
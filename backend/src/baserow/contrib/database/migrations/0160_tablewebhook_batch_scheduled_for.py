@@ -0,0 +1,25 @@
+# Generated by Django 4.1.13 on 2024-04-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0159_rowchange"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="tablewebhook",
+            name="batch_scheduled",
+        ),
+        migrations.AddField(
+            model_name="tablewebhook",
+            name="batch_scheduled_for",
+            field=models.DateTimeField(
+                help_text="The moment the scheduled call delivering the batched "
+                "events is expected to run. Empty if no call has been scheduled.",
+                null=True,
+            ),
+        ),
+    ]
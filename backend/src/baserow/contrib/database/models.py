@@ -1,4 +1,7 @@
-from baserow.contrib.database.fields.dependencies.models import FieldDependency
+from baserow.contrib.database.fields.dependencies.models import (
+    DeferredDependantUpdate,
+    FieldDependency,
+)
 from baserow.core.models import Application
 
 from .fields.models import (
@@ -28,6 +31,7 @@ from .views.models import (
 )
 from .webhooks.models import (
     TableWebhook,
+    TableWebhookBatchedEvent,
     TableWebhookCall,
     TableWebhookEvent,
     TableWebhookHeader,
@@ -61,7 +65,9 @@ __all__ = [
     "TableWebhookEvent",
     "TableWebhookHeader",
     "TableWebhookCall",
+    "TableWebhookBatchedEvent",
     "FieldDependency",
+    "DeferredDependantUpdate",
 ]
 
 
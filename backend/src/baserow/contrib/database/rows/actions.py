@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -220,7 +220,8 @@ class ImportRowsActionType(UndoableActionType):
         table: Table,
         data=List[List[Any]],
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+        row_count: Optional[int] = None,
+    ) -> Tuple[List[Union[GeneratedTableModel, int]], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -235,12 +236,22 @@ class ImportRowsActionType(UndoableActionType):
         :param table: The table for which the rows should be imported.
         :param data: List of rows values for rows that need to be created.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :param row_count: If provided, `data` can be any iterable yielding this amount
+            of rows. The rows are then imported chunk by chunk using
+            `RowHandler.import_rows_in_chunks` and only their ids are returned.
+        :return: The created list of rows instances (or ids) and the error report.
         """
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress
-        )
+        if row_count is not None:
+            created_rows, error_report = RowHandler().import_rows_in_chunks(
+                user, table, data, row_count, progress=progress
+            )
+            row_ids = created_rows
+        else:
+            created_rows, error_report = RowHandler().import_rows(
+                user, table, data, progress=progress
+            )
+            row_ids = [row.id for row in created_rows]
 
         workspace = table.database.workspace
         params = cls.Params(
@@ -248,7 +259,7 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
@@ -701,6 +712,65 @@ class UpdateRowActionType(UndoableActionType):
         )
 
 
+def get_changed_rows_values(
+    rows_values: List[Dict[str, Any]],
+    original_rows_values_by_id: Dict[int, Dict[str, Any]],
+    fields_metadata_by_row_id: Dict[int, Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]], Dict[int, Dict[str, Any]]]:
+    """
+    Strips the values that haven't changed from the new values, the original values
+    and the fields metadata of the updated rows, so that only the field level diff
+    has to be stored in the action params. The rows of which no value has changed
+    are left out entirely.
+
+    :param rows_values: The new values of the rows, including their id.
+    :param original_rows_values_by_id: The values of the rows before the update by
+        row id.
+    :param fields_metadata_by_row_id: The metadata of the fields by row id.
+    :return: The changed new values, original values and fields metadata.
+    """
+
+    changed_rows_values = []
+    changed_original_rows_values_by_id = {}
+    changed_fields_metadata_by_row_id = {}
+    for row_values in rows_values:
+        row_id = row_values["id"]
+        original_values = original_rows_values_by_id.get(row_id, {})
+        changed_values = {
+            key: value
+            for key, value in row_values.items()
+            if key != "id"
+            and (key not in original_values or original_values[key] != value)
+        }
+        if not changed_values:
+            continue
+
+        fields_metadata = fields_metadata_by_row_id.get(row_id, {})
+        changed_rows_values.append({"id": row_id, **changed_values})
+        changed_original_rows_values_by_id[row_id] = {
+            "id": row_id,
+            **{
+                key: original_values[key]
+                for key in changed_values
+                if key in original_values
+            },
+        }
+        changed_fields_metadata_by_row_id[row_id] = {
+            "id": row_id,
+            **{
+                key: fields_metadata[key]
+                for key in changed_values
+                if key in fields_metadata
+            },
+        }
+
+    return (
+        changed_rows_values,
+        changed_original_rows_values_by_id,
+        changed_fields_metadata_by_row_id,
+    )
+
+
 class UpdateRowsActionType(UndoableActionType):
     type = "update_rows"
     description = ActionTypeDescription(
@@ -751,6 +821,18 @@ class UpdateRowsActionType(UndoableActionType):
         result = row_handler.update_rows(user, table, rows_values, model=model)
         updated_rows = result.updated_rows
 
+        # Pasting into a large grid can update many rows at once, so only the values
+        # that have actually changed are stored to keep the action params small.
+        (
+            changed_rows_values,
+            original_rows_values_by_id,
+            updated_fields_metadata_by_row_id,
+        ) = get_changed_rows_values(
+            rows_values,
+            result.original_rows_values_by_id,
+            result.updated_fields_metadata_by_row_id,
+        )
+
         workspace = table.database.workspace
         params = cls.Params(
             table.id,
@@ -758,9 +840,9 @@ class UpdateRowsActionType(UndoableActionType):
             table.database.id,
             table.database.name,
             [row.id for row in updated_rows],
-            rows_values,
-            result.original_rows_values_by_id,
-            result.updated_fields_metadata_by_row_id,
+            changed_rows_values,
+            original_rows_values_by_id,
+            updated_fields_metadata_by_row_id,
         )
         cls.register_action(user, params, cls.scope(table.id), workspace=workspace)
 
@@ -797,11 +879,17 @@ class UpdateRowsActionType(UndoableActionType):
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
-        table = TableHandler().get_table(params.table_id)
         original_rows_values = list(params.original_rows_values_by_id.values())
+        if not original_rows_values:
+            return
+
+        table = TableHandler().get_table(params.table_id)
         RowHandler().update_rows(user, table, original_rows_values)
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
+        if not params.row_values:
+            return
+
         table = TableHandler().get_table(params.table_id)
         RowHandler().update_rows(user, table, params.row_values)
@@ -0,0 +1,168 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.dispatch import receiver
+
+from baserow.contrib.database.rows.exceptions import (
+    InvalidRowChangeCursor,
+    RowChangeCursorExpired,
+)
+from baserow.contrib.database.rows.models import RowChange
+from baserow.contrib.database.rows.signals import (
+    rows_created,
+    rows_deleted,
+    rows_updated,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.signals import table_updated
+
+
+class RowChangeLogHandler:
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS > 0
+
+    @classmethod
+    def record_change(
+        cls,
+        table: Table,
+        change_type: str,
+        row_ids: Iterable[int],
+        field_ids: Optional[Iterable[int]] = None,
+    ) -> Optional[RowChange]:
+        """
+        Appends a change of the provided rows to the change log of the table. The id
+        of the current transaction is stored with it, so that listing the changes
+        can wait until all the transactions that might still add older changes
+        have finished.
+
+        :param table: The table where the rows have changed.
+        :param change_type: One of `RowChange.CHANGE_TYPES`.
+        :param row_ids: The ids of the changed rows.
+        :param field_ids: The ids of the updated fields, if the rows were updated.
+        :return: The created entry or None if the change log is disabled.
+        """
+
+        if not cls.is_enabled():
+            return None
+
+        return RowChange.objects.create(
+            table=table,
+            transaction_id=RawSQL("txid_current()", []),
+            change_type=change_type,
+            row_ids=sorted(row_ids),
+            field_ids=sorted(field_ids) if field_ids is not None else None,
+        )
+
+    @classmethod
+    def encode_cursor(cls, change: RowChange) -> str:
+        return f"{change.transaction_id}_{change.id}"
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> Tuple[int, int]:
+        """
+        :raises InvalidRowChangeCursor: If the cursor is malformed.
+        """
+
+        try:
+            transaction_id, change_id = cursor.split("_")
+            return int(transaction_id), int(change_id)
+        except ValueError:
+            raise InvalidRowChangeCursor()
+
+    @classmethod
+    def list_changes(
+        cls, table_id: int, since: Optional[str], limit: int
+    ) -> Tuple[List[RowChange], Optional[str], bool]:
+        """
+        Lists the changes of the rows of the table after the provided cursor, in
+        the order they must be applied. Only the changes made by transactions that
+        are older than any still running transaction are returned, because those
+        could still add changes that must come first. This guarantees that
+        continuing from the returned cursor never skips a change.
+
+        :param table_id: The id of the table to list the row changes of.
+        :param since: The cursor returned by a previous call. All the retained
+            changes are listed if not provided.
+        :param limit: The maximum number of changes to return.
+        :raises InvalidRowChangeCursor: If the provided cursor is malformed.
+        :raises RowChangeCursorExpired: If the change of the provided cursor has
+            been removed from the change log because of its age, in which case the
+            changes following it might have been removed too.
+        :return: The changes, the cursor to list the next changes from and whether
+            there are more changes after them. The cursor is the provided one if
+            there are no new changes.
+        """
+
+        queryset = RowChange.objects.filter(
+            table_id=table_id,
+            transaction_id__lt=RawSQL(
+                "txid_snapshot_xmin(txid_current_snapshot())", []
+            ),
+        ).order_by("transaction_id", "id")
+
+        if since:
+            transaction_id, change_id = cls.decode_cursor(since)
+            # The entries are only removed once they're older than the retention
+            # period, so if the entry of the cursor still exists, then all the ones
+            # following it still exist as well.
+            if not RowChange.objects.filter(
+                table_id=table_id, transaction_id=transaction_id, id=change_id
+            ).exists():
+                raise RowChangeCursorExpired()
+            queryset = queryset.filter(
+                Q(transaction_id__gt=transaction_id)
+                | Q(transaction_id=transaction_id, id__gt=change_id)
+            )
+
+        changes = list(queryset[: limit + 1])
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        next_cursor = cls.encode_cursor(changes[-1]) if changes else since
+        return changes, next_cursor, has_more
+
+    @classmethod
+    def delete_entries_older_than(cls, cutoff: datetime):
+        """
+        Deletes all row change log entries that are older than the given cutoff
+        date.
+
+        :param cutoff: The date and time before which all entries will be deleted.
+        """
+
+        delete_qs = RowChange.objects.filter(timestamp__lt=cutoff)
+        delete_qs._raw_delete(delete_qs.db)
+
+
+@receiver(rows_created)
+def rows_created_record_change(sender, rows, table, **kwargs):
+    RowChangeLogHandler.record_change(
+        table, RowChange.CHANGE_TYPE_CREATED, [row.id for row in rows]
+    )
+
+
+@receiver(rows_updated)
+def rows_updated_record_change(sender, rows, table, updated_field_ids=None, **kwargs):
+    RowChangeLogHandler.record_change(
+        table,
+        RowChange.CHANGE_TYPE_UPDATED,
+        [row.id for row in rows],
+        updated_field_ids or [],
+    )
+
+
+@receiver(rows_deleted)
+def rows_deleted_record_change(sender, rows, table, **kwargs):
+    RowChangeLogHandler.record_change(
+        table, RowChange.CHANGE_TYPE_DELETED, [row.id for row in rows]
+    )
+
+
+@receiver(table_updated)
+def table_updated_record_change(sender, table, force_table_refresh=False, **kwargs):
+    # The rows might have been changed in bulk without sending the row signals.
+    if force_table_refresh:
+        RowChangeLogHandler.record_change(table, RowChange.CHANGE_TYPE_REFRESHED, [])
@@ -24,3 +24,15 @@ class ReportMaxErrorCountExceeded(Exception):
     def __init__(self, report, *args, **kwargs):
         self.report = report
         super().__init__("Too many errors", *args, **kwargs)
+
+
+class InvalidRowChangeCursor(Exception):
+    """Raised when the cursor to list the row changes from is malformed."""
+
+
+class RowChangeCursorExpired(Exception):
+    """
+    Raised when the changes following the cursor to list the row changes from might
+    have been removed from the change log, because they're older than the retention
+    period.
+    """
@@ -1,6 +1,7 @@
 from collections import defaultdict
 from copy import deepcopy
 from decimal import Decimal
+from math import floor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,10 +18,11 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import connection, transaction
-from django.db.models import Model, QuerySet, Window
+from django.db.models import Expression, Model, Q, QuerySet, Window
 from django.db.models.expressions import RawSQL
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.db.models.functions import RowNumber
@@ -28,6 +30,9 @@ from django.utils.encoding import force_str
 
 from opentelemetry import metrics, trace
 
+from baserow.contrib.database.fields.dependencies.deferred_updates import (
+    DeferredDependantUpdateHandler,
+)
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
@@ -60,8 +65,9 @@ from ..table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
 )
 from .constants import ROW_IMPORT_CREATION, ROW_IMPORT_VALIDATION
+from .copy_insert import CopyInsertNotSupported, copy_insert
 from .error_report import RowErrorReport
-from .exceptions import RowDoesNotExist, RowIdsNotUnique
+from .exceptions import ReportMaxErrorCountExceeded, RowDoesNotExist, RowIdsNotUnique
 from .operations import (
     DeleteDatabaseRowOperationType,
     MoveRowDatabaseRowOperationType,
@@ -71,6 +77,7 @@ from .operations import (
 from .signals import (
     before_rows_delete,
     before_rows_update,
+    row_orders_rebalanced,
     row_orders_recalculated,
     rows_created,
     rows_deleted,
@@ -90,6 +97,15 @@ RowsForUpdate = NewType("RowsForUpdate", QuerySet)
 
 
 BATCH_SIZE = 1024
+# The amount of rows that are read, validated and created at once when importing
+# rows in chunks.
+IMPORT_CHUNK_SIZE = 10 * BATCH_SIZE
+# The amount of rows before and after the target row of which the orders are spread
+# out again when no intermediate order can be found anymore.
+ROW_ORDER_REBALANCE_WINDOW = 50
+# The minimum gap between two rebalanced orders. The window is widened until the
+# orders in it can be spread out by at least this gap.
+ROW_ORDER_REBALANCE_MIN_STEP = Decimal("0.0001")
 
 meter = metrics.get_meter(__name__)
 rows_created_counter = meter.create_counter(
@@ -387,8 +403,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         provided `before_row` or at the end of the table, depending on whether the
         `before_row` value is provided.
 
-        Note that this method can trigger an update of all the rows in the table in
-        the event all the orders must be recalculated.
+        Note that this method can update the orders of the rows around the
+        `before_row` in the event no intermediate order can be found anymore.
 
         :param before_row: The row instance where the before orders must be
             calculated for. If `None`, then it's assumed that the orders are for
@@ -409,10 +425,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             except CannotCalculateIntermediateOrder:
                 # If the `find_intermediate_order` fails with a
                 # `CannotCalculateIntermediateOrder`, it means that it's not possible
-                # calculate an intermediate fraction. Therefore, must reset all the
-                # orders of the table (while respecting their original order),
-                # so that we can then can find the fraction any many more after.
-                self.recalculate_row_orders(model.baserow_table, model)
+                # calculate an intermediate fraction. Therefore, must spread out the
+                # orders of the rows around the `before_row` (while respecting their
+                # original order), so that we can then find the fraction and many
+                # more after.
+                self.rebalance_row_orders(model.baserow_table, before_row, model)
                 # Refresh the row element as its order might have changed
                 before_row.refresh_from_db()
                 return get_unique_orders_before_item(
@@ -871,6 +888,34 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         values = mapped_back_to_internal_field_names
         return values
 
+    def _apply_or_defer_dependant_updates(
+        self,
+        table: Table,
+        row_ids: List[int],
+        updated_field_ids: Set[int],
+        deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
+        update_collector: FieldUpdateCollector,
+        field_cache: FieldCache,
+    ):
+        """
+        Applies the collected updates of the fields depending on the updated rows. If
+        the table defers the dependant updates, then only the dependants in the table
+        itself are updated right away, and the dependants in the other tables are
+        recalculated later by a background worker.
+        """
+
+        if not table.defer_dependant_updates:
+            update_collector.apply_updates_and_get_updated_fields(field_cache)
+            return
+
+        update_collector.apply_starting_table_updates_and_get_updated_fields(
+            field_cache
+        )
+        if update_collector.has_updates_via_link_row_fields():
+            DeferredDependantUpdateHandler.defer_updates(
+                table, row_ids, updated_field_ids, deleted_m2m_rels_per_link_field
+            )
+
     def update_row_by_id(
         self,
         user: AbstractUser,
@@ -1023,7 +1068,14 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 field_cache,
                 path_to_starting_table,
             )
-        update_collector.apply_updates_and_get_updated_fields(field_cache)
+        self._apply_or_defer_dependant_updates(
+            table,
+            [row.id],
+            updated_field_ids,
+            m2m_change_tracker.get_deleted_link_row_rels_for_update_collector(),
+            update_collector,
+            field_cache,
+        )
         # We need to refresh here as ExpressionFields might have had their values
         # updated. Django does not support UPDATE .... RETURNING and so we need to
         # query for the rows updated values instead.
@@ -1130,8 +1182,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             # saved.
             instance._m2m_values = relations
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, _) in rows_relationships]
+        threshold = settings.BASEROW_CREATE_ROWS_COPY_THRESHOLD
+        use_copy = bool(threshold) and len(rows_relationships) >= threshold
+        inserted_rows, pending_update_statements = self._insert_rows(
+            model, [row for (row, _) in rows_relationships], use_copy=use_copy
         )
         rows_created_counter.add(len(rows_relationships))
 
@@ -1153,11 +1207,15 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         for field_name, values in many_to_many.items():
             through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+            self._insert_rows(through, values, use_copy=use_copy)
 
         update_collector = FieldUpdateCollector(
             table, starting_row_ids=[row.id for row in inserted_rows]
         )
+        for field_name, update_statement in pending_update_statements.items():
+            update_collector.add_field_with_pending_update_statement(
+                model.get_field_object(field_name)["field"], update_statement
+            )
         field_cache = FieldCache()
         field_cache.cache_model(model)
         field_ids = []
@@ -1229,6 +1287,31 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             return inserted_rows, report
         return rows_to_return
 
+    def _insert_rows(
+        self, model: Type[Model], rows: List[Model], use_copy: bool = False
+    ) -> Tuple[List[Model], Dict[str, Expression]]:
+        """
+        Inserts the provided model instances in the database. If `use_copy` is True
+        the instances are streamed using the `COPY` command, which is a lot faster
+        for a large amount of rows. If one of the values can't be copied, it falls
+        back to `bulk_create`.
+
+        :param model: The model of the instances.
+        :param rows: The instances that must be inserted.
+        :param use_copy: Whether the `COPY` command should be used.
+        :return: The inserted instances and the update statements, by field name,
+            that still have to be executed for the inserted rows. Only the `COPY`
+            command leaves pending update statements, for the formula fields.
+        """
+
+        if use_copy:
+            try:
+                return rows, copy_insert(model, rows)
+            except CopyInsertNotSupported:
+                pass
+
+        return model.objects.bulk_create(rows), {}
+
     def _prepare_m2m_field_related_objects(
         self, row: GeneratedTableModel, field_name: str, value: List[Any]
     ) -> Tuple[List[Type[Model]], str]:
@@ -1333,6 +1416,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
+        skip_search_update: bool = False,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates rows by batch and generates an error report instead of failing on first
@@ -1343,6 +1427,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
         :param model: Optional model to prevent recomputing table model.
+        :param skip_search_update: If True, the search update task is not triggered.
+            The caller is then responsible for triggering it once all the rows have
+            been created.
         :return: The created rows and the error report.
         """
 
@@ -1382,7 +1469,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
             all_created_rows += created_rows
 
-        SearchHandler.field_value_updated_or_created(table)
+        if not skip_search_update:
+            SearchHandler.field_value_updated_or_created(table)
 
         return all_created_rows, report
 
@@ -1423,9 +1511,120 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             context=table,
         )
 
+        model = table.get_model()
+        fields = self._get_import_fields(model)
+
         error_report = RowErrorReport(data)
+        created_rows = self._import_rows_chunk(
+            user,
+            table,
+            model,
+            fields,
+            data,
+            error_report,
+            validate=validate,
+            progress=progress,
+        )
+
+        if send_realtime_update:
+            # Just send a single table_updated here as realtime update instead
+            # of rows_created because we might import a lot of rows.
+            table_updated.send(self, table=table, user=user, force_table_refresh=True)
+
+        return created_rows, error_report.to_dict()
+
+    def import_rows_in_chunks(
+        self,
+        user: AbstractUser,
+        table: Table,
+        data: Iterable[List[Any]],
+        row_count: int,
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        send_realtime_update: bool = True,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Tuple[List[int], Dict[int, Dict[str, Any]]]:
+        """
+        Works like `import_rows`, but consumes the provided data iterable chunk by
+        chunk. Every chunk is validated, created and reported before the next one is
+        read, so the memory usage is bounded by the chunk size instead of the
+        amount of rows. Only the ids of the created rows are kept and returned.
+
+        :param user: The user of whose behalf the rows are created.
+        :param table: The table for which the rows should be created.
+        :param data: An iterable of rows values, for example a generator reading
+            the rows from a file.
+        :param row_count: The amount of rows the iterable yields. Used to track the
+            progress.
+        :param validate: If True the data are validated before the import.
+        :param progress: Give a progress instance to track the progress of the
+            import.
+        :param send_realtime_update: The parameter passed to the rows_created
+            signal indicating if a realtime update should be send.
+        :param chunk_size: The maximum amount of rows kept in memory at once.
+        :raises ReportMaxErrorCountExceeded: When the total amount of errors exceeds
+            the report error limit.
+        :return: The ids of the created rows and the error report.
+        """
+
+        workspace = table.database.workspace
+        CoreHandler().check_permissions(
+            user,
+            ImportRowsDatabaseTableOperationType.type,
+            workspace=workspace,
+            context=table,
+        )
 
         model = table.get_model()
+        fields = self._get_import_fields(model)
+
+        import_progress = progress.create_child(100, row_count) if progress else None
+
+        created_row_ids = []
+        report = {}
+        error_limit = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT
+        for count, chunk in enumerate(grouper(chunk_size, data)):
+            row_start_index = count * chunk_size
+            error_report = RowErrorReport(chunk, error_limit=error_limit - len(report))
+            chunk_progress = (
+                import_progress.create_child(len(chunk), 100)
+                if import_progress
+                else None
+            )
+
+            try:
+                created_rows = self._import_rows_chunk(
+                    user,
+                    table,
+                    model,
+                    fields,
+                    chunk,
+                    error_report,
+                    validate=validate,
+                    progress=chunk_progress,
+                    skip_search_update=True,
+                )
+            except ReportMaxErrorCountExceeded as exc:
+                for index, error in exc.report.items():
+                    report[index + row_start_index] = error
+                raise ReportMaxErrorCountExceeded(report) from exc
+
+            created_row_ids += [row.id for row in created_rows]
+            for index, error in error_report.to_dict().items():
+                report[index + row_start_index] = error
+
+        SearchHandler.field_value_updated_or_created(table)
+
+        if send_realtime_update:
+            table_updated.send(self, table=table, user=user, force_table_refresh=True)
+
+        return created_row_ids, report
+
+    def _get_import_fields(self, model: Type[GeneratedTableModel]) -> List["Field"]:
+        """
+        Returns the fields the imported values are mapped to, in the order they
+        appear in the imported rows.
+        """
 
         fields = [
             field_object["field"]
@@ -1435,6 +1634,26 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Sort by order then by id
         fields.sort(key=lambda f: (f.order, f.id))
+        return fields
+
+    def _import_rows_chunk(
+        self,
+        user: AbstractUser,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        fields: List["Field"],
+        data: Iterable[List[Any]],
+        error_report: RowErrorReport,
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        skip_search_update: bool = False,
+    ) -> List[GeneratedTableModel]:
+        """
+        Reshapes, validates and creates the provided rows values. The errors are
+        added to the provided error report, which must be built from the same data.
+
+        :return: The created row instances.
+        """
 
         for index, row in enumerate(data):
             # Check row length
@@ -1488,7 +1707,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
 
         created_rows, creation_report = self.create_rows_by_batch(
-            user, table, valid_rows, progress=creation_sub_progress, model=model
+            user,
+            table,
+            valid_rows,
+            progress=creation_sub_progress,
+            model=model,
+            skip_search_update=skip_search_update,
         )
 
         # Add errors to global report
@@ -1498,12 +1722,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 error,
             )
 
-        if send_realtime_update:
-            # Just send a single table_updated here as realtime update instead
-            # of rows_created because we might import a lot of rows.
-            table_updated.send(self, table=table, user=user, force_table_refresh=True)
-
-        return created_rows, error_report.to_dict()
+        return created_rows
 
     def get_fields_metadata_for_row_history(
         self,
@@ -1792,7 +2011,14 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 field_cache,
                 path_to_starting_table,
             )
-        update_collector.apply_updates_and_get_updated_fields(field_cache)
+        self._apply_or_defer_dependant_updates(
+            table,
+            row_ids,
+            updated_field_ids,
+            m2m_change_tracker.get_deleted_link_row_rels_for_update_collector(),
+            update_collector,
+            field_cache,
+        )
 
         from baserow.contrib.database.views.handler import ViewHandler
 
@@ -2171,6 +2397,88 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return trashed_rows
 
+    def rebalance_row_orders(
+        self,
+        table: Table,
+        row: GeneratedTableModel,
+        model: Optional[Type[GeneratedTableModel]] = None,
+        window: int = ROW_ORDER_REBALANCE_WINDOW,
+    ) -> List[GeneratedTableModel]:
+        """
+        Spreads out the orders of the rows around the provided row evenly, while
+        respecting their existing position, so that new intermediate orders can be
+        found again. Only the rows in a window around the row are updated, the
+        window is widened until the orders can be spread out by at least
+        `ROW_ORDER_REBALANCE_MIN_STEP`. Contrary to `recalculate_row_orders`, this
+        never has to rewrite all the rows of a large table.
+
+        With a window of one row around row 3:
+
+        id     old_order                 new_order
+        1      1.00000000000000000000    1.00000000000000000000
+        2      1.99999999999999999998    1.50000000000000000000
+        3      1.99999999999999999999    2.00000000000000000000
+        4      2.00000000000000000000    2.50000000000000000000
+        5      3.00000000000000000000    3.00000000000000000000
+
+        :param table: The table of which the row orders must be rebalanced.
+        :param row: The row around which the orders must be rebalanced.
+        :param model: The already generated model if any.
+        :param window: The initial amount of rows before and after the row of
+            which the orders are rebalanced.
+        :return: The rows of which the order has been updated.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        queryset = model.objects_and_trash
+        before_q = Q(order__lt=row.order) | Q(order=row.order, id__lt=row.id)
+
+        while True:
+            rows_before = list(
+                queryset.filter(before_q).order_by("-order", "-id")[: window + 1]
+            )
+            rows_after = list(
+                queryset.exclude(before_q).order_by("order", "id")[: window + 2]
+            )
+
+            rows_to_rebalance = (
+                list(reversed(rows_before[:window])) + rows_after[: window + 1]
+            )
+            if len(rows_before) > window:
+                lower_bound = rows_before[window].order
+            else:
+                lower_bound = min(Decimal("0"), floor(rows_to_rebalance[0].order) - 1)
+
+            if len(rows_after) > window + 1:
+                upper_bound = rows_after[window + 1].order
+                step = (upper_bound - lower_bound) / (len(rows_to_rebalance) + 1)
+                if step < ROW_ORDER_REBALANCE_MIN_STEP:
+                    window *= 4
+                    continue
+            else:
+                # The window reaches the end of the table, so the orders can be
+                # spread out by whole numbers.
+                step = Decimal("1")
+            break
+
+        old_orders = {}
+        for index, row_to_rebalance in enumerate(rows_to_rebalance, start=1):
+            old_orders[row_to_rebalance.id] = row_to_rebalance.order
+            row_to_rebalance.order = round(lower_bound + step * index, 20)
+        queryset.bulk_update(rows_to_rebalance, ["order"], batch_size=BATCH_SIZE)
+
+        row_orders_rebalanced.send(
+            self,
+            table=table,
+            model=model,
+            rows=[r for r in rows_to_rebalance if not r.trashed],
+            old_orders=old_orders,
+        )
+
+        return rows_to_rebalance
+
     def recalculate_row_orders(self, table: Table, model: GeneratedTableModel = None):
         """
         Recalculates the order to whole numbers of all rows based on the existing
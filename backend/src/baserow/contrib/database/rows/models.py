@@ -60,3 +60,58 @@ class RowHistory(models.Model):
     class Meta:
         ordering = ("-action_timestamp", "-id")
         indexes = [models.Index(fields=["table", "row_id", "-action_timestamp", "-id"])]
+
+
+class RowChange(models.Model):
+    """
+    An append-only log of the rows that have been created, updated or deleted in a
+    table, so that a consumer can cheaply find out what changed since its last
+    synchronization. Every entry covers all the rows of one change.
+    """
+
+    CHANGE_TYPE_CREATED = "created"
+    CHANGE_TYPE_UPDATED = "updated"
+    CHANGE_TYPE_DELETED = "deleted"
+    # Any row of the table might have changed, for example because many rows have
+    # been restored or all the values of a formula field have been recalculated.
+    CHANGE_TYPE_REFRESHED = "refreshed"
+    CHANGE_TYPES = [
+        CHANGE_TYPE_CREATED,
+        CHANGE_TYPE_UPDATED,
+        CHANGE_TYPE_DELETED,
+        CHANGE_TYPE_REFRESHED,
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    table = models.ForeignKey(
+        "database.Table",
+        on_delete=models.CASCADE,
+        help_text="The table where the rows have changed.",
+    )
+    transaction_id = models.BigIntegerField(
+        help_text="The id of the database transaction that changed the rows. The "
+        "changes are listed in the order of this id, so that a change committed "
+        "after a more recent one is never skipped."
+    )
+    change_type = models.CharField(
+        max_length=9,
+        choices=[(change_type, change_type) for change_type in CHANGE_TYPES],
+        help_text="Whether the rows have been created, updated or deleted, or if "
+        "any row might have changed.",
+    )
+    row_ids = ArrayField(
+        models.PositiveIntegerField(),
+        help_text="The ids of the changed rows. Empty if any row might have changed.",
+    )
+    field_ids = ArrayField(
+        models.PositiveIntegerField(),
+        null=True,
+        help_text="The ids of the updated fields. Only set for updated rows.",
+    )
+    timestamp = models.DateTimeField(
+        auto_now_add=True, help_text="The moment the rows have changed."
+    )
+
+    class Meta:
+        ordering = ("transaction_id", "id")
+        indexes = [models.Index(fields=["table", "transaction_id", "id"])]
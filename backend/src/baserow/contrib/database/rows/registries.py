@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Generator, Iterable, List, Optional
 
 from django.db.models import QuerySet
 
@@ -19,7 +19,7 @@ class RowMetadataRegistry(Registry):
     name = "row_metadata"
 
     def generate_and_merge_metadata_for_row(
-        self, user, table, row_id: int
+        self, user, table, row_id: int, opt_in_types: Optional[Iterable[str]] = None
     ) -> Dict[str, Any]:
         """
         Alternative for generate_and_merge_metadata_for_rows which takes a single row
@@ -27,11 +27,15 @@ class RowMetadataRegistry(Registry):
         """
 
         return self.generate_and_merge_metadata_for_rows(
-            user, table, (i for i in [row_id])
+            user, table, (i for i in [row_id]), opt_in_types=opt_in_types
         ).get(row_id, {})
 
     def generate_and_merge_metadata_for_rows(
-        self, user, table, row_ids: Generator[int, None, None]
+        self,
+        user,
+        table,
+        row_ids: Generator[int, None, None],
+        opt_in_types: Optional[Iterable[str]] = None,
     ) -> Dict[int, Dict[str, Any]]:
         """
         For every type of row metadata will generate that type of metadata for each
@@ -51,11 +55,18 @@ class RowMetadataRegistry(Registry):
         :param row_ids: A generator which should return the row ids generate metadata
             for. If no RowMetadataTypes are registered then this generator will not be
             invoked.
+        :param opt_in_types: The types of the opt in RowMetadataTypes that must be
+            generated as well. The other opt in types are skipped.
         :return: A dictionary of Row Id -> RowMetadataType -> Metadata Value if
             metadata types are registered, otherwise an empty dict.
         """
 
-        metadata_types = self.get_all()
+        opt_in_types = set(opt_in_types or [])
+        metadata_types = [
+            metadata_type
+            for metadata_type in self.get_all()
+            if not metadata_type.opt_in or metadata_type.type in opt_in_types
+        ]
         if len(metadata_types) > 0:
             row_ids = list(row_ids)
             row_metadata = {}
@@ -83,6 +94,12 @@ class RowMetadataType(Instance, abc.ABC):
     See RowMetadataRegistry.generate_and_merge_metadata_for_rows for more details.
     """
 
+    opt_in = False
+    """
+    Indicates whether the metadata is only generated when the type is explicitly
+    requested, because it's only relevant for some of the listings.
+    """
+
     @abc.abstractmethod
     def generate_metadata_for_rows(
         self, user, table, row_ids: List[int]
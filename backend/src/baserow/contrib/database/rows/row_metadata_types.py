@@ -0,0 +1,49 @@
+from typing import Any, Dict, List
+
+from rest_framework import serializers
+from rest_framework.fields import Field
+
+from baserow.contrib.database.fields.models import LinkRowField
+from baserow.contrib.database.fields.utils.link_row import get_link_row_values_count
+from baserow.contrib.database.rows.registries import RowMetadataType
+
+
+class LinkRowValuesCountMetadataType(RowMetadataType):
+    """
+    Contains the total amount of linked rows of every link row field having a
+    `link_row_values_limit`, because only the first linked rows are included in the
+    listed rows. The remaining ones can be fetched with the endpoint listing the
+    linked rows of a single cell. It's only generated when the listed link row
+    values are actually limited.
+    """
+
+    type = "link_row_values_count"
+    opt_in = True
+
+    def generate_metadata_for_rows(
+        self, user, table, row_ids: List[int]
+    ) -> Dict[int, Any]:
+        fields = list(
+            LinkRowField.objects.filter(
+                table=table, link_row_values_limit__isnull=False
+            )
+        )
+        if not fields or not row_ids:
+            return {}
+
+        model = table.get_model(fields=fields, field_ids=[])
+        metadata = {}
+        for field in fields:
+            model_field = model._meta.get_field(field.db_column)
+            counts = get_link_row_values_count(model_field, row_ids)
+            for row_id, count in counts.items():
+                metadata.setdefault(row_id, {})[str(field.id)] = count
+        return metadata
+
+    def get_example_serializer_field(self) -> Field:
+        return serializers.DictField(
+            child=serializers.IntegerField(min_value=0),
+            help_text="The total amount of linked rows per link row field id, for the "
+            "link row fields where only the first linked rows are included.",
+            required=False,
+        )
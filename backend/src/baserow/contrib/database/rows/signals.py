@@ -11,5 +11,6 @@ rows_deleted = Signal()
 rows_ai_values_generation_error = Signal()
 
 row_orders_recalculated = Signal()
+row_orders_rebalanced = Signal()
 
 rows_history_updated = Signal()
@@ -20,8 +20,23 @@ def clean_up_row_history_entries(self):
     RowHistoryHandler.delete_entries_older_than(cutoff_datetime)
 
 
+@app.task(bind=True, queue="export")
+def clean_up_row_change_log_entries(self):
+    """
+    Execute job cleanup for the row change log entries.
+    """
+
+    from .change_log import RowChangeLogHandler
+
+    older_than_days = timedelta(days=settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS)
+
+    cutoff_datetime = datetime.combine(timezone.now() - older_than_days, time.min)
+    RowChangeLogHandler.delete_entries_older_than(cutoff_datetime)
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     every = timedelta(minutes=settings.BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES)
 
     sender.add_periodic_task(every, clean_up_row_history_entries.s())
+    sender.add_periodic_task(every, clean_up_row_change_log_entries.s())
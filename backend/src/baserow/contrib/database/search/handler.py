@@ -1,5 +1,6 @@
-import math
+import time
 import traceback
+from contextlib import contextmanager
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
 
@@ -11,6 +12,7 @@ from django.db import connection, transaction
 from django.db.models import Expression, Func, Q, QuerySet, TextField, Value
 from django.utils.encoding import force_str
 
+from celery.exceptions import SoftTimeLimitExceeded
 from loguru import logger
 from opentelemetry import trace
 from psycopg2 import sql
@@ -40,6 +42,11 @@ if TYPE_CHECKING:
 
 tracer = trace.get_tracer(__name__)
 
+TSV_UPDATE_SLOT_CACHE_KEY = "tsvector_update_slot_{}"
+TSV_UPDATE_CHECKPOINT_CACHE_KEY = "tsvector_update_checkpoint_{}"
+TSV_UPDATE_ATTEMPTS_CACHE_KEY = "{}_attempts"
+TSV_UPDATE_CHECKPOINT_TIMEOUT = 60 * 60 * 24
+
 
 class SearchModes(str, Enum):
     # Use this mode to search rows using LIKE operators against each
@@ -341,6 +348,7 @@ class SearchHandler(
         update_tsvectors_for_changed_rows_only: bool,
         field_ids_to_restrict_update_to: Optional[List[int]] = None,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        checkpoint_key: Optional[str] = None,
     ):
         """
         Takes out a lock on the table what being updated if the
@@ -355,6 +363,8 @@ class SearchHandler(
             provided ids will have their tsv columns updated.
         :param progress_builder: If provided will be used to build a child progress bar
             and report on this methods progress to the parent of the progress_builder.
+        :param checkpoint_key: If provided, the progress of an update of all the rows
+            is stored in the cache with this key, so that it can be resumed.
         """
 
         use_lock = hasattr(cache, "lock")
@@ -385,6 +395,7 @@ class SearchHandler(
                 update_tsvectors_for_changed_rows_only,
                 field_ids_to_restrict_update_to,
                 progress_builder,
+                checkpoint_key,
             )
         finally:
             # The lock must be released if anything goes wrong during the update or
@@ -405,6 +416,7 @@ class SearchHandler(
         update_tsvectors_for_changed_rows_only: bool,
         field_ids_to_restrict_update_to: Optional[List[int]] = None,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        checkpoint_key: Optional[str] = None,
     ):
         """
         Responsible for updating a table's `tsvector` columns. If the caller is
@@ -421,6 +433,10 @@ class SearchHandler(
             provided ids will have their tsv columns updated.
         :param progress_builder: If provided will be used to build a child progress bar
             and report on this methods progress to the parent of the progress_builder.
+        :param checkpoint_key: If provided, the id of the last updated row is stored
+            in the cache with this key after every chunk when all rows are updated.
+            Calling this method again with the same key resumes the update after
+            that row.
         :return: None
         """
 
@@ -473,6 +489,7 @@ class SearchHandler(
             set_background_updated_false=field_ids_to_restrict_update_to is None,
             update_tsvectors_for_changed_rows_only=update_tsvectors_for_changed_rows_only,
             progress_builder=progress.create_child_builder(represents_progress=800),
+            checkpoint_key=checkpoint_key,
         )
 
         if must_vacuum:
@@ -502,39 +519,154 @@ class SearchHandler(
             )
             cursor.execute(query)  # type: ignore
 
+    @classmethod
+    def get_tsv_update_checkpoint_key(cls, identifier: str) -> str:
+        return TSV_UPDATE_CHECKPOINT_CACHE_KEY.format(identifier)
+
+    @classmethod
+    def register_tsv_update_attempt(cls, checkpoint_key: str) -> int:
+        """
+        Registers an attempt to continue the update from the checkpoint and returns
+        the number of attempts made since the checkpoint last moved forward. If a
+        chunk keeps exceeding the hard time limit, the task is redelivered without
+        any progress, which can be detected this way.
+
+        :param checkpoint_key: The cache key holding the progress of the update.
+        :return: The number of attempts without progress, including this one.
+        """
+
+        attempts_key = TSV_UPDATE_ATTEMPTS_CACHE_KEY.format(checkpoint_key)
+        last_id = cache.get(checkpoint_key, 0)
+        previous = cache.get(attempts_key)
+        attempts = (
+            previous["attempts"] + 1
+            if previous is not None and previous["last_id"] == last_id
+            else 1
+        )
+        cache.set(
+            attempts_key,
+            {"last_id": last_id, "attempts": attempts},
+            timeout=TSV_UPDATE_CHECKPOINT_TIMEOUT,
+        )
+        return attempts
+
+    @classmethod
+    def clear_tsv_update_checkpoint(cls, checkpoint_key: str):
+        """
+        Removes the progress and the attempts of the update from the cache.
+
+        :param checkpoint_key: The cache key holding the progress of the update.
+        """
+
+        cache.delete_many(
+            [checkpoint_key, TSV_UPDATE_ATTEMPTS_CACHE_KEY.format(checkpoint_key)]
+        )
+
+    @classmethod
+    @contextmanager
+    def tsvector_update_slot(cls):
+        """
+        Context manager limiting the number of tables of which the tsvectors are
+        updated at the same time to `TSV_UPDATE_MAX_CONCURRENT_TABLES`, across all
+        workers. It yields `True` if a slot has been acquired, and `False` if all
+        the slots are taken, in which case the update should be retried later. The
+        slot of a crashed worker is released after the search update time limit.
+        """
+
+        max_concurrent_tables = settings.TSV_UPDATE_MAX_CONCURRENT_TABLES
+        if max_concurrent_tables <= 0:
+            yield True
+            return
+
+        for slot in range(max_concurrent_tables):
+            slot_key = TSV_UPDATE_SLOT_CACHE_KEY.format(slot)
+            if cache.add(
+                slot_key, True, timeout=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT
+            ):
+                try:
+                    yield True
+                finally:
+                    cache.delete(slot_key)
+                return
+
+        yield False
+
+    @classmethod
+    def get_next_chunk_size(cls, chunk_size: int, duration: float) -> int:
+        """
+        Adapts the size of the next chunk based on the duration of the previous one,
+        so that a chunk takes roughly `TSV_UPDATE_CHUNK_TARGET_SECONDS`. The size
+        at most doubles between two chunks.
+
+        :param chunk_size: The size of the previous chunk.
+        :param duration: The amount of seconds it took to update the previous chunk.
+        :return: The size of the next chunk.
+        """
+
+        target_seconds = settings.TSV_UPDATE_CHUNK_TARGET_SECONDS
+        if target_seconds <= 0 or duration <= 0:
+            return chunk_size
+
+        next_chunk_size = int(chunk_size * min(2.0, target_seconds / duration))
+        return max(
+            settings.TSV_UPDATE_MIN_CHUNK_SIZE,
+            min(settings.TSV_UPDATE_MAX_CHUNK_SIZE, next_chunk_size),
+        )
+
     @classmethod
     def split_update_into_chunks_by_ranges(
         cls,
         qs,
         update_query,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        checkpoint_key: Optional[str] = None,
     ) -> Optional[int]:
         """
-        Split the queryset up into chunks based on the count, and update the tsv
-        cells for the rows in the chunk. It will stop when max number of
-        precalculated iterations is reached.
+        Split the queryset up into chunks of consecutive ids, and update the tsv
+        cells for the rows in the chunk until all rows are updated. The size of the
+        chunks is adapted to the duration of the previous chunk.
+
+        :param checkpoint_key: If provided, the id of the last updated row is stored
+            in the cache after every chunk, and the update starts after the stored
+            id if there is one already.
         """
 
-        total_count = qs.count()
+        last_id = 0
+        if checkpoint_key is not None:
+            last_id = cache.get(checkpoint_key, 0)
+
+        qs = qs.order_by("id")
+        total_count = qs.filter(id__gt=last_id).count()
 
         # There can be an edge case where the row has already bee updated. To prevent
         # division by zero exceptions, we don't have to do anything here.
         if total_count == 0:
             return 0
 
-        total_iterations = math.ceil(total_count / settings.TSV_UPDATE_CHUNK_SIZE)
-        progress = ChildProgressBuilder.build(
-            progress_builder, child_total=total_iterations
-        )
+        progress = ChildProgressBuilder.build(progress_builder, child_total=total_count)
+        chunk_size = settings.TSV_UPDATE_CHUNK_SIZE
         total_updated = 0
-        for i in range(0, total_count, settings.TSV_UPDATE_CHUNK_SIZE):
+        while True:
+            started = time.monotonic()
             with transaction.atomic():
-                next_ids = qs.order_by("id").values_list("id", flat=True)[
-                    i : i + settings.TSV_UPDATE_CHUNK_SIZE
-                ]
+                next_ids = list(
+                    qs.filter(id__gt=last_id).values_list("id", flat=True)[:chunk_size]
+                )
+                if not next_ids:
+                    break
                 next_chunk = qs.filter(id__in=next_ids).select_for_update(of=("self",))
                 total_updated += next_chunk.update(**update_query)
-            progress.increment()
+
+            last_id = next_ids[-1]
+            if checkpoint_key is not None:
+                cache.set(
+                    checkpoint_key, last_id, timeout=TSV_UPDATE_CHECKPOINT_TIMEOUT
+                )
+            progress.increment(len(next_ids))
+            chunk_size = cls.get_next_chunk_size(chunk_size, time.monotonic() - started)
+
+        if checkpoint_key is not None:
+            cache.delete(checkpoint_key)
         return total_updated
 
     @classmethod
@@ -547,7 +679,9 @@ class SearchHandler(
         """
         This method keeps iterating over the provided row queryset, fetch the not
         updated rows in chunks, and update the tsv cells of those chunks. It will
-        keep going until none are left.
+        keep going until none are left. Because the rows stay flagged until they
+        are updated, the update can be resumed by calling this method again. The
+        size of the chunks is adapted to the duration of the previous chunk.
         """
 
         estimated_count = qs.count()
@@ -557,25 +691,25 @@ class SearchHandler(
         if estimated_count == 0:
             return 0
 
-        estimated_iterations = math.ceil(
-            estimated_count / settings.TSV_UPDATE_CHUNK_SIZE
-        )
         progress = ChildProgressBuilder.build(
-            progress_builder, child_total=estimated_iterations
+            progress_builder, child_total=estimated_count
         )
+        chunk_size = settings.TSV_UPDATE_CHUNK_SIZE
         total_updated = 0
         while True:
+            started = time.monotonic()
             with transaction.atomic():
-                next_ids = qs.order_by("id").values_list("id", flat=True)[
-                    0 : settings.TSV_UPDATE_CHUNK_SIZE
-                ]
+                next_ids = qs.order_by("id").values_list("id", flat=True)[0:chunk_size]
                 next_ids = list(next_ids)
                 next_chunk = qs.filter(id__in=next_ids)
                 this_chunk_updated = next_chunk.update(**update_query)
-                progress.increment()
-                total_updated += 0
+                progress.increment(
+                    min(this_chunk_updated, estimated_count - progress.progress)
+                )
+                total_updated += this_chunk_updated
                 if this_chunk_updated == 0:
                     return total_updated
+            chunk_size = cls.get_next_chunk_size(chunk_size, time.monotonic() - started)
 
     @classmethod
     def run_tsvector_update_statement(
@@ -585,6 +719,7 @@ class SearchHandler(
         set_background_updated_false: bool,
         update_tsvectors_for_changed_rows_only: bool,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        checkpoint_key: Optional[str] = None,
     ) -> Optional[int]:
         progress = ChildProgressBuilder.build(progress_builder, child_total=1000)
 
@@ -609,7 +744,12 @@ class SearchHandler(
                     progress_builder=progress.create_child_builder(
                         represents_progress=1000
                     ),
+                    checkpoint_key=checkpoint_key,
                 )
+        except SoftTimeLimitExceeded:
+            # The task running the update is about to be killed, so it must stop
+            # right away and resume from the last chunk in another task.
+            raise
         except Exception as e:
             progress.set_progress(0)
 
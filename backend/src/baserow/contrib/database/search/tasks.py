@@ -2,6 +2,7 @@ from typing import List, Optional
 
 from django.conf import settings
 
+from celery.exceptions import SoftTimeLimitExceeded
 from loguru import logger
 
 from baserow.config.celery import app
@@ -11,16 +12,26 @@ from baserow.contrib.database.search.exceptions import (
 
 
 @app.task(
+    bind=True,
     queue="export",
     time_limit=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+    acks_late=True,
+    reject_on_worker_lost=True,
 )
 def async_update_tsvector_columns(
+    self,
     table_id: int,
     update_tsvs_for_changed_rows_only: bool,
     field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    checkpoint_key: Optional[str] = None,
 ):
     """
-    Responsible for asynchronously updating the `tsvector` columns on a table.
+    Responsible for asynchronously updating the `tsvector` columns on a table. The
+    task is retried later if too many tables are already being updated, and it
+    resumes from the last updated chunk if it's redelivered after a worker crash or
+    if it exceeds its soft time limit. The update is abandoned if it's redelivered
+    `TSV_UPDATE_MAX_ATTEMPTS` times without any progress, for example because a
+    chunk keeps exceeding the hard time limit.
 
     :param table_id: The ID of the table we'd like to update the tsvectors for.
     :param update_tsvs_for_changed_rows_only: By default we will only update rows on
@@ -28,15 +39,57 @@ def async_update_tsvector_columns(
         If set to `False`, we will index all cells that match the other parameters.
     :param field_ids_to_restrict_update_to: If provided only the fields matching the
         provided ids will have their tsv columns updated.
+    :param checkpoint_key: The cache key holding the progress of the update of all
+        the rows. Defaults to a key based on the id of this task, which stays the
+        same when the task is redelivered.
     """
 
     from baserow.contrib.database.search.handler import SearchHandler
     from baserow.contrib.database.table.handler import TableHandler
 
+    if checkpoint_key is None:
+        checkpoint_key = SearchHandler.get_tsv_update_checkpoint_key(self.request.id)
+    task_kwargs = {
+        "table_id": table_id,
+        "update_tsvs_for_changed_rows_only": update_tsvs_for_changed_rows_only,
+        "field_ids_to_restrict_update_to": field_ids_to_restrict_update_to,
+        "checkpoint_key": checkpoint_key,
+    }
+
     table = TableHandler().get_table(table_id)
-    try:
-        SearchHandler.update_tsvector_columns_locked(
-            table, update_tsvs_for_changed_rows_only, field_ids_to_restrict_update_to
-        )
-    except PostgresFullTextSearchDisabledException:
-        logger.debug(f"Postgres full-text search is disabled.")
+    with SearchHandler.tsvector_update_slot() as acquired:
+        if not acquired:
+            async_update_tsvector_columns.apply_async(
+                kwargs=task_kwargs, countdown=settings.TSV_UPDATE_RETRY_DELAY_SECONDS
+            )
+            return
+
+        attempts = SearchHandler.register_tsv_update_attempt(checkpoint_key)
+        if attempts > settings.TSV_UPDATE_MAX_ATTEMPTS:
+            logger.error(
+                "Abandoning the tsvector update of table {table_id} after {attempts} "
+                "attempts without progress.",
+                table_id=table_id,
+                attempts=attempts - 1,
+            )
+            SearchHandler.clear_tsv_update_checkpoint(checkpoint_key)
+            return
+
+        try:
+            SearchHandler.update_tsvector_columns_locked(
+                table,
+                update_tsvs_for_changed_rows_only,
+                field_ids_to_restrict_update_to,
+                checkpoint_key=checkpoint_key,
+            )
+        except PostgresFullTextSearchDisabledException:
+            logger.debug(f"Postgres full-text search is disabled.")
+        except SoftTimeLimitExceeded:
+            logger.info(
+                "Resuming the tsvector update of table {table_id} in a new task.",
+                table_id=table_id,
+            )
+            async_update_tsvector_columns.apply_async(kwargs=task_kwargs)
+            return
+
+        SearchHandler.clear_tsv_update_checkpoint(checkpoint_key)
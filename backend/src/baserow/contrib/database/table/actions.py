@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -45,9 +45,11 @@ class CreateTableActionType(UndoableActionType):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Iterable[List[Any]]] = None,
         first_row_header: bool = True,
         progress: Optional[Progress] = None,
+        row_count: Optional[int] = None,
+        column_count: Optional[int] = None,
     ) -> Table:
         """
         Create a table in the specified database.
@@ -63,6 +65,10 @@ class CreateTableActionType(UndoableActionType):
             this options is ignored.
         :param progress: An optional progress instance if you want to track the progress
             of the task.
+        :param row_count: If provided, `data` can be any iterable yielding this amount
+            of rows. See `TableHandler.create_table` for more information.
+        :param column_count: The largest amount of values in a row of `data`. Required
+            when `row_count` is provided.
         :return: The created table and the error report.
         """
 
@@ -74,6 +80,8 @@ class CreateTableActionType(UndoableActionType):
             first_row_header=first_row_header,
             fill_example=True,
             progress=progress,
+            row_count=row_count,
+            column_count=column_count,
         )
 
         workspace = database.workspace
@@ -240,34 +248,49 @@ class UpdateTableActionType(UndoableActionType):
         table_id: int
         table_name: str
         original_table_name: str
+        defer_dependant_updates: Optional[bool] = None
+        original_defer_dependant_updates: Optional[bool] = None
 
     @classmethod
-    def do(cls, user: AbstractUser, table: Table, name: str) -> Table:
+    def do(
+        cls,
+        user: AbstractUser,
+        table: Table,
+        name: Optional[str] = None,
+        defer_dependant_updates: Optional[bool] = None,
+    ) -> Table:
         """
         Updates the table.
         See baserow.contrib.database.table.handler.TableHandler.update_table
         for further details.
-        Undoing this action restore the original table name and redoing
-        set the new name again.
+        Undoing this action restore the original table name and
+        `defer_dependant_updates`, and redoing set the new values again.
 
         :param user: The user on whose behalf the table is updated.
         :param table: The table instance that needs to be updated.
-        :param kwargs: The fields that need to be updated.
+        :param name: The new name of the table.
+        :param defer_dependant_updates: Whether the dependant fields in other tables
+            must be updated in the background.
         :raises ValueError: When the provided table is not an instance of Table.
         :return: The updated table instance.
         """
 
         original_table_name = table.name
+        original_defer_dependant_updates = table.defer_dependant_updates
 
-        TableHandler().update_table(user, table, name=name)
+        TableHandler().update_table(
+            user, table, name=name, defer_dependant_updates=defer_dependant_updates
+        )
 
         database = table.database
         params = cls.Params(
             database.id,
             database.name,
             table.id,
-            name,
+            table.name,
             original_table_name,
+            table.defer_dependant_updates,
+            original_defer_dependant_updates,
         )
 
         cls.register_action(
@@ -282,12 +305,20 @@ class UpdateTableActionType(UndoableActionType):
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
         TableHandler().update_table_by_id(
-            user, params.table_id, name=params.original_table_name
+            user,
+            params.table_id,
+            name=params.original_table_name,
+            defer_dependant_updates=params.original_defer_dependant_updates,
         )
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
-        TableHandler().update_table_by_id(user, params.table_id, name=params.table_name)
+        TableHandler().update_table_by_id(
+            user,
+            params.table_id,
+            name=params.table_name,
+            defer_dependant_updates=params.defer_dependant_updates,
+        )
 
 
 class DuplicateTableActionType(UndoableActionType):
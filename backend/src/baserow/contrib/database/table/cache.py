@@ -12,10 +12,19 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+In front of the Redis cache, every process keeps a bounded least recently used cache
+of the pickled field attrs keyed by the table id and version, so that the field attrs
+of recently used tables can be loaded without a Redis round trip. The field attrs
+are stored pickled because the model fields can't be shared between models, every
+model needs its own copy.
 """
+import pickle  # nosec
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 
 from django.conf import settings
 from django.core.cache import caches
@@ -29,16 +38,66 @@ if typing.TYPE_CHECKING:
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
 
+class LocalModelFieldAttrsCache:
+    """
+    A thread safe and bounded least recently used cache of pickled field attrs, kept
+    in the memory of the current process.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, table_id: int, version: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(table_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(table_id)
+        return pickle.loads(entry[1])  # nosec
+
+    def set(self, table_id: int, version: str, field_attrs: Dict[str, Any]):
+        if self.max_size <= 0:
+            return
+
+        pickled_field_attrs = pickle.dumps(field_attrs)
+        with self._lock:
+            self._entries[table_id] = (version, pickled_field_attrs)
+            self._entries.move_to_end(table_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, table_id: int):
+        with self._lock:
+            self._entries.pop(table_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_model_field_attrs_cache = LocalModelFieldAttrsCache(
+    settings.BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE
+)
+
+
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
 
 
 def get_cached_model_field_attrs(table: "Table") -> Optional[Dict[str, Any]]:
+    field_attrs = local_model_field_attrs_cache.get(table.id, table.version)
+    if field_attrs is not None:
+        return field_attrs
+
     cache_key = table_model_cache_entry_key(table.id)
     cache_entry = generated_models_cache.get(cache_key)
 
     if cache_entry and cache_entry["version"] == table.version:
-        return cache_entry["field_attrs"]
+        field_attrs = cache_entry["field_attrs"]
+        local_model_field_attrs_cache.set(table.id, table.version, field_attrs)
+        return field_attrs
     else:
         return None
 
@@ -50,10 +109,12 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
         {"field_attrs": field_attrs, "version": table.version},
         timeout=None,
     )
+    local_model_field_attrs_cache.set(table.id, table.version, field_attrs)
 
 
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    local_model_field_attrs_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -75,3 +136,4 @@ def invalidate_table_in_model_cache(table_id: int):
     from baserow.contrib.database.table.models import Table
 
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
+    local_model_field_attrs_cache.delete(table_id)
@@ -1,5 +1,5 @@
 import traceback
-from typing import Any, Dict, List, NewType, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, Iterator, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
@@ -413,10 +413,12 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Iterable[List[Any]]] = None,
         first_row_header: bool = True,
         fill_example: bool = False,
         progress: Optional[Progress] = None,
+        row_count: Optional[int] = None,
+        column_count: Optional[int] = None,
     ):
         """
         Creates a new table from optionally provided data. If no data is specified,
@@ -435,6 +437,11 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :param fill_example: Fill the table with example field and data.
         :param progress: An optional progress instance if you want to track the progress
             of the task.
+        :param row_count: If provided, `data` can be any iterable yielding this amount
+            of rows, like a generator reading them from a file. The rows are then
+            imported chunk by chunk instead of being loaded in memory at once.
+        :param column_count: The largest amount of values in a row of `data`. Required
+            when `row_count` is provided.
         :return: The created table and the error report.
         """
 
@@ -448,7 +455,15 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(0, state=TABLE_CREATION)
 
-        if data is not None:
+        if data is not None and row_count is not None:
+            (
+                fields,
+                data,
+                row_count,
+            ) = self.normalize_initial_table_data_stream(
+                data, row_count, column_count, first_row_header=first_row_header
+            )
+        elif data is not None:
             (
                 fields,
                 data,
@@ -464,9 +479,19 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
 
         table = self.create_table_and_fields(user, database, name, fields)
 
-        _, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress, send_realtime_update=False
-        )
+        if row_count is not None:
+            _, error_report = RowHandler().import_rows_in_chunks(
+                user,
+                table,
+                data,
+                row_count,
+                progress=progress,
+                send_realtime_update=False,
+            )
+        else:
+            _, error_report = RowHandler().import_rows(
+                user, table, data, progress=progress, send_realtime_update=False
+            )
 
         table_created.send(self, table=table, user=user)
 
@@ -567,21 +592,89 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if len(data) == 0:
             raise InvalidInitialTableData("At least one row should be provided.")
 
+        largest_column_count = len(max(data, key=len))
+        self._check_initial_table_data_size(len(data), largest_column_count)
+
+        header = data.pop(0) if first_row_header else []
+        fields_with_type = self.get_initial_table_fields(header, largest_column_count)
+        result = [[str(value) for value in row] for row in data]
+
+        return fields_with_type, result
+
+    def normalize_initial_table_data_stream(
+        self,
+        data: Iterable[List[Any]],
+        row_count: int,
+        column_count: int,
+        first_row_header: bool,
+    ) -> Tuple[List, Iterator[List[str]], int]:
+        """
+        Same as `normalize_initial_table_data`, but for an iterable of rows that
+        can't be loaded in memory at once. Only the header is read right away, the
+        rows are normalized lazily while they are consumed.
+
+        :param data: An iterable yielding all the provided rows.
+        :param row_count: The amount of rows `data` yields.
+        :param column_count: The largest amount of values in a row of `data`.
+        :param first_row_header: Indicates if the first row is the header. For each
+            of these header columns a field is going to be created.
+        :raises InvalidInitialTableData: When the data doesn't contain a column or row.
+        :return: A list containing the field names with a type, an iterator
+            yielding the normalized rows and the amount of rows it yields.
+        """
+
+        if row_count == 0:
+            raise InvalidInitialTableData("At least one row should be provided.")
+
+        self._check_initial_table_data_size(row_count, column_count)
+
+        rows = iter(data)
+        header = list(next(rows)) if first_row_header else []
+        fields_with_type = self.get_initial_table_fields(header, column_count)
+        result = ([str(value) for value in row] for row in rows)
+
+        if first_row_header:
+            row_count -= 1
+
+        return fields_with_type, result, row_count
+
+    def _check_initial_table_data_size(self, row_count: int, column_count: int):
+        """
+        :raises InitialTableDataLimitExceeded: When there are more rows than allowed.
+        :raises InvalidInitialTableData: When the data doesn't contain a column.
+        """
+
         limit = settings.INITIAL_TABLE_DATA_LIMIT
-        if limit and len(data) > limit:
+        if limit and row_count > limit:
             raise InitialTableDataLimitExceeded(
                 f"It is not possible to import more than "
                 f"{settings.INITIAL_TABLE_DATA_LIMIT} rows when creating a table."
             )
 
-        largest_column_count = len(max(data, key=len))
-
-        if largest_column_count == 0:
+        if column_count == 0:
             raise InvalidInitialTableData("At least one column should be provided.")
 
-        fields = data.pop(0) if first_row_header else []
+    def get_initial_table_fields(
+        self, header: List[Any], column_count: int
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Generates the text fields of a new table based on the provided header. A field
+        is named after each header value and missing names are generated until
+        `column_count` fields exist.
+
+        :param header: The names of the fields. Can be empty.
+        :param column_count: The amount of fields that must be created.
+        :raises MaxFieldNameLengthExceeded: When the provided name is too long.
+        :raises InitialTableDataDuplicateName: When duplicates exit in field names.
+        :raises ReservedBaserowFieldNameException: When the field name is reserved by
+            Baserow.
+        :raises InvalidBaserowFieldName: When the field name is invalid (empty).
+        :return: A list containing the field names with a type.
+        """
 
-        for i in range(len(fields), largest_column_count):
+        fields = header
+
+        for i in range(len(fields), column_count):
             fields.append(_("Field %d") % (i + 1,))
 
         if len(fields) > settings.MAX_FIELD_LIMIT:
@@ -609,10 +702,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if "" in field_name_set:
             raise InvalidBaserowFieldName()
 
-        fields_with_type = [(field_name, "text", {}) for field_name in fields]
-        result = [[str(value) for value in row] for row in data]
-
-        return fields_with_type, result
+        return [(field_name, "text", {}) for field_name in fields]
 
     def get_example_table_field_and_data(self):
         """
@@ -638,27 +728,46 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         data = []
         return fields, data
 
-    def update_table_by_id(self, user: AbstractUser, table_id: int, name: str) -> Table:
+    def update_table_by_id(
+        self,
+        user: AbstractUser,
+        table_id: int,
+        name: Optional[str] = None,
+        defer_dependant_updates: Optional[bool] = None,
+    ) -> Table:
         """
         Updates an existing table instance.
 
         :param user: The user on whose behalf the table is updated.
         :param table_id: The id of the table that needs to be updated.
         :param name: The name to be updated.
+        :param defer_dependant_updates: Whether the dependant fields in other tables
+            must be updated in the background.
         :raises ValueError: When the provided table is not an instance of Table.
         :return: The updated table instance.
         """
 
         table = self.get_table_for_update(table_id)
-        return self.update_table(user, table, name)
+        return self.update_table(
+            user, table, name, defer_dependant_updates=defer_dependant_updates
+        )
 
-    def update_table(self, user: AbstractUser, table: Table, name: str) -> Table:
+    def update_table(
+        self,
+        user: AbstractUser,
+        table: Table,
+        name: Optional[str] = None,
+        defer_dependant_updates: Optional[bool] = None,
+    ) -> Table:
         """
-        Updates an existing table instance.
+        Updates an existing table instance. The values that are not provided are
+        left unchanged.
 
         :param user: The user on whose behalf the table is updated.
         :param table: The table instance that needs to be updated.
         :param name: The name to be updated.
+        :param defer_dependant_updates: Whether the dependant fields in other tables
+            must be updated in the background.
         :raises ValueError: When the provided table is not an instance of Table.
         :return: The updated table instance.
         """
@@ -673,7 +782,10 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             context=table,
         )
 
-        table.name = name
+        if name is not None:
+            table.name = name
+        if defer_dependant_updates is not None:
+            table.defer_dependant_updates = defer_dependant_updates
         table.save()
 
         table_updated.send(self, table=table, user=user)
@@ -93,6 +93,15 @@ def get_row_needs_background_update_index(table):
 
 
 class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limit_link_row_values = False
+
+    def _clone(self, *args, **kwargs):
+        c = super()._clone(*args, **kwargs)
+        c.limit_link_row_values = self.limit_link_row_values
+        return c
+
     def _insert(self, objs, fields, *args, **kwargs):
         """
         We never want to include TSVector fields when inserting rows, we manage them
@@ -160,7 +169,7 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
         with cachalot_enabled():
             return super().count()
 
-    def enhance_by_fields(self):
+    def enhance_by_fields(self, limit_link_row_values: bool = False):
         """
         Enhances the queryset based on the `enhance_queryset_in_bulk` for each unique
         field type used in the table. This one will eventually call the
@@ -168,10 +177,18 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
         field adds the `prefetch_related` to prevent N queries per row. This helper
         should only be used when multiple rows are going to be fetched.
 
+        :param limit_link_row_values: Indicates that only the first related rows of
+            the link row fields having a `link_row_values_limit` must be fetched. This
+            should only be used when the rows are listed, because the values of
+            those fields are incomplete.
         :return: The enhanced queryset.
         :rtype: QuerySet
         """
 
+        if limit_link_row_values:
+            self = self._chain()
+            self.limit_link_row_values = True
+
         by_type = defaultdict(list)
         for field_object in self.model._field_objects.values():
             field_type = field_object["type"]
@@ -873,6 +890,12 @@ class Table(
         help_text="Indicates whether the table has had the background_update_needed "
         "column added.",
     )
+    defer_dependant_updates = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the formula, lookup and rollup fields in other "
+        "tables depending on the changed rows are updated in the background instead "
+        "of while the rows are updated.",
+    )
     last_modified_by_column_added = models.BooleanField(
         default=True,
         null=True,
@@ -10,8 +10,15 @@ from baserow.contrib.database.rows.signals import (
     rows_updated,
 )
 from baserow.contrib.database.table.signals import table_created, table_deleted
+from baserow.contrib.database.views.models import FormView
+from baserow.contrib.database.views.signals import (
+    view_created,
+    view_deleted,
+    view_updated,
+)
 from baserow.core.registries import application_type_registry
 from baserow.core.signals import application_created
+from baserow.core.usage.handler import UsageHandler
 
 from .tasks import create_tables_usage_for_new_database, update_table_usage
 
@@ -77,3 +84,12 @@ def on_application_created(sender, application, **kwargs):
 def on_field_restored(sender, field, **kwargs):
     if isinstance(field, FileField):
         transaction.on_commit(lambda: update_table_usage.delay(field.table_id))
+
+
+# Form view signals for storage usage
+@receiver([view_created, view_updated, view_deleted])
+def on_form_view_changed(sender, view, **kwargs):
+    if issubclass(view.specific_class, FormView):
+        UsageHandler.mark_workspaces_for_storage_usage_update(
+            [view.table.database.workspace_id]
+        )
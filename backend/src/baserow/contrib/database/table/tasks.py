@@ -1,7 +1,9 @@
 from collections import defaultdict
 
+from django.conf import settings
 from django.db import transaction
 
+from celery.exceptions import SoftTimeLimitExceeded
 from loguru import logger
 
 from baserow.config.celery import app
@@ -141,27 +143,42 @@ def setup_new_background_update_and_search_columns(self, table_id: int):
         PostgresFullTextSearchDisabledException,
     )
     from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.search.tasks import async_update_tsvector_columns
     from baserow.contrib.database.table.handler import TableHandler
 
-    with transaction.atomic():
-        table = TableHandler().get_table_for_update(table_id)
-        TableHandler().create_needs_background_update_field(table)
+    with SearchHandler.tsvector_update_slot() as acquired:
+        if not acquired:
+            # Too many tables are being migrated at the same time, so this one is
+            # retried later to avoid saturating the database.
+            setup_new_background_update_and_search_columns.apply_async(
+                (table_id,), countdown=settings.TSV_UPDATE_RETRY_DELAY_SECONDS
+            )
+            return
+
+        with transaction.atomic():
+            table = TableHandler().get_table_for_update(table_id)
+            TableHandler().create_needs_background_update_field(table)
+
+            try:
+                SearchHandler.sync_tsvector_columns(table)
+            except PostgresFullTextSearchDisabledException:
+                logger.debug("Postgres full-text search is disabled.")
 
         try:
-            SearchHandler.sync_tsvector_columns(table)
+            # The `update_tsvectors_for_changed_rows_only` is set to `True` here
+            # because it's okay to keep looping over the rows until all tsv columns
+            # are updated. This will also prevent deadlocks if any of the rows are
+            # updated, because the `update_tsvector_columns` acquires a lock while
+            # it's running.
+            SearchHandler.update_tsvector_columns_locked(
+                table, update_tsvectors_for_changed_rows_only=True
+            )
         except PostgresFullTextSearchDisabledException:
             logger.debug("Postgres full-text search is disabled.")
-
-    try:
-        # The `update_tsvectors_for_changed_rows_only` is set to `True` here because
-        # it's okay to keep looping over the rows until all tsv columns are updated.
-        # This will also prevent deadlocks if any of the rows are updated, because the
-        # `update_tsvector_columns` acquires a lock while it's running.
-        SearchHandler.update_tsvector_columns_locked(
-            table, update_tsvectors_for_changed_rows_only=True
-        )
-    except PostgresFullTextSearchDisabledException:
-        logger.debug("Postgres full-text search is disabled.")
+        except SoftTimeLimitExceeded:
+            # The rows that haven't been updated yet are still flagged, so another
+            # task can continue where this one stopped.
+            async_update_tsvector_columns.delay(table_id, True)
 
 
 @app.task(bind=True, queue="export")
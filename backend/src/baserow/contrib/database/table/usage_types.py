@@ -1,4 +1,6 @@
-from django.db.models import Sum
+from typing import Dict, List
+
+from django.db.models import Q, QuerySet, Sum
 from django.db.models.functions import Coalesce
 
 from baserow.core.usage.registries import UsageInMB, WorkspaceStorageUsageItemType
@@ -19,3 +21,27 @@ class TableWorkspaceStorageUsageItemType(WorkspaceStorageUsageItemType):
             .filter(database__workspace_id=workspace_id)
             .aggregate(sum=Coalesce(Sum("usage__storage_usage"), 0))["sum"]
         )
+
+    def calculate_storage_usage_for_workspaces(
+        self, workspace_ids: List[int]
+    ) -> Dict[int, UsageInMB]:
+        # ensure all pending updates are applied first
+        TableUsageHandler.update_tables_usage()
+
+        return dict(
+            TableHandler.get_tables()
+            .filter(database__workspace_id__in=workspace_ids)
+            .order_by()
+            .values("database__workspace_id")
+            .annotate(sum=Coalesce(Sum("usage__storage_usage"), 0))
+            .values_list("database__workspace_id", "sum")
+        )
+
+    def get_workspace_ids_to_update(self) -> QuerySet:
+        # The tables with pending updates or without usage yet are the ones of which
+        # the storage usage changes when the pending updates are applied.
+        return (
+            TableHandler.get_tables()
+            .filter(Q(usage_update__isnull=False) | Q(usage__isnull=True))
+            .values("database__workspace_id")
+        )
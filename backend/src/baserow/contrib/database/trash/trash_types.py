@@ -45,6 +45,7 @@ User = get_user_model()
 class TableTrashableItemType(TrashableItemType):
     type = "table"
     model_class = Table
+    affects_storage_usage = True
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return trashed_item.database
@@ -507,6 +508,8 @@ class RowsTrashableItemType(TrashableItemType):
 class ViewTrashableItemType(TrashableItemType):
     type = "view"
     model_class = View
+    # The images of the form views count towards the storage usage.
+    affects_storage_usage = True
 
     @property
     def requires_parent_id(self) -> bool:
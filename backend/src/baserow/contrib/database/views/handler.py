@@ -1,21 +1,36 @@
 import dataclasses
+import json
 import re
 import traceback
 from collections import defaultdict, namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
 from hashlib import shake_128
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.db import connection
+from django.db import DatabaseError, connection
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
 from django.db.models.expressions import F, OrderBy
+from django.db.models.functions import Cast, Upper
 from django.db.models.query import QuerySet
 
 import jwt
@@ -24,9 +39,15 @@ from opentelemetry import trace
 from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
+from baserow.contrib.database.constants import (
+    ROW_COUNT_MODE_CAPPED,
+    ROW_COUNT_MODE_ESTIMATE,
+    ROW_COUNT_MODE_EXACT,
+)
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import (
+    FILTER_TYPE_AND,
     AdvancedFilterBuilder,
     FilterBuilder,
 )
@@ -114,6 +135,7 @@ from .exceptions import (
     ViewFilterDoesNotExist,
     ViewFilterGroupDoesNotExist,
     ViewFilterNotSupported,
+    ViewFilterTypeDoesNotExist,
     ViewFilterTypeNotAllowedForField,
     ViewGroupByDoesNotExist,
     ViewGroupByFieldAlreadyExist,
@@ -127,6 +149,7 @@ from .exceptions import (
 )
 from .models import (
     OWNERSHIP_TYPE_COLLABORATIVE,
+    GridViewFieldOptions,
     View,
     ViewDecoration,
     ViewFilter,
@@ -348,15 +371,17 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
     @classmethod
     def after_field_changed_or_deleted(cls, field: Field):
         """
-        Called when a field is deleted. This will remove any indexes that are no
-        longer required.
+        Called when a field is deleted or its column has changed. This will remove
+        any indexes that are no longer required and create the ones that are
+        missing, for the views sorted or grouped by the field.
 
-        :param field: The field that was deleted.
+        :param field: The field that was changed or deleted.
         """
 
         views_need_to_be_updated = View.objects.filter(
-            viewsort__field_id=field.pk, db_index_name__isnull=False
-        )
+            Q(viewsort__field_id=field.pk) | Q(viewgroupby__field_id=field.pk),
+            db_index_name__isnull=False,
+        ).distinct()
         for view in views_need_to_be_updated:
             cls.schedule_index_update(view)
 
@@ -474,6 +499,185 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
             view.save(update_fields=["db_index_name"])
 
 
+class ViewTrigramIndexingHandler(metaclass=baserow_trace_methods(tracer)):
+    """
+    Manages the trigram indexes speeding up the contains filters of the views. The
+    `icontains` lookup used by these filters compiles to an `UPPER(column::text)
+    LIKE` expression, which can use a GIN trigram index on the same expression
+    instead of scanning the whole table. An index is created for every field
+    filtered with a contains filter by at least one view and dropped as soon as no
+    view uses such a filter anymore.
+
+    The indexes aren't partial, because the `link_row_contains` filters search the
+    related rows through the relation without a `trashed` condition, which would
+    prevent the planner from using an index limited to the rows that aren't
+    trashed.
+    """
+
+    filter_types = ["contains", "contains_not"]
+    link_row_filter_types = ["link_row_contains", "link_row_not_contains"]
+
+    @classmethod
+    def get_index(cls, field_id: int) -> GinIndex:
+        """
+        Returns the trigram index of the field, matching the expression the
+        `icontains` lookup filters on.
+
+        :param field_id: The id of the field to index.
+        :return: The trigram index for the field.
+        """
+
+        return GinIndex(
+            OpClass(
+                Upper(
+                    Cast(f"field_{field_id}", output_field=django_models.TextField())
+                ),
+                name="gin_trgm_ops",
+            ),
+            name=Field(id=field_id).trigram_index_name,
+        )
+
+    @classmethod
+    def get_field_ids_to_index(cls, table: Table) -> Set[int]:
+        """
+        Returns the ids of the fields of the table that are filtered with a contains
+        filter by at least one view and can be trigram indexed. The primary field is
+        included when a link row contains filter in another table searches it.
+
+        :param table: The table to get the fields to index for.
+        :return: The ids of the fields that need a trigram index.
+        """
+
+        filtered_field_ids = set(
+            ViewFilter.objects.filter(
+                view__table=table,
+                view__trashed=False,
+                type__in=cls.filter_types,
+            ).values_list("field_id", flat=True)
+        )
+        if ViewFilter.objects.filter(
+            view__trashed=False,
+            field__trashed=False,
+            field__linkrowfield__link_row_table=table,
+            type__in=cls.link_row_filter_types,
+        ).exists():
+            filtered_field_ids.update(
+                Field.objects.filter(table=table, primary=True).values_list(
+                    "id", flat=True
+                )
+            )
+
+        return {
+            field.id
+            for field in Field.objects.filter(
+                id__in=filtered_field_ids, table=table
+            ).select_related("content_type")
+            if field_type_registry.get_by_model(
+                field.specific_class
+            ).can_have_trigram_index
+        }
+
+    @classmethod
+    def get_indexed_field_ids(cls, table: Table) -> Set[int]:
+        """
+        Returns the ids of the fields of the table having a trigram index.
+
+        :param table: The table to check the indexes of.
+        :return: The ids of the fields having a trigram index.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+                [table.get_database_table_name()],
+            )
+            index_names = [row[0] for row in cursor.fetchall()]
+
+        field_ids = set()
+        for index_name in index_names:
+            match = re.fullmatch(r"tbl_trgm_(\d+)_idx", index_name)
+            if match:
+                field_ids.add(int(match.group(1)))
+        return field_ids
+
+    @classmethod
+    def create_trigram_extension_if_not_exists(cls) -> bool:
+        """
+        Creates the `pg_trgm` extension providing the trigram operator classes if
+        it doesn't exist yet.
+
+        :return: Whether the extension is available.
+        """
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError as exc:
+            logger.error(
+                "Failed to create the pg_trgm extension because of {e}", e=str(exc)
+            )
+            return False
+        return True
+
+    @classmethod
+    def schedule_index_update(cls, table_id: int):
+        """
+        Schedules a celery task updating the trigram indexes of the table.
+
+        :param table_id: The id of the table for which the indexes must be updated.
+        """
+
+        from baserow.contrib.database.views.tasks import schedule_trigram_index_update
+
+        schedule_trigram_index_update(table_id)
+
+    @classmethod
+    def update_indexes(cls, table: Table):
+        """
+        Creates the missing trigram indexes of the fields filtered with a contains
+        filter and drops the ones that aren't used by any view anymore. All the
+        indexes are dropped if the automatic trigram indexing has been disabled.
+
+        :param table: The table to update the trigram indexes for.
+        """
+
+        with atomic_if_not_already():
+            field_ids_to_index = (
+                cls.get_field_ids_to_index(table)
+                if settings.AUTO_INDEX_TRIGRAM_ENABLED
+                else set()
+            )
+            indexed_field_ids = cls.get_indexed_field_ids(table)
+
+            field_ids_to_add = field_ids_to_index - indexed_field_ids
+            field_ids_to_remove = indexed_field_ids - field_ids_to_index
+            if field_ids_to_add and not cls.create_trigram_extension_if_not_exists():
+                field_ids_to_add = set()
+            if not field_ids_to_add and not field_ids_to_remove:
+                return
+
+            model = table.get_model()
+            with safe_django_schema_editor() as schema_editor:
+                for field_id in field_ids_to_remove:
+                    db_index = django_models.Index(
+                        "id", name=Field(id=field_id).trigram_index_name
+                    )
+                    schema_editor.remove_index(model, db_index)
+                    logger.info(
+                        "Removed Index {db_index_name} of table {table_id}",
+                        db_index_name=db_index.name,
+                        table_id=table.id,
+                    )
+                for field_id in field_ids_to_add:
+                    db_index = cls.get_index(field_id)
+                    schema_editor.add_index(model, db_index)
+                    logger.info(
+                        "Created Index {db_index_name} of table {table_id}",
+                        db_index_name=db_index.name,
+                        table_id=table.id,
+                    )
+
+
 class ViewHandler(metaclass=baserow_trace_methods(tracer)):
     PUBLIC_VIEW_TOKEN_ALGORITHM = "HS256"  # nosec
 
@@ -2557,6 +2761,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         apply_sorts: bool = True,
         apply_filters: bool = True,
         search_mode: Optional[SearchModes] = None,
+        limit_link_row_values: bool = False,
     ) -> QuerySet:
         """
         Returns a queryset for the provided view which is appropriately sorted,
@@ -2577,13 +2782,17 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param apply_sorts: Whether to apply view sorts to the resulting queryset.
         :param apply_filters: Whether to apply view filters to the resulting queryset.
         :param search_mode: The type of search to perform if a search term is provided.
+        :param limit_link_row_values: Whether only the first related rows of the
+            link row fields having a `link_row_values_limit` must be fetched.
         :return: The appropriate queryset for the provided view.
         """
 
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            limit_link_row_values=limit_link_row_values
+        )
 
         view_type = view_type_registry.get_by_model(view.specific_class)
         if view_type.can_filter and apply_filters:
@@ -2600,6 +2809,139 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
         return queryset
 
+    def has_active_filters(self, view: View) -> bool:
+        """
+        Returns whether the view has filters that are applied to its rows.
+
+        :param view: The view to check.
+        :return: True if at least one filter is applied to the rows of the view.
+        """
+
+        view_type = view_type_registry.get_by_model(view.specific_class)
+        if not view_type.can_filter or view.filters_disabled:
+            return False
+        return view.viewfilter_set.exists()
+
+    def _get_row_count_cache_key(self, table_id: int) -> str:
+        """
+        Returns the row count cache key for the specified table.
+        """
+
+        return f"table_row_count__{table_id}"
+
+    def get_cached_row_count(self, model: GeneratedTableModel) -> int:
+        """
+        Returns the number of rows of the table, which is also the row count of all
+        the unfiltered views of the table. The count is cached and kept up to date
+        by `update_cached_row_count` when rows are created or deleted.
+
+        :param model: The generated model of the table.
+        :return: The number of non trashed rows in the table.
+        """
+
+        cache_key = self._get_row_count_cache_key(model.baserow_table_id)
+        count = cache.get(cache_key)
+        if count is None:
+            count = model.objects.count()
+            cache.add(
+                cache_key,
+                count,
+                timeout=settings.BASEROW_CACHED_ROW_COUNT_TIMEOUT_SECONDS,
+            )
+        return count
+
+    def update_cached_row_count(self, table_id: int, delta: int):
+        """
+        Adds the delta to the cached row count of the table if it's cached.
+
+        :param table_id: The id of the table where rows have been created or
+            deleted.
+        :param delta: The number of created rows, negative if rows were deleted.
+        """
+
+        try:
+            cache.incr(self._get_row_count_cache_key(table_id), delta)
+        except ValueError:
+            # Nothing is cached, the count is computed on the next request.
+            pass
+
+    def clear_cached_row_count(self, table_id: int):
+        """
+        Removes the cached row count of the table, for example when many rows have
+        been changed without sending the row signals.
+
+        :param table_id: The id of the table to clear the cached count of.
+        """
+
+        cache.delete(self._get_row_count_cache_key(table_id))
+
+    def get_estimated_row_count(self, queryset: QuerySet) -> int:
+        """
+        Returns the number of rows the query planner expects the queryset to
+        return, without executing it.
+
+        :param queryset: The queryset to estimate the number of rows of.
+        :return: The estimated number of rows.
+        """
+
+        sql, params = queryset.order_by().values("id").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)  # nosec b608
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_row_count(
+        self,
+        view: View,
+        queryset: QuerySet,
+        count_mode: str = ROW_COUNT_MODE_EXACT,
+        search: Optional[str] = None,
+        adhoc_filters: Optional[AdHocFilters] = None,
+    ) -> Tuple[int, str]:
+        """
+        Counts the rows of a view queryset. By default, all the rows are counted.
+        If another count mode is requested, the count of an unfiltered queryset
+        comes from the cached row count of the table, and for a filtered queryset
+        the estimate of the query planner is used or the counting stops at
+        `BASEROW_CAPPED_ROW_COUNT_LIMIT`. Small estimates are counted exactly
+        because they are the least accurate and cheap to count.
+
+        :param view: The view of which the rows are counted.
+        :param queryset: The queryset of the view to count the rows of.
+        :param count_mode: One of `ROW_COUNT_MODES`.
+        :param search: The search term that has been applied to the queryset.
+        :param adhoc_filters: The ad hoc filters that have been applied to the
+            queryset.
+        :return: A tuple containing the count and the count mode describing it,
+            which is `exact` if the count is exact, `estimate` if it's estimated and
+            `capped` if there are more rows than the count.
+        """
+
+        queryset = queryset.order_by()
+        if count_mode == ROW_COUNT_MODE_EXACT:
+            return queryset.count(), ROW_COUNT_MODE_EXACT
+
+        filtered = (
+            bool(search)
+            or (adhoc_filters is not None and adhoc_filters.has_any_filters)
+            or self.has_active_filters(view)
+        )
+        if not filtered:
+            return self.get_cached_row_count(queryset.model), ROW_COUNT_MODE_EXACT
+
+        limit = settings.BASEROW_CAPPED_ROW_COUNT_LIMIT
+        if count_mode == ROW_COUNT_MODE_ESTIMATE:
+            estimate = self.get_estimated_row_count(queryset)
+            if estimate > limit:
+                return estimate, ROW_COUNT_MODE_ESTIMATE
+
+        count = queryset[: limit + 1].count()
+        if count > limit:
+            return limit, ROW_COUNT_MODE_CAPPED
+        return count, ROW_COUNT_MODE_EXACT
+
     def _get_aggregation_lock_cache_key(self, view: View):
         """
         Returns the aggregation lock cache key for the specified view.
@@ -2621,6 +2963,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_incremental_aggregations_cache_key(self, table_id: int):
+        """
+        Returns the cache key indicating that the table has cached aggregation
+        states that can be updated incrementally.
+        """
+
+        return f"aggregation_incremental__{table_id}"
+
     def clear_full_aggregation_cache(self, view: View):
         """
         Clears the cache key for the specified view.
@@ -2791,6 +3141,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Do we need to compute some aggregations?
         if need_computation or with_total:
+            use_cache = not search and not adhoc_filters.has_any_filters
             db_result = self.get_field_aggregations(
                 user,
                 view,
@@ -2803,17 +3154,29 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 adhoc_filters=adhoc_filters,
                 search=search,
                 search_mode=search_mode,
+                with_incremental_states=use_cache,
             )
+            states = db_result.pop("incremental_states", {})
 
-            if not search and not adhoc_filters.has_any_filters:
+            if use_cache:
                 to_cache = {}
                 for key, value in db_result.items():
                     # We don't cache total value
                     if key != "total":
-                        to_cache[self._get_aggregation_value_cache_key(view, key)] = {
+                        cached_value = {
                             "value": value,
                             "version": need_computation[key]["version"],
                         }
+                        if key in states:
+                            cached_value["state"] = states[key]
+                            to_cache[
+                                self._get_incremental_aggregations_cache_key(
+                                    view.table_id
+                                )
+                            ] = True
+                        to_cache[
+                            self._get_aggregation_value_cache_key(view, key)
+                        ] = cached_value
 
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
@@ -2841,6 +3204,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         adhoc_filters: Optional[AdHocFilters] = None,
         search: Optional[str] = None,
         search_mode: Optional[SearchModes] = None,
+        with_incremental_states: bool = False,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -2859,6 +3223,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             instead of the view's own filters.
         :param search: the search string to consider.
         :param search: the mode that the search is in.
+        :param with_incremental_states: Whether the states of the aggregations that
+            can be maintained incrementally must be computed in the same query. If
+            so, they're included in the result as a dict keyed by field name under
+            the `incremental_states` key.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -2902,6 +3270,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             queryset = queryset.search_all_fields(search, search_mode=search_mode)
 
         aggregation_dict = {}
+        state_keys = {}
 
         for field_instance, aggregation_type_name in aggregations:
             field_name = field_instance.db_column
@@ -2922,6 +3291,20 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 field_name, model_field, field
             )
 
+            # The state of read only fields is not needed because they're never
+            # updated incrementally.
+            field_type = model._field_objects[field_instance.id]["type"]
+            if with_incremental_states and not field_type.read_only:
+                state_aggregations = (
+                    aggregation_type.get_incremental_state_aggregations(
+                        field_name, model_field, field
+                    )
+                    or {}
+                )
+                for key, state_aggregation in state_aggregations.items():
+                    state_keys[f"{field_name}_state_{key}"] = (field_name, key)
+                    aggregation_dict[f"{field_name}_state_{key}"] = state_aggregation
+
         # Check if the returned aggregations contain a `AnnotatedAggregation`,
         # and if so, apply the annotations and only keep the actual aggregation in
         # the dict. This is needed because some aggregations require annotated values
@@ -2935,7 +3318,225 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if with_total:
             aggregation_dict["total"] = Count("id", distinct=True)
 
-        return queryset.aggregate(**aggregation_dict)
+        result = queryset.aggregate(**aggregation_dict)
+
+        if with_incremental_states:
+            states = defaultdict(dict)
+            for state_key, (field_name, key) in state_keys.items():
+                states[field_name][key] = result.pop(state_key)
+            result["incremental_states"] = dict(states)
+
+        return result
+
+    def get_incremental_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        field_ids: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[View, Field, str]]:
+        """
+        Returns the cached view aggregations of the table that can be updated
+        incrementally when rows are created, updated or deleted. This is only
+        possible for views without filters because otherwise the changed rows might
+        enter or leave the view, and only for fields of which the values can't
+        change for other rows than the changed ones, so not for read only fields
+        that can depend on other rows, like formulas, or for many to many fields.
+
+        :param table: The table where the rows have changed.
+        :param model: The generated model of the table.
+        :param field_ids: Optionally only the aggregations of these fields are
+            returned.
+        :return: A list of (view, field, aggregation_type) tuples.
+        """
+
+        # Only the aggregations having a cached state can be updated, so the tables
+        # of which no state has been cached recently don't need to be queried.
+        if not cache.get(self._get_incremental_aggregations_cache_key(table.id)):
+            return []
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table=table)
+            .exclude(aggregation_raw_type="")
+            .annotate(
+                has_filters=Exists(
+                    ViewFilter.objects.filter(view_id=OuterRef("grid_view_id"))
+                )
+            )
+            .select_related("grid_view")
+        )
+        if field_ids is not None:
+            field_options = field_options.filter(field_id__in=field_ids)
+
+        incremental_aggregations = []
+        for options in field_options:
+            field_object = model._field_objects.get(options.field_id)
+            if field_object is None or field_object["type"].read_only:
+                continue
+
+            if options.has_filters and not options.grid_view.filters_disabled:
+                continue
+
+            field_name = field_object["name"]
+            aggregation_type = view_aggregation_type_registry.get(
+                options.aggregation_raw_type
+            )
+            state_aggregations = aggregation_type.get_incremental_state_aggregations(
+                field_name, model._meta.get_field(field_name), field_object["field"]
+            )
+            if state_aggregations is not None:
+                incremental_aggregations.append(
+                    (
+                        options.grid_view,
+                        field_object["field"],
+                        options.aggregation_raw_type,
+                    )
+                )
+
+        return incremental_aggregations
+
+    def get_incremental_aggregation_states(
+        self,
+        model: GeneratedTableModel,
+        row_ids: List[int],
+        aggregations: List[Tuple[View, Field, str]],
+    ) -> Dict[Tuple[int, str], Dict[str, Any]]:
+        """
+        Computes the states of the provided incremental aggregations for the
+        provided rows only. Because all the views are unfiltered, the states are
+        computed once per field and aggregation type.
+
+        :param model: The generated model of the table.
+        :param row_ids: The ids of the changed rows.
+        :param aggregations: The aggregations returned by
+            `get_incremental_aggregations`.
+        :return: A dict where the key is a (field_id, aggregation_type) tuple and
+            the value the state of the rows.
+        """
+
+        if not row_ids or not aggregations:
+            return {}
+
+        aggregation_dict = {}
+        state_keys = {}
+        for _, field, aggregation_type_name in aggregations:
+            field_name = field.db_column
+            aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+            state_aggregations = aggregation_type.get_incremental_state_aggregations(
+                field_name, model._meta.get_field(field_name), field
+            )
+            for key, state_aggregation in state_aggregations.items():
+                alias = f"{field_name}_{aggregation_type_name}_{key}"
+                aggregation_dict[alias] = state_aggregation
+                state_keys[alias] = ((field.id, aggregation_type_name), key)
+
+        queryset = model.objects.filter(id__in=row_ids)
+        for key, value in aggregation_dict.items():
+            if isinstance(value, AnnotatedAggregation):
+                queryset = queryset.annotate(**value.annotations)
+                aggregation_dict[key] = value.aggregation
+
+        result = queryset.aggregate(**aggregation_dict)
+
+        states = defaultdict(dict)
+        for alias, (state_key, key) in state_keys.items():
+            states[state_key][key] = result[alias]
+        return dict(states)
+
+    def apply_incremental_aggregation_deltas(
+        self,
+        aggregations: List[Tuple[View, Field, str]],
+        removed_states: Dict[Tuple[int, str], Dict[str, Any]],
+        added_states: Dict[Tuple[int, str], Dict[str, Any]],
+    ):
+        """
+        Updates the cached view aggregation values by applying the states of the
+        removed and added rows instead of recomputing them on the whole table.
+
+        The row change has already bumped the aggregation versions via
+        `field_value_updated`. A cached value is only updated if it was computed
+        exactly one version before the current one, meaning that the bump of this
+        change is the only one since. In all the other cases, for example when
+        another change happened concurrently, nothing is done and the aggregation
+        is fully recomputed on the next request.
+
+        :param aggregations: The aggregations returned by
+            `get_incremental_aggregations`.
+        :param removed_states: The states of the deleted rows or of the updated
+            rows before the update.
+        :param added_states: The states of the created rows or of the updated rows
+            after the update.
+        """
+
+        aggregations_per_view = defaultdict(list)
+        views = {}
+        for view, field, aggregation_type_name in aggregations:
+            aggregations_per_view[view.id].append((field, aggregation_type_name))
+            views[view.id] = view
+
+        use_lock = hasattr(cache, "lock")
+        for view_id, view_aggregations in aggregations_per_view.items():
+            view = views[view_id]
+
+            if use_lock:
+                cache_lock = cache.lock(
+                    self._get_aggregation_lock_cache_key(view), timeout=10
+                )
+                cache_lock.acquire()
+
+            names = [field.db_column for field, _ in view_aggregations]
+            cached = cache.get_many(
+                [self._get_aggregation_value_cache_key(view, name) for name in names]
+                + [
+                    self._get_aggregation_version_cache_key(view, name)
+                    for name in names
+                ]
+            )
+
+            to_cache = {}
+            for field, aggregation_type_name in view_aggregations:
+                value_cache_key = self._get_aggregation_value_cache_key(
+                    view, field.db_column
+                )
+                cached_value = cached.get(value_cache_key)
+                cached_version = cached.get(
+                    self._get_aggregation_version_cache_key(view, field.db_column), 1
+                )
+
+                if (
+                    cached_value is None
+                    or cached_value.get("state") is None
+                    or cached_value["version"] + 1 != cached_version
+                ):
+                    continue
+
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                state_key = (field.id, aggregation_type_name)
+                state = aggregation_type.apply_incremental_state_delta(
+                    cached_value["state"],
+                    removed_states.get(state_key),
+                    added_states.get(state_key),
+                )
+                if state is not None:
+                    to_cache[value_cache_key] = {
+                        "value": aggregation_type.get_value_from_incremental_state(
+                            state
+                        ),
+                        "version": cached_version,
+                        "state": state,
+                    }
+                    to_cache[
+                        self._get_incremental_aggregations_cache_key(view.table_id)
+                    ] = True
+
+            cache.set_many(to_cache)
+
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    pass
 
     def rotate_view_slug(self, user: AbstractUser, view: View) -> View:
         """
@@ -3252,6 +3853,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         adhoc_filters: Optional[AdHocFilters] = None,
         table_model: Type[GeneratedTableModel] = None,
         view_type=None,
+        limit_link_row_values: bool = False,
     ):
         """
         This function constructs a queryset which applies all the filters
@@ -3272,6 +3874,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param table_model: A model which can be passed if it's already instantiated.
         :param view_type: The view_type which can be passed if it's already
             instantiated.
+        :param limit_link_row_values: Whether only the first related rows of the
+            link row fields having a `link_row_values_limit` must be fetched.
         :return: A tuple containing:
             - A queryset of rows.
             - A list of field_ids of the fields that are visible.
@@ -3300,7 +3904,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         # We have to still make a model with all fields as the public rows should still
         # be filtered by hidden fields.
-        queryset = table_model.objects.all().enhance_by_fields()
+        queryset = table_model.objects.all().enhance_by_fields(
+            limit_link_row_values=limit_link_row_values
+        )
         queryset = self.apply_filters(view, queryset)
 
         if view_type.can_group_by:
@@ -3469,6 +4075,7 @@ class CachingPublicViewRowChecker:
         only_include_views_which_want_realtime_events: bool,
         updated_field_ids: Optional[Iterable[int]] = None,
     ):
+        self._model = model
         self._public_views = (
             table.view_set.filter(public=True)
             .prefetch_related("viewfilter_set", "filter_groups")
@@ -3503,6 +4110,7 @@ class CachingPublicViewRowChecker:
                         view,
                         filter_qs,
                         self._view_row_checks_can_be_cached(view),
+                        self._get_python_filter(view, model),
                     )
                 )
 
@@ -3521,17 +4129,12 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view([row])
+        views = [
+            view
+            for view, *_ in self._views_with_filters
+            if row.id in visible_row_ids_per_view[view.id]
+        ]
 
         return views + self._always_visible_views
 
@@ -3552,25 +4155,11 @@ class CachingPublicViewRowChecker:
         """
 
         visible_views_rows = []
-        row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
-
-            else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view(rows)
+        for view, *_ in self._views_with_filters:
+            visible_ids = visible_row_ids_per_view[view.id]
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -3579,16 +4168,126 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_visible_row_ids_per_view(self, rows) -> Dict[int, Set[int]]:
+        """
+        Finds out in which of the views with filters the provided rows are visible.
+        The views of which the filters can be evaluated in Python are checked
+        without querying the database, the cached results are reused and the
+        filters of all the remaining views are checked together in one single
+        query.
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+        :param rows: Rows in the checkers table.
+        :return: The ids of the visible rows per view id.
+        """
+
+        visible_row_ids_per_view = defaultdict(set)
+        views_to_check = []
+        for view, filter_qs, can_use_cache, python_filter in self._views_with_filters:
+            view_cache = self._view_row_check_cache[view.id]
+            if python_filter is not None:
+                visible_row_ids_per_view[view.id] = {
+                    row.id for row in rows if python_filter(row)
+                }
+            elif can_use_cache and all(row.id in view_cache for row in rows):
+                visible_row_ids_per_view[view.id] = {
+                    row.id for row in rows if view_cache[row.id]
+                }
+            else:
+                views_to_check.append((view, filter_qs, can_use_cache))
+
+        if len(views_to_check) > 0:
+            checked_row_ids_per_view = self._check_rows_visible(views_to_check, rows)
+            for view, _, can_use_cache in views_to_check:
+                visible_ids = checked_row_ids_per_view[view.id]
+                visible_row_ids_per_view[view.id] = visible_ids
+                if can_use_cache:
+                    for row in rows:
+                        self._view_row_check_cache[view.id][row.id] = (
+                            row.id in visible_ids
+                        )
+
+        return visible_row_ids_per_view
+
+    def _check_rows_visible(self, views_to_check, rows) -> Dict[int, Set[int]]:
+        """
+        Checks in one query in which of the provided views the rows are visible, by
+        annotating every row with one boolean per view indicating whether the row
+        matches the filters of that view.
+        """
+
+        annotations = {
+            f"visible_in_view_{view.id}": Exists(filter_qs.filter(id=OuterRef("id")))
+            for view, filter_qs, _ in views_to_check
+        }
+        queryset = (
+            self._model.objects.filter(id__in=[row.id for row in rows])
+            .annotate(**annotations)
+            .values("id", *annotations.keys())
         )
 
+        visible_row_ids_per_view = defaultdict(set)
+        for values in queryset:
+            for view, *_ in views_to_check:
+                if values[f"visible_in_view_{view.id}"]:
+                    visible_row_ids_per_view[view.id].add(values["id"])
+        return visible_row_ids_per_view
+
+    # noinspection PyMethodMayBeStatic
+    def _get_python_filter(
+        self, view: View, model: GeneratedTableModel
+    ) -> Optional[Callable[[GeneratedTableModel], bool]]:
+        """
+        Returns a function checking in Python whether an already fetched row matches
+        the filters of the view, or `None` if at least one of the filters can only
+        be evaluated by the database.
+        """
+
+        if view.filters_disabled:
+            return lambda row: True
+
+        if len(view.filter_groups.all()) > 0:
+            return None
+
+        python_filters = []
+        for view_filter in view.viewfilter_set.all():
+            field_object = model._field_objects.get(view_filter.field_id)
+            if field_object is None:
+                return None
+
+            field = field_object["field"]
+            try:
+                view_filter_type = view_filter_type_registry.get(view_filter.type)
+            except ViewFilterTypeDoesNotExist:
+                return None
+            if not view_filter_type.field_is_compatible(field):
+                return None
+
+            python_filter = view_filter_type.get_python_filter(
+                field_object["name"],
+                view_filter.value,
+                model._meta.get_field(field_object["name"]),
+                field,
+            )
+            if python_filter is None:
+                return None
+            python_filters.append(python_filter)
+
+        combine = all if view.filter_type == FILTER_TYPE_AND else any
+
+        def matches(row):
+            # Trashed rows are never visible in the filtered views.
+            if getattr(row, "trashed", False):
+                return False
+            results = [
+                result
+                for result in (python_filter(row) for python_filter in python_filters)
+                if result is not None
+            ]
+            # The filters without a value don't filter at all.
+            return len(results) == 0 or combine(results)
+
+        return matches
+
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
             return True
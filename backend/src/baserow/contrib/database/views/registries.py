@@ -860,6 +860,26 @@ class ViewFilterType(Instance):
 
         raise NotImplementedError("Each must have his own get_filter method.")
 
+    def get_python_filter(
+        self, field_name, value, model_field, field
+    ) -> Optional[Callable[[Any], Optional[bool]]]:
+        """
+        Optionally returns a function that evaluates the filter in Python for an
+        already fetched row, so that it can be checked if the row matches without
+        querying the database. The function must match exactly the same rows as the
+        filter returned by `get_filter` and return `None` if the filter value
+        doesn't filter at all.
+
+        :param field_name: The name of the field that needs to be filtered.
+        :param value: The value that the field must be compared to.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A function accepting the row and returning whether it matches, or
+            `None` if the filter can only be evaluated by the database.
+        """
+
+        return None
+
     def get_preload_values(self, view_filter) -> dict:
         """
         Optionally a view filter type can preload certain values for displaying
@@ -970,6 +990,68 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_incremental_state_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Optional[Dict[str, django_models.Aggregate]]:
+        """
+        Aggregation types that can be decomposed can return the aggregations needed
+        to maintain the aggregated value incrementally. The result of these
+        aggregations, the state, is cached next to the value. When rows are created,
+        updated or deleted, the same aggregations are computed for the changed rows
+        only and applied to the cached state using `apply_incremental_state_delta`
+        instead of recomputing the aggregation on the whole table.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict of aggregations or None if the aggregation type can't be
+            maintained incrementally for the provided field.
+        """
+
+        return None
+
+    def apply_incremental_state_delta(
+        self,
+        state: Dict[str, Any],
+        removed_state: Optional[Dict[str, Any]],
+        added_state: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Computes the new state after removing the rows of the `removed_state` and
+        adding the rows of the `added_state`. Must only be implemented if
+        `get_incremental_state_aggregations` returns aggregations.
+
+        :param state: The cached state of all the rows.
+        :param removed_state: The state of the rows that have been deleted or the
+            state of the updated rows before the update.
+        :param added_state: The state of the rows that have been created or the
+            state of the updated rows after the update.
+        :return: The new state or None if it can't be computed incrementally, in
+            which case the aggregation is fully recomputed.
+        """
+
+        raise NotImplementedError(
+            "Each incremental aggregation type must implement "
+            "apply_incremental_state_delta."
+        )
+
+    def get_value_from_incremental_state(self, state: Dict[str, Any]) -> Any:
+        """
+        Returns the aggregated value from the provided state. Must only be
+        implemented if `get_incremental_state_aggregations` returns aggregations.
+
+        :param state: The state of all the rows.
+        :return: The aggregated value.
+        """
+
+        raise NotImplementedError(
+            "Each incremental aggregation type must implement "
+            "get_value_from_incremental_state."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
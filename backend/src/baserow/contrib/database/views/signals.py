@@ -1,7 +1,11 @@
+from django.conf import settings
+from django.db import transaction
 from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
+from baserow.contrib.database.table import signals as table_signals
 
 from .models import GalleryView
 
@@ -77,6 +81,43 @@ def update_view_index_if_view_group_by_changes(sender, view_group_by, **kwargs):
     ViewIndexingHandler.schedule_index_update(view_group_by.view)
 
 
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def update_trigram_indexes_if_view_filter_changes(sender, view_filter, **kwargs):
+    if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+        return
+
+    from baserow.contrib.database.views.handler import ViewTrigramIndexingHandler
+
+    ViewTrigramIndexingHandler.schedule_index_update(view_filter.view.table_id)
+
+    if view_filter.type in ViewTrigramIndexingHandler.link_row_filter_types:
+        # The primary field of the linked table is the one being searched.
+        field = view_filter.field.specific
+        link_row_table_id = getattr(field, "link_row_table_id", None)
+        if link_row_table_id is not None:
+            ViewTrigramIndexingHandler.schedule_index_update(link_row_table_id)
+
+
+@receiver([view_created, view_deleted])
+def update_trigram_indexes_if_view_created_or_deleted(sender, view, **kwargs):
+    if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+        return
+
+    from baserow.contrib.database.views.handler import ViewTrigramIndexingHandler
+
+    ViewTrigramIndexingHandler.schedule_index_update(view.table_id)
+
+
+@receiver([field_signals.field_updated, field_signals.field_deleted])
+def update_trigram_indexes_if_field_changes(sender, field, **kwargs):
+    if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+        return
+
+    from baserow.contrib.database.views.handler import ViewTrigramIndexingHandler
+
+    ViewTrigramIndexingHandler.schedule_index_update(field.table_id)
+
+
 @receiver(view_loaded)
 def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     from baserow.contrib.database.table.tasks import (
@@ -89,3 +130,112 @@ def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     table = view.table
     if not table.last_modified_by_column_added or not table.created_by_column_added:
         setup_created_by_and_last_modified_by_column.delay(table_id=view.table.id)
+
+
+def _get_incremental_aggregations_and_states(table, model, rows, field_ids=None):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    aggregations = handler.get_incremental_aggregations(table, model, field_ids)
+    if not aggregations:
+        return None
+
+    states = handler.get_incremental_aggregation_states(
+        model, [row.id for row in rows], aggregations
+    )
+    return aggregations, states
+
+
+def _apply_incremental_aggregation_deltas_on_commit(
+    aggregations, removed_states, added_states
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    transaction.on_commit(
+        lambda: ViewHandler().apply_incremental_aggregation_deltas(
+            aggregations, removed_states, added_states
+        )
+    )
+
+
+@receiver(row_signals.rows_created)
+def rows_created_update_aggregations(sender, rows, table, model, **kwargs):
+    result = _get_incremental_aggregations_and_states(table, model, rows)
+    if result is not None:
+        aggregations, added_states = result
+        _apply_incremental_aggregation_deltas_on_commit(aggregations, {}, added_states)
+
+
+@receiver(row_signals.before_rows_update)
+def before_rows_update_get_aggregation_states(
+    sender, rows, table, model, updated_field_ids, **kwargs
+):
+    if not updated_field_ids:
+        return None
+
+    return _get_incremental_aggregations_and_states(
+        table, model, rows, updated_field_ids
+    )
+
+
+@receiver(row_signals.rows_updated)
+def rows_updated_update_aggregations(
+    sender, rows, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    before = dict(before_return).get(before_rows_update_get_aggregation_states)
+    if before is None:
+        return
+
+    aggregations, removed_states = before
+    added_states = ViewHandler().get_incremental_aggregation_states(
+        model, [row.id for row in rows], aggregations
+    )
+    _apply_incremental_aggregation_deltas_on_commit(
+        aggregations, removed_states, added_states
+    )
+
+
+@receiver(row_signals.before_rows_delete)
+def before_rows_delete_get_aggregation_states(sender, rows, table, model, **kwargs):
+    return _get_incremental_aggregations_and_states(table, model, rows)
+
+
+@receiver(row_signals.rows_deleted)
+def rows_deleted_update_aggregations(sender, before_return, **kwargs):
+    before = dict(before_return).get(before_rows_delete_get_aggregation_states)
+    if before is None:
+        return
+
+    aggregations, removed_states = before
+    _apply_incremental_aggregation_deltas_on_commit(aggregations, removed_states, {})
+
+
+@receiver(row_signals.rows_created)
+def rows_created_update_cached_row_count(sender, rows, table, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    transaction.on_commit(
+        lambda: ViewHandler().update_cached_row_count(table.id, len(rows))
+    )
+
+
+@receiver(row_signals.rows_deleted)
+def rows_deleted_update_cached_row_count(sender, rows, table, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    transaction.on_commit(
+        lambda: ViewHandler().update_cached_row_count(table.id, -len(rows))
+    )
+
+
+@receiver(table_signals.table_updated)
+def table_updated_clear_cached_row_count(
+    sender, table, force_table_refresh=False, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    # The rows might have been changed in bulk without sending the row signals.
+    if force_table_refresh:
+        transaction.on_commit(lambda: ViewHandler().clear_cached_row_count(table.id))
@@ -8,17 +8,27 @@ from celery_singleton import DuplicateTaskError, Singleton
 from loguru import logger
 
 from baserow.config.celery import app
+from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.views.exceptions import ViewDoesNotExist
-from baserow.contrib.database.views.handler import ViewHandler, ViewIndexingHandler
+from baserow.contrib.database.views.handler import (
+    ViewHandler,
+    ViewIndexingHandler,
+    ViewTrigramIndexingHandler,
+)
 from baserow.contrib.database.views.models import View
 
 AUTO_INDEX_CACHE_KEY = "auto_index_view_cache_key"
+AUTO_TRIGRAM_INDEX_CACHE_KEY = "auto_trigram_index_table_cache_key"
 
 
 def get_auto_index_cache_key(view_id):
     return f"{AUTO_INDEX_CACHE_KEY}:{view_id}"
 
 
+def get_auto_trigram_index_cache_key(table_id):
+    return f"{AUTO_TRIGRAM_INDEX_CACHE_KEY}:{table_id}"
+
+
 @app.task(
     base=Singleton,
     queue="export",
@@ -97,3 +107,72 @@ def schedule_view_index_update(view_id: int):
         return
 
     transaction.on_commit(lambda: _schedule_view_index_update(view_id))
+
+
+@app.task(
+    base=Singleton,
+    queue="export",
+    lock_expiry=settings.AUTO_INDEX_LOCK_EXPIRY,
+    raise_on_duplicate=True,
+)
+@transaction.atomic()
+def update_trigram_indexes(table_id: int):
+    """
+    Creates/drops the trigram indexes of the provided table if needed.
+
+    :param table_id: The id of the table for which the indexes should be updated.
+    """
+
+    try:
+        table = Table.objects.get(id=table_id)
+        ViewTrigramIndexingHandler.update_indexes(table)
+    except Table.DoesNotExist:
+        # can be ignored, the table doesn't exist anymore
+        pass
+    finally:
+        # check for any pending trigram index updates and schedule them out of this
+        # singleton task to avoid concurrency issues
+        _check_for_pending_trigram_index_updates.delay(table_id)
+
+
+@app.task(queue="export")
+def _check_for_pending_trigram_index_updates(table_id):
+    """
+    Checks if there are any pending trigram index updates and schedules them.
+    """
+
+    if cache.delete(get_auto_trigram_index_cache_key(table_id)):
+        _schedule_trigram_index_update(table_id)
+
+
+def _schedule_trigram_index_update(table_id: int):
+    try:
+        update_trigram_indexes.delay(table_id)
+    except DuplicateTaskError:
+        # Add the table_id in the cache so that `update_trigram_indexes` will
+        # re-schedule itself at the end of the currently running task.
+        cache.set(
+            get_auto_trigram_index_cache_key(table_id),
+            True,
+            timeout=settings.AUTO_INDEX_LOCK_EXPIRY * 2,
+        )
+    except Exception as exc:  # nosec
+        logger.error(
+            "Failed to schedule trigram index update because of {e}", e=str(exc)
+        )
+        traceback.print_exc()
+
+
+def schedule_trigram_index_update(table_id: int):
+    """
+    Schedules a trigram index update for the provided table id once the current
+    transaction commits. If the update is already running, it will re-schedule
+    itself at the end.
+
+    :param table_id: The id of the table for which the indexes should be updated.
+    """
+
+    if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+        return
+
+    transaction.on_commit(lambda: _schedule_trigram_index_update(table_id))
@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from django.db.models import Q, Sum
 from django.db.models.functions import Coalesce
 
@@ -6,6 +8,7 @@ from baserow.core.usage.registries import (
     USAGE_UNIT_MB,
     UsageInMB,
     WorkspaceStorageUsageItemType,
+    get_user_files_usage_by_workspace,
 )
 from baserow.core.user_files.models import UserFile
 
@@ -30,3 +33,20 @@ class FormViewWorkspaceStorageUsageItem(WorkspaceStorageUsageItemType):
         )
 
         return usage or 0
+
+    def calculate_storage_usage_for_workspaces(
+        self, workspace_ids: List[int]
+    ) -> Dict[int, UsageInMB]:
+        form_views = FormView.objects.filter(
+            table__database__workspace_id__in=workspace_ids,
+            table__trashed=False,
+            table__database__trashed=False,
+        ).order_by()
+
+        return get_user_files_usage_by_workspace(
+            form_views.values_list(
+                "table__database__workspace_id", "cover_image_id"
+            ).union(
+                form_views.values_list("table__database__workspace_id", "logo_image_id")
+            )
+        )
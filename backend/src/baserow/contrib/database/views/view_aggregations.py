@@ -1,4 +1,5 @@
-from typing import Dict
+from decimal import Decimal
+from typing import Any, Dict, Optional
 
 from django.db.models import (
     Avg,
@@ -69,6 +70,57 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
+def _get_state_value(state: Optional[Dict[str, Any]], key: str) -> Any:
+    """
+    Returns the value of the key in the incremental state. A missing state means
+    that no rows have been added or removed.
+    """
+
+    return None if state is None else state[key]
+
+
+def _add_or_subtract(value: Any, removed: Any, added: Any) -> Any:
+    """
+    Subtracts the removed value and adds the added value to the provided value
+    where `None` means that there is nothing to add or subtract. This also works
+    for types that can't be combined with `0` like `timedelta`.
+    """
+
+    if removed is not None:
+        value = value - removed
+    if added is not None:
+        value = added if value is None else value + added
+    return value
+
+
+def _apply_sum_and_count_delta(
+    state: Dict[str, Any],
+    removed_state: Optional[Dict[str, Any]],
+    added_state: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Applies the delta to a state containing the sum and the count of the non
+    empty values. The sum is `None` if there are no values left.
+    """
+
+    count = (
+        state["count"]
+        - (_get_state_value(removed_state, "count") or 0)
+        + (_get_state_value(added_state, "count") or 0)
+    )
+    if count == 0:
+        return {"sum": None, "count": 0}
+
+    return {
+        "sum": _add_or_subtract(
+            state["sum"],
+            _get_state_value(removed_state, "sum"),
+            _get_state_value(added_state, "sum"),
+        ),
+        "count": count,
+    }
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -125,6 +177,22 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        if isinstance(model_field, ManyToManyField):
+            return None
+
+        return {"count": self.get_aggregation(field_name, model_field, field)}
+
+    def apply_incremental_state_delta(self, state, removed_state, added_state):
+        return {
+            "count": state["count"]
+            - (_get_state_value(removed_state, "count") or 0)
+            + (_get_state_value(added_state, "count") or 0)
+        }
+
+    def get_value_from_incremental_state(self, state):
+        return state["count"]
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -214,6 +282,27 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"value": self.get_aggregation(field_name, model_field, field)}
+
+    def apply_incremental_state_delta(self, state, removed_state, added_state):
+        value = state["value"]
+        removed = _get_state_value(removed_state, "value")
+        added = _get_state_value(added_state, "value")
+
+        # If a removed value could have been the minimum, the new minimum can only
+        # be found by looking at all the rows again.
+        if removed is not None and (value is None or removed <= value):
+            return None
+
+        if added is not None and (value is None or added < value):
+            value = added
+
+        return {"value": value}
+
+    def get_value_from_incremental_state(self, state):
+        return state["value"]
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -240,6 +329,27 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"value": self.get_aggregation(field_name, model_field, field)}
+
+    def apply_incremental_state_delta(self, state, removed_state, added_state):
+        value = state["value"]
+        removed = _get_state_value(removed_state, "value")
+        added = _get_state_value(added_state, "value")
+
+        # If a removed value could have been the maximum, the new maximum can only
+        # be found by looking at all the rows again.
+        if removed is not None and (value is None or removed >= value):
+            return None
+
+        if added is not None and (value is None or added > value):
+            value = added
+
+        return {"value": value}
+
+    def get_value_from_incremental_state(self, state):
+        return state["value"]
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -260,6 +370,17 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        # The count of non null values is needed to know whether the sum must be
+        # `None` because there are no values left.
+        return {"sum": Sum(field_name), "count": Count(field_name)}
+
+    def apply_incremental_state_delta(self, state, removed_state, added_state):
+        return _apply_sum_and_count_delta(state, removed_state, added_state)
+
+    def get_value_from_incremental_state(self, state):
+        return state["sum"]
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -284,6 +405,24 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count("id", filter=not_empty),
+        }
+
+    def apply_incremental_state_delta(self, state, removed_state, added_state):
+        return _apply_sum_and_count_delta(state, removed_state, added_state)
+
+    def get_value_from_incremental_state(self, state):
+        if not state["count"]:
+            return None
+
+        return Decimal(state["sum"]) / state["count"]
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
@@ -1,4 +1,5 @@
 import datetime as datetime_module
+import operator
 import zoneinfo
 from collections import defaultdict
 from datetime import date, datetime, timedelta
@@ -6,7 +7,14 @@ from decimal import Decimal
 from math import ceil, floor
 from typing import Any, Dict, Optional, Tuple, Union
 
-from django.db.models import DateField, DateTimeField, IntegerField, Q
+from django.db.models import (
+    BooleanField,
+    DateField,
+    DateTimeField,
+    ForeignKey,
+    IntegerField,
+    Q,
+)
 from django.db.models.expressions import F, Func
 from django.db.models.functions import Extract, Length, Mod, TruncDate
 
@@ -67,6 +75,29 @@ from .registries import ViewFilterType
 DATE_FILTER_EMPTY_VALUE = ""
 DATE_FILTER_TIMEZONE_SEPARATOR = "?"
 
+# The field types storing the value of the cell as is in the row, so that the
+# value of an already fetched row can be compared in Python.
+PYTHON_FILTERABLE_FIELD_TYPES = [
+    TextFieldType.type,
+    LongTextFieldType.type,
+    URLFieldType.type,
+    EmailFieldType.type,
+    PhoneNumberFieldType.type,
+    NumberFieldType.type,
+    RatingFieldType.type,
+    BooleanFieldType.type,
+    SingleSelectFieldType.type,
+]
+
+
+def is_python_filterable_field(field: Field) -> bool:
+    """
+    Returns whether the value of the field can be compared in Python.
+    """
+
+    field_type = field_type_registry.get_by_model(field)
+    return field_type.type in PYTHON_FILTERABLE_FIELD_TYPES
+
 
 class NotViewFilterTypeMixin:
     def default_filter_on_exception(self):
@@ -75,6 +106,17 @@ class NotViewFilterTypeMixin:
     def get_filter(self, *args, **kwargs):
         return ~super().get_filter(*args, **kwargs)
 
+    def get_python_filter(self, *args, **kwargs):
+        python_filter = super().get_python_filter(*args, **kwargs)
+        if python_filter is None:
+            return None
+
+        def not_python_filter(row):
+            matches = python_filter(row)
+            return None if matches is None else not matches
+
+        return not_python_filter
+
 
 class EqualViewFilterType(ViewFilterType):
     """
@@ -118,6 +160,21 @@ class EqualViewFilterType(ViewFilterType):
         except Exception:
             return self.default_filter_on_exception()
 
+    def get_python_filter(self, field_name, value, model_field, field):
+        if not is_python_filterable_field(field):
+            return None
+
+        value = value.strip()
+        if value == "":
+            return lambda row: None
+
+        try:
+            value = model_field.get_prep_value(value)
+        except Exception:
+            return None
+
+        return lambda row: model_field.to_python(getattr(row, field_name)) == value
+
 
 class NotEqualViewFilterType(NotViewFilterTypeMixin, EqualViewFilterType):
     type = "not_equal"
@@ -374,6 +431,29 @@ class NumericComparisonViewFilterType(ViewFilterType):
         except Exception:
             return self.default_filter_on_exception()
 
+    def get_python_filter(self, field_name, value, model_field, field):
+        if not is_python_filterable_field(field):
+            return None
+
+        value = value.strip()
+        if value == "":
+            return lambda row: None
+
+        try:
+            if self.should_round_value_to_compare(value, model_field):
+                value = self.rounding_func(Decimal(value))
+            value = model_field.get_prep_value(value)
+        except Exception:
+            return None
+
+        compare = getattr(operator, self.operator)
+
+        def python_filter(row):
+            row_value = model_field.to_python(getattr(row, field_name))
+            return row_value is not None and compare(row_value, value)
+
+        return python_filter
+
 
 class LowerThanViewFilterType(NumericComparisonViewFilterType):
     """
@@ -1065,6 +1145,16 @@ class SingleSelectEqualViewFilterType(ViewFilterType):
         except Exception:
             return Q()
 
+    def get_python_filter(self, field_name, value, model_field, field):
+        value = value.strip()
+
+        try:
+            option_id = int(value)
+        except ValueError:
+            return lambda row: None
+
+        return lambda row: getattr(row, f"{field_name}_id") == option_id
+
     def set_import_serialized_value(self, value, id_mapping):
         try:
             value = int(value)
@@ -1098,6 +1188,14 @@ class SingleSelectIsAnyOfViewFilterType(ViewFilterType):
 
         return Q(**{f"{field_name}_id__in": option_ids})
 
+    def get_python_filter(self, field_name, value: str, model_field, field):
+        if not value:
+            return lambda row: None
+
+        option_ids = {int(v) for v in value.split(",") if v.isdigit()}
+
+        return lambda row: getattr(row, f"{field_name}_id") in option_ids
+
 
 class SingleSelectIsNoneOfViewFilterType(
     NotViewFilterTypeMixin, SingleSelectIsAnyOfViewFilterType
@@ -1147,6 +1245,13 @@ class BooleanViewFilterType(ViewFilterType):
         except Exception:
             return Q()
 
+    def get_python_filter(self, field_name, value, model_field, field):
+        if not is_python_filterable_field(field):
+            return None
+
+        value = value.strip().lower() in ["y", "t", "o", "yes", "true", "on", "1"]
+        return lambda row: getattr(row, field_name) == value
+
 
 class ManyToManyHasBaseViewFilter(ViewFilterType):
     """
@@ -1461,6 +1566,17 @@ class EmptyViewFilterType(ViewFilterType):
 
         return field_type.empty_query(field_name, model_field, field)
 
+    def get_python_filter(self, field_name, value, model_field, field):
+        if not is_python_filterable_field(field):
+            return None
+
+        if isinstance(model_field, BooleanField):
+            return lambda row: getattr(row, field_name) is False
+        elif isinstance(model_field, ForeignKey):
+            return lambda row: getattr(row, f"{field_name}_id") is None
+        else:
+            return lambda row: getattr(row, field_name) in [None, ""]
+
 
 class NotEmptyViewFilterType(NotViewFilterTypeMixin, EmptyViewFilterType):
     type = "not_empty"
@@ -16,6 +16,7 @@ from baserow.core.utils import extract_allowed, set_allowed_attrs
 from .exceptions import TableWebhookDoesNotExist, TableWebhookMaxAllowedCountExceeded
 from .models import (
     TableWebhook,
+    TableWebhookBatchedEvent,
     TableWebhookCall,
     TableWebhookEvent,
     TableWebhookHeader,
@@ -29,6 +30,7 @@ from .operations import (
     UpdateWebhookOperationType,
 )
 from .registries import webhook_event_type_registry
+from .tasks import schedule_batched_webhook_call
 from .validators import get_webhook_request_function
 
 
@@ -167,6 +169,7 @@ class WebhookHandler:
             "request_method",
             "name",
             "include_all_events",
+            "batch_events",
         ]
         values = extract_allowed(kwargs, allowed_fields)
         webhook = TableWebhook.objects.create(table_id=table.id, **values)
@@ -237,6 +240,7 @@ class WebhookHandler:
             "name",
             "include_all_events",
             "active",
+            "batch_events",
         ]
         webhook = set_allowed_attrs(kwargs, allowed_fields, webhook)
         webhook.save()
@@ -353,6 +357,36 @@ class WebhookHandler:
 
         return first_request, response
 
+    def add_batched_event(
+        self, webhook: TableWebhook, event_id: str, event_type: str, payload: dict
+    ):
+        """
+        Adds the event to the queue of the webhook instead of calling it directly.
+        The queued events are delivered together in a single call after
+        `BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS`, or right away when
+        `BASEROW_WEBHOOKS_BATCH_MAX_EVENTS` is reached.
+
+        :param webhook: The webhook that must be called with the event.
+        :param event_id: The unique uuid event id.
+        :param event_type: The event type related to the payload.
+        :param payload: The JSON serializable payload of the event.
+        """
+
+        TableWebhookBatchedEvent.objects.create(
+            webhook=webhook, event_id=event_id, event_type=event_type, payload=payload
+        )
+        max_events = settings.BASEROW_WEBHOOKS_BATCH_MAX_EVENTS
+        pending_count = TableWebhookBatchedEvent.objects.filter(webhook=webhook)[
+            :max_events
+        ].count()
+        # A full batch is delivered right away, otherwise we wait for more events.
+        schedule_batched_webhook_call(
+            webhook.id,
+            countdown=0
+            if pending_count >= max_events
+            else settings.BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS,
+        )
+
     def get_headers(self, event_type: str, event_id: str):
         """Returns the default headers that must be added to every request."""
 
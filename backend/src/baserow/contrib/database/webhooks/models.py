@@ -1,5 +1,6 @@
 import uuid
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxLengthValidator
 from django.db import models
 
@@ -52,6 +53,16 @@ class TableWebhook(CreatedAndUpdatedOnMixin, models.Model):
     failed_triggers = models.IntegerField(
         default=0, help_text="The amount of failed webhook calls."
     )
+    batch_events = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the events must be collected for a short while "
+        "and sent together in a single call instead of making a call per event.",
+    )
+    batch_scheduled_for = models.DateTimeField(
+        null=True,
+        help_text="The moment the scheduled call delivering the batched events is "
+        "expected to run. Empty if no call has been scheduled.",
+    )
 
     @property
     def header_dict(self):
@@ -71,6 +82,22 @@ class TableWebhookEvent(CreatedAndUpdatedOnMixin, models.Model):
         ordering = ("id",)
 
 
+class TableWebhookBatchedEvent(models.Model):
+    webhook = models.ForeignKey(
+        TableWebhook, related_name="batched_events", on_delete=models.CASCADE
+    )
+    event_id = models.UUIDField(help_text="The unique id of the event.")
+    event_type = models.CharField(max_length=50)
+    payload = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        help_text="The payload of the event that must be included in the next call.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("id",)
+
+
 class TableWebhookHeader(models.Model):
     webhook = models.ForeignKey(
         TableWebhook, related_name="headers", on_delete=models.CASCADE
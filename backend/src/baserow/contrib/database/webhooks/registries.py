@@ -7,7 +7,7 @@ from django.dispatch.dispatcher import Signal
 from baserow.contrib.database.table.models import Table
 from baserow.core.registry import Instance, ModelRegistryMixin, Registry
 
-from .tasks import call_webhook
+from .tasks import call_webhooks
 
 
 class WebhookEventType(Instance):
@@ -124,20 +124,32 @@ class WebhookEventType(Instance):
         webhook_handler = WebhookHandler()
         webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
+        calls = []
         for webhook in webhooks:
             payload = self.get_payload(event_id, webhook, **kwargs)
+            if webhook.batch_events:
+                webhook_handler.add_batched_event(webhook, event_id, self.type, payload)
+                continue
+
             headers = webhook.header_dict
             headers.update(**webhook_handler.get_headers(self.type, event_id))
-            call_webhook.delay(
-                webhook_id=webhook.id,
-                event_id=event_id,
-                event_type=self.type,
-                method=webhook.request_method,
-                url=webhook.url,
-                headers=headers,
-                payload=payload,
+            calls.append(
+                {
+                    "webhook_id": webhook.id,
+                    "event_id": event_id,
+                    "event_type": self.type,
+                    "method": webhook.request_method,
+                    "url": webhook.url,
+                    "headers": headers,
+                    "payload": payload,
+                }
             )
 
+        if calls:
+            # The calls are made concurrently by a single task, so that a slow
+            # receiver doesn't occupy a worker of the export queue per event.
+            call_webhooks.delay(calls=calls)
+
 
 class WebhookEventTypeRegistry(ModelRegistryMixin, Registry):
     name = "webhook_event"
@@ -1,75 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from typing import List, Optional
+
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
 from baserow.config.celery import app
 
+# The event type of the calls delivering multiple batched events at once.
+BATCH_EVENT_TYPE = "batch"
 
-@app.task(
-    bind=True,
-    max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
-    queue="export",
-)
-def call_webhook(
-    self,
+
+def _make_webhook_request(handler, method: str, url: str, headers: dict, payload):
+    """
+    Makes the webhook request and catches the errors that are expected if the
+    receiver can't be reached.
+
+    :return: A tuple containing the request, the response, whether the call was
+        successful and the error message.
+    """
+
+    from advocate import UnacceptableAddressException
+    from requests import RequestException
+
+    request = None
+    response = None
+    success = False
+    error = ""
+
+    try:
+        request, response = handler.make_request(method, url, headers, payload)
+        success = response.ok
+    except RequestException as exception:
+        request = exception.request
+        response = exception.response
+        error = str(exception)
+    except UnacceptableAddressException as exception:
+        error = f"UnacceptableAddressException: {exception}"
+
+    return request, response, success, error
+
+
+def _store_webhook_call(
+    handler,
     webhook_id: int,
     event_id: str,
     event_type: str,
-    method: str,
     url: str,
-    headers: dict,
-    payload: dict,
-    **kwargs: dict,
+    request,
+    response,
+    success: bool,
+    error: str,
 ):
     """
-    This task should be called asynchronously when the webhook call must be trigged.
-    All the raw values should be provided as argument. If the call fails for whatever
-    reason, it tries again until the max retries have been reached.
+    Stores the call in the log of the webhook and updates the failed triggers of the
+    webhook in a short transaction.
 
-    :param webhook_id: The id of the webhook related to the call.
-    :param event_id: A unique event id that can used as id for the table webhook call
-        model.
-    :param event_type: The event type related to the webhook trigger.
-    :param method: The request method the must be used.
-    :param url: The URL can must be called.
-    :param headers: The additional headers that must be added to the request. The key
-        is the name and the value is the value.
-    :param payload: The JSON serializable payload that must be used as request body.
+    :return: The updated webhook or None if it has been deleted in the meantime.
     """
 
     from django.utils import timezone
 
-    from advocate import UnacceptableAddressException
-    from requests import RequestException
-
-    from .handler import WebhookHandler
     from .models import TableWebhook, TableWebhookCall
 
     with transaction.atomic():
-        handler = WebhookHandler()
-
         try:
             webhook = TableWebhook.objects.select_for_update(of=("self",)).get(
                 id=webhook_id
             )
         except TableWebhook.DoesNotExist:
-            # If the webhook has been deleted while executing, we don't want to continue
-            # trying to call the URL because we can't update the state of the webhook.
-            return
-
-        request = None
-        response = None
-        success = False
-        error = ""
-
-        try:
-            request, response = handler.make_request(method, url, headers, payload)
-            success = response.ok
-        except RequestException as exception:
-            request = exception.request
-            response = exception.response
-            error = str(exception)
-        except UnacceptableAddressException as exception:
-            error = f"UnacceptableAddressException: {exception}"
+            # If the webhook has been deleted while executing, we can't update the
+            # state of the webhook anymore.
+            return None
 
         TableWebhookCall.objects.update_or_create(
             event_id=event_id,
@@ -115,6 +119,71 @@ def call_webhook(
             webhook.active = False
             webhook.save()
 
+    return webhook
+
+
+@app.task(
+    bind=True,
+    max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
+    queue="export",
+)
+def call_webhook(
+    self,
+    webhook_id: int,
+    event_id: str,
+    event_type: str,
+    method: str,
+    url: str,
+    headers: dict,
+    payload: dict,
+    **kwargs: dict,
+):
+    """
+    This task should be called asynchronously when the webhook call must be trigged.
+    All the raw values should be provided as argument. If the call fails for whatever
+    reason, it tries again until the max retries have been reached.
+
+    :param webhook_id: The id of the webhook related to the call.
+    :param event_id: A unique event id that can used as id for the table webhook call
+        model.
+    :param event_type: The event type related to the webhook trigger.
+    :param method: The request method the must be used.
+    :param url: The URL can must be called.
+    :param headers: The additional headers that must be added to the request. The key
+        is the name and the value is the value.
+    :param payload: The JSON serializable payload that must be used as request body.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhook
+
+    handler = WebhookHandler()
+
+    # The request is made outside of any transaction, so that the webhook row isn't
+    # locked and no database connection is held while waiting for the receiver.
+    # Otherwise, a slow receiver would serialize all the calls of the webhook.
+    if not TableWebhook.objects.filter(id=webhook_id).exists():
+        # If the webhook has been deleted, we don't want to continue trying to call
+        # the URL because we can't update the state of the webhook.
+        return
+
+    request, response, success, error = _make_webhook_request(
+        handler, method, url, headers, payload
+    )
+    webhook = _store_webhook_call(
+        handler,
+        webhook_id,
+        event_id,
+        event_type,
+        url,
+        request,
+        response,
+        success,
+        error,
+    )
+    if webhook is None:
+        return
+
     # This part must be outside of the transaction block, otherwise it could cause
     # the transaction to rollback when the retry exception is raised, and we don't want
     # that to happen.
@@ -125,3 +194,267 @@ def call_webhook(
         # If the task is still operating within the max retries per call limit,
         # then we want to retry the task with an exponential backoff.
         self.retry(countdown=2**self.request.retries)
+
+
+@app.task(queue="export")
+def call_webhooks(calls: List[dict]):
+    """
+    Makes multiple webhook calls concurrently, so that a slow receiver only occupies
+    one of the `BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS` threads instead of the whole
+    worker. Only the HTTP requests run in the threads, the calls are stored in the
+    worker thread as soon as they complete. A failed call is retried separately by
+    the `call_webhook` task.
+
+    :param calls: The calls that must be made. Every call is a dict containing the
+        keyword arguments of the `call_webhook` task.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhook
+
+    handler = WebhookHandler()
+
+    existing_webhook_ids = set(
+        TableWebhook.objects.filter(
+            id__in=[call["webhook_id"] for call in calls]
+        ).values_list("id", flat=True)
+    )
+    # Calls of deleted webhooks are skipped because their state can't be updated.
+    calls = [call for call in calls if call["webhook_id"] in existing_webhook_ids]
+    if not calls:
+        return
+
+    max_workers = min(len(calls), settings.BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _make_webhook_request,
+                handler,
+                call["method"],
+                call["url"],
+                call["headers"],
+                call["payload"],
+            ): call
+            for call in calls
+        }
+        for future in as_completed(futures):
+            call = futures[future]
+            request, response, success, error = future.result()
+            webhook = _store_webhook_call(
+                handler,
+                call["webhook_id"],
+                call["event_id"],
+                call["event_type"],
+                call["url"],
+                request,
+                response,
+                success,
+                error,
+            )
+            if webhook is not None and not success and webhook.active:
+                # This call counts as the first try, so the retry continues with the
+                # same exponential backoff as `call_webhook`.
+                call_webhook.apply_async(kwargs=call, countdown=1, retries=1)
+
+
+def schedule_batched_webhook_call(webhook_id: int, countdown: int = 0):
+    """
+    Schedules the task delivering the batched events of the webhook, unless it has
+    already been scheduled to run before the requested moment. Only one delivery can
+    be pending per webhook, so that the events are always delivered in order. A
+    scheduled delivery that didn't run long after it was expected to is considered
+    lost and replaced.
+
+    :param webhook_id: The id of the webhook that has batched events.
+    :param countdown: The amount of seconds to wait before making the call, so that
+        the events of the following seconds are delivered together.
+    """
+
+    from .models import TableWebhook
+
+    now = timezone.now()
+    scheduled_for = now + timedelta(seconds=countdown)
+    stale_before = now - timedelta(
+        seconds=settings.BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS
+    )
+    # A later delivery can be replaced by an earlier one. The later task notices
+    # that it has been replaced when it runs and then does nothing.
+    if (
+        TableWebhook.objects.filter(
+            Q(batch_scheduled_for__isnull=True)
+            | Q(batch_scheduled_for__lt=stale_before)
+            | Q(batch_scheduled_for__gt=scheduled_for),
+            id=webhook_id,
+        ).update(batch_scheduled_for=scheduled_for)
+        == 0
+    ):
+        return
+
+    try:
+        call_batched_webhook.apply_async(
+            kwargs={
+                "webhook_id": webhook_id,
+                "scheduled_for": scheduled_for.isoformat(),
+            },
+            countdown=countdown,
+        )
+    except Exception:
+        TableWebhook.objects.filter(
+            id=webhook_id, batch_scheduled_for=scheduled_for
+        ).update(batch_scheduled_for=None)
+        raise
+
+
+@app.task(queue="export")
+def schedule_stale_batched_webhook_calls():
+    """
+    Schedules the delivery of the batched events of the webhooks of which no
+    delivery is pending anymore, because the task was lost or couldn't be
+    scheduled.
+    """
+
+    from .models import TableWebhook
+
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS
+    )
+    webhook_ids = (
+        TableWebhook.objects.filter(
+            Q(batch_scheduled_for__isnull=True)
+            | Q(batch_scheduled_for__lt=stale_before),
+            batched_events__created_on__lt=stale_before,
+        )
+        .values_list("id", flat=True)
+        .distinct()
+    )
+    for webhook_id in webhook_ids:
+        schedule_batched_webhook_call(webhook_id)
+
+
+@app.task(
+    bind=True,
+    max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
+    queue="export",
+)
+def call_batched_webhook(self, webhook_id: int, scheduled_for: Optional[str] = None):
+    """
+    Delivers the oldest batched events of the webhook, up to
+    `BASEROW_WEBHOOKS_BATCH_MAX_EVENTS`, in a single call. If the call fails, it
+    tries again until the max retries have been reached, before moving on with the
+    next events. The next delivery is scheduled right away if there are remaining
+    events.
+
+    :param webhook_id: The id of the webhook that has batched events.
+    :param scheduled_for: The moment this delivery was scheduled for. If the
+        webhook has been scheduled for another moment in the meantime, this
+        delivery has been replaced and doesn't do anything.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhook, TableWebhookBatchedEvent
+
+    handler = WebhookHandler()
+
+    try:
+        webhook = TableWebhook.objects.select_related("table__database").get(
+            id=webhook_id
+        )
+    except TableWebhook.DoesNotExist:
+        # The batched events have been deleted together with the webhook.
+        return
+
+    if scheduled_for is not None and (
+        webhook.batch_scheduled_for is None
+        or webhook.batch_scheduled_for.isoformat() != scheduled_for
+    ):
+        return
+
+    this_delivery = TableWebhook.objects.filter(
+        id=webhook_id, batch_scheduled_for=webhook.batch_scheduled_for
+    )
+
+    if not webhook.active:
+        TableWebhookBatchedEvent.objects.filter(webhook_id=webhook_id).delete()
+        this_delivery.update(batch_scheduled_for=None)
+        return
+
+    events = list(
+        webhook.batched_events.all()[: settings.BASEROW_WEBHOOKS_BATCH_MAX_EVENTS]
+    )
+    if events:
+        # The id of the first event is used as delivery id, so that it doesn't
+        # change when the call is retried.
+        event_id = events[0].event_id
+        payload = {
+            "table_id": webhook.table_id,
+            "database_id": webhook.table.database_id,
+            "workspace_id": webhook.table.database.workspace_id,
+            "event_id": str(event_id),
+            "event_type": BATCH_EVENT_TYPE,
+            "events": [event.payload for event in events],
+        }
+        headers = webhook.header_dict
+        headers.update(**handler.get_headers(BATCH_EVENT_TYPE, event_id))
+
+        request, response, success, error = _make_webhook_request(
+            handler, webhook.request_method, webhook.url, headers, payload
+        )
+        webhook = _store_webhook_call(
+            handler,
+            webhook_id,
+            event_id,
+            BATCH_EVENT_TYPE,
+            webhook.url,
+            request,
+            response,
+            success,
+            error,
+        )
+        if webhook is None:
+            return
+
+        if (
+            not success
+            and webhook.active
+            and self.request.retries < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL
+        ):
+            # The events stay in the queue, so that they're included again in
+            # the retry and delivered before the newer ones.
+            countdown = 2**self.request.retries
+            retry_scheduled_for = timezone.now() + timedelta(seconds=countdown)
+            this_delivery.update(batch_scheduled_for=retry_scheduled_for)
+            self.retry(
+                countdown=countdown,
+                kwargs={
+                    "webhook_id": webhook_id,
+                    "scheduled_for": retry_scheduled_for.isoformat(),
+                },
+            )
+
+        TableWebhookBatchedEvent.objects.filter(
+            id__in=[event.id for event in events]
+        ).delete()
+
+    if this_delivery.update(batch_scheduled_for=None) == 0:
+        # Another delivery has been scheduled in the meantime.
+        return
+
+    remaining_count = TableWebhookBatchedEvent.objects.filter(webhook_id=webhook_id)[
+        : settings.BASEROW_WEBHOOKS_BATCH_MAX_EVENTS
+    ].count()
+    if remaining_count > 0:
+        # A full batch can be delivered right away, otherwise we wait for more events.
+        schedule_batched_webhook_call(
+            webhook_id,
+            countdown=0
+            if remaining_count >= settings.BASEROW_WEBHOOKS_BATCH_MAX_EVENTS
+            else settings.BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS,
+        )
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(seconds=settings.BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS),
+        schedule_stale_batched_webhook_calls.s(),
+    )
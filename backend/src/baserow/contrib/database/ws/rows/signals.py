@@ -14,6 +14,9 @@ from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.ws.registries import page_registry
 
+# The maximum amount of rebalanced rows that are sent to the clients as updated rows.
+ROW_ORDERS_REBALANCED_MAX_BROADCAST_ROWS = 200
+
 
 @receiver(row_signals.before_rows_update)
 def serialize_rows_values(
@@ -129,6 +132,31 @@ def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
     )
 
 
+@receiver(row_signals.row_orders_rebalanced)
+def row_orders_rebalanced(sender, table, model, rows, old_orders, **kwargs):
+    table_page_type = page_registry.get("table")
+
+    # Sending all the rebalanced rows would result in a huge message if the
+    # rebalanced window is large, so the clients are asked to refresh instead.
+    if len(rows) > ROW_ORDERS_REBALANCED_MAX_BROADCAST_ROWS:
+        message = RealtimeRowMessages.row_orders_recalculated(table_id=table.id)
+    else:
+        serialized_rows = serialize_rows_for_response(rows, model)
+        message = RealtimeRowMessages.rows_updated(
+            table_id=table.id,
+            serialized_rows_before_update=[
+                {**serialized_row, "order": f"{old_orders[serialized_row['id']]:.20f}"}
+                for serialized_row in serialized_rows
+            ],
+            serialized_rows=serialized_rows,
+            metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
+                None, table, [row.id for row in rows]
+            ),
+        )
+
+    transaction.on_commit(lambda: table_page_type.broadcast(message, table_id=table.id))
+
+
 @receiver(row_signals.row_orders_recalculated)
 def row_orders_recalculated(sender, table, **kwargs):
     table_page_type = page_registry.get("table")
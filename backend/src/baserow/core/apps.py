@@ -282,6 +282,7 @@ class CoreConfig(AppConfig):
 
         import baserow.core.notifications.receivers  # noqa: F401
         import baserow.core.notifications.tasks  # noqa: F401
+        import baserow.core.usage.receivers  # noqa: F401
         from baserow.core.notification_types import (
             BaserowVersionUpgradeNotificationType,
             WorkspaceInvitationAcceptedNotificationType,
@@ -9,6 +9,14 @@ from baserow.core.utils import Progress
 class Command(BaseCommand):
     help = "Calculate the storage usage of every workspace"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only-updated",
+            action="store_true",
+            help="Only recalculate the workspaces that have changed since the "
+            "previous calculation.",
+        )
+
     def handle(self, *args, **options):
         progress_total = 1000
 
@@ -25,7 +33,8 @@ class Command(BaseCommand):
 
         with tqdm(total=progress_total) as progress_bar:
             workspaces_updated = UsageHandler.calculate_storage_usage(
-                progress_builder=create_progress_and_update_bar(progress_bar)
+                progress_builder=create_progress_and_update_bar(progress_bar),
+                only_updated=options["only_updated"],
             )
 
         self.stdout.write(
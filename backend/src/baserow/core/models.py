@@ -34,6 +34,7 @@ from .services.models import Service
 __all__ = [
     "Settings",
     "Workspace",
+    "WorkspaceStorageUsageUpdate",
     "WorkspaceUser",
     "WorkspaceInvitation",
     "Application",
@@ -279,6 +280,22 @@ class Workspace(HierarchicalModelMixin, TrashableModelMixin, CreatedAndUpdatedOn
         return f"<Workspace id={self.id}, name={self.name}>"
 
 
+class WorkspaceStorageUsageUpdate(models.Model):
+    """
+    This table maintains an entry for each workspace where something that counts
+    towards the storage usage has changed since the last time the storage usage was
+    calculated (e.g. a new image in a form view or a trashed application). It allows
+    `UsageHandler.calculate_storage_usage` to only recalculate the storage usage of
+    the workspaces that have changed, instead of all of them. Changes to the files of
+    the tables are tracked by the `TableUsageUpdate` entries.
+    """
+
+    workspace = models.OneToOneField(
+        Workspace, on_delete=models.CASCADE, related_name="storage_usage_update"
+    )
+    timestamp = models.DateTimeField(auto_now=True)
+
+
 class WorkspaceUser(
     HierarchicalModelMixin,
     ParentWorkspaceTrashableModelMixin,
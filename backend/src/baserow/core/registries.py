@@ -88,6 +88,16 @@ class ImportExportConfig:
     """
     workspace_for_user_references: "Workspace" = None
 
+    """
+    Whether or not the rows can be copied directly in the database instead of being
+    serialized. This is only possible if the exported application still exists in
+    the same database when it's imported, like for snapshots and duplicates.
+
+    For example, this configures the database to not export the rows, but to copy
+    them from the exported tables using `INSERT ... SELECT` statements when importing.
+    """
+    copy_rows_in_database: bool = False
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
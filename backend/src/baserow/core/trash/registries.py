@@ -18,6 +18,14 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
     A TrashableItemType specifies a baserow model which can be trashed.
     """
 
+    affects_storage_usage = False
+    """
+    Indicates whether trashing or restoring an item of this type changes the storage
+    usage of the workspace, in which case the workspace is marked for a storage usage
+    update. The changes of the rows and fields are already tracked by the table
+    usage.
+    """
+
     def lookup_trashed_item(
         self, trashed_entry, trash_item_lookup_cache: Dict[str, Any] = None
     ):
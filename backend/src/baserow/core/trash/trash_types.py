@@ -14,6 +14,7 @@ from baserow.core.trash.registries import TrashableItemType, trash_item_type_reg
 class ApplicationTrashableItemType(TrashableItemType):
     type = "application"
     model_class = Application
+    affects_storage_usage = True
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return trashed_item.workspace
@@ -1,50 +1,110 @@
-from typing import Optional
+from typing import Iterable, Optional
 
-from django.db.models import F, OuterRef, PositiveIntegerField, Subquery, Sum
+from django.db.models import F, OuterRef, PositiveIntegerField, Q, Subquery, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from baserow.contrib.database.table.models import Table
-from baserow.core.models import Workspace
+from baserow.core.models import Workspace, WorkspaceStorageUsageUpdate
 from baserow.core.usage.registries import workspace_storage_usage_item_registry
 from baserow.core.utils import ChildProgressBuilder, grouper
 
 
 class UsageHandler:
+    @classmethod
+    def mark_workspaces_for_storage_usage_update(cls, workspace_ids: Iterable[int]):
+        """
+        Marks the provided workspaces so that their storage usage is recalculated
+        the next time the storage usage of the updated workspaces is calculated.
+
+        :param workspace_ids: The ids of the workspaces that have changed.
+        """
+
+        WorkspaceStorageUsageUpdate.objects.bulk_create(
+            [
+                WorkspaceStorageUsageUpdate(workspace_id=workspace_id)
+                for workspace_id in set(workspace_ids)
+                if workspace_id is not None
+            ],
+            update_conflicts=True,
+            update_fields=["timestamp"],
+            unique_fields=["workspace"],
+        )
+
+    @classmethod
+    def get_updated_workspaces_filter(cls) -> Q:
+        """
+        Returns a filter matching the workspaces of which the storage usage must be
+        recalculated because something has changed since the last calculation, or
+        because it has never been calculated.
+        """
+
+        q = Q(storage_usage_updated_at__isnull=True) | Q(
+            storage_usage_update__isnull=False
+        )
+        for item in workspace_storage_usage_item_registry.get_all():
+            workspace_ids = item.get_workspace_ids_to_update()
+            if workspace_ids is not None:
+                q |= Q(id__in=workspace_ids)
+        return q
+
     @classmethod
     def calculate_storage_usage(
         cls,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        only_updated: bool = False,
     ) -> int:
         """
-        Calculates the storage usage of every workspace.
+        Calculates the storage usage of every workspace. The usage of every item type
+        is calculated for a chunk of workspaces at once.
 
         :param progress_builder: An optional progress builder that can be used to
             indicate the progress of the calculation.
+        :param only_updated: Indicates whether only the workspaces that have changed
+            since the last calculation must be updated.
         :return: The amount of workspaces that have been updated.
         """
 
         count, chunk_size = 0, 256
+        started_at = timezone.now()
         qs = Workspace.objects.filter(template__isnull=True)
-        workspaces_queryset = qs.iterator(chunk_size=chunk_size)
+        if only_updated:
+            qs = qs.filter(cls.get_updated_workspaces_filter())
+        # The ids are fetched upfront because calculating the usage of an item can
+        # consume the changes that were used to select the workspaces.
+        workspace_ids = list(qs.order_by("id").values_list("id", flat=True))
+
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=len(workspace_ids)
+        )
 
-        progress = ChildProgressBuilder.build(progress_builder, child_total=qs.count())
+        for workspace_ids_chunk in grouper(chunk_size, workspace_ids):
+            usage_in_megabytes = {
+                workspace_id: 0 for workspace_id in workspace_ids_chunk
+            }
+            for item in workspace_storage_usage_item_registry.get_all():
+                item_usage = item.calculate_storage_usage_for_workspaces(
+                    list(workspace_ids_chunk)
+                )
+                for workspace_id, usage in item_usage.items():
+                    usage_in_megabytes[workspace_id] += usage or 0
 
-        for workspaces in grouper(chunk_size, workspaces_queryset):
             now = timezone.now()
-            for workspace in workspaces:
-                usage_in_megabytes = 0
-                for item in workspace_storage_usage_item_registry.get_all():
-                    usage_in_megabytes += item.calculate_storage_usage(workspace.id)
-
-                workspace.storage_usage = usage_in_megabytes
-                workspace.storage_usage_updated_at = now
-                progress.increment()
-
+            workspaces = [
+                Workspace(
+                    id=workspace_id, storage_usage=usage, storage_usage_updated_at=now
+                )
+                for workspace_id, usage in usage_in_megabytes.items()
+            ]
             Workspace.objects.bulk_update(
                 workspaces, ["storage_usage", "storage_usage_updated_at"]
             )
             count += len(workspaces)
+            progress.increment(len(workspaces))
+
+        # The workspaces that have changed during the calculation keep their entry, so
+        # that they're updated again next time.
+        WorkspaceStorageUsageUpdate.objects.filter(timestamp__lte=started_at).delete()
 
         return count
 
@@ -0,0 +1,11 @@
+from django.dispatch import receiver
+
+from baserow.core.signals import application_created
+from baserow.core.usage.handler import UsageHandler
+
+
+@receiver(application_created)
+def on_application_created(sender, application, **kwargs):
+    # A duplicated or installed application can contain files that count towards the
+    # storage usage of the workspace.
+    UsageHandler.mark_workspaces_for_storage_usage_update([application.workspace_id])
@@ -1,11 +1,43 @@
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from baserow.core.registry import Instance, Registry
+from baserow.core.user_files.models import UserFile
 
 UsageInMB = int
 USAGE_UNIT_MB = 1000**2
 
 
+def get_user_files_usage_by_workspace(
+    workspace_and_user_file_ids: Iterable[Tuple[int, Optional[int]]]
+) -> Dict[int, UsageInMB]:
+    """
+    Sums the size of the user files used in every workspace. A user file that is
+    used multiple times in the same workspace is only counted once.
+
+    :param workspace_and_user_file_ids: (workspace_id, user_file_id) tuples.
+    :return: the usage of the user files by workspace id, rounded down to whole
+        megabytes like the per workspace calculations.
+    """
+
+    user_file_ids_by_workspace = defaultdict(set)
+    for workspace_id, user_file_id in workspace_and_user_file_ids:
+        if user_file_id is not None:
+            user_file_ids_by_workspace[workspace_id].add(user_file_id)
+
+    all_user_file_ids = set().union(*user_file_ids_by_workspace.values())
+    sizes = dict(
+        UserFile.objects.filter(id__in=all_user_file_ids).values_list("id", "size")
+    )
+
+    return {
+        workspace_id: sum(sizes.get(user_file_id, 0) for user_file_id in user_file_ids)
+        // USAGE_UNIT_MB
+        for workspace_id, user_file_ids in user_file_ids_by_workspace.items()
+    }
+
+
 class WorkspaceStorageUsageItemType(Instance, ABC):
     """
     A GroupStorageUsageItemType defines an item that can calculate
@@ -23,6 +55,35 @@ class WorkspaceStorageUsageItemType(Instance, ABC):
 
         pass
 
+    def calculate_storage_usage_for_workspaces(
+        self, workspace_ids: List[int]
+    ) -> Dict[int, UsageInMB]:
+        """
+        Calculates the storage usage for multiple workspaces at once in a specific
+        part of the application. Item types should override this method to compute
+        the usage of all the workspaces with a single grouped query, the default
+        implementation calls `calculate_storage_usage` for every workspace.
+
+        :param workspace_ids: the workspaces that the usage is calculated for
+        :return: the total usage by workspace id
+        """
+
+        return {
+            workspace_id: self.calculate_storage_usage(workspace_id)
+            for workspace_id in workspace_ids
+        }
+
+    def get_workspace_ids_to_update(self) -> Optional[Iterable[int]]:
+        """
+        Returns the ids of the workspaces of which the usage of this item has
+        changed since the last calculation, if the item type keeps track of its
+        changes in another way than the `WorkspaceStorageUsageUpdate` entries.
+
+        :return: the ids of the changed workspaces or None
+        """
+
+        return None
+
 
 class WorkspaceStorageUsageItemTypeRegistry(Registry):
     """
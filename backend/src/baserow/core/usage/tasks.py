@@ -14,7 +14,9 @@ def run_calculate_storage():
     from baserow.core.usage.handler import UsageHandler
 
     if CoreHandler().get_settings().track_workspace_usage:
-        UsageHandler.calculate_storage_usage()
+        UsageHandler.calculate_storage_usage(
+            only_updated=settings.BASEROW_STORAGE_USAGE_JOB_ONLY_UPDATED
+        )
 
 
 @app.on_after_finalize.connect
@@ -0,0 +1,104 @@
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+PERMITTED_USERS_CACHE_VERSION_KEY = "ws_permitted_users_version_{workspace_id}"
+PERMITTED_USERS_CACHE_KEY = (
+    "ws_permitted_users_{workspace_id}_{version}_{operation_type}_{scope_name}_"
+    "{scope_id}"
+)
+
+
+def _get_permitted_users_cache_version(workspace_id: int) -> int:
+    return cache.get(
+        PERMITTED_USERS_CACHE_VERSION_KEY.format(workspace_id=workspace_id), 0
+    )
+
+
+def _get_permitted_users_cache_key(
+    workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+) -> str:
+    return PERMITTED_USERS_CACHE_KEY.format(
+        workspace_id=workspace_id,
+        version=_get_permitted_users_cache_version(workspace_id),
+        operation_type=operation_type,
+        scope_name=scope_name,
+        scope_id=scope_id,
+    )
+
+
+def get_cached_permitted_user_ids(
+    workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+) -> Optional[List[int]]:
+    """
+    Returns the ids of the users of the workspace that were permitted to perform the
+    operation on the scope when they were cached, or None if they're not cached.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_type: The operation that has been checked.
+    :param scope_name: The name of the scope that the operation is executed on.
+    :param scope_id: The id of the scope instance.
+    """
+
+    if not settings.BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS:
+        return None
+
+    return cache.get(
+        _get_permitted_users_cache_key(
+            workspace_id, operation_type, scope_name, scope_id
+        )
+    )
+
+
+def set_cached_permitted_user_ids(
+    workspace_id: int,
+    operation_type: str,
+    scope_name: str,
+    scope_id: int,
+    user_ids: List[int],
+):
+    """
+    Caches the ids of the users of the workspace that are permitted to perform the
+    operation on the scope, so that the permissions don't have to be checked for
+    every user for the next broadcasts. The cache is invalidated when the members
+    or the permissions of the workspace change, and expires after
+    `BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS` to also pick up changes that
+    don't send a signal, like a license change.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_type: The operation that has been checked.
+    :param scope_name: The name of the scope that the operation is executed on.
+    :param scope_id: The id of the scope instance.
+    :param user_ids: The ids of the permitted users.
+    """
+
+    timeout = settings.BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS
+    if not timeout:
+        return
+
+    cache.set(
+        _get_permitted_users_cache_key(
+            workspace_id, operation_type, scope_name, scope_id
+        ),
+        user_ids,
+        timeout=timeout,
+    )
+
+
+def invalidate_permitted_users_cache(workspace_id: int):
+    """
+    Invalidates all the cached permitted users of the workspace by changing the
+    version used in the cache keys. The old entries simply expire.
+
+    :param workspace_id: The workspace of which the members or the permissions have
+        changed.
+    """
+
+    version_key = PERMITTED_USERS_CACHE_VERSION_KEY.format(workspace_id=workspace_id)
+    cache.add(version_key, 0, timeout=None)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # The key has been evicted in the meantime, which invalidates the cache too.
+        pass
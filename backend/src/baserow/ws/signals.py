@@ -27,6 +27,7 @@ from baserow.core.registries import object_scope_type_registry
 from baserow.core.user import signals as user_signals
 from baserow.core.utils import generate_hash
 
+from .cache import invalidate_permitted_users_cache
 from .tasks import (
     broadcast_application_created,
     broadcast_to_group,
@@ -205,6 +206,25 @@ def workspace_user_deleted(sender, workspace_user_id, workspace_user, user, **kw
     transaction.on_commit(broadcast_to_workspace_and_removed_user)
 
 
+@receiver(signals.workspace_user_added)
+@receiver(signals.workspace_user_updated)
+@receiver(signals.workspace_user_deleted)
+@receiver(signals.workspace_restored)
+def invalidate_permitted_users_cache_when_workspace_user_changed(
+    sender, workspace_user, **kwargs
+):
+    workspace_id = workspace_user.workspace_id
+    transaction.on_commit(lambda: invalidate_permitted_users_cache(workspace_id))
+
+
+@receiver(signals.permissions_updated)
+def invalidate_permitted_users_cache_when_permissions_updated(
+    sender, workspace, **kwargs
+):
+    workspace_id = workspace.id
+    transaction.on_commit(lambda: invalidate_permitted_users_cache(workspace_id))
+
+
 @receiver(signals.workspace_restored)
 def workspace_restored(sender, workspace_user, user, **kwargs):
     workspaceuser_workspaces = (
@@ -123,6 +123,18 @@ def broadcast_to_permitted_users(
     from baserow.core.models import Workspace, WorkspaceUser
     from baserow.core.registries import object_scope_type_registry
 
+    from .cache import get_cached_permitted_user_ids, set_cached_permitted_user_ids
+
+    # The permitted users are cached until the members or the permissions of the
+    # workspace change, so that a busy table doesn't check the permissions of every
+    # workspace user for every broadcasted event.
+    user_ids = get_cached_permitted_user_ids(
+        workspace_id, operation_type, scope_name, scope_id
+    )
+    if user_ids is not None:
+        broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
+        return
+
     workspace = Workspace.objects.get(id=workspace_id)
 
     users_in_workspace = [
@@ -152,6 +164,9 @@ def broadcast_to_permitted_users(
             context=scope,
         )
     ]
+    set_cached_permitted_user_ids(
+        workspace_id, operation_type, scope_name, scope_id, user_ids
+    )
 
     broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
@@ -0,0 +1,30 @@
+from django.db.models import F, Q
+
+from baserow.api.pagination import KeysetPagination
+
+
+def _get_top_level_lookups(q: Q):
+    lookups = []
+    for child in q.children:
+        if isinstance(child, Q) and child.connector == "OR":
+            lookups += [c for c in child.children if not isinstance(c, Q)]
+        elif not isinstance(child, Q):
+            lookups.append(child)
+    return lookups
+
+
+def test_keyset_filter_bounds_the_leading_order_by():
+    paginator = KeysetPagination()
+    names = ["_keyset_0", "_keyset_1"]
+
+    keyset_filter = paginator.get_keyset_filter(
+        names, [F("order").asc(), F("id").asc()], ["1.5", 10]
+    )
+    assert keyset_filter.connector == "AND"
+    assert ("_keyset_0__gte", "1.5") in _get_top_level_lookups(keyset_filter)
+
+    keyset_filter = paginator.get_keyset_filter(
+        names, [F("name").desc(), F("id").asc()], ["b", 10]
+    )
+    assert keyset_filter.connector == "AND"
+    assert ("_keyset_0__lte", "b") in _get_top_level_lookups(keyset_filter)
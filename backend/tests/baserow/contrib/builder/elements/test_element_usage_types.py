@@ -116,3 +116,49 @@ def test_image_element_workspace_storage_usage_item_duplicate_ids(data_fixture):
     )
 
     assert usage == 2
+
+
+@pytest.mark.django_db
+def test_image_element_workspace_storage_usage_item_for_workspaces(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    page = data_fixture.create_builder_page(
+        builder=data_fixture.create_builder_application(workspace=workspace)
+    )
+    workspace_2 = data_fixture.create_workspace(user=user)
+
+    image_file = data_fixture.create_user_file(is_image=True, size=2 * USAGE_UNIT_MB)
+    data_fixture.create_builder_image_element(page=page, image_file=image_file)
+    data_fixture.create_builder_image_element(page=page, image_file=image_file)
+
+    usage = (
+        ImageElementWorkspaceStorageUsageItem().calculate_storage_usage_for_workspaces(
+            [workspace.id, workspace_2.id]
+        )
+    )
+
+    assert usage.get(workspace.id, 0) == 2
+    assert usage.get(workspace_2.id, 0) == 0
+
+
+@pytest.mark.django_db
+def test_image_element_workspace_storage_usage_item_for_workspaces_is_the_same(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    page = data_fixture.create_builder_page(
+        builder=data_fixture.create_builder_application(workspace=workspace)
+    )
+
+    for size in [1.5, 1.7]:
+        image_file = data_fixture.create_user_file(
+            is_image=True, size=int(size * USAGE_UNIT_MB)
+        )
+        data_fixture.create_builder_image_element(page=page, image_file=image_file)
+
+    usage_type = ImageElementWorkspaceStorageUsageItem()
+    usage = usage_type.calculate_storage_usage_for_workspaces([workspace.id])
+
+    assert usage[workspace.id] == usage_type.calculate_storage_usage(workspace.id)
+    assert usage[workspace.id] == 3
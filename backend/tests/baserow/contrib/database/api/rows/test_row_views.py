@@ -19,6 +19,8 @@ from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.actions import UpdateRowsActionType
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.models import RowChange
+from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.search.handler import ALL_SEARCH_MODES, SearchHandler
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.tokens.handler import TokenHandler
@@ -408,6 +410,63 @@ def test_list_rows(api_client, data_fixture):
     assert response_json["error"] == "ERROR_USER_NOT_IN_GROUP"
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture, settings):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [3, None, 1, 2, 2]
+    ]
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?cursor=&size=3", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert [r["id"] for r in response_json["results"]] == [r.id for r in rows[:3]]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['next_cursor']}&size=3",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [r.id for r in rows[3:]]
+    assert response_json["next_cursor"] is None
+
+    response = api_client.get(
+        f"{url}?cursor=&size=3&order_by=-field_{number_field.id}",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == [
+        rows[0].id,
+        rows[3].id,
+        rows[4].id,
+    ]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['next_cursor']}&size=3"
+        f"&order_by=-field_{number_field.id}",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == [rows[2].id, rows[1].id]
+
+    response = api_client.get(
+        f"{url}?cursor=&size={settings.ROW_PAGE_SIZE_LIMIT + 1}",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
 @pytest.mark.django_db
 def test_list_rows_adhoc_filtering_query_param_null_character(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -3139,3 +3198,184 @@ def test_list_row_history_endpoint_is_paginated(data_fixture, api_client):
             },
         ],
     }
+
+
+@pytest.mark.django_db
+def test_list_rows_with_link_row_values_limit(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    related_table = data_fixture.create_database_table(user=user, database=database)
+    related_primary_field = data_fixture.create_text_field(
+        table=related_table, name="Name", primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user,
+        table,
+        "link_row",
+        name="Link",
+        link_row_table=related_table,
+        link_row_values_limit=2,
+    )
+    related_rows = RowHandler().create_rows(
+        user,
+        related_table,
+        [{f"field_{related_primary_field.id}": str(index)} for index in range(5)],
+    )
+    row = RowHandler().create_row(
+        user,
+        table,
+        {f"field_{link_field.id}": [related_row.id for related_row in related_rows]},
+    )
+
+    list_url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    # All the linked rows are included, unless the limit is requested.
+    response = api_client.get(
+        list_url, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()["results"][0][f"field_{link_field.id}"]) == 5
+
+    response = api_client.get(
+        f"{list_url}?limit_link_row_values=true",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["results"][0][f"field_{link_field.id}"] == [
+        {"id": related_rows[0].id, "value": "0"},
+        {"id": related_rows[1].id, "value": "1"},
+    ]
+
+    # A single row always contains all the linked rows.
+    response = api_client.get(
+        reverse(
+            "api:database:rows:item", kwargs={"table_id": table.id, "row_id": row.id}
+        ),
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()[f"field_{link_field.id}"]) == 5
+
+    response = api_client.get(
+        reverse(
+            "api:database:rows:link_row_values",
+            kwargs={"table_id": table.id, "row_id": row.id, "field_id": link_field.id},
+        )
+        + "?limit=2&offset=2",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["count"] == 5
+    assert response_json["results"] == [
+        {"id": related_rows[2].id, "value": "2"},
+        {"id": related_rows[3].id, "value": "3"},
+    ]
+
+    other_field = data_fixture.create_text_field(table=table)
+    response = api_client.get(
+        reverse(
+            "api:database:rows:link_row_values",
+            kwargs={"table_id": table.id, "row_id": row.id, "field_id": other_field.id},
+        ),
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+
+@pytest.mark.django_db
+def test_link_row_values_count_row_metadata(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    related_table = data_fixture.create_database_table(user=user, database=database)
+    data_fixture.create_text_field(table=related_table, name="Name", primary=True)
+    link_field = FieldHandler().create_field(
+        user,
+        table,
+        "link_row",
+        name="Link",
+        link_row_table=related_table,
+        link_row_values_limit=1,
+    )
+    related_rows = RowHandler().create_rows(user, related_table, [{}, {}, {}])
+    row_1, row_2 = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                f"field_{link_field.id}": [
+                    related_row.id for related_row in related_rows
+                ]
+            },
+            {},
+        ],
+    )
+
+    metadata = row_metadata_registry.generate_and_merge_metadata_for_rows(
+        user, table, [row_1.id, row_2.id]
+    )
+    assert "link_row_values_count" not in metadata.get(row_1.id, {})
+
+    metadata = row_metadata_registry.generate_and_merge_metadata_for_rows(
+        user, table, [row_1.id, row_2.id], opt_in_types=["link_row_values_count"]
+    )
+    assert metadata[row_1.id]["link_row_values_count"] == {str(link_field.id): 3}
+    assert "link_row_values_count" not in metadata.get(row_2.id, {})
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS=7)
+def test_list_row_changes(data_fixture, api_client):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    token = TokenHandler().create_token(user, table.database.workspace, "Sync")
+
+    row = RowHandler().create_row(user, table, {name_field.id: "a"})
+
+    url = reverse("api:database:rows:changes", kwargs={"table_id": table.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"Token {token.key}")
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert [
+        (change["type"], change["row_ids"]) for change in response_json["changes"]
+    ] == [("created", [row.id])]
+    assert response_json["has_more"] is False
+    cursor = response_json["next_cursor"]
+
+    RowHandler().update_row_by_id(user, table, row.id, {f"field_{name_field.id}": "b"})
+
+    response = api_client.get(
+        url, {"since": cursor}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert [
+        (change["type"], change["row_ids"], change["field_ids"])
+        for change in response_json["changes"]
+    ] == [("updated", [row.id], [name_field.id])]
+    assert response_json["next_cursor"] != cursor
+
+    response = api_client.get(
+        url, {"since": "invalid"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_ROW_CHANGE_CURSOR"
+
+    RowChange.objects.filter(table=table).delete()
+    response = api_client.get(
+        url, {"since": cursor}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_CHANGE_CURSOR_EXPIRED"
+
+    other_user, other_token = data_fixture.create_user_and_token()
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {other_token}")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
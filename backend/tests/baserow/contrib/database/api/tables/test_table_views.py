@@ -1,4 +1,3 @@
-import json
 from unittest.mock import patch
 
 from django.db import connection
@@ -15,6 +14,7 @@ from rest_framework.status import (
 )
 
 from baserow.contrib.database.file_import.models import FileImportJob
+from baserow.contrib.database.file_import.utils import read_file_import_data
 from baserow.contrib.database.table.models import Table
 from baserow.test_utils.helpers import (
     assert_serialized_rows_contain_same_values,
@@ -193,8 +193,10 @@ def test_create_table_with_data(
 
     with patch_filefield_storage():
         with job.data_file.open("r") as fin:
-            data = json.load(fin)
-            assert data == [
+            data, row_count, column_count = read_file_import_data(fin)
+            assert row_count == 4
+            assert column_count == 5
+            assert list(data) == [
                 ["A", "B", "C", "D"],
                 ["1-1", "1-2", "1-3", "1-4", "1-5"],
                 ["2-1", "2-2", "2-3"],
@@ -322,6 +324,21 @@ def test_update_table(api_client, data_fixture):
 
     assert response_json["id"] == table_1.id
     assert response_json["name"] == table_1.name == "New name"
+    assert response_json["defer_dependant_updates"] is False
+
+    url = reverse("api:database:tables:item", kwargs={"table_id": table_1.id})
+    response = api_client.patch(
+        url,
+        {"defer_dependant_updates": True},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    table_1.refresh_from_db()
+    assert response_json["name"] == table_1.name == "New name"
+    assert response_json["defer_dependant_updates"] is True
+    assert table_1.defer_dependant_updates
 
     url = reverse("api:database:tables:item", kwargs={"table_id": table_2.id})
     response = api_client.patch(
@@ -3,7 +3,10 @@ from decimal import Decimal
 from typing import Any, Dict, List
 
 from django.core.cache import cache
+from django.db import connection
 from django.shortcuts import reverse
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from pytest_unordered import unordered
@@ -16,6 +19,7 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from baserow.api.pagination import KeysetPagination
 from baserow.contrib.database.api.constants import PUBLIC_PLACEHOLDER_ENTITY_ID
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
@@ -207,6 +211,151 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=text_field, order="DESC")
+
+    model = table.get_model()
+    names = ["b", None, "a", "c", "b", None, "a"]
+    for name in names:
+        model.objects.create(**{f"field_{text_field.id}": name})
+    expected_ids = list(
+        ViewHandler().get_queryset(grid, model=model).values_list("id", flat=True)
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    ids = []
+    cursor = ""
+    for _ in range(4):
+        response = api_client.get(
+            url,
+            {"cursor": cursor, "size": 2},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert "count" not in response_json
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+        if cursor is None:
+            assert response_json["next"] is None
+            break
+        assert f"cursor={cursor}" in response_json["next"]
+
+    assert cursor is None
+    assert ids == expected_ids
+
+    response = api_client.get(
+        url, {"cursor": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    # Well encoded cursors with the wrong length, shape or types are rejected too.
+    for values in [
+        ["a", "1", 1, 1],
+        ["a", ["1"], 1],
+        ["a", "not a number", 1],
+        ["a", "1", "not a number"],
+    ]:
+        response = api_client.get(
+            url,
+            {"cursor": KeysetPagination.encode_cursor(values)},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_CAPPED_ROW_COUNT_LIMIT=2)
+def test_list_rows_with_count_mode(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="equal", value="a"
+    )
+    model = table.get_model()
+    for name in ["a", "a", "a", "b"]:
+        model.objects.create(**{f"field_{text_field.id}": name})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, {"count": ""}, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 3}
+
+    response = api_client.get(
+        url, {"count": "", "count_mode": "capped"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 2, "count_mode": "capped"}
+
+    # The rows after the capped count can still be fetched.
+    response = api_client.get(
+        url,
+        {"limit": 1, "offset": 2, "count_mode": "capped"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["count"] == 2
+    assert response_json["count_mode"] == "capped"
+    assert len(response_json["results"]) == 1
+
+    response = api_client.get(
+        url, {"count_mode": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "count_mode,expected_status",
+    [
+        ("exact", HTTP_400_BAD_REQUEST),
+        ("estimate", HTTP_200_OK),
+        ("capped", HTTP_200_OK),
+    ],
+)
+def test_list_rows_page_out_of_range_with_count_mode(
+    api_client, data_fixture, count_mode, expected_status
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create()
+    model.objects.create()
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url,
+        {"size": 2, "page": 999, "count_mode": count_mode},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == expected_status
+    if expected_status == HTTP_400_BAD_REQUEST:
+        assert response.json()["error"] == "ERROR_INVALID_PAGE"
+    else:
+        # The count is approximate, so the pages after it can still be requested.
+        assert response.json()["results"] == []
+
+    response = api_client.get(
+        url, {"size": 2, "count_mode": count_mode}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 2
+    assert response.json()["count_mode"] == "exact"
+    assert len(response.json()["results"]) == 2
+
+
 @pytest.mark.django_db
 def test_list_rows_with_group_by(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -959,11 +1108,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "state": {"sum": None, "count": 0},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "state": {"count": 0},
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -1061,11 +1212,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "state": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "state": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -1114,10 +1267,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "state": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "state": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -1138,10 +1293,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "state": {"sum": Decimal(1200), "count": 1},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "state": {"count": 1},
     }
 
     # Let's update the filter
@@ -1582,6 +1739,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert (
         cache.get(
@@ -1597,6 +1755,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
@@ -1621,6 +1780,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
 
     check_table_2_aggregation_values(
@@ -1630,6 +1790,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
@@ -1643,6 +1804,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 6
     assert cache.get(
@@ -1675,6 +1837,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal("1111"),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
 
@@ -1693,6 +1856,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal("1111"),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
     assert cache.get(
@@ -4000,3 +4164,138 @@ def test_list_grid_rows_adhoc_filtering_advanced_filters(api_client, data_fixtur
         response_json = response.json()
         assert response.status_code == HTTP_400_BAD_REQUEST
         assert response_json["error"] == "ERROR_FILTERS_PARAM_VALIDATION_ERROR"
+
+
+@pytest.mark.django_db
+def test_public_grid_view_link_row_values(api_client, data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    related_primary_field = data_fixture.create_text_field(
+        table=related_table, primary=True
+    )
+    text_field = data_fixture.create_text_field(table=table)
+    link_field = FieldHandler().create_field(
+        user,
+        table,
+        "link_row",
+        name="Link",
+        link_row_table=related_table,
+        link_row_values_limit=1,
+    )
+    hidden_link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Hidden link", link_row_table=related_table
+    )
+    grid = data_fixture.create_grid_view(table=table, public=True, create_options=False)
+    data_fixture.create_grid_view_field_option(grid, text_field, hidden=False)
+    data_fixture.create_grid_view_field_option(grid, link_field, hidden=False)
+    data_fixture.create_grid_view_field_option(grid, hidden_link_field, hidden=True)
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="equal", value="visible"
+    )
+    related_rows = RowHandler().create_rows(
+        user,
+        related_table,
+        [{f"field_{related_primary_field.id}": str(index)} for index in range(3)],
+    )
+    related_row_ids = [related_row.id for related_row in related_rows]
+    row, filtered_row = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                f"field_{text_field.id}": "visible",
+                f"field_{link_field.id}": related_row_ids,
+                f"field_{hidden_link_field.id}": related_row_ids,
+            },
+            {
+                f"field_{text_field.id}": "filtered",
+                f"field_{link_field.id}": related_row_ids,
+            },
+        ],
+    )
+
+    url = reverse("api:database:views:grid:public_rows", kwargs={"slug": grid.slug})
+    response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()["results"][0][f"field_{link_field.id}"]) == 3
+
+    response = api_client.get(f"{url}?limit_link_row_values=true")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["results"][0][f"field_{link_field.id}"] == [
+        {"id": related_rows[0].id, "value": "0"}
+    ]
+
+    def get_link_row_values(row_id, field_id):
+        return api_client.get(
+            reverse(
+                "api:database:views:link_row_values",
+                kwargs={"slug": grid.slug, "row_id": row_id, "field_id": field_id},
+            )
+            + "?offset=1"
+        )
+
+    response = get_link_row_values(row.id, link_field.id)
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["count"] == 3
+    assert response_json["results"] == [
+        {"id": related_rows[1].id, "value": "1"},
+        {"id": related_rows[2].id, "value": "2"},
+    ]
+
+    response = get_link_row_values(filtered_row.id, link_field.id)
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = get_link_row_values(row.id, hidden_link_field.id)
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+
+@pytest.mark.django_db
+def test_list_rows_link_row_values_count_only_when_limited(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    link_field = FieldHandler().create_field(
+        user,
+        table,
+        "link_row",
+        name="Link",
+        link_row_table=related_table,
+        link_row_values_limit=1,
+    )
+    grid = data_fixture.create_grid_view(table=table)
+    related_rows = RowHandler().create_rows(user, related_table, [{}, {}])
+    row = RowHandler().create_row(
+        user,
+        table,
+        {f"field_{link_field.id}": [related_row.id for related_row in related_rows]},
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(
+            url, {"include": "row_metadata"}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["row_metadata"] == {}
+    # Neither the limited link row fields nor their counts are queried.
+    assert not [
+        query
+        for query in captured.captured_queries
+        if "link_row_values_limit" in query["sql"]
+    ]
+
+    response = api_client.get(
+        url,
+        {"include": "row_metadata", "limit_link_row_values": "true"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["row_metadata"] == {
+        str(row.id): {"link_row_values_count": {str(link_field.id): 2}}
+    }
@@ -0,0 +1,72 @@
+import pytest
+
+from baserow.contrib.database.db.copy_rows import copy_table_relations, copy_table_rows
+from baserow.core.utils import ChildProgressBuilder, Progress
+
+
+@pytest.mark.django_db
+def test_copy_table_rows_increments_progress_per_chunk(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    for index in range(5):
+        model.objects.create(**{f"field_{text_field.id}": f"Row {index}"})
+    target_table = data_fixture.create_database_table(database=table.database)
+    target_model = target_table.get_model()
+
+    progress = Progress(100)
+    increments = []
+    progress.register_updated_event(lambda *args: increments.append(args))
+    copy_table_rows(
+        model,
+        target_model,
+        {},
+        {},
+        chunk_size=2,
+        progress_builder=ChildProgressBuilder(progress, represents_progress=100),
+    )
+
+    assert target_model.objects.count() == 5
+    assert len(increments) == 3
+    assert progress.progress == 100
+
+
+@pytest.mark.django_db
+def test_copy_table_rows_of_empty_table_completes_progress(data_fixture):
+    table = data_fixture.create_database_table()
+    target_table = data_fixture.create_database_table(database=table.database)
+    target_model = target_table.get_model()
+
+    progress = Progress(100)
+    copy_table_rows(
+        table.get_model(),
+        target_model,
+        {},
+        {},
+        progress_builder=ChildProgressBuilder(progress, represents_progress=100),
+    )
+
+    assert target_model.objects.count() == 0
+    assert progress.progress == 100
+
+
+@pytest.mark.django_db
+def test_copy_table_relations_skips_missing_source_fields(data_fixture):
+    table = data_fixture.create_database_table()
+    target_table = data_fixture.create_database_table(database=table.database)
+    link_field = data_fixture.create_link_row_field(
+        table=target_table, link_row_table=table
+    )
+    target_model = target_table.get_model()
+
+    copy_table_relations(
+        table.get_model(),
+        target_model,
+        {link_field.db_column: "field_0"},
+        {},
+    )
+
+    through_model = target_model._meta.get_field(
+        link_field.db_column
+    ).remote_field.through
+    assert through_model.objects.count() == 0
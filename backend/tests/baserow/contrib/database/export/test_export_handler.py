@@ -1,4 +1,5 @@
-from datetime import timezone
+from datetime import date, timezone
+from decimal import Decimal
 from io import BytesIO
 from typing import List
 from unittest.mock import patch
@@ -101,6 +102,133 @@ def test_csv_is_sorted_by_sorts(storage_mock, data_fixture):
     assert contents == expected
 
 
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+    ".CHUNK_SIZE",
+    2,
+)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_csv_is_sorted_by_sorts_across_chunks(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["B", "E", "A", "D", "C"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+    job, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user
+    )
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n2,E\r\n4,D\r\n5,C\r\n1,B\r\n3,A\r\n"
+    assert contents == expected
+    job.refresh_from_db()
+    assert job.state == EXPORT_JOB_FINISHED_STATUS
+    assert job.progress_percentage == 100.0
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_table_to_parquet_with_native_types(storage_mock, data_fixture):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", order=1)
+    number_field = data_fixture.create_number_field(
+        table=table, name="number", number_decimal_places=2, order=2
+    )
+    boolean_field = data_fixture.create_boolean_field(
+        table=table, name="boolean", order=3
+    )
+    date_field = data_fixture.create_date_field(
+        table=table, name="date", date_include_time=False, order=4
+    )
+    single_select_field = data_fixture.create_single_select_field(
+        table=table, name="single_select", order=5
+    )
+    option = data_fixture.create_select_option(
+        field=single_select_field, value="A", color="blue"
+    )
+    model = table.get_model()
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "Something",
+            f"field_{number_field.id}": Decimal("1.50"),
+            f"field_{boolean_field.id}": True,
+            f"field_{date_field.id}": date(2020, 1, 2),
+            f"field_{single_select_field.id}": option,
+        },
+    )
+    model.objects.create()
+
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "parquet"}
+    )
+    handler.run_export_job(job)
+
+    parquet_table = pq.read_table(BytesIO(stub_file.getvalue()))
+    assert parquet_table.schema.field("id").type == pa.int64()
+    assert parquet_table.schema.field("text").type == pa.string()
+    assert parquet_table.schema.field("number").type.scale == 2
+    assert parquet_table.schema.field("boolean").type == pa.bool_()
+    assert parquet_table.schema.field("date").type == pa.date32()
+    assert parquet_table.schema.field("single_select").type == pa.string()
+    assert parquet_table.to_pylist() == [
+        {
+            "id": 1,
+            "text": "Something",
+            "number": Decimal("1.50"),
+            "boolean": True,
+            "date": date(2020, 1, 2),
+            "single_select": "A",
+        },
+        {
+            "id": 2,
+            "text": None,
+            "number": None,
+            "boolean": False,
+            "date": None,
+            "single_select": None,
+        },
+    ]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_parquet_export_makes_the_column_names_unique(storage_mock, data_fixture):
+    import pyarrow.parquet as pq
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    id_field = data_fixture.create_text_field(table=table, name="id", order=1)
+    id_2_field = data_fixture.create_text_field(table=table, name="id 2", order=2)
+    model = table.get_model()
+    model.objects.create(
+        **{f"field_{id_field.id}": "first", f"field_{id_2_field.id}": "second"}
+    )
+
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "parquet"}
+    )
+    handler.run_export_job(job)
+
+    parquet_table = pq.read_table(BytesIO(stub_file.getvalue()))
+    assert parquet_table.column_names == ["id", "id 2", "id 2 2"]
+    assert parquet_table.to_pylist() == [{"id": 1, "id 2": "first", "id 2 2": "second"}]
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.export.handler.default_storage")
 def test_csv_is_filtered_by_filters(storage_mock, data_fixture):
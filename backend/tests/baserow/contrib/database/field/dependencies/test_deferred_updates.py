@@ -0,0 +1,157 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.utils import timezone
+
+import pytest
+
+from baserow.contrib.database.fields.dependencies.deferred_updates import (
+    DeferredDependantUpdateHandler,
+)
+from baserow.contrib.database.fields.dependencies.models import DeferredDependantUpdate
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+@pytest.mark.django_db
+def test_dependant_updates_in_other_tables_can_be_deferred(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    primary_field = data_fixture.create_text_field(
+        table=table, name="Name", primary=True
+    )
+    other_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=other_table, name="Name", primary=True)
+    handler = FieldHandler()
+    link_field = handler.create_field(
+        user, other_table, "link_row", name="Link", link_row_table=table
+    )
+    lookup_field = handler.create_field(
+        user,
+        other_table,
+        "formula",
+        name="Lookup",
+        formula="join(lookup('Link', 'Name'), ',')",
+    )
+    same_table_field = handler.create_field(
+        user, table, "formula", name="Upper", formula="upper(field('Name'))"
+    )
+    table.defer_dependant_updates = True
+    table.save()
+
+    row = RowHandler().create_row(user, table, {f"field_{primary_field.id}": "a"})
+    other_row = RowHandler().create_row(
+        user, other_table, {f"field_{link_field.id}": [row.id]}
+    )
+    other_model = other_table.get_model()
+    assert (
+        getattr(other_model.objects.get(id=other_row.id), f"field_{lookup_field.id}")
+        == "a"
+    )
+
+    row = RowHandler().update_row_by_id(
+        user, table, row.id, {f"field_{primary_field.id}": "b"}
+    )
+
+    # The dependants in the same table are updated right away.
+    assert getattr(row, f"field_{same_table_field.id}") == "B"
+    assert (
+        getattr(other_model.objects.get(id=other_row.id), f"field_{lookup_field.id}")
+        == "a"
+    )
+    assert DeferredDependantUpdate.objects.filter(table=table).count() == 1
+
+    with patch(
+        "baserow.contrib.database.fields.dependencies.deferred_updates."
+        "rows_updated.send"
+    ) as mock_rows_updated:
+        assert DeferredDependantUpdateHandler.apply_deferred_updates(table.id) == 1
+
+    assert (
+        getattr(other_model.objects.get(id=other_row.id), f"field_{lookup_field.id}")
+        == "b"
+    )
+    assert not DeferredDependantUpdate.objects.filter(table=table).exists()
+    mock_rows_updated.assert_called_once()
+    kwargs = mock_rows_updated.call_args[1]
+    assert kwargs["table"].id == other_table.id
+    assert [updated_row.id for updated_row in kwargs["rows"]] == [other_row.id]
+    assert kwargs["updated_field_ids"] == [lookup_field.id]
+
+
+@pytest.mark.django_db
+def test_deferred_dependant_updates_are_coalesced(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    primary_field = data_fixture.create_text_field(
+        table=table, name="Name", primary=True
+    )
+    other_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=other_table, name="Name", primary=True)
+    handler = FieldHandler()
+    link_field = handler.create_field(
+        user, other_table, "link_row", name="Link", link_row_table=table
+    )
+    joined_field = handler.create_field(
+        user,
+        other_table,
+        "formula",
+        name="Joined",
+        formula="join(lookup('Link', 'Name'), ',')",
+    )
+    table.defer_dependant_updates = True
+    table.save()
+
+    row_1, row_2 = RowHandler().create_rows(
+        user,
+        table,
+        [{f"field_{primary_field.id}": "a"}, {f"field_{primary_field.id}": "b"}],
+    )
+    other_row = RowHandler().create_row(
+        user, other_table, {f"field_{link_field.id}": [row_1.id, row_2.id]}
+    )
+
+    RowHandler().update_row_by_id(
+        user, table, row_1.id, {f"field_{primary_field.id}": "c"}
+    )
+    RowHandler().update_rows(
+        user, table, [{"id": row_2.id, f"field_{primary_field.id}": "d"}]
+    )
+    assert DeferredDependantUpdate.objects.filter(table=table).count() == 2
+
+    assert DeferredDependantUpdateHandler.apply_deferred_updates(table.id) == 2
+
+    other_model = other_table.get_model()
+    assert (
+        getattr(other_model.objects.get(id=other_row.id), f"field_{joined_field.id}")
+        == "c,d"
+    )
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.fields.tasks.apply_deferred_dependant_updates.apply_async"
+)
+def test_schedule_leftover_deferred_updates(mock_apply_async, data_fixture):
+    leftover_table = data_fixture.create_database_table()
+    recent_table = data_fixture.create_database_table()
+    DeferredDependantUpdate.objects.create(
+        table=leftover_table, row_ids=[1], field_ids=[1]
+    )
+    DeferredDependantUpdate.objects.create(
+        table=recent_table, row_ids=[1], field_ids=[1]
+    )
+    DeferredDependantUpdate.objects.filter(table=leftover_table).update(
+        created_on=timezone.now() - timedelta(minutes=10)
+    )
+    cache.clear()
+
+    assert DeferredDependantUpdateHandler.schedule_leftover_deferred_updates() == [
+        leftover_table.id
+    ]
+    mock_apply_async.assert_called_once()
+    _, kwargs = mock_apply_async.call_args
+    assert kwargs["kwargs"] == {"table_id": leftover_table.id}
@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from unittest.mock import patch
 
 from django.test import override_settings
 from django.utils import timezone as django_timezone
@@ -377,6 +378,78 @@ def test_run_periodic_field_type_doesnt_update_trashed_workspace(data_fixture):
         assert FormulaFieldType().get_fields_needing_periodic_update().count() == 0
 
 
+@pytest.mark.django_db
+def test_run_periodic_field_type_update_skips_today_until_the_date_changes(
+    data_fixture,
+):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    with freeze_time("2023-02-27 10:00"):
+        workspace.refresh_now()
+        today_field = data_fixture.create_formula_field(table=table, formula="today()")
+        now_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        row = table.get_model().objects.create()
+
+    with patch(
+        "baserow.contrib.database.fields.field_types.FormulaFieldType"
+        "._refresh_row_values"
+    ) as mock_refresh_row_values, freeze_time("2023-02-27 10:30"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    refreshed_field_ids = [
+        call.args[0].id for call in mock_refresh_row_values.call_args_list
+    ]
+    assert refreshed_field_ids == [now_field.id]
+
+    with freeze_time("2023-02-28 00:10"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{today_field.id}") == date(2023, 2, 28)
+    assert getattr(row, f"field_{now_field.id}") == datetime(
+        2023, 2, 28, 0, 10, 0, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.django_db
+def test_run_periodic_field_type_update_only_flags_changed_rows(data_fixture):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+
+    with freeze_time("2023-02-27 10:00"):
+        workspace.refresh_now()
+        formula_field = data_fixture.create_formula_field(
+            table=table, formula=f"now() > field('{date_field.name}')"
+        )
+        model = table.get_model()
+        row_in_past = model.objects.create(
+            **{f"field_{date_field.id}": datetime(2023, 1, 1, tzinfo=timezone.utc)}
+        )
+        row_near_boundary = model.objects.create(
+            **{
+                f"field_{date_field.id}": datetime(
+                    2023, 2, 27, 10, 15, tzinfo=timezone.utc
+                )
+            }
+        )
+    model.objects.update(needs_background_update=False)
+
+    with freeze_time("2023-02-27 10:30"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row_in_past.refresh_from_db()
+    row_near_boundary.refresh_from_db()
+    assert getattr(row_near_boundary, f"field_{formula_field.id}") is True
+    assert row_near_boundary.needs_background_update
+    assert not row_in_past.needs_background_update
+
+
 @override_settings(STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES=60)
 @pytest.mark.django_db
 def test_run_delete_mentions_marked_for_deletion(data_fixture):
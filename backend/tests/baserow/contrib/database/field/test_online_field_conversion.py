@@ -0,0 +1,178 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+
+import pytest
+
+from baserow.contrib.database.fields.actions import UpdateFieldActionType
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import NumberField
+from baserow.contrib.database.fields.online_conversion import OnlineFieldConversion
+from baserow.contrib.database.views.handler import ViewIndexingHandler
+from baserow.core.action.handler import ActionHandler
+from baserow.core.action.models import Action
+from baserow.core.action.registries import action_type_registry
+from baserow.core.jobs.constants import JOB_FINISHED
+from baserow.core.jobs.handler import JobHandler
+from baserow.test_utils.helpers import assert_undo_redo_actions_are_valid
+
+
+def _get_column_names(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
+            [table.get_database_table_name()],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+@pytest.mark.django_db
+def test_online_field_conversion(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "1.234"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "not a number"})
+
+    conversion = OnlineFieldConversion.for_update(
+        user, field, "number", number_decimal_places=2
+    )
+    conversion.start()
+    conversion.backfill(chunk_size=1)
+
+    # The rows that are created or updated after the start are converted by the
+    # trigger.
+    row_2.refresh_from_db()
+    setattr(row_2, f"field_{field.id}", "2")
+    row_2.save()
+    row_3 = model.objects.create(**{f"field_{field.id}": "3.456"})
+    assert f"field_{field.id}_shadow" in _get_column_names(table)
+
+    field = FieldHandler().update_field(
+        user, field, "number", number_decimal_places=2, online_conversion=conversion
+    )
+
+    assert isinstance(field, NumberField)
+    assert f"field_{field.id}_shadow" not in _get_column_names(table)
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{field.id}", flat=True)
+    ) == [Decimal("1.23"), Decimal("2.00"), Decimal("3.46")]
+    assert [row_1.id, row_2.id, row_3.id] == list(
+        model.objects.order_by("id").values_list("id", flat=True)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname LIKE %s",
+            [f"field_{field.id}_online_conversion_%"],
+        )
+        assert cursor.fetchone()[0] == 0
+
+
+@pytest.mark.django_db
+@patch.object(ViewIndexingHandler, "schedule_index_update")
+def test_online_field_conversion_schedules_the_view_index_updates(
+    mock_schedule_index_update, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Text")
+    sorted_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=sorted_view, field=field)
+    grouped_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_group_by(view=grouped_view, field=field)
+    for view in [sorted_view, grouped_view]:
+        ViewIndexingHandler.update_index(view)
+        view.refresh_from_db()
+        assert view.db_index_name is not None
+    mock_schedule_index_update.reset_mock()
+
+    conversion = OnlineFieldConversion.for_update(user, field, "number")
+    conversion.start()
+    conversion.backfill()
+    FieldHandler().update_field(user, field, "number", online_conversion=conversion)
+
+    # The indexes of the old column have been dropped with it, so they must be
+    # created again on the new column.
+    scheduled_view_ids = {
+        call.args[0].id for call in mock_schedule_index_update.call_args_list
+    }
+    assert scheduled_view_ids == {sorted_view.id, grouped_view.id}
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_not_needed(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+
+    assert OnlineFieldConversion.for_update(user, text_field, name="Renamed") is None
+    assert OnlineFieldConversion.for_update(user, text_field, "number") is not None
+    assert OnlineFieldConversion.for_update(user, single_select_field, "text") is None
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_can_be_undone(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": "12"})
+
+    conversion = OnlineFieldConversion.for_update(user, field, "number")
+    conversion.start()
+    conversion.backfill()
+    field, _ = action_type_registry.get_by_type(UpdateFieldActionType).do(
+        user, field, "number", online_conversion=conversion
+    )
+
+    # The old column is kept as backup instead of copying the values.
+    action = Action.objects.get(type=UpdateFieldActionType.type)
+    backup_column = action.params["backup_data"]["backed_up_column_name"]
+    assert backup_column in _get_column_names(table)
+
+    actions = ActionHandler.undo(
+        user, [UpdateFieldActionType.scope(field.table_id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(actions, [UpdateFieldActionType])
+
+    model = table.get_model()
+    assert getattr(model.objects.get(), f"field_{field.id}") == "12"
+    assert backup_column not in _get_column_names(table)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_convert_field_job_type(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+    model.objects.bulk_create(
+        [model(**{f"field_{field.id}": str(index)}) for index in range(5)]
+    )
+
+    job = JobHandler().create_and_start_job(
+        user,
+        "convert_field",
+        field_id=field.id,
+        new_type_name="number",
+        field_values={"number_negative": True},
+        sync=True,
+    )
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    field = FieldHandler().get_field(field.id).specific
+    assert isinstance(field, NumberField)
+    assert field.number_negative
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{field.id}", flat=True)
+    ) == [Decimal(index) for index in range(5)]
+    assert f"field_{field.id}_shadow" not in _get_column_names(table)
@@ -1,4 +1,7 @@
+import json
+
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 from django.utils import timezone
 
@@ -499,6 +502,29 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_with_legacy_data_file(
+    data_fixture, patch_filefield_storage
+):
+    data = [["A", "B"], ["1-1", "1-2", "1-3"], ["2-1"]]
+
+    # Data files created before the JSON lines format contain a single JSON array.
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            data=data, data_file=ContentFile(json.dumps(data))
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+
+    text_fields = TextField.objects.filter(table=job.table)
+    assert [field.name for field in text_fields] == ["A", "B", "Field 3"]
+
+    model = job.table.get_model()
+    assert model.objects.count() == 2
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+from django.test import override_settings
+
+import pytest
+from freezegun import freeze_time
+
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+from baserow.contrib.database.rows.exceptions import (
+    InvalidRowChangeCursor,
+    RowChangeCursorExpired,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.models import RowChange
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS=7)
+def test_row_changes_are_recorded_and_listed_since_a_cursor(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+
+    handler = RowHandler()
+    row_1, row_2 = handler.create_rows(
+        user, table, [{name_field.id: "a"}, {name_field.id: "b"}]
+    )
+    handler.create_row(user, other_table, {})
+    handler.update_rows(user, table, [{"id": row_2.id, f"field_{name_field.id}": "c"}])
+
+    changes, cursor, has_more = RowChangeLogHandler.list_changes(table.id, None, 10)
+    assert [(c.change_type, c.row_ids, c.field_ids) for c in changes] == [
+        (RowChange.CHANGE_TYPE_CREATED, [row_1.id, row_2.id], None),
+        (RowChange.CHANGE_TYPE_UPDATED, [row_2.id], [name_field.id]),
+    ]
+    assert has_more is False
+
+    changes, same_cursor, _ = RowChangeLogHandler.list_changes(table.id, cursor, 10)
+    assert changes == []
+    assert same_cursor == cursor
+
+    handler.delete_row_by_id(user, table, row_1.id)
+    changes, _, _ = RowChangeLogHandler.list_changes(table.id, cursor, 10)
+    assert [(c.change_type, c.row_ids) for c in changes] == [
+        (RowChange.CHANGE_TYPE_DELETED, [row_1.id])
+    ]
+
+    changes, cursor, has_more = RowChangeLogHandler.list_changes(table.id, None, 1)
+    assert [c.change_type for c in changes] == [RowChange.CHANGE_TYPE_CREATED]
+    assert has_more is True
+
+    with pytest.raises(InvalidRowChangeCursor):
+        RowChangeLogHandler.list_changes(table.id, "invalid", 10)
+
+
+@pytest.mark.django_db
+def test_row_changes_are_not_recorded_if_the_change_log_is_disabled(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    RowHandler().create_row(user, table, {})
+
+    assert not RowChange.objects.filter(table=table).exists()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS=7)
+def test_delete_row_change_log_entries_older_than(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    with freeze_time("2021-01-01 12:00"):
+        RowHandler().create_row(user, table, {})
+    with freeze_time("2021-01-03 12:00"):
+        RowHandler().create_row(user, table, {})
+
+    RowChangeLogHandler.delete_entries_older_than(
+        datetime(2021, 1, 2, tzinfo=timezone.utc)
+    )
+
+    assert RowChange.objects.filter(table=table).count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS=7)
+def test_list_row_changes_since_an_expired_cursor(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    with freeze_time("2021-01-01 12:00"):
+        RowHandler().create_row(user, table, {})
+    _, cursor, _ = RowChangeLogHandler.list_changes(table.id, None, 10)
+    with freeze_time("2021-01-03 12:00"):
+        RowHandler().create_row(user, table, {})
+
+    changes, _, _ = RowChangeLogHandler.list_changes(table.id, cursor, 10)
+    assert len(changes) == 1
+
+    RowChangeLogHandler.delete_entries_older_than(
+        datetime(2021, 1, 2, tzinfo=timezone.utc)
+    )
+
+    with pytest.raises(RowChangeCursorExpired):
+        RowChangeLogHandler.list_changes(table.id, cursor, 10)
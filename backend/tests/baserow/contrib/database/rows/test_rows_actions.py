@@ -19,6 +19,7 @@ from baserow.contrib.database.rows.actions import (
 )
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.action.handler import ActionHandler
+from baserow.core.action.models import Action
 from baserow.core.action.registries import action_type_registry
 from baserow.test_utils.helpers import assert_undo_redo_actions_are_valid
 
@@ -1145,6 +1146,73 @@ def test_can_undo_redo_update_rows(data_fixture):
     assert getattr(row_two, f"field_{name_field.id}") == "New value"
 
 
+@pytest.mark.django_db
+@pytest.mark.undo_redo
+def test_update_rows_action_only_stores_changed_values(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    color_field = data_fixture.create_text_field(table=table, name="Color")
+
+    row_handler = RowHandler()
+    row_one = row_handler.create_row(
+        user, table, {name_field.id: "Name 1", color_field.id: "Red"}
+    )
+    row_two = row_handler.create_row(
+        user, table, {name_field.id: "Name 2", color_field.id: "Blue"}
+    )
+
+    action_type_registry.get_by_type(UpdateRowsActionType).do(
+        user,
+        table,
+        [
+            {
+                "id": row_one.id,
+                f"field_{name_field.id}": "New name",
+                f"field_{color_field.id}": "Red",
+            },
+            {
+                "id": row_two.id,
+                f"field_{name_field.id}": "Name 2",
+                f"field_{color_field.id}": "Blue",
+            },
+        ],
+    )
+
+    action = Action.objects.get(type=UpdateRowsActionType.type)
+    assert action.params["row_ids"] == [row_one.id, row_two.id]
+    assert action.params["row_values"] == [
+        {"id": row_one.id, f"field_{name_field.id}": "New name"}
+    ]
+    assert action.params["original_rows_values_by_id"] == {
+        str(row_one.id): {"id": row_one.id, f"field_{name_field.id}": "Name 1"}
+    }
+    assert list(action.params["updated_fields_metadata_by_row_id"]) == [str(row_one.id)]
+    assert set(action.params["updated_fields_metadata_by_row_id"][str(row_one.id)]) == {
+        "id",
+        f"field_{name_field.id}",
+    }
+
+    ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    row_one.refresh_from_db()
+    row_two.refresh_from_db()
+    assert getattr(row_one, f"field_{name_field.id}") == "Name 1"
+    assert getattr(row_one, f"field_{color_field.id}") == "Red"
+    assert getattr(row_two, f"field_{name_field.id}") == "Name 2"
+
+    action_redone = ActionHandler.redo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(action_redone, [UpdateRowsActionType])
+
+    row_one.refresh_from_db()
+    assert getattr(row_one, f"field_{name_field.id}") == "New name"
+
+
 @pytest.mark.django_db
 @pytest.mark.undo_redo
 def test_can_undo_redo_update_rows_interesting_field_types(data_fixture):
@@ -13,7 +13,11 @@ from baserow.contrib.database.api.utils import (
     extract_field_ids_from_string,
     get_include_exclude_fields,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.exceptions import (
+    ReportMaxErrorCountExceeded,
+    RowDoesNotExist,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
@@ -832,6 +836,73 @@ def test_create_rows_last_modified_by(data_fixture):
     assert rows[1].last_modified_by == user
 
 
+@pytest.mark.django_db
+def test_create_rows_using_copy(data_fixture, settings):
+    settings.BASEROW_CREATE_ROWS_COPY_THRESHOLD = 2
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    other_table = data_fixture.create_database_table(
+        name="Brand", database=table.database
+    )
+    other_row = other_table.get_model().objects.create()
+
+    field_handler = FieldHandler()
+    name_field = field_handler.create_field(user, table, "text", name="Name")
+    speed_field = field_handler.create_field(
+        user, table, "number", name="Speed", number_decimal_places=1
+    )
+    link_field = field_handler.create_field(
+        user, table, "link_row", name="Brand", link_row_table=other_table
+    )
+    formula_field = field_handler.create_field(
+        user,
+        table,
+        "formula",
+        name="Formula",
+        formula="concat(field('Name'), ' ', count(field('Brand')))",
+    )
+    autonumber_field = field_handler.create_field(
+        user, table, "autonumber", name="Autonumber"
+    )
+
+    rows_values = [
+        {
+            name_field.db_column: "Tesla\tModel\n3\\",
+            speed_field.db_column: "240.5",
+            link_field.db_column: [other_row.id],
+        },
+        {name_field.db_column: None, speed_field.db_column: None},
+    ]
+
+    with patch.object(
+        RowHandler, "_insert_rows", wraps=RowHandler()._insert_rows
+    ) as insert_rows:
+        rows = RowHandler().create_rows(user, table, rows_values=rows_values)
+
+    assert insert_rows.call_args_list[0][1]["use_copy"] is True
+
+    model = table.get_model()
+    rows = list(model.objects.all())
+    assert len(rows) == 2
+    assert getattr(rows[0], name_field.db_column) == "Tesla\tModel\n3\\"
+    assert getattr(rows[0], speed_field.db_column) == Decimal("240.5")
+    assert [r.id for r in getattr(rows[0], link_field.db_column).all()] == [
+        other_row.id
+    ]
+    assert getattr(rows[0], formula_field.db_column) == "Tesla\tModel\n3\\ 1"
+    assert getattr(rows[0], autonumber_field.db_column) == 1
+    assert rows[0].created_by == user
+    assert rows[0].created_on is not None
+    assert getattr(rows[1], name_field.db_column) is None
+    assert getattr(rows[1], formula_field.db_column).endswith("0")
+    assert getattr(rows[1], autonumber_field.db_column) == 2
+
+    # New rows still get ids from the same sequence.
+    row = model.objects.create()
+    assert row.id == rows[1].id + 1
+
+
 @pytest.mark.django_db
 def test_update_rows_created_on_and_last_modified(data_fixture):
     user = data_fixture.create_user()
@@ -1019,6 +1090,50 @@ def test_import_rows(
     assert sorted(report.keys()) == sorted([1, 2])
 
 
+@pytest.mark.django_db
+def test_import_rows_in_chunks(data_fixture, settings):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="Name", order=1)
+    data_fixture.create_number_field(table=table, name="Max speed", order=2)
+
+    handler = RowHandler()
+
+    def stream_rows():
+        yield ["Tesla", 240]
+        yield ["Giulietta", "bad"]
+        yield ["Panda", 160]
+        yield ["Fiesta", 180, "too many"]
+        yield ["Clio"]
+
+    row_ids, report = handler.import_rows_in_chunks(
+        user=user,
+        table=table,
+        data=stream_rows(),
+        row_count=5,
+        chunk_size=2,
+        send_realtime_update=False,
+    )
+
+    model = table.get_model()
+    assert list(model.objects.values_list("id", flat=True)) == row_ids
+    assert model.objects.count() == 3
+    assert sorted(report.keys()) == [1, 3]
+    assert report[3] == {"non_field_errors": ["Too many values in this line."]}
+
+    settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT = 2
+    with pytest.raises(ReportMaxErrorCountExceeded) as exc:
+        handler.import_rows_in_chunks(
+            user=user,
+            table=table,
+            data=[["A", "bad"], ["B", 1], ["C", "bad"], ["D", "bad"]],
+            row_count=4,
+            chunk_size=2,
+        )
+
+    assert sorted(exc.value.report.keys()) == [0, 2]
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.rows_updated.send")
 @patch("baserow.contrib.database.rows.signals.before_rows_update.send")
@@ -1362,7 +1477,7 @@ def test_get_unique_orders_first_before_row(data_fixture):
 
 
 @pytest.mark.django_db
-def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fixture):
+def test_get_unique_orders_before_row_triggering_row_order_rebalance(data_fixture):
     user = data_fixture.create_user()
     database = data_fixture.create_database_application(user=user)
     table = data_fixture.create_database_table(
@@ -1392,6 +1507,61 @@ def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fix
     assert row_4.order == Decimal("3.00000000000000000000")
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.row_orders_rebalanced.send")
+def test_rebalance_row_orders_only_updates_window(send_mock, data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    row_1 = model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("1.99999999999999999998"))
+    row_3 = model.objects.create(order=Decimal("1.99999999999999999999"))
+    row_4 = model.objects.create(order=Decimal("2.00000000000000000000"))
+    row_5 = model.objects.create(order=Decimal("3.00000000000000000000"))
+    row_6 = model.objects.create(order=Decimal("4.00000000000000000000"))
+
+    rebalanced_rows = RowHandler().rebalance_row_orders(table, row_3, model, window=1)
+    assert [row.id for row in rebalanced_rows] == [row_2.id, row_3.id, row_4.id]
+
+    assert [(row.id, row.order) for row in model.objects.all()] == [
+        (row_1.id, Decimal("1.00000000000000000000")),
+        (row_2.id, Decimal("1.50000000000000000000")),
+        (row_3.id, Decimal("2.00000000000000000000")),
+        (row_4.id, Decimal("2.50000000000000000000")),
+        (row_5.id, Decimal("3.00000000000000000000")),
+        (row_6.id, Decimal("4.00000000000000000000")),
+    ]
+
+    send_mock.assert_called_once()
+    kwargs = send_mock.call_args[1]
+    assert kwargs["table"].id == table.id
+    assert [row.id for row in kwargs["rows"]] == [row_2.id, row_3.id, row_4.id]
+    assert kwargs["old_orders"] == {
+        row_2.id: Decimal("1.99999999999999999998"),
+        row_3.id: Decimal("1.99999999999999999999"),
+        row_4.id: Decimal("2.00000000000000000000"),
+    }
+
+
+@pytest.mark.django_db
+def test_rebalance_row_orders_widens_window_when_gap_is_too_small(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    rows = [
+        model.objects.create(order=Decimal(f"1.0000000000000000000{index}"))
+        for index in range(6)
+    ]
+
+    RowHandler().rebalance_row_orders(table, rows[2], model, window=1)
+
+    # The orders around the row are too close together to be spread out, so the
+    # window is widened until it covers the whole table.
+    assert [(row.id, row.order) for row in model.objects.all()] == [
+        (row.id, Decimal(index)) for index, row in enumerate(rows, start=1)
+    ]
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
 def test_recalculate_row_orders(send_mock, data_fixture):
@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
 from django.db import connection
 from django.test.utils import override_settings
 
@@ -7,6 +8,7 @@ import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
+from baserow.contrib.database.search.tasks import async_update_tsvector_columns
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -384,3 +386,101 @@ def test_split_update_into_chunks_until_all_background_done(data_fixture):
     assert rows[2].needs_background_update is False
     assert getattr(rows[3], field.tsv_db_column) == "'4':2 'test':1"
     assert rows[3].needs_background_update is False
+
+
+@override_settings(TSV_UPDATE_CHUNK_SIZE=2, TSV_UPDATE_MIN_CHUNK_SIZE=1)
+@pytest.mark.django_db
+def test_split_update_into_chunks_by_ranges_resumes_from_checkpoint(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"}) for i in range(4)
+    ]
+
+    checkpoint_key = SearchHandler.get_tsv_update_checkpoint_key("test")
+    cache.set(checkpoint_key, rows[1].id)
+
+    SearchHandler().update_tsvector_columns(table, False, checkpoint_key=checkpoint_key)
+
+    rows = list(model.objects.all().order_by("id"))
+    assert getattr(rows[0], field.tsv_db_column) is None
+    assert getattr(rows[1], field.tsv_db_column) is None
+    assert getattr(rows[2], field.tsv_db_column) == "'2':2 'test':1"
+    assert getattr(rows[3], field.tsv_db_column) == "'3':2 'test':1"
+    assert cache.get(checkpoint_key) is None
+
+
+@override_settings(
+    TSV_UPDATE_CHUNK_TARGET_SECONDS=1,
+    TSV_UPDATE_MIN_CHUNK_SIZE=10,
+    TSV_UPDATE_MAX_CHUNK_SIZE=1000,
+)
+def test_get_next_chunk_size():
+    # Slow chunks shrink the next chunk, but not below the minimum.
+    assert SearchHandler.get_next_chunk_size(100, 2) == 50
+    assert SearchHandler.get_next_chunk_size(100, 100) == 10
+    # Fast chunks at most double the next chunk, but not above the maximum.
+    assert SearchHandler.get_next_chunk_size(100, 0.1) == 200
+    assert SearchHandler.get_next_chunk_size(800, 0.1) == 1000
+
+    with override_settings(TSV_UPDATE_CHUNK_TARGET_SECONDS=0):
+        assert SearchHandler.get_next_chunk_size(100, 100) == 100
+
+
+@override_settings(TSV_UPDATE_MAX_CONCURRENT_TABLES=1)
+def test_tsvector_update_slot_limits_concurrent_updates():
+    with SearchHandler.tsvector_update_slot() as acquired:
+        assert acquired is True
+        with SearchHandler.tsvector_update_slot() as acquired_concurrently:
+            assert acquired_concurrently is False
+
+    with SearchHandler.tsvector_update_slot() as acquired:
+        assert acquired is True
+
+    with override_settings(TSV_UPDATE_MAX_CONCURRENT_TABLES=0):
+        with SearchHandler.tsvector_update_slot() as acquired:
+            with SearchHandler.tsvector_update_slot() as acquired_concurrently:
+                assert acquired and acquired_concurrently
+
+
+def test_register_tsv_update_attempt_counts_attempts_without_progress():
+    checkpoint_key = SearchHandler.get_tsv_update_checkpoint_key("attempts")
+
+    assert SearchHandler.register_tsv_update_attempt(checkpoint_key) == 1
+    assert SearchHandler.register_tsv_update_attempt(checkpoint_key) == 2
+
+    # The counter starts again as soon as the checkpoint moves forward.
+    cache.set(checkpoint_key, 10)
+    assert SearchHandler.register_tsv_update_attempt(checkpoint_key) == 1
+
+    SearchHandler.clear_tsv_update_checkpoint(checkpoint_key)
+    assert cache.get(checkpoint_key) is None
+    assert SearchHandler.register_tsv_update_attempt(checkpoint_key) == 1
+    SearchHandler.clear_tsv_update_checkpoint(checkpoint_key)
+
+
+@override_settings(TSV_UPDATE_MAX_ATTEMPTS=2)
+@pytest.mark.django_db
+@patch.object(SearchHandler, "update_tsvector_columns_locked")
+def test_async_update_tsvector_columns_abandons_after_attempts_without_progress(
+    mock_update_tsvector_columns_locked, data_fixture
+):
+    table = data_fixture.create_database_table()
+    checkpoint_key = SearchHandler.get_tsv_update_checkpoint_key("redelivered")
+    cache.set(checkpoint_key, 5)
+    # The previous deliveries have been lost without moving the checkpoint.
+    for _ in range(2):
+        SearchHandler.register_tsv_update_attempt(checkpoint_key)
+
+    async_update_tsvector_columns(table.id, False, checkpoint_key=checkpoint_key)
+
+    mock_update_tsvector_columns_locked.assert_not_called()
+    assert cache.get(checkpoint_key) is None
+
+    # A new update starts from scratch and clears its attempts once done.
+    async_update_tsvector_columns(table.id, False, checkpoint_key=checkpoint_key)
+    mock_update_tsvector_columns_locked.assert_called_once()
+    assert SearchHandler.register_tsv_update_attempt(checkpoint_key) == 1
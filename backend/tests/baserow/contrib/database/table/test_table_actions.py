@@ -224,6 +224,38 @@ def test_can_undo_redo_update_table(data_fixture):
     assert table.name == new_table_name
 
 
+@pytest.mark.django_db
+@pytest.mark.undo_redo
+def test_can_undo_redo_update_table_defer_dependant_updates(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(
+        database=database, user=user, name="table"
+    )
+
+    table = action_type_registry.get_by_type(UpdateTableActionType).do(
+        user, table, defer_dependant_updates=True
+    )
+    assert table.defer_dependant_updates
+    assert table.name == "table"
+
+    actions_undone = ActionHandler.undo(
+        user, [ApplicationActionScopeType.value(application_id=database.id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(actions_undone, [UpdateTableActionType])
+    table.refresh_from_db()
+    assert not table.defer_dependant_updates
+    assert table.name == "table"
+
+    actions_redone = ActionHandler.redo(
+        user, [ApplicationActionScopeType.value(application_id=database.id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(actions_redone, [UpdateTableActionType])
+    table.refresh_from_db()
+    assert table.defer_dependant_updates
+
+
 @pytest.mark.django_db
 @pytest.mark.undo_redo
 def test_can_undo_duplicate_simple_table(data_fixture):
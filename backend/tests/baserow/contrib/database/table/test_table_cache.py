@@ -1,9 +1,17 @@
+from unittest.mock import patch
+
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    LocalModelFieldAttrsCache,
+    generated_models_cache,
+    get_cached_model_field_attrs,
+    invalidate_table_in_model_cache,
+    local_model_field_attrs_cache,
+)
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +212,41 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_model_field_attrs_are_cached_in_the_local_process(data_fixture):
+    field = data_fixture.create_text_field()
+    table = field.table
+    table.get_model()
+    table.refresh_from_db()
+
+    with patch.object(generated_models_cache, "get") as mock_get:
+        field_attrs = get_cached_model_field_attrs(table)
+        mock_get.assert_not_called()
+
+    assert field.db_column in field_attrs
+    # Every call must return new field instances because they can't be shared
+    # between models.
+    assert field_attrs[field.db_column] is not (
+        get_cached_model_field_attrs(table)[field.db_column]
+    )
+
+    invalidate_table_in_model_cache(table.id)
+    assert local_model_field_attrs_cache.get(table.id, table.version) is None
+    table.refresh_from_db()
+    assert get_cached_model_field_attrs(table) is None
+
+
+def test_local_model_field_attrs_cache_evicts_least_recently_used_tables():
+    local_cache = LocalModelFieldAttrsCache(max_size=2)
+    local_cache.set(1, "v1", {"a": 1})
+    local_cache.set(2, "v1", {"b": 2})
+    assert local_cache.get(1, "v1") == {"a": 1}
+
+    local_cache.set(3, "v1", {"c": 3})
+
+    assert local_cache.get(1, "v1") == {"a": 1}
+    assert local_cache.get(2, "v1") is None
+    assert local_cache.get(3, "v1") == {"c": 3}
+    assert local_cache.get(3, "v2") is None
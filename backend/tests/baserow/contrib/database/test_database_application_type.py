@@ -128,6 +128,113 @@ def test_import_export_database(data_fixture):
     assert row_3.id == 3
 
 
+@pytest.mark.django_db
+def test_import_export_database_copy_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=select_field, value="A")
+    link_field = data_fixture.create_link_row_field(table=table, link_row_table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "Test",
+            f"field_{select_field.id}": option,
+            "last_modified_by": user,
+        }
+    )
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "Test 2"})
+    getattr(row_2, f"field_{link_field.id}").set([row_1.id])
+    model.objects.create(**{f"field_{text_field.id}": "Trashed", "trashed": True})
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(
+        include_permission_data=True, copy_rows_in_database=True
+    )
+    serialized = database_type.export_serialized(database, config)
+    assert serialized["tables"][0]["rows"] == []
+
+    id_mapping = {}
+    imported_database = database_type.import_serialized(
+        workspace, serialized, config, id_mapping, None, None
+    )
+
+    imported_table = imported_database.table_set.get()
+    imported_model = imported_table.get_model()
+    imported_rows = list(imported_model.objects.all())
+    assert [r.id for r in imported_rows] == [row_1.id, row_2.id]
+
+    new_text_name = f'field_{id_mapping["database_fields"][text_field.id]}'
+    new_select_name = f'field_{id_mapping["database_fields"][select_field.id]}'
+    new_link_name = f'field_{id_mapping["database_fields"][link_field.id]}'
+    imported_row_1, imported_row_2 = imported_rows
+    assert getattr(imported_row_1, new_text_name) == "Test"
+    assert imported_row_1.last_modified_by_id == user.id
+    assert getattr(imported_row_1, new_select_name).id == (
+        id_mapping["database_field_select_options"][option.id]
+    )
+    assert [r.id for r in getattr(imported_row_2, new_link_name).all()] == [row_1.id]
+
+    # It must still be possible to create a new row in the imported table.
+    assert imported_model.objects.create().id == 3
+
+
+@pytest.mark.django_db
+@patch.object(DatabaseApplicationType, "IMPORT_ROWS_CHUNK_SIZE", 2)
+def test_import_export_database_rows_in_multiple_chunks(data_fixture):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    other_table = data_fixture.create_database_table(database=database)
+    link_field = data_fixture.create_link_row_field(
+        table=other_table, link_row_table=table
+    )
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{text_field.id}": f"Row {index}"})
+        for index in range(5)
+    ]
+    other_row = other_table.get_model().objects.create()
+    getattr(other_row, f"field_{link_field.id}").set([rows[0].id, rows[4].id])
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(include_permission_data=True)
+    serialized = database_type.export_serialized(database, config)
+
+    id_mapping = {}
+    imported_database = database_type.import_serialized(
+        workspace, serialized, config, id_mapping, None, None
+    )
+
+    imported_table = imported_database.table_set.get(
+        id=id_mapping["database_tables"][table.id]
+    )
+    imported_model = imported_table.get_model()
+    new_text_name = f'field_{id_mapping["database_fields"][text_field.id]}'
+    assert [getattr(row, new_text_name) for row in imported_model.objects.all()] == [
+        f"Row {index}" for index in range(5)
+    ]
+
+    imported_other_table = imported_database.table_set.get(
+        id=id_mapping["database_tables"][other_table.id]
+    )
+    imported_other_model = imported_other_table.get_model()
+    new_link_name = f'field_{id_mapping["database_fields"][link_field.id]}'
+    imported_other_row = imported_other_model.objects.get()
+    assert [r.id for r in getattr(imported_other_row, new_link_name).all()] == [
+        rows[0].id,
+        rows[4].id,
+    ]
+
+    # The sequences of all the tables must have been reset.
+    assert imported_model.objects.create().id == 6
+    assert imported_other_model.objects.create().id == 2
+
+
 @pytest.mark.django_db
 def test_create_application_and_init_with_data(data_fixture):
     core_handler = CoreHandler()
@@ -1,10 +1,15 @@
 import random
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
@@ -467,3 +472,163 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_updated_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    sum_field = data_fixture.create_number_field(table=table)
+    min_field = data_fixture.create_number_field(table=table)
+    average_field = data_fixture.create_number_field(table=table)
+    empty_count_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    for field, aggregation_raw_type in [
+        (sum_field, "sum"),
+        (min_field, "min"),
+        (average_field, "average"),
+        (empty_count_field, "empty_count"),
+    ]:
+        data_fixture.create_grid_view_field_option(
+            grid_view=grid_view,
+            field=field,
+            aggregation_type="whatever",
+            aggregation_raw_type=aggregation_raw_type,
+        )
+
+    view_handler = ViewHandler()
+    row_handler = RowHandler()
+
+    def row_values(number, text):
+        return {
+            f"field_{sum_field.id}": number,
+            f"field_{min_field.id}": number,
+            f"field_{average_field.id}": number,
+            f"field_{empty_count_field.id}": text,
+        }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_1, row_2 = row_handler.create_rows(
+            user, table, [row_values(10, "a"), row_values(20, "")]
+        )
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        sum_field.db_column: Decimal(30),
+        min_field.db_column: Decimal(10),
+        average_field.db_column: Decimal(15),
+        empty_count_field.db_column: 1,
+    }
+
+    def get_cached_values():
+        return {
+            field.db_column: view_handler.get_view_field_aggregations(user, grid_view)[
+                field.db_column
+            ]
+            for field in [sum_field, min_field, average_field, empty_count_field]
+        }
+
+    def assert_cache_is_up_to_date(field):
+        cached_value = cache.get(f"aggregation_value__{grid_view.id}_{field.db_column}")
+        cached_version = cache.get(
+            f"aggregation_version__{grid_view.id}_{field.db_column}"
+        )
+        assert cached_value["version"] == cached_version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_3 = row_handler.create_row(user, table, row_values(30, None))
+
+    for field in [sum_field, min_field, average_field, empty_count_field]:
+        assert_cache_is_up_to_date(field)
+    assert get_cached_values() == {
+        sum_field.db_column: Decimal(60),
+        min_field.db_column: Decimal(10),
+        average_field.db_column: Decimal(20),
+        empty_count_field.db_column: 2,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user,
+            table,
+            [
+                {
+                    "id": row_3.id,
+                    f"field_{sum_field.id}": 40,
+                    f"field_{average_field.id}": None,
+                    f"field_{empty_count_field.id}": "c",
+                }
+            ],
+        )
+
+    for field in [sum_field, average_field, empty_count_field]:
+        assert_cache_is_up_to_date(field)
+    assert get_cached_values() == {
+        sum_field.db_column: Decimal(70),
+        min_field.db_column: Decimal(10),
+        average_field.db_column: Decimal(15),
+        empty_count_field.db_column: 1,
+    }
+
+    # Deleting the row containing the minimum can't be done incrementally, so the
+    # min aggregation must be recomputed.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [row_1.id])
+
+    cached_min = cache.get(f"aggregation_value__{grid_view.id}_{min_field.db_column}")
+    assert cached_min["version"] != cache.get(
+        f"aggregation_version__{grid_view.id}_{min_field.db_column}"
+    )
+    for field in [sum_field, average_field, empty_count_field]:
+        assert_cache_is_up_to_date(field)
+    assert get_cached_values() == {
+        sum_field.db_column: Decimal(60),
+        min_field.db_column: Decimal(20),
+        average_field.db_column: Decimal(20),
+        empty_count_field.db_column: 1,
+    }
+
+
+@pytest.mark.django_db
+def test_row_changes_dont_query_aggregations_without_cached_states(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_grid_view_field_option(
+        grid_view=grid_view,
+        field=number_field,
+        aggregation_type="whatever",
+        aggregation_raw_type="sum",
+    )
+    row_handler = RowHandler()
+
+    def get_field_options_queries(captured):
+        return [
+            query
+            for query in captured.captured_queries
+            if "database_gridviewfieldoptions" in query["sql"]
+            and "aggregation_raw_type" in query["sql"]
+        ]
+
+    with CaptureQueriesContext(connection) as captured:
+        with django_capture_on_commit_callbacks(execute=True):
+            row = row_handler.create_row(user, table, {number_field.db_column: 1})
+            row_handler.update_rows(
+                user, table, [{"id": row.id, number_field.db_column: 2}]
+            )
+            row_handler.delete_row_by_id(user, table, row.id)
+    assert get_field_options_queries(captured) == []
+
+    # Once the aggregation state has been cached, it's updated incrementally.
+    ViewHandler().get_view_field_aggregations(user, grid_view)
+    with CaptureQueriesContext(connection) as captured:
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.create_row(user, table, {number_field.db_column: 3})
+    assert len(get_field_options_queries(captured)) == 1
+    assert ViewHandler().get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3
+    }
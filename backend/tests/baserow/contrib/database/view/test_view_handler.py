@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import override_settings
 
 import pytest
@@ -47,6 +48,7 @@ from baserow.contrib.database.views.handler import (
     PublicViewRows,
     ViewHandler,
     ViewIndexingHandler,
+    ViewTrigramIndexingHandler,
 )
 from baserow.contrib.database.views.models import (
     OWNERSHIP_TYPE_COLLABORATIVE,
@@ -2021,9 +2023,13 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     # Should not appear in any results
     data_fixture.create_form_view(user, table=table, public=True)
 
-    # Public View 1 has filters which match row 1
+    # Public View 1 has filters which match row 1. The `contains` filter can't be
+    # evaluated in Python, so the database must be queried.
     data_fixture.create_view_filter(
-        view=public_grid_view, field=filtered_field, type="equal", value="FilterValue"
+        view=public_grid_view,
+        field=filtered_field,
+        type="contains",
+        value="FilterValue",
     )
     model = table.get_model()
     visible_row = model.objects.create(
@@ -2034,7 +2040,7 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     )
     invisible_row = model.objects.create(
         **{
-            f"field_{filtered_field.id}": "NotFilterValue",
+            f"field_{filtered_field.id}": "Other",
             f"field_{unfiltered_field.id}": "any",
         }
     )
@@ -2047,14 +2053,14 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
 
     view_ptr_specific = public_grid_view.view_ptr.specific
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
-        # public view
+        # Only should run a single query to check if the row is in the single public
+        # view
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific
         ]
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
-        # public view
+        # Only should run a single query to check if the row is in the single public
+        # view
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
     another_public_grid_view = data_fixture.create_grid_view(
@@ -2063,7 +2069,7 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     data_fixture.create_view_filter(
         view=another_public_grid_view,
         field=filtered_field,
-        type="equal",
+        type="contains",
         value="FilterValue",
     )
 
@@ -2074,15 +2080,94 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
     specific_another_view = another_public_grid_view.view_ptr.specific
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific,
             specific_another_view,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [visible_row, invisible_row]
+        ) == [
+            PublicViewRows(view=view_ptr_specific, allowed_row_ids={visible_row.id}),
+            PublicViewRows(
+                view=specific_another_view, allowed_row_ids={visible_row.id}
+            ),
+        ]
+
+
+@pytest.mark.django_db
+def test_public_view_row_checker_evaluates_simple_filters_without_queries(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=single_select_field)
+    equal_view = data_fixture.create_grid_view(user, table=table, public=True, order=0)
+    data_fixture.create_view_filter(
+        view=equal_view, field=text_field, type="equal", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=equal_view, field=number_field, type="higher_than", value="1"
+    )
+    or_view = data_fixture.create_grid_view(
+        user, table=table, public=True, order=1, filter_type="OR"
+    )
+    data_fixture.create_view_filter(
+        view=or_view, field=boolean_field, type="boolean", value="1"
+    )
+    data_fixture.create_view_filter(
+        view=or_view, field=single_select_field, type="single_select_equal", value=""
+    )
+    not_view = data_fixture.create_grid_view(user, table=table, public=True, order=2)
+    data_fixture.create_view_filter(
+        view=not_view,
+        field=single_select_field,
+        type="single_select_not_equal",
+        value=str(option.id),
+    )
+    data_fixture.create_view_filter(view=not_view, field=text_field, type="not_empty")
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "a",
+            f"field_{number_field.id}": 2,
+            f"field_{boolean_field.id}": True,
+        }
+    )
+    row_2 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "",
+            f"field_{number_field.id}": 1,
+            f"field_{single_select_field.id}": option,
+        }
+    )
+    rows = list(model.objects.all())
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+    with django_assert_num_queries(0):
+        public_view_rows = row_checker.get_public_views_where_rows_are_visible(rows)
+
+    assert [(view.id, row_ids) for view, row_ids in public_view_rows] == [
+        (equal_view.id, {row_1.id}),
+        (or_view.id, {row_1.id}),
+        (not_view.id, {row_1.id}),
+    ]
+    # The results must be the same as the filters applied by the database.
+    for view, row_ids in public_view_rows:
+        filtered = ViewHandler().apply_filters(view, model.objects.all())
+        assert set(filtered.values_list("id", flat=True)) == row_ids
 
 
 @pytest.mark.django_db
@@ -2904,6 +2989,91 @@ def test_creating_view_sort_creates_a_new_index(data_fixture, enable_singleton_t
     assert ViewIndexingHandler.does_index_exist(index.name) is True
 
 
+@override_settings(AUTO_INDEX_TRIGRAM_ENABLED=True)
+@pytest.mark.django_db(transaction=True)
+def test_contains_view_filters_create_and_drop_trigram_indexes(
+    data_fixture, enable_singleton_testing
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(user=user, table=table)
+    number_field = data_fixture.create_number_field(user=user, table=table)
+    handler = ViewHandler()
+    grid_view = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == set()
+
+    view_filter = handler.create_filter(
+        user=user, view=grid_view, field=text_field, type_name="contains", value="a"
+    )
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == {text_field.id}
+
+    # Number fields can't be trigram indexed.
+    handler.create_filter(
+        user=user, view=grid_view, field=number_field, type_name="contains", value="1"
+    )
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == {text_field.id}
+
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "Baserow"})
+    assert handler.apply_filters(grid_view, model.objects.all()).count() == 1
+
+    handler.update_filter(user, view_filter, type_name="equal")
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == set()
+
+    handler.update_filter(user, view_filter, type_name="contains_not")
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == {text_field.id}
+
+    handler.delete_filter(user, view_filter)
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == set()
+
+
+@override_settings(AUTO_INDEX_TRIGRAM_ENABLED=True)
+@pytest.mark.django_db(transaction=True)
+def test_link_row_contains_view_filters_index_the_related_primary_field(
+    data_fixture, enable_singleton_testing
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    primary_field = data_fixture.create_text_field(
+        user=user, table=related_table, primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+
+    ViewHandler().create_filter(
+        user=user,
+        view=grid_view,
+        field=link_field,
+        type_name="link_row_contains",
+        value="a",
+    )
+
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(related_table) == {
+        primary_field.id
+    }
+    assert ViewTrigramIndexingHandler.get_indexed_field_ids(table) == set()
+
+    # The index must not be partial, otherwise it can't be used by the join on
+    # the related table, which doesn't filter on the trashed rows.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+            [primary_field.trigram_index_name],
+        )
+        (index_definition,) = cursor.fetchone()
+    assert "WHERE" not in index_definition.upper()
+
+
 @override_settings(
     AUTO_INDEX_VIEW_ENABLED=True,
 )
@@ -4275,3 +4445,51 @@ def test_get_queryset_apply_sorts(data_fixture):
 
     row_ids = [row.id for row in rows]
     assert row_ids == [row_3.id, row_2.id, row_1.id]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_CAPPED_ROW_COUNT_LIMIT=3)
+def test_get_row_count(data_fixture, django_capture_on_commit_callbacks):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    RowHandler().create_rows(
+        user, table, [{f"field_{text_field.id}": "a"} for _ in range(5)], model=model
+    )
+
+    handler = ViewHandler()
+    queryset = handler.get_queryset(grid, model=model)
+    assert handler.get_row_count(grid, queryset) == (5, "exact")
+    assert handler.get_row_count(grid, queryset, "capped") == (5, "exact")
+
+    # The count of the unfiltered view is cached and kept up to date when rows are
+    # created or deleted.
+    assert handler.get_row_count(grid, queryset, "estimate") == (5, "exact")
+    model.objects.create()
+    assert handler.get_row_count(grid, queryset, "estimate") == (5, "exact")
+    with django_capture_on_commit_callbacks(execute=True):
+        row = RowHandler().create_row(user, table, {}, model=model)
+    assert handler.get_row_count(grid, queryset, "estimate") == (6, "exact")
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().delete_row(user, table, row, model=model)
+    assert handler.get_row_count(grid, queryset, "estimate") == (5, "exact")
+    assert handler.get_row_count(grid, queryset) == (6, "exact")
+
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="equal", value="a"
+    )
+    queryset = handler.get_queryset(grid, model=model)
+    assert handler.get_row_count(grid, queryset, "capped") == (3, "capped")
+    assert handler.get_row_count(grid, queryset, "exact") == (5, "exact")
+
+    # Small estimates are counted exactly.
+    with patch.object(ViewHandler, "get_estimated_row_count", return_value=2):
+        assert handler.get_row_count(grid, queryset, "estimate") == (3, "capped")
+    with patch.object(ViewHandler, "get_estimated_row_count", return_value=1000):
+        assert handler.get_row_count(grid, queryset, "estimate") == (
+            1000,
+            "estimate",
+        )
+    assert handler.get_estimated_row_count(queryset) >= 0
@@ -2,7 +2,7 @@ import pytest
 from pyinstrument import Profiler
 
 from baserow.contrib.database.views.usage_types import FormViewWorkspaceStorageUsageItem
-from baserow.core.models import Workspace
+from baserow.core.models import Workspace, WorkspaceStorageUsageUpdate
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.usage.handler import UsageHandler
 from baserow.core.usage.registries import USAGE_UNIT_MB
@@ -130,6 +130,99 @@ def test_form_view_workspace_storage_usage_item_duplicate_ids_within_image_categ
     assert usage == 6  # Instead of 12
 
 
+@pytest.mark.django_db
+def test_form_view_workspace_storage_usage_item_for_workspaces(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    table = data_fixture.create_database_table(
+        user=user,
+        database=data_fixture.create_database_application(workspace=workspace),
+    )
+    workspace_2 = data_fixture.create_workspace(user=user)
+    table_2 = data_fixture.create_database_table(
+        user=user,
+        database=data_fixture.create_database_application(workspace=workspace_2),
+    )
+    workspace_3 = data_fixture.create_workspace(user=user)
+
+    cover_image = data_fixture.create_user_file(is_image=True, size=2 * USAGE_UNIT_MB)
+    logo_image = data_fixture.create_user_file(is_image=True, size=4 * USAGE_UNIT_MB)
+    data_fixture.create_form_view(
+        table=table, cover_image=cover_image, logo_image=logo_image
+    )
+    data_fixture.create_form_view(table=table, cover_image=logo_image)
+    data_fixture.create_form_view(table=table_2, cover_image=cover_image)
+
+    usage = FormViewWorkspaceStorageUsageItem().calculate_storage_usage_for_workspaces(
+        [workspace.id, workspace_2.id, workspace_3.id]
+    )
+
+    assert usage.get(workspace.id, 0) == 6
+    assert usage.get(workspace_2.id, 0) == 2
+    assert usage.get(workspace_3.id, 0) == 0
+
+
+@pytest.mark.django_db
+def test_form_view_workspace_storage_usage_item_for_workspaces_is_the_same(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    table = data_fixture.create_database_table(
+        user=user,
+        database=data_fixture.create_database_application(workspace=workspace),
+    )
+
+    cover_image = data_fixture.create_user_file(
+        is_image=True, size=int(1.5 * USAGE_UNIT_MB)
+    )
+    logo_image = data_fixture.create_user_file(
+        is_image=True, size=int(1.7 * USAGE_UNIT_MB)
+    )
+    data_fixture.create_form_view(
+        table=table, cover_image=cover_image, logo_image=logo_image
+    )
+
+    usage_type = FormViewWorkspaceStorageUsageItem()
+    usage = usage_type.calculate_storage_usage_for_workspaces([workspace.id])
+
+    assert usage[workspace.id] == usage_type.calculate_storage_usage(workspace.id)
+    assert usage[workspace.id] == 3
+
+
+@pytest.mark.django_db
+def test_calculate_storage_usage_only_updated_workspaces(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    table = data_fixture.create_database_table(
+        user=user,
+        database=data_fixture.create_database_application(workspace=workspace),
+    )
+    workspace_2 = data_fixture.create_workspace(user=user)
+    table_2 = data_fixture.create_database_table(
+        user=user,
+        database=data_fixture.create_database_application(workspace=workspace_2),
+    )
+
+    assert UsageHandler.calculate_storage_usage() == 2
+    assert not WorkspaceStorageUsageUpdate.objects.exists()
+
+    image = data_fixture.create_user_file(is_image=True, size=2 * USAGE_UNIT_MB)
+    data_fixture.create_form_view(table=table, cover_image=image)
+    data_fixture.create_form_view(table=table_2, cover_image=image)
+    UsageHandler.mark_workspaces_for_storage_usage_update([workspace.id])
+
+    assert UsageHandler.calculate_storage_usage(only_updated=True) == 1
+    assert not WorkspaceStorageUsageUpdate.objects.exists()
+
+    workspace.refresh_from_db()
+    workspace_2.refresh_from_db()
+    assert workspace.storage_usage == 2
+    assert workspace_2.storage_usage == 0
+
+    assert UsageHandler.calculate_storage_usage(only_updated=True) == 0
+
+
 @pytest.mark.django_db
 @pytest.mark.disabled_in_ci
 # You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
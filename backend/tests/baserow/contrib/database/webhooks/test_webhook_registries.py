@@ -7,8 +7,8 @@ from baserow.contrib.database.rows.handler import RowHandler
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.contrib.database.webhooks.registries.call_webhook")
-def test_signal_listener(mock_call_webhook, data_fixture):
+@patch("baserow.contrib.database.webhooks.registries.call_webhooks")
+def test_signal_listener(mock_call_webhooks, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     webhook = data_fixture.create_table_webhook(
@@ -22,8 +22,10 @@ def test_signal_listener(mock_call_webhook, data_fixture):
 
     RowHandler().create_row(user=user, table=table, values={})
 
-    mock_call_webhook.delay.assert_called_once()
-    _, kwargs = mock_call_webhook.delay.call_args
+    mock_call_webhooks.delay.assert_called_once()
+    _, delay_kwargs = mock_call_webhooks.delay.call_args
+    assert len(delay_kwargs["calls"]) == 1
+    kwargs = delay_kwargs["calls"][0]
     assert kwargs["webhook_id"] == webhook.id
     assert isinstance(kwargs["event_id"], uuid.UUID)
     assert kwargs["event_type"] == "rows.created"
@@ -41,3 +43,41 @@ def test_signal_listener(mock_call_webhook, data_fixture):
         "event_type": "rows.created",
         "items": [{"id": 1, "order": "1.00000000000000000000"}],
     }
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook")
+@patch("baserow.contrib.database.webhooks.registries.call_webhooks")
+def test_signal_listener_batch_events(
+    mock_call_webhooks, mock_call_batched_webhook, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    webhook = data_fixture.create_table_webhook(
+        user=user,
+        table=table,
+        url="http://localhost/",
+        include_all_events=False,
+        events=["rows.created"],
+        batch_events=True,
+    )
+
+    RowHandler().create_row(user=user, table=table, values={})
+    RowHandler().create_row(user=user, table=table, values={})
+
+    mock_call_webhooks.delay.assert_not_called()
+    # Only one delivery is scheduled for all the batched events.
+    mock_call_batched_webhook.apply_async.assert_called_once()
+    _, kwargs = mock_call_batched_webhook.apply_async.call_args
+    assert kwargs["kwargs"]["webhook_id"] == webhook.id
+    assert kwargs["countdown"] == 5
+
+    batched_events = list(webhook.batched_events.all())
+    assert len(batched_events) == 2
+    assert batched_events[0].event_type == "rows.created"
+    assert batched_events[0].payload["event_type"] == "rows.created"
+    assert batched_events[0].payload["items"][0]["id"] == 1
+    assert batched_events[1].payload["items"][0]["id"] == 2
+    webhook.refresh_from_db()
+    assert webhook.batch_scheduled_for is not None
+    assert kwargs["kwargs"]["scheduled_for"] == webhook.batch_scheduled_for.isoformat()
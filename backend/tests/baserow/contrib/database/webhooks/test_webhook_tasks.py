@@ -1,15 +1,30 @@
+import json
+import threading
+import uuid
+from datetime import timedelta
 from unittest.mock import patch
 
 from django.db import transaction
 from django.test import override_settings
+from django.utils import timezone
 
 import httpretty
 import pytest
 import responses
 from celery.exceptions import Retry
 
-from baserow.contrib.database.webhooks.models import TableWebhookCall
-from baserow.contrib.database.webhooks.tasks import call_webhook
+from baserow.contrib.database.webhooks.handler import WebhookHandler
+from baserow.contrib.database.webhooks.models import (
+    TableWebhookBatchedEvent,
+    TableWebhookCall,
+)
+from baserow.contrib.database.webhooks.tasks import (
+    call_batched_webhook,
+    call_webhook,
+    call_webhooks,
+    schedule_batched_webhook_call,
+    schedule_stale_batched_webhook_calls,
+)
 from baserow.test_utils.helpers import stub_getaddrinfo
 
 
@@ -207,3 +222,294 @@ def test_can_call_webhook_to_localhost_when_private_addresses_allowed(
     assert not call.error
     assert call.response_status == 201
     assert webhook.active
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=0)
+def test_call_webhook_makes_request_outside_of_transaction(data_fixture):
+    responses.add(responses.POST, "http://localhost/", status=200)
+    webhook = data_fixture.create_table_webhook(failed_triggers=1)
+    in_atomic_block_during_request = []
+
+    def make_request(*args, **kwargs):
+        in_atomic_block_during_request.append(
+            transaction.get_connection().in_atomic_block
+        )
+        return make_request.original(*args, **kwargs)
+
+    make_request.original = WebhookHandler().make_request
+    with patch.object(WebhookHandler, "make_request", side_effect=make_request):
+        call_webhook.run(
+            webhook_id=webhook.id,
+            event_id="00000000-0000-0000-0000-000000000000",
+            event_type="rows.created",
+            method="POST",
+            url="http://localhost/",
+            headers={},
+            payload={"type": "rows.created"},
+        )
+
+    assert in_atomic_block_during_request == [False]
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 1
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 0
+
+
+def _webhook_call_kwargs(webhook, url, event_id):
+    return {
+        "webhook_id": webhook.id,
+        "event_id": event_id,
+        "event_type": "rows.created",
+        "method": "POST",
+        "url": url,
+        "headers": {},
+        "payload": {"type": "rows.created"},
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook.apply_async")
+def test_call_webhooks_slow_receiver_does_not_block_other_calls(
+    mock_apply_async, data_fixture
+):
+    slow_webhook = data_fixture.create_table_webhook(url="http://slow/")
+    fast_webhook = data_fixture.create_table_webhook(url="http://fast/")
+    fast_called = threading.Event()
+    slow_waited_for_fast_call = []
+
+    def slow_receiver(request):
+        # Only returns early if the fast receiver is called while this one is
+        # still busy, which isn't possible if the calls are made one by one.
+        slow_waited_for_fast_call.append(fast_called.wait(timeout=5))
+        return 200, {}, "{}"
+
+    def fast_receiver(request):
+        fast_called.set()
+        return 200, {}, "{}"
+
+    responses.add_callback(responses.POST, "http://slow/", callback=slow_receiver)
+    responses.add_callback(responses.POST, "http://fast/", callback=fast_receiver)
+
+    call_webhooks(
+        calls=[
+            _webhook_call_kwargs(
+                slow_webhook, "http://slow/", "00000000-0000-0000-0000-000000000000"
+            ),
+            _webhook_call_kwargs(
+                fast_webhook, "http://fast/", "00000000-0000-0000-0000-000000000001"
+            ),
+        ]
+    )
+
+    assert slow_waited_for_fast_call == [True]
+    assert TableWebhookCall.objects.filter(webhook=slow_webhook).count() == 1
+    assert TableWebhookCall.objects.filter(webhook=fast_webhook).count() == 1
+    mock_apply_async.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook.apply_async")
+def test_call_webhooks_retries_failed_calls_separately_and_skips_deleted_webhooks(
+    mock_apply_async, data_fixture
+):
+    webhook = data_fixture.create_table_webhook(url="http://localhost/")
+    responses.add(responses.POST, "http://localhost/", status=500)
+    kwargs = _webhook_call_kwargs(
+        webhook, "http://localhost/", "00000000-0000-0000-0000-000000000000"
+    )
+    deleted_webhook_kwargs = {
+        **kwargs,
+        "webhook_id": 0,
+        "event_id": "00000000-0000-0000-0000-000000000001",
+    }
+
+    call_webhooks(calls=[kwargs, deleted_webhook_kwargs])
+
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 1
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 1
+    mock_apply_async.assert_called_once_with(kwargs=kwargs, countdown=1, retries=1)
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_BATCH_MAX_EVENTS=2)
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook.apply_async")
+def test_call_batched_webhook(mock_apply_async, data_fixture):
+    responses.add(responses.POST, "http://localhost/", status=200)
+    webhook = data_fixture.create_table_webhook(
+        url="http://localhost/", batch_events=True, batch_scheduled_for=timezone.now()
+    )
+    for index in range(3):
+        TableWebhookBatchedEvent.objects.create(
+            webhook=webhook,
+            event_id=uuid.uuid4(),
+            event_type="rows.created",
+            payload={"event_type": "rows.created", "index": index},
+        )
+    first_event = webhook.batched_events.first()
+
+    call_batched_webhook.run(webhook_id=webhook.id)
+
+    assert len(responses.calls) == 1
+    body = json.loads(responses.calls[0].request.body)
+    assert body["event_type"] == "batch"
+    assert body["event_id"] == str(first_event.event_id)
+    assert [event["index"] for event in body["events"]] == [0, 1]
+    call = TableWebhookCall.objects.get(webhook=webhook)
+    assert call.event_type == "batch"
+    assert call.event_id == first_event.event_id
+
+    # The remaining event must be delivered in the next call.
+    assert [e.payload["index"] for e in webhook.batched_events.all()] == [2]
+    mock_apply_async.assert_called_once()
+    webhook.refresh_from_db()
+    assert webhook.batch_scheduled_for is not None
+    _, kwargs = mock_apply_async.call_args
+    # The next batch is full, so it's delivered right away.
+    assert kwargs["countdown"] == 0
+
+    call_batched_webhook.run(**kwargs["kwargs"])
+
+    assert len(responses.calls) == 2
+    body = json.loads(responses.calls[1].request.body)
+    assert [event["index"] for event in body["events"]] == [2]
+    assert webhook.batched_events.count() == 0
+    webhook.refresh_from_db()
+    assert webhook.batch_scheduled_for is None
+    assert mock_apply_async.call_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook.apply_async")
+def test_call_batched_webhook_replaced_by_another_delivery(
+    mock_apply_async, data_fixture
+):
+    responses.add(responses.POST, "http://localhost/", status=200)
+    webhook = data_fixture.create_table_webhook(
+        url="http://localhost/", batch_events=True, batch_scheduled_for=timezone.now()
+    )
+    TableWebhookBatchedEvent.objects.create(
+        webhook=webhook,
+        event_id=uuid.uuid4(),
+        event_type="rows.created",
+        payload={"event_type": "rows.created"},
+    )
+
+    replaced_scheduled_for = timezone.now() - timedelta(seconds=1)
+    call_batched_webhook.run(
+        webhook_id=webhook.id, scheduled_for=replaced_scheduled_for.isoformat()
+    )
+
+    assert len(responses.calls) == 0
+    assert webhook.batched_events.count() == 1
+    webhook.refresh_from_db()
+    assert webhook.batch_scheduled_for is not None
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_WEBHOOKS_BATCH_WINDOW_SECONDS=5,
+    BASEROW_WEBHOOKS_BATCH_MAX_EVENTS=2,
+)
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook.apply_async")
+def test_add_batched_event_delivers_full_batch_right_away(
+    mock_apply_async, data_fixture
+):
+    webhook = data_fixture.create_table_webhook(batch_events=True)
+    handler = WebhookHandler()
+
+    handler.add_batched_event(webhook, uuid.uuid4(), "rows.created", {})
+
+    mock_apply_async.assert_called_once()
+    _, kwargs = mock_apply_async.call_args
+    assert kwargs["countdown"] == 5
+
+    handler.add_batched_event(webhook, uuid.uuid4(), "rows.created", {})
+
+    # The earlier delivery replaces the one waiting for more events.
+    assert mock_apply_async.call_count == 2
+    _, kwargs = mock_apply_async.call_args
+    assert kwargs["countdown"] == 0
+    webhook.refresh_from_db()
+    assert kwargs["kwargs"]["scheduled_for"] == webhook.batch_scheduled_for.isoformat()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS=60)
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook.apply_async")
+def test_schedule_batched_webhook_call_replaces_stale_delivery(
+    mock_apply_async, data_fixture
+):
+    pending_webhook = data_fixture.create_table_webhook(
+        batch_events=True, batch_scheduled_for=timezone.now()
+    )
+    stale_webhook = data_fixture.create_table_webhook(
+        batch_events=True,
+        batch_scheduled_for=timezone.now() - timedelta(seconds=120),
+    )
+
+    schedule_batched_webhook_call(pending_webhook.id, countdown=5)
+    mock_apply_async.assert_not_called()
+
+    schedule_batched_webhook_call(stale_webhook.id, countdown=5)
+    mock_apply_async.assert_called_once()
+    _, kwargs = mock_apply_async.call_args
+    assert kwargs["kwargs"]["webhook_id"] == stale_webhook.id
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook.apply_async")
+def test_schedule_batched_webhook_call_resets_when_scheduling_fails(
+    mock_apply_async, data_fixture
+):
+    mock_apply_async.side_effect = ConnectionError
+    webhook = data_fixture.create_table_webhook(batch_events=True)
+
+    with pytest.raises(ConnectionError):
+        schedule_batched_webhook_call(webhook.id, countdown=5)
+
+    webhook.refresh_from_db()
+    assert webhook.batch_scheduled_for is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_WEBHOOKS_BATCH_SCHEDULE_TIMEOUT_SECONDS=60)
+@patch("baserow.contrib.database.webhooks.tasks.call_batched_webhook.apply_async")
+def test_schedule_stale_batched_webhook_calls(mock_apply_async, data_fixture):
+    long_ago = timezone.now() - timedelta(seconds=120)
+    unscheduled_webhook = data_fixture.create_table_webhook(batch_events=True)
+    stale_webhook = data_fixture.create_table_webhook(
+        batch_events=True, batch_scheduled_for=long_ago
+    )
+    pending_webhook = data_fixture.create_table_webhook(
+        batch_events=True, batch_scheduled_for=long_ago + timedelta(seconds=100)
+    )
+    # Recent events can still be scheduled by the listener.
+    recent_webhook = data_fixture.create_table_webhook(batch_events=True)
+    for webhook in [
+        unscheduled_webhook,
+        stale_webhook,
+        pending_webhook,
+        recent_webhook,
+    ]:
+        TableWebhookBatchedEvent.objects.create(
+            webhook=webhook,
+            event_id=uuid.uuid4(),
+            event_type="rows.created",
+            payload={"event_type": "rows.created"},
+        )
+    TableWebhookBatchedEvent.objects.exclude(webhook=recent_webhook).update(
+        created_on=long_ago
+    )
+
+    schedule_stale_batched_webhook_calls()
+
+    scheduled_webhook_ids = {
+        kwargs["kwargs"]["webhook_id"] for _, kwargs in mock_apply_async.call_args_list
+    }
+    assert scheduled_webhook_ids == {unscheduled_webhook.id, stale_webhook.id}
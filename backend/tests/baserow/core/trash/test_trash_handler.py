@@ -8,7 +8,12 @@ from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.models import Table
 from baserow.core.exceptions import ApplicationDoesNotExist, WorkspaceDoesNotExist
-from baserow.core.models import Application, TrashEntry, Workspace
+from baserow.core.models import (
+    Application,
+    TrashEntry,
+    Workspace,
+    WorkspaceStorageUsageUpdate,
+)
 from baserow.core.trash.exceptions import (
     CannotDeleteAlreadyDeletedItem,
     CannotRestoreChildBeforeParent,
@@ -518,3 +523,26 @@ def test_permanently_delete_item_raises_operationalerror(
             TrashHandler.try_perm_delete_trash_entry(
                 trash_entry, trash_item_lookup_cache
             )
+
+
+@pytest.mark.django_db
+def test_only_trashing_items_affecting_the_storage_usage_marks_the_workspace(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    database = table.database
+    workspace = database.workspace
+    row = RowHandler().create_row(user=user, table=table, values={})
+    WorkspaceStorageUsageUpdate.objects.all().delete()
+
+    TrashHandler.trash(user, workspace, database, row)
+    TrashHandler.restore_item(user, "row", row.id, parent_trash_item_id=table.id)
+    assert not WorkspaceStorageUsageUpdate.objects.exists()
+
+    TrashHandler.trash(user, workspace, database, table)
+    assert WorkspaceStorageUsageUpdate.objects.filter(workspace=workspace).exists()
+
+    WorkspaceStorageUsageUpdate.objects.all().delete()
+    TrashHandler.restore_item(user, "table", table.id)
+    assert WorkspaceStorageUsageUpdate.objects.filter(workspace=workspace).exists()
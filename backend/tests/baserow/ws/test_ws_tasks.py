@@ -1,13 +1,20 @@
+from unittest.mock import patch
+
+from django.test.utils import override_settings
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
+from baserow.core.handler import CoreHandler
+from baserow.core.operations import ReadApplicationOperationType
 from baserow.ws.tasks import (
     broadcast_to_channel_group,
     broadcast_to_group,
     broadcast_to_groups,
+    broadcast_to_permitted_users,
     broadcast_to_users,
     broadcast_to_users_individual_payloads,
     force_disconnect_users,
@@ -507,3 +514,44 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
 
     await communicator_1.disconnect()
     await communicator_2.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WS_PERMITTED_USERS_CACHE_TIMEOUT_SECONDS=60)
+@patch("baserow.ws.tasks.broadcast_to_users")
+def test_broadcast_to_permitted_users_caches_permitted_users(
+    mock_broadcast_to_users, data_fixture
+):
+    user_1 = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user_1)
+    database = data_fixture.create_database_application(workspace=workspace)
+    kwargs = {
+        "workspace_id": workspace.id,
+        "operation_type": ReadApplicationOperationType.type,
+        "scope_name": "application",
+        "scope_id": database.id,
+        "payload": {"test": "test"},
+    }
+
+    with patch.object(
+        CoreHandler,
+        "check_permission_for_multiple_actors",
+        autospec=True,
+        side_effect=CoreHandler.check_permission_for_multiple_actors,
+    ) as mock_check_permission:
+        broadcast_to_permitted_users(**kwargs)
+        broadcast_to_permitted_users(**kwargs)
+
+        assert mock_check_permission.call_count == 1
+        assert mock_broadcast_to_users.call_count == 2
+        assert mock_broadcast_to_users.call_args[0][0] == [user_1.id]
+
+        # Adding a user to the workspace must invalidate the cache.
+        CoreHandler().add_user_to_workspace(workspace, user_2)
+        broadcast_to_permitted_users(**kwargs)
+
+        assert mock_check_permission.call_count == 2
+        assert sorted(mock_broadcast_to_users.call_args[0][0]) == sorted(
+            [user_1.id, user_2.id]
+        )
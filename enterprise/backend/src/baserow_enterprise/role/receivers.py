@@ -8,6 +8,7 @@ from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
 from baserow.core.signals import permissions_updated, workspace_user_updated
 from baserow.core.types import Subject
+from baserow.ws.cache import invalidate_permitted_users_cache
 from baserow.ws.tasks import broadcast_to_users
 from baserow_enterprise.signals import (
     role_assignment_created,
@@ -15,6 +16,9 @@ from baserow_enterprise.signals import (
     role_assignment_updated,
     team_deleted,
     team_restored,
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
 )
 from baserow_enterprise.teams.models import Team
 
@@ -66,6 +70,16 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_permitted_users_cache_when_team_subject_changed(
+    sender, subject, **kwargs
+):
+    workspace_id = subject.team.workspace_id
+    transaction.on_commit(lambda: invalidate_permitted_users_cache(workspace_id))
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
@@ -1,3 +1,6 @@
+import os
+
+
 def setup(settings):
     """
     This function is called after Baserow as setup its own Django settings file but
@@ -11,3 +14,9 @@ def setup(settings):
 
     # How many row comments can be requested at once.
     settings.ROW_COMMENT_PAGE_SIZE_LIMIT = 200
+
+    # How many prompts can be made concurrently when generating the values of an AI
+    # field for multiple rows.
+    settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS = int(
+        os.getenv("BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS", 5)
+    )
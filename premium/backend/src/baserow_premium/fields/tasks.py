@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+
 from baserow.config.celery import app
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.operations import ListFieldsOperationType
@@ -16,6 +21,10 @@ from baserow.core.user.handler import User
 
 from .models import AIField
 
+# The generated values are written back in chunks of this many rows, so that the
+# rows are updated in a single query and a single `rows_updated` signal is sent.
+AI_VALUES_UPDATE_CHUNK_SIZE = 50
+
 
 @app.task(bind=True, queue="export")
 def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list[int]):
@@ -52,35 +61,58 @@ def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list
     if ai_field.ai_generative_ai_model not in ai_models:
         raise ModelDoesNotBelongToType(model_name=ai_field.ai_generative_ai_model)
 
-    for i, row in enumerate(rows):
+    def get_prompt_message(row):
         context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
-        message = str(
+        return str(
             resolve_formula(
                 ai_field.ai_prompt, formula_runtime_function_registry, context
             )
         )
 
-        try:
-            value = generative_ai_model_type.prompt(
-                ai_field.ai_generative_ai_model, message, workspace=workspace
-            )
-        except Exception as exc:
-            # If the prompt fails once, we should not continue with the other rows.
-            rows_ai_values_generation_error.send(
-                self,
-                user=user,
-                rows=rows[i:],
-                field=ai_field,
-                table=table,
-                error_message=str(exc),
-            )
-            raise exc
-
-        RowHandler().update_row_by_id(
-            user,
-            table,
-            row.id,
-            {ai_field.db_column: value},
-            model=model,
-            values_already_prepared=True,
-        )
+    # The prompts are mostly waiting on the network, so they're made concurrently in
+    # threads. The messages are resolved and the values are written back in the
+    # current thread because those need the database connection.
+    max_concurrent_prompts = max(1, settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS)
+    with ThreadPoolExecutor(max_workers=max_concurrent_prompts) as executor:
+        for chunk_start in range(0, len(rows), AI_VALUES_UPDATE_CHUNK_SIZE):
+            chunk = rows[chunk_start : chunk_start + AI_VALUES_UPDATE_CHUNK_SIZE]
+            futures = [
+                executor.submit(
+                    generative_ai_model_type.prompt,
+                    ai_field.ai_generative_ai_model,
+                    get_prompt_message(row),
+                    workspace=workspace,
+                )
+                for row in chunk
+            ]
+
+            rows_values = []
+            error = None
+            for row, future in zip(chunk, futures):
+                try:
+                    value = future.result()
+                except Exception as exc:
+                    error = exc
+                    break
+                rows_values.append({"id": row.id, ai_field.db_column: value})
+
+            if error is not None:
+                for future in futures:
+                    future.cancel()
+
+            if rows_values:
+                with transaction.atomic():
+                    RowHandler().update_rows(user, table, rows_values, model=model)
+
+            if error is not None:
+                # If the prompt fails once, we should not continue with the other
+                # rows.
+                rows_ai_values_generation_error.send(
+                    self,
+                    user=user,
+                    rows=rows[chunk_start + len(rows_values) :],
+                    field=ai_field,
+                    table=table,
+                    error_message=str(error),
+                )
+                raise error
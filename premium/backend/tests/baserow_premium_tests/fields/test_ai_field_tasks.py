@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+from django.test.utils import override_settings
+
 import pytest
 from baserow_premium.fields.tasks import generate_ai_values_for_rows
 
@@ -153,3 +155,41 @@ def test_generate_ai_field_value_view_generative_ai_invalid_prompt(
         patched_rows_ai_values_generation_error.call_args[1]["error_message"]
         == "Test error"
     )
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@override_settings(BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS=3)
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_value_for_multiple_rows_in_one_update(
+    patched_rows_updated, premium_data_fixture
+):
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user(
+        email="test@test.nl", password="password", first_name="Test1"
+    )
+
+    database = premium_data_fixture.create_database_application(
+        user=user, name="database"
+    )
+    table = premium_data_fixture.create_database_table(name="table", database=database)
+    firstname = premium_data_fixture.create_text_field(table=table, name="firstname")
+    field = premium_data_fixture.create_ai_field(
+        table=table,
+        name="ai",
+        ai_prompt=f"concat('Hello ', get('fields.field_{firstname.id}'))",
+    )
+
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[{f"field_{firstname.id}": str(i)} for i in range(10)],
+    )
+
+    generate_ai_values_for_rows(user.id, field.id, [row.id for row in rows])
+
+    assert patched_rows_updated.call_count == 1
+    updated_rows = patched_rows_updated.call_args[1]["rows"]
+    assert [getattr(row, field.db_column) for row in updated_rows] == [
+        f"Generated: Hello {i}" for i in range(10)
+    ]
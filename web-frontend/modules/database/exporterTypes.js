@@ -1,6 +1,7 @@
 import { Registerable } from '@baserow/modules/core/registry'
 import { GridViewType } from '@baserow/modules/database/viewTypes'
 import TableCSVExporter from '@baserow/modules/database/components/export/TableCSVExporter'
+import TableParquetExporter from '@baserow/modules/database/components/export/TableParquetExporter'
 
 export class TableExporterType extends Registerable {
   /**
@@ -113,3 +114,30 @@ export class CSVTableExporterType extends TableExporterType {
     return [GridViewType.getType()]
   }
 }
+
+export class ParquetTableExporterType extends TableExporterType {
+  static getType() {
+    return 'parquet'
+  }
+
+  getIconClass() {
+    return 'baserow-icon-file-code'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('exporterType.parquet')
+  }
+
+  getFormComponent() {
+    return TableParquetExporter
+  }
+
+  getCanExportTable() {
+    return true
+  }
+
+  getSupportedViews() {
+    return [GridViewType.getType()]
+  }
+}
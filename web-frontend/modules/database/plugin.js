@@ -119,7 +119,10 @@ import rowModalNavigationStore from '@baserow/modules/database/store/rowModalNav
 import rowHistoryStore from '@baserow/modules/database/store/rowHistory'
 
 import { registerRealtimeEvents } from '@baserow/modules/database/realtime'
-import { CSVTableExporterType } from '@baserow/modules/database/exporterTypes'
+import {
+  CSVTableExporterType,
+  ParquetTableExporterType,
+} from '@baserow/modules/database/exporterTypes'
 import {
   BaserowAdd,
   BaserowAnd,
@@ -495,6 +498,7 @@ export default (context) => {
   app.$registry.register('importer', new JSONImporterType(context))
   app.$registry.register('settings', new APITokenSettingsType(context))
   app.$registry.register('exporter', new CSVTableExporterType(context))
+  app.$registry.register('exporter', new ParquetTableExporterType(context))
   app.$registry.register(
     'webhookEvent',
     new RowsCreatedWebhookEventType(context)